@@ -1,6 +1,7 @@
 '''Public exports.'''
-from application.terminal     import Terminal     as Terminal
-from application.solverDialog import SolverDialog as SolverDialog
-from application.mainWindow   import MainWindow   as MainWindow
-from application.app          import App          as App
-from application.app          import current      as current
+from application.terminal       import Terminal       as Terminal
+from application.solverDialog   import SolverDialog   as SolverDialog
+from application.jobQueueDialog import JobQueueDialog as JobQueueDialog
+from application.mainWindow     import MainWindow     as MainWindow
+from application.app            import App            as App
+from application.app            import current        as current
@@ -0,0 +1,3 @@
+'''Public exports.'''
+from application.jobQueueDialog.jobQueueDialogShell import JobQueueDialogShell as JobQueueDialogShell
+from application.jobQueueDialog.jobQueueDialog      import JobQueueDialog      as JobQueueDialog
@@ -0,0 +1,150 @@
+import os.path
+from typing import Literal, cast
+from process import Job, JobQueue, JobStates
+from application.jobQueueDialog.jobQueueDialogShell import JobQueueDialogShell
+from PySide6.QtWidgets import QWidget, QFileDialog, QTableWidgetItem
+from PySide6.QtCore import QTimer
+
+class JobQueueDialog(JobQueueDialogShell):
+    '''
+    The job queue dialog.
+    '''
+
+    # attribute slots
+    __slots__ = ('_timer', '_jobQueue', '_modelDatabaseFile')
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        '''Job queue dialog constructor.'''
+        super().__init__(parent)
+        # job queue
+        self._modelDatabaseFile: str | None = None
+        self._jobQueue: JobQueue = JobQueue()
+        self._maxWorkersBox.setValue(self._jobQueue.maxWorkers)
+        self._memoryReserveBox.setValue(round(self._jobQueue.memoryReserve))
+        # timer
+        self._timer: QTimer = QTimer(self)
+        self._timer.timeout.connect(self.onTimerTimeout) # type: ignore
+        self._timer.start(250)
+        # connections
+        self._openModelDatabaseButton.clicked.connect(self.onOpenModelDatabase)          # type: ignore
+        self._addJobButton.clicked.connect(self.onAddJob)                                # type: ignore
+        self._maxWorkersBox.valueChanged.connect(self.onMaxWorkers)                      # type: ignore
+        self._memoryReserveBox.valueChanged.connect(self.onMemoryReserve)                # type: ignore
+        self._cancelJobButton.clicked.connect(self.onCancelJob)                          # type: ignore
+        self._cancelAllButton.clicked.connect(self.onCancelAll)                          # type: ignore
+        self._clearFinishedButton.clicked.connect(self.onClearFinished)                  # type: ignore
+        self._openOutputDatabaseButton.clicked.connect(self.onOpenOutputDatabase)        # type: ignore
+        self._jobsTable.itemSelectionChanged.connect(self.updateActions)                 # type: ignore
+
+    def jobQueue(self) -> JobQueue:
+        '''Returns the job queue (e.g. for submitting jobs from the terminal).'''
+        return self._jobQueue
+
+    def onTimerTimeout(self) -> None:
+        '''
+        This method is executed once every n units of time.
+        This method drives the job queue and shows the current state of its jobs.
+        '''
+        self._jobQueue.poll()
+        self.updateJobsTable()
+        self.updateActions()
+        # queue status
+        running: int = len(self._jobQueue.runningJobs())
+        queued: int = sum(1 for job in self._jobQueue.jobs() if job.state == JobStates.Queued)
+        self._statusBox.setText(f'{running} running, {queued} queued' if running + queued > 0 else 'Idle')
+
+    def updateJobsTable(self) -> None:
+        '''Updates the contents of the jobs table.'''
+        jobs: tuple[Job, ...] = self._jobQueue.jobs()
+        if self._jobsTable.rowCount() != len(jobs): self._jobsTable.setRowCount(len(jobs))
+        for row, job in enumerate(jobs):
+            state: str = job.state.name + (f' ({job.stage})' if job.stage else '')
+            for column, text in enumerate((
+                job.name,
+                job.analysisType.capitalize() + (f' ({job.eigenvalues})' if job.analysisType != 'static' else ''),
+                str(job.priority),
+                state,
+                f'{job.attempts}/{job.maxRetries + 1}',
+                str(job.exitCode) if job.exitCode is not None else '-',
+                f'{job.peakMemory:.0f} MB',
+                f'{job.cpuTime:.3f} s'
+            )):
+                item: QTableWidgetItem | None = self._jobsTable.item(row, column)
+                if not item:
+                    self._jobsTable.setItem(row, column, QTableWidgetItem(text))
+                elif item.text() != text:
+                    item.setText(text)
+
+    def updateActions(self) -> None:
+        '''Enables/disables the action buttons.'''
+        job: Job | None = self.selectedJob()
+        self._addJobButton.setEnabled(bool(self._modelDatabaseFile))
+        self._eigenvaluesBox.setEnabled(self._analysisTypeBox.currentText() != 'Static')
+        self._cancelJobButton.setEnabled(bool(job and job.state in (JobStates.Queued, JobStates.Running)))
+        self._cancelAllButton.setEnabled(not self._jobQueue.isIdle())
+        self._openOutputDatabaseButton.setEnabled(
+            bool(job and job.state == JobStates.Done and os.path.isfile(job.outputDatabaseFile))
+        )
+
+    def selectedJob(self) -> Job | None:
+        '''Returns the currently selected job.'''
+        rows: list[int] = sorted(set(index.row() for index in self._jobsTable.selectedIndexes()))
+        jobs: tuple[Job, ...] = self._jobQueue.jobs()
+        if len(rows) == 1 and rows[0] < len(jobs): return jobs[rows[0]]
+        return None
+
+    def onOpenModelDatabase(self) -> None:
+        '''On open model database button clicked.'''
+        filePath: str = QFileDialog.getOpenFileName( # type: ignore
+            parent=self,
+            caption='Open Database',
+            filter='FeaSoft Model Database Files (*.fs_mdb);;All Files (*.*)',
+            options=QFileDialog.Option.DontUseNativeDialog
+        )[0]
+        if filePath != '':
+            self._modelDatabaseFile = os.path.splitext(filePath)[0] + '.fs_mdb'
+            self._modelDatabaseBox.setText(self._modelDatabaseFile)
+
+    def onAddJob(self) -> None:
+        '''On add job button clicked.'''
+        if not self._modelDatabaseFile:
+            raise RuntimeError('a model database must first be specified')
+        self._jobQueue.submit(Job(
+            self._modelDatabaseFile,
+            cast(Literal['static', 'frequency', 'buckle'], self._analysisTypeBox.currentText().lower()),
+            self._eigenvaluesBox.value(),
+            self._priorityBox.value(),
+            self._retriesBox.value()
+        ))
+
+    def onMaxWorkers(self) -> None:
+        '''On max workers value changed.'''
+        self._jobQueue.maxWorkers = self._maxWorkersBox.value()
+
+    def onMemoryReserve(self) -> None:
+        '''On memory reserve value changed.'''
+        self._jobQueue.memoryReserve = float(self._memoryReserveBox.value())
+
+    def onCancelJob(self) -> None:
+        '''On cancel job button clicked.'''
+        job: Job | None = self.selectedJob()
+        if job: self._jobQueue.cancel(job)
+
+    def onCancelAll(self) -> None:
+        '''On cancel all button clicked.'''
+        self._jobQueue.cancelAll()
+
+    def onClearFinished(self) -> None:
+        '''On clear finished button clicked.'''
+        self._jobsTable.clearSelection()
+        self._jobQueue.clearFinished()
+
+    def onOpenOutputDatabase(self) -> None:
+        '''On open output database button clicked.'''
+        job: Job | None = self.selectedJob()
+        if job and os.path.isfile(job.outputDatabaseFile):
+            exec(f'''
+import application
+application.current.mainWindow.setOutputDatabase({job.outputDatabaseFile!r})
+print("Output database opened: '{job.outputDatabaseFile}'")
+            ''')
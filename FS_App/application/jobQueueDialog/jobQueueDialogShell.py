@@ -0,0 +1,217 @@
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import (
+    QWidget, QDialog, QGridLayout, QHBoxLayout, QVBoxLayout, QGroupBox, QLabel, QLineEdit, QComboBox, QFrame,
+    QPushButton, QSpinBox, QTableWidget, QAbstractItemView, QHeaderView
+)
+
+class JobQueueDialogShell(QDialog):
+    '''
+    The job queue dialog shell (basic UI).
+    '''
+
+#   # attribute slots (crashes QT)
+#   __slots__ = (
+#       '_layout', '_newJobGroupBox', '_newJobGroupBoxLayout', '_modelDatabaseLabel', '_modelDatabaseBox',
+#       '_openModelDatabaseButton', '_analysisTypeLabel', '_analysisTypeBox', '_eigenvaluesLabel', '_eigenvaluesBox',
+#       '_priorityLabel', '_priorityBox', '_retriesLabel', '_retriesBox', '_addJobButton', '_queueGroupBox',
+#       '_queueGroupBoxLayout', '_maxWorkersLabel', '_maxWorkersBox', '_memoryReserveLabel', '_memoryReserveBox',
+#       '_statusLabel', '_statusBox', '_jobsFrame', '_jobsFrameLayout', '_jobsLabel', '_jobsTable', '_actionsFrame',
+#       '_actionsFrameLayout', '_cancelJobButton', '_cancelAllButton', '_clearFinishedButton',
+#       '_openOutputDatabaseButton'
+#   )
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        '''Job queue dialog shell constructor.'''
+        super().__init__(parent)
+
+        # dialog (self)
+        self.setWindowTitle('Job Queue')
+        self.resize(720, 600)
+
+        # layout
+        self._layout: QGridLayout = QGridLayout(self)
+        self.setLayout(self._layout)
+
+        # new job group box
+        self._newJobGroupBox: QGroupBox = QGroupBox(self)
+        self._newJobGroupBox.setTitle('New Job')
+        self._layout.addWidget(self._newJobGroupBox, 0, 0, 1, 1)
+
+        # new job group box layout
+        self._newJobGroupBoxLayout: QGridLayout = QGridLayout(self._newJobGroupBox)
+        self._newJobGroupBox.setLayout(self._newJobGroupBoxLayout)
+
+        # model database label
+        self._modelDatabaseLabel: QLabel = QLabel(self._newJobGroupBox)
+        self._modelDatabaseLabel.setText('Model Database:')
+        self._newJobGroupBoxLayout.addWidget(self._modelDatabaseLabel, 0, 0)
+
+        # model database box
+        self._modelDatabaseBox: QLineEdit = QLineEdit(self._newJobGroupBox)
+        self._modelDatabaseBox.setReadOnly(True)
+        self._modelDatabaseBox.setText('...')
+        self._newJobGroupBoxLayout.addWidget(self._modelDatabaseBox, 0, 1, 1, 3)
+
+        # open model database button
+        self._openModelDatabaseButton: QPushButton = QPushButton(self._newJobGroupBox)
+        self._openModelDatabaseButton.setIcon(QIcon('./resources/images/file-open.svg'))
+        self._newJobGroupBoxLayout.addWidget(self._openModelDatabaseButton, 0, 4)
+
+        # analysis type label
+        self._analysisTypeLabel: QLabel = QLabel(self._newJobGroupBox)
+        self._analysisTypeLabel.setText('Analysis Type:')
+        self._newJobGroupBoxLayout.addWidget(self._analysisTypeLabel, 1, 0)
+
+        # analysis type box
+        self._analysisTypeBox: QComboBox = QComboBox(self._newJobGroupBox)
+        self._analysisTypeBox.addItems(('Static', 'Frequency', 'Buckle'))
+        self._newJobGroupBoxLayout.addWidget(self._analysisTypeBox, 1, 1)
+
+        # eigenvalues label
+        self._eigenvaluesLabel: QLabel = QLabel(self._newJobGroupBox)
+        self._eigenvaluesLabel.setText('Number of Eigenvalues:')
+        self._newJobGroupBoxLayout.addWidget(self._eigenvaluesLabel, 1, 2)
+
+        # eigenvalues box
+        self._eigenvaluesBox: QSpinBox = QSpinBox(self._newJobGroupBox)
+        self._eigenvaluesBox.setMinimum(1)
+        self._eigenvaluesBox.setMaximum(100)
+        self._eigenvaluesBox.setSingleStep(1)
+        self._eigenvaluesBox.setValue(10)
+        self._newJobGroupBoxLayout.addWidget(self._eigenvaluesBox, 1, 3)
+
+        # priority label
+        self._priorityLabel: QLabel = QLabel(self._newJobGroupBox)
+        self._priorityLabel.setText('Priority:')
+        self._newJobGroupBoxLayout.addWidget(self._priorityLabel, 2, 0)
+
+        # priority box
+        self._priorityBox: QSpinBox = QSpinBox(self._newJobGroupBox)
+        self._priorityBox.setMinimum(-100)
+        self._priorityBox.setMaximum(100)
+        self._priorityBox.setSingleStep(1)
+        self._priorityBox.setValue(0)
+        self._newJobGroupBoxLayout.addWidget(self._priorityBox, 2, 1)
+
+        # retries label
+        self._retriesLabel: QLabel = QLabel(self._newJobGroupBox)
+        self._retriesLabel.setText('Retries:')
+        self._newJobGroupBoxLayout.addWidget(self._retriesLabel, 2, 2)
+
+        # retries box
+        self._retriesBox: QSpinBox = QSpinBox(self._newJobGroupBox)
+        self._retriesBox.setMinimum(0)
+        self._retriesBox.setMaximum(10)
+        self._retriesBox.setSingleStep(1)
+        self._retriesBox.setValue(0)
+        self._newJobGroupBoxLayout.addWidget(self._retriesBox, 2, 3)
+
+        # add job button
+        self._addJobButton: QPushButton = QPushButton(self._newJobGroupBox)
+        self._addJobButton.setEnabled(False)
+        self._addJobButton.setText('Add Job')
+        self._newJobGroupBoxLayout.addWidget(self._addJobButton, 3, 3, 1, 2)
+
+        # queue group box
+        self._queueGroupBox: QGroupBox = QGroupBox(self)
+        self._queueGroupBox.setTitle('Queue')
+        self._layout.addWidget(self._queueGroupBox, 0, 1, 1, 1)
+
+        # queue group box layout
+        self._queueGroupBoxLayout: QGridLayout = QGridLayout(self._queueGroupBox)
+        self._queueGroupBox.setLayout(self._queueGroupBoxLayout)
+
+        # max workers label
+        self._maxWorkersLabel: QLabel = QLabel(self._queueGroupBox)
+        self._maxWorkersLabel.setText('Workers:')
+        self._queueGroupBoxLayout.addWidget(self._maxWorkersLabel, 0, 0)
+
+        # max workers box
+        self._maxWorkersBox: QSpinBox = QSpinBox(self._queueGroupBox)
+        self._maxWorkersBox.setMinimum(1)
+        self._maxWorkersBox.setMaximum(256)
+        self._maxWorkersBox.setSingleStep(1)
+        self._queueGroupBoxLayout.addWidget(self._maxWorkersBox, 0, 1)
+
+        # memory reserve label
+        self._memoryReserveLabel: QLabel = QLabel(self._queueGroupBox)
+        self._memoryReserveLabel.setText('Memory Reserve:')
+        self._queueGroupBoxLayout.addWidget(self._memoryReserveLabel, 1, 0)
+
+        # memory reserve box
+        self._memoryReserveBox: QSpinBox = QSpinBox(self._queueGroupBox)
+        self._memoryReserveBox.setMinimum(0)
+        self._memoryReserveBox.setMaximum(1048576)
+        self._memoryReserveBox.setSingleStep(256)
+        self._memoryReserveBox.setSuffix(' MB')
+        self._queueGroupBoxLayout.addWidget(self._memoryReserveBox, 1, 1)
+
+        # status label
+        self._statusLabel: QLabel = QLabel(self._queueGroupBox)
+        self._statusLabel.setText('Status:')
+        self._queueGroupBoxLayout.addWidget(self._statusLabel, 2, 0)
+
+        # status box
+        self._statusBox: QLineEdit = QLineEdit(self._queueGroupBox)
+        self._statusBox.setReadOnly(True)
+        self._statusBox.setText('Idle')
+        self._queueGroupBoxLayout.addWidget(self._statusBox, 2, 1)
+
+        # jobs frame
+        self._jobsFrame: QFrame = QFrame(self)
+        self._layout.addWidget(self._jobsFrame, 1, 0, 1, 2)
+
+        # jobs frame layout
+        self._jobsFrameLayout: QVBoxLayout = QVBoxLayout(self._jobsFrame)
+        self._jobsFrameLayout.setContentsMargins(0, 0, 0, 0)
+        self._jobsFrame.setLayout(self._jobsFrameLayout)
+
+        # jobs label
+        self._jobsLabel: QLabel = QLabel(self._jobsFrame)
+        self._jobsLabel.setText('Jobs')
+        self._jobsFrameLayout.addWidget(self._jobsLabel)
+
+        # jobs table
+        self._jobsTable: QTableWidget = QTableWidget(self._jobsFrame)
+        self._jobsTable.setColumnCount(8)
+        self._jobsTable.setHorizontalHeaderLabels((
+            'Job', 'Analysis', 'Priority', 'State', 'Attempts', 'Exit Code', 'Peak Memory', 'CPU Time'
+        ))
+        self._jobsTable.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._jobsTable.verticalHeader().setVisible(False)
+        self._jobsTable.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._jobsTable.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self._jobsTable.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._jobsFrameLayout.addWidget(self._jobsTable)
+
+        # actions frame
+        self._actionsFrame: QFrame = QFrame(self)
+        self._layout.addWidget(self._actionsFrame, 2, 0, 1, 2)
+
+        # actions frame layout
+        self._actionsFrameLayout: QHBoxLayout = QHBoxLayout(self._actionsFrame)
+        self._actionsFrameLayout.setContentsMargins(0, 0, 0, 0)
+        self._actionsFrame.setLayout(self._actionsFrameLayout)
+
+        # cancel job button
+        self._cancelJobButton: QPushButton = QPushButton(self._actionsFrame)
+        self._cancelJobButton.setEnabled(False)
+        self._cancelJobButton.setText('Cancel Job')
+        self._actionsFrameLayout.addWidget(self._cancelJobButton)
+
+        # cancel all button
+        self._cancelAllButton: QPushButton = QPushButton(self._actionsFrame)
+        self._cancelAllButton.setEnabled(False)
+        self._cancelAllButton.setText('Cancel All')
+        self._actionsFrameLayout.addWidget(self._cancelAllButton)
+
+        # clear finished button
+        self._clearFinishedButton: QPushButton = QPushButton(self._actionsFrame)
+        self._clearFinishedButton.setText('Clear Finished')
+        self._actionsFrameLayout.addWidget(self._clearFinishedButton)
+
+        # open output database button
+        self._openOutputDatabaseButton: QPushButton = QPushButton(self._actionsFrame)
+        self._openOutputDatabaseButton.setEnabled(False)
+        self._openOutputDatabaseButton.setText('Open Output Database')
+        self._actionsFrameLayout.addWidget(self._openOutputDatabaseButton)
@@ -6,12 +6,13 @@ from dataModel import (
     ModelingSpaces, DataObject, NodeSet, ElementSet, Section, ConcentratedLoad, BoundaryCondition, ModelDatabase,
     OutputDatabase, Mesh, ElementTypes, BodyLoad, SurfaceSet, Pressure, SurfaceTraction
 )
-from inputOutput import AbaqusReader, FSWriter, FSReader
-from visualization import Viewport, Views, InteractionStyles
+from inputOutput import AbaqusReader, FSWriter, FSReader, FSProgressiveReader
+from visualization import Viewport, Views, InteractionStyles, Animator
 from application.terminal import Terminal
 from application.mainWindow.mainWindowShell import MainWindowShell
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 from PySide6.QtGui import QCloseEvent
+from PySide6.QtCore import QTimer
 
 class MainWindow(MainWindowShell):
     '''
@@ -31,7 +32,9 @@ class MainWindow(MainWindowShell):
             case 'Visualization': return self._outputViewport
 
     # attribute slots
-    __slots__ = ('_module', '_modelDatabase', '_outputDatabase')
+    __slots__ = (
+        '_module', '_modelDatabase', '_outputDatabase', '_outputDatabaseReader', '_outputDatabaseTimer', '_animator'
+    )
 
     def __init__(self) -> None:
         '''Main window constructor.'''
@@ -41,6 +44,13 @@ class MainWindow(MainWindowShell):
         # databases
         self._modelDatabase: ModelDatabase | None = None
         self._outputDatabase: OutputDatabase | None = None
+        # progressive loading of output databases that are still being written (file size polling)
+        self._outputDatabaseReader: FSProgressiveReader | None = None
+        self._outputDatabaseTimer: QTimer = QTimer(self)
+        self._outputDatabaseTimer.setInterval(1000)
+        self._outputDatabaseTimer.timeout.connect(self.onOutputDatabaseTimer)                         # type: ignore
+        # animation of the output viewport
+        self._animator: Animator = Animator(self._outputViewport)
         # update window title
         self.updateWindowTitle()
         # setup connections
@@ -57,6 +67,10 @@ class MainWindow(MainWindowShell):
         self._menuBarModulePreprocessor.triggered.connect(self.onMenuBarModulePreprocessor)           # type: ignore
         self._menuBarModuleVisualization.triggered.connect(self.onMenuBarModuleVisualization)         # type: ignore
         self._menuBarSolverDialog.triggered.connect(self.onMenuBarSolverDialog)                       # type: ignore
+        self._menuBarSolverQueue.triggered.connect(self.onMenuBarSolverQueue)                         # type: ignore
+        self._menuBarAnimateFrames.triggered.connect(self.onMenuBarAnimateFrames)                     # type: ignore
+        self._menuBarAnimateMode.triggered.connect(self.onMenuBarAnimateMode)                         # type: ignore
+        self._menuBarAnimateStop.triggered.connect(self.onMenuBarAnimateStop)                         # type: ignore
         self._menuBarOptionsCommon.triggered.connect(self.onMenuBarOptionsCommon)                     # type: ignore
         self._menuBarOptionsResult.triggered.connect(self.onMenuBarOptionsResult)                     # type: ignore
         self._menuBarQueryMesh.triggered.connect(self.onMenuBarQueryMesh)                             # type: ignore
@@ -92,6 +106,7 @@ class MainWindow(MainWindowShell):
         title: str = f'FeaSoft - {self._module} Module'
         if self._module == 'Preprocessor' and self._modelDatabase: title += f' - {self._modelDatabase.filePath}'
         elif self._module == 'Visualization' and self._outputDatabase: title += f' - {self._outputDatabase.filePath}'
+        if self._module == 'Visualization' and self._outputDatabaseReader: title += ' (Loading)'
         self.setWindowTitle(title)
 
     def show(self) -> None:
@@ -169,17 +184,36 @@ class MainWindow(MainWindowShell):
         '''
         Creates an output database from file.
         Updates the GUI based on the new output database.
+        If the file is still being written (by the solver), its frames are loaded as they are completed.
         '''
+        # stop loading the previous output database
+        self._outputDatabaseTimer.stop()
+        self._outputDatabaseReader = None
         # if a file is not given, dereference the output database
         if not filePath:
             self._outputDatabase = None
         else:
-            # create output database from file
+            # create output database from file (with the frames written so far)
             extension: str = os.path.splitext(filePath)[1]
             match extension:
-                case '.fs_odb': self._outputDatabase = FSReader.readOutputDatabase(filePath)
+                case '.fs_odb':
+                    reader: FSProgressiveReader = FSProgressiveReader(filePath)
+                    reader.poll()
+                    self._outputDatabase = reader.outputDatabase
+                    if not reader.isComplete:
+                        self._outputDatabaseReader = reader
+                        self._outputDatabaseTimer.start()
                 case _: raise ValueError(f"invalid file extension: '{extension}'")
         # update output tree and output viewport
+        self.updateOutputDatabase()
+        # open visualization module
+        if self._module != 'Visualization': self.setModule('Visualization')
+        # update window title
+        self.updateWindowTitle()
+
+    def updateOutputDatabase(self) -> None:
+        '''Updates the output tree and the output viewport based on the current output database.'''
+        self._animator.stop()
         self._outputTree.setOutputDatabase(self._outputDatabase)
         self._outputViewport.setGridRenderObject(
             self._outputDatabase.mesh if self._outputDatabase else None,
@@ -191,10 +225,14 @@ class MainWindow(MainWindowShell):
             self._outputViewport.setView(Views.Isometric)
         else:
             self._outputViewport.setView(Views.Front)
-        # open visualization module
-        if self._module != 'Visualization': self.setModule('Visualization')
-        # update window title
-        self.updateWindowTitle()
+
+    def startAnimation(self, mode: Literal['Frames', 'Mode']) -> None:
+        '''Starts animating the selected nodal scalar field (through the frames, or sweeping its frame).'''
+        selection = self._outputTree.currentSelection()
+        if not self._outputDatabase or not selection or selection[0] != 'Field':
+            raise RuntimeError('a nodal scalar field must first be selected')
+        frame, groupName, fieldName = cast(tuple[int, str, str], selection[1])
+        self._animator.start(self._outputDatabase, frame, groupName, fieldName, mode)
 
     def setModule(self, module: Literal['Preprocessor', 'Visualization']) -> None:
         '''Updates the view based on the given module.'''
@@ -214,9 +252,12 @@ class MainWindow(MainWindowShell):
         self._menuBarModulePreprocessor.setChecked(isPreprocessor)
         self._menuBarSolver.menuAction().setVisible(isPreprocessor)
         if self._solverDialog.isVisible() and not isPreprocessor: self._solverDialog.close()
+        if self._jobQueueDialog.isVisible() and not isPreprocessor: self._jobQueueDialog.close()
         self._modelTree.setVisible(isPreprocessor)
         # visualization module
         self._menuBarModuleVisualization.setChecked(isVisualization)
+        self._menuBarAnimate.menuAction().setVisible(isVisualization)
+        if self._animator.isRunning and not isVisualization: self.onMenuBarAnimateStop()
         self._outputTree.setVisible(isVisualization)
         # update window title
         self.updateWindowTitle()
@@ -294,8 +335,35 @@ class MainWindow(MainWindowShell):
         if stopPicking: self.disablePicking()
         self._modelViewport.render()
 
+    def onOutputDatabaseTimer(self) -> None:
+        '''On output database timer timeout (progressive loading).'''
+        reader: FSProgressiveReader | None = self._outputDatabaseReader
+        if not reader: return
+        # read the frames written since the last timeout (stop loading if the file cannot be interpreted)
+        try:
+            frameCount: int = reader.poll()
+        except RuntimeError:
+            self._outputDatabaseTimer.stop()
+            self._outputDatabaseReader = None
+            self.updateWindowTitle()
+            raise
+        # mesh read (or file replaced by a new solver run): rebuild the tree, otherwise add the new frames
+        if reader.outputDatabase is not self._outputDatabase:
+            self._outputDatabase = reader.outputDatabase
+            self.updateOutputDatabase()
+        elif frameCount > 0:
+            self._outputTree.appendFrames()
+        # stop loading once the whole file is read
+        if reader.isComplete:
+            self._outputDatabaseTimer.stop()
+            self._outputDatabaseReader = None
+            print(f"Output database loaded: '{reader.filePath}'")
+        self.updateWindowTitle()
+
     def onOutputTreeSelection(self) -> None:
         '''On output tree current item changed.'''
+        # stop animation
+        self._animator.stop()
         # clear viewport info, previous plot, and reset deformation
         self._outputViewport.info.clear()
         self._outputViewport.plotNodalScalarField(None, render=False)
@@ -387,7 +455,6 @@ class MainWindow(MainWindowShell):
                     self._outputViewport.info.setText(
                         0, f'Deformation Scale Factor: {Viewport.deformationScaleFactor()}'
                     )
-                    self._outputViewport.render()
             case _: pass
 
 #-----------------------------------------------------------------------------------------------------------------------
@@ -485,7 +552,7 @@ class MainWindow(MainWindowShell):
                 self.setModelDatabase(None)
                 print('Model database closed')
             case 'Visualization':
-                if not self._outputDatabase:
+                if not self._outputDatabase and not self._outputDatabaseReader:
                     raise RuntimeError('an output database must first be opened')
                 self.setOutputDatabase(None)
                 print('Output database closed')
@@ -506,6 +573,24 @@ class MainWindow(MainWindowShell):
         '''On Menu Bar > Solver > Dialog.'''
         self._solverDialog.show()
 
+    def onMenuBarSolverQueue(self) -> None:
+        '''On Menu Bar > Solver > Queue.'''
+        self._jobQueueDialog.show()
+
+    def onMenuBarAnimateFrames(self) -> None:
+        '''On Menu Bar > Animate > Frames.'''
+        self.startAnimation('Frames')
+
+    def onMenuBarAnimateMode(self) -> None:
+        '''On Menu Bar > Animate > Mode Shape.'''
+        self.startAnimation('Mode')
+
+    def onMenuBarAnimateStop(self) -> None:
+        '''On Menu Bar > Animate > Stop.'''
+        if not self._animator.isRunning: return
+        self._animator.stop()
+        self.onOutputTreeSelection() # show the selected frame again
+
     def onMenuBarOptionsCommon(self) -> None:
         '''On Menu Bar > Options > Common.'''
         self._optionsCommonDialog.show()
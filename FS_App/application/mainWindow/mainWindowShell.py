@@ -1,5 +1,6 @@
 from application.terminal import Terminal
 from application.solverDialog import SolverDialog
+from application.jobQueueDialog import JobQueueDialog
 from application.optionsCommonDialog import OptionsCommonDialog
 from application.optionsResultDialog import OptionsResultDialog
 from application.aboutDialog import AboutDialogShell
@@ -31,7 +32,9 @@ class MainWindowShell(QMainWindow):
 #       '_verticalSplitter', '_horizontalSplitter', '_splitterLeft', '_splitterLeftLayout', '_modelTree', '_outputTree',
 #       '_terminal', '_rightSplitter', '_rightSplitterLayout', '_modelViewport', '_outputViewport', '_solverDialog',
 #       '_optionsCommonDialog', '_optionsResultDialog', '_menuBarDebug', '_menuBarDebugTraceback', '_menuBarQuery',
-#       '_menuBarQueryMesh', '_aboutDialog', '_menuBarHelp', '_menuBarHelpAbout'
+#       '_menuBarQueryMesh', '_aboutDialog', '_menuBarHelp', '_menuBarHelpAbout',
+#       '_menuBarSolverQueue', '_jobQueueDialog', '_menuBarAnimate', '_menuBarAnimateFrames', '_menuBarAnimateMode',
+#       '_menuBarAnimateStop'
 #   )
 
     def __init__(self) -> None:
@@ -148,6 +151,33 @@ class MainWindowShell(QMainWindow):
         self._menuBarSolverDialog.setIcon(self._icons['solver-dialog'])
         self._menuBarSolver.addAction(self._menuBarSolverDialog) # type: ignore
 
+        # menu bar > solver > queue
+        self._menuBarSolverQueue: QAction = QAction(self._menuBarSolver)
+        self._menuBarSolverQueue.setText('Queue')
+        self._menuBarSolverQueue.setIcon(self._icons['solver-dialog'])
+        self._menuBarSolver.addAction(self._menuBarSolverQueue) # type: ignore
+
+        # menu bar > animate
+        self._menuBarAnimate: QMenu = QMenu(self._menuBar)
+        self._menuBarAnimate.setTitle('Animate')
+        self._menuBarAnimate.menuAction().setVisible(False)
+        self._menuBar.addAction(self._menuBarAnimate.menuAction())
+
+        # menu bar > animate > frames
+        self._menuBarAnimateFrames: QAction = QAction(self._menuBarAnimate)
+        self._menuBarAnimateFrames.setText('Frames')
+        self._menuBarAnimate.addAction(self._menuBarAnimateFrames) # type: ignore
+
+        # menu bar > animate > mode shape
+        self._menuBarAnimateMode: QAction = QAction(self._menuBarAnimate)
+        self._menuBarAnimateMode.setText('Mode Shape')
+        self._menuBarAnimate.addAction(self._menuBarAnimateMode) # type: ignore
+
+        # menu bar > animate > stop
+        self._menuBarAnimateStop: QAction = QAction(self._menuBarAnimate)
+        self._menuBarAnimateStop.setText('Stop')
+        self._menuBarAnimate.addAction(self._menuBarAnimateStop) # type: ignore
+
         # menu bar > options
         self._menuBarOptions: QMenu = QMenu(self._menuBar)
         self._menuBarOptions.setTitle('Options')
@@ -468,6 +498,7 @@ class MainWindowShell(QMainWindow):
 
         # dialogs
         self._solverDialog: SolverDialog = SolverDialog(self)
+        self._jobQueueDialog: JobQueueDialog = JobQueueDialog(self)
         self._optionsCommonDialog: OptionsCommonDialog = OptionsCommonDialog(self)
         self._optionsResultDialog: OptionsResultDialog = OptionsResultDialog(self)
         self._aboutDialog: AboutDialogShell = AboutDialogShell(self)
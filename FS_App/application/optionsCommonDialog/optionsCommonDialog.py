@@ -46,6 +46,7 @@ class OptionsCommonDialog(OptionsCommonDialogShell):
         self.setBoxColor(self._background2Box, Viewport.background2())
         self.setBoxColor(self._foregroundBox, Viewport.foreground())
         self._fontSizeBox.setValue(Viewport.fontSize())
+        self._levelOfDetailBox.setValue(Viewport.levelOfDetailThreshold())
         # setup connections
         Viewport.registerCallback(self.onViewportOptionChanged)
         self._gridLinesVisibleBox.stateChanged.connect(self.onGridLinesVisible)            # type: ignore
@@ -61,6 +62,7 @@ class OptionsCommonDialog(OptionsCommonDialogShell):
         self._background2Box.clicked.connect(self.onBackground2)                           # type: ignore
         self._foregroundBox.clicked.connect(self.onForeground)                             # type: ignore
         self._fontSizeBox.valueChanged.connect(self.onFontSize)                            # type: ignore
+        self._levelOfDetailBox.valueChanged.connect(self.onLevelOfDetail)                  # type: ignore
 
     def getColor(self, widget: QCheckBox) -> QColor:
         '''Launches the QColorDialog.'''
@@ -86,6 +88,7 @@ class OptionsCommonDialog(OptionsCommonDialogShell):
             case 'Background2': self.setBoxColor(self._background2Box, optionValue)
             case 'Foreground': self.setBoxColor(self._foregroundBox, optionValue)
             case 'FontSize': self._fontSizeBox.setValue(optionValue)
+            case 'LevelOfDetailThreshold': self._levelOfDetailBox.setValue(optionValue)
             case _: pass
 
     def onGridLinesVisible(self) -> None:
@@ -144,3 +147,7 @@ class OptionsCommonDialog(OptionsCommonDialogShell):
     def onFontSize(self) -> None:
         '''On font size box value changed.'''
         Viewport.setFontSize(self._fontSizeBox.value())
+
+    def onLevelOfDetail(self) -> None:
+        '''On level of detail box value changed.'''
+        Viewport.setLevelOfDetailThreshold(self._levelOfDetailBox.value())
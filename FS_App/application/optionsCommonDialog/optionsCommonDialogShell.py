@@ -15,7 +15,8 @@ class OptionsCommonDialogShell(QDialog):
 #       '_cellColorBox', '_gridGlyphsGroupBox', '_gridGlyphsGroupBoxLayout', '_pointScaleLabel', '_pointScaleBox',
 #       '_arrowScaleLabel', '_arrowScaleBox', '_viewportGroupBox', '_viewportGroupBoxLayout', '_projectionLabel',
 #       '_projectionBox', '_lightingLabel', '_lightingBox', '_backgroundLabel', '_background1Box', '_background2Box',
-#       '_foregroundLabel', '_foregroundBox', '_fontSizeLabel', '_fontSizeBox'
+#       '_foregroundLabel', '_foregroundBox', '_fontSizeLabel', '_fontSizeBox', '_levelOfDetailLabel',
+#       '_levelOfDetailBox'
 #   )
 
     def __init__(self, parent: QWidget | None = None) -> None:
@@ -197,3 +198,16 @@ class OptionsCommonDialogShell(QDialog):
         # foreground box
         self._foregroundBox: QCheckBox = QCheckBox(self._viewportGroupBox)
         self._viewportGroupBoxLayout.addWidget(self._foregroundBox, 5, 1)
+
+        # level of detail label
+        self._levelOfDetailLabel: QLabel = QLabel(self._viewportGroupBox)
+        self._levelOfDetailLabel.setText('LOD Threshold (Cells):')
+        self._viewportGroupBoxLayout.addWidget(self._levelOfDetailLabel, 6, 0)
+
+        # level of detail box
+        self._levelOfDetailBox: QSpinBox = QSpinBox(self._viewportGroupBox)
+        self._levelOfDetailBox.setMinimum(0)
+        self._levelOfDetailBox.setMaximum(1000000000)
+        self._levelOfDetailBox.setSingleStep(100000)
+        self._levelOfDetailBox.setSpecialValueText('Off')
+        self._viewportGroupBoxLayout.addWidget(self._levelOfDetailBox, 6, 1)
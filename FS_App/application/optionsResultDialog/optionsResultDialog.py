@@ -9,13 +9,15 @@ class OptionsResultDialog(OptionsResultDialogShell):
     '''
 
     # attribute slots
-    __slots__ = ()
+    __slots__ = ('_scaleFactorSliderRange',)
 
     def __init__(self, parent: QWidget | None = None) -> None:
         '''Options > result dialog constructor.'''
         super().__init__(parent)
         # initial setup
+        self._scaleFactorSliderRange: float = 1.0
         self._scaleFactorBox.setText(str(Viewport.deformationScaleFactor()))
+        self.setScaleFactorSliderRange(Viewport.deformationScaleFactor())
         self._showMaxBox.setChecked(Viewport.showMaxPointLabel())
         self._showMinBox.setChecked(Viewport.showMinPointLabel())
         self._customLimitsBox.setChecked(Viewport.useCustomLimits())
@@ -31,6 +33,7 @@ class OptionsResultDialog(OptionsResultDialogShell):
         # connections
         Viewport.registerCallback(self.onViewportOptionChanged)
         self._scaleFactorBox.editingFinished.connect(self.onScaleFactor)       # type: ignore
+        self._scaleFactorSlider.valueChanged.connect(self.onScaleFactorSlider) # type: ignore
         self._showMaxBox.stateChanged.connect(self.onShowMax)                  # type: ignore
         self._showMinBox.stateChanged.connect(self.onShowMin)                  # type: ignore
         self._customLimitsBox.stateChanged.connect(self.onCustomLimits)        # type: ignore
@@ -45,7 +48,9 @@ class OptionsResultDialog(OptionsResultDialogShell):
     def onViewportOptionChanged(self, optionName: str, optionValue: Any) -> None:
         '''On viewport global option changed.'''
         match optionName:
-            case 'DeformationScaleFactor': self._scaleFactorBox.setText(str(optionValue))
+            case 'DeformationScaleFactor':
+                self._scaleFactorBox.setText(str(optionValue))
+                self.setScaleFactorSliderPosition(optionValue)
             case 'ShowMaxPointLabel': self._showMaxBox.setChecked(optionValue)
             case 'ShowMinPointLabel': self._showMinBox.setChecked(optionValue)
             case 'UseCustomLimits': self._customLimitsBox.setChecked(optionValue)
@@ -60,9 +65,30 @@ class OptionsResultDialog(OptionsResultDialogShell):
 
     def onScaleFactor(self) -> None:
         '''On scale factor box editing finished.'''
-        try: Viewport.setDeformationScaleFactor(float(self._scaleFactorBox.text()))
+        try:
+            scaleFactor: float = float(self._scaleFactorBox.text())
+            self.setScaleFactorSliderRange(scaleFactor)
+            Viewport.setDeformationScaleFactor(scaleFactor)
         except: self._scaleFactorBox.setText(str(Viewport.deformationScaleFactor()))
 
+    def onScaleFactorSlider(self) -> None:
+        '''On scale factor slider value changed (the grid deformation is updated while dragging).'''
+        fraction: float = self._scaleFactorSlider.value()/self._scaleFactorSlider.maximum()
+        Viewport.setDeformationScaleFactor(float(f'{fraction*self._scaleFactorSliderRange:.4g}'))
+
+    def setScaleFactorSliderRange(self, scaleFactor: float) -> None:
+        '''Sets the slider range from zero to twice the specified (typed) scale factor.'''
+        self._scaleFactorSliderRange = 2.0*abs(scaleFactor) if scaleFactor != 0.0 else 1.0
+        self.setScaleFactorSliderPosition(scaleFactor)
+
+    def setScaleFactorSliderPosition(self, scaleFactor: float) -> None:
+        '''Moves the slider to the specified scale factor (without changing the scale factor).'''
+        self._scaleFactorSlider.blockSignals(True)
+        self._scaleFactorSlider.setValue(
+            round(self._scaleFactorSlider.maximum()*abs(scaleFactor)/self._scaleFactorSliderRange)
+        )
+        self._scaleFactorSlider.blockSignals(False)
+
     def onShowMax(self) -> None:
         '''On show max box state changed.'''
         Viewport.setShowMaxPointLabel(self._showMaxBox.isChecked())
@@ -1,8 +1,9 @@
 from visualization import Colormaps
 from PySide6.QtWidgets import (
     QWidget, QDialog, QVBoxLayout, QGridLayout, QGroupBox, QLabel, QLineEdit, QCheckBox, QSizePolicy, QComboBox,
-    QSpinBox
+    QSpinBox, QSlider
 )
+from PySide6.QtCore import Qt
 
 class OptionsResultDialogShell(QDialog):
     '''
@@ -16,7 +17,8 @@ class OptionsResultDialogShell(QDialog):
 #       '_customLimitsLabel', '_customLimitsBox', '_maxLimitLabel', '_maxLimitBox', '_minLimitLabel', '_minLimitBox',
 #       '_scalarBarGroupBox', '_scalarBarGroupBoxLayout', '_numberFormatLabel', '_numberFormatBox',
 #       '_decimalPlacesLabel', '_decimalPlacesBox', '_colormapLabel', '_colormapBox', '_intervalsLabel',
-#       '_intervalsBox', '_reverseColormapLabel', '_reverseColormapBox'
+#       '_intervalsBox', '_reverseColormapLabel', '_reverseColormapBox', '_scaleFactorSliderLabel',
+#       '_scaleFactorSlider'
 #   )
 
     def __init__(self, parent: QWidget | None = None) -> None:
@@ -50,6 +52,19 @@ class OptionsResultDialogShell(QDialog):
         self._scaleFactorBox.setSizePolicy(QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
         self._deformationGroupBoxLayout.addWidget(self._scaleFactorBox, 0, 1)
 
+        # scale factor slider label
+        self._scaleFactorSliderLabel: QLabel = QLabel(self._deformationGroupBox)
+        self._scaleFactorSliderLabel.setText('Scale Slider:')
+        self._deformationGroupBoxLayout.addWidget(self._scaleFactorSliderLabel, 1, 0)
+
+        # scale factor slider
+        self._scaleFactorSlider: QSlider = QSlider(Qt.Orientation.Horizontal, self._deformationGroupBox)
+        self._scaleFactorSlider.setMinimum(0)
+        self._scaleFactorSlider.setMaximum(200)
+        self._scaleFactorSlider.setSingleStep(1)
+        self._scaleFactorSlider.setPageStep(20)
+        self._deformationGroupBoxLayout.addWidget(self._scaleFactorSlider, 1, 1)
+
         # limits group box
         self._limitsGroupBox: QGroupBox = QGroupBox(self)
         self._limitsGroupBox.setTitle('Limits')
@@ -1,8 +1,12 @@
+import os
 import sys
-import os.path
-from process import Subprocess
+import time
+from typing import cast
+from inputOutput import FSReader
+from process import Subprocess, Executables, TelemetrySampler, ResultCache, SolverProgress, CostPredictor
 from application.solverDialog.solverDialogShell import SolverDialogShell
-from PySide6.QtWidgets import QWidget, QFileDialog
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import QWidget, QFileDialog, QScrollBar
 from PySide6.QtCore import QTimer
 
 class SolverDialog(SolverDialogShell):
@@ -13,7 +17,8 @@ class SolverDialog(SolverDialogShell):
     # attribute slots
     __slots__ = (
         '_timer', '_solverProcess', '_modelDatabaseFile', '_solverJobInputFile', '_outputDatabaseFile', '_logFile',
-        '_runSolverNext'
+        '_runSolverNext', '_logOffset', '_telemetrySampler', '_cacheKey', '_progress',
+        '_cost', '_solverStartTime'
     )
 
     def __init__(self, parent: QWidget | None = None) -> None:
@@ -24,9 +29,19 @@ class SolverDialog(SolverDialogShell):
         self._solverJobInputFile: str | None = None
         self._outputDatabaseFile: str | None = None
         self._logFile:            str | None = None
+        # number of log file bytes shown in the log box (-1 while no log is shown)
+        self._logOffset: int = -1
         # solver process
         self._runSolverNext: bool = False
         self._solverProcess: Subprocess = Subprocess()
+        self._telemetrySampler: TelemetrySampler | None = None
+        # result cache key of the current job (while it is being solved)
+        self._cacheKey: str | None = None
+        # solver progress (parsed from the progress markers in the log)
+        self._progress: SolverProgress = SolverProgress()
+        # cost prediction of the current model database (and start time of the solver run that calibrates it)
+        self._cost: CostPredictor | None = None
+        self._solverStartTime: float | None = None
         # timer
         self._timer: QTimer = QTimer(self)
         self._timer.timeout.connect(self.onTimerTimeout) # type: ignore
@@ -37,6 +52,7 @@ class SolverDialog(SolverDialogShell):
         self._terminateSolverButton.clicked.connect(self.onTerminateSolver)         # type: ignore
         self._openOutputDatabaseButton.clicked.connect(self.onOpenOutputDatabase)   # type: ignore
         self._openModelDatabaseButton.clicked.connect(self.onOpenModelDatabase)     # type: ignore
+        self._renumberNodesBox.toggled.connect(self.onRenumberNodesToggled)         # type: ignore
 
     def onTimerTimeout(self) -> None:
         '''
@@ -54,6 +70,9 @@ class SolverDialog(SolverDialogShell):
         self._eigenvaluesGroupBox.setVisible(not self._staticButton.isChecked())
         self._startSolverButton.setEnabled(not self._solverProcess.isAlive())
         self._writeSolverJobInputButton.setEnabled(not self._solverProcess.isAlive())
+        self._keepSolverJobInputBox.setEnabled(not self._solverProcess.isAlive() and hasattr(os, 'mkfifo'))
+        self._forceSolveBox.setEnabled(not self._solverProcess.isAlive())
+        self._renumberNodesBox.setEnabled(not self._solverProcess.isAlive())
         self._terminateSolverButton.setEnabled(self._solverProcess.isAlive())
         self._openOutputDatabaseButton.setEnabled(
             bool(self._outputDatabaseFile and os.path.isfile(self._outputDatabaseFile))
@@ -65,6 +84,12 @@ class SolverDialog(SolverDialogShell):
         self._outputDatabaseBox.setText(self._outputDatabaseFile if self._outputDatabaseFile else '...')
         self._logFileBox.setText(self._logFile if self._logFile else '...')
 
+        # stop telemetry once the preprocessor/solver has exited
+        if self._telemetrySampler and not self._solverProcess.isAlive(): self.stopTelemetry()
+
+        # update log (and progress)
+        self.updateLog()
+
         # check if preprocessor/solver is successfully done
         if self._solverProcess.exitCode() == 0:
             # append CPU time to log
@@ -72,22 +97,94 @@ class SolverDialog(SolverDialogShell):
                 with open(self._logFile, 'a') as file:
                     cpuTime: float = float(self._timeBox.text()[:-2])
                     file.write('Elapsed CPU time: ' + ('<250 ms' if cpuTime == 0 else self._timeBox.text()) + '\n\n')
+            # record the time spent per solver phase
+            if self._progress.phaseCount > 0 and not self._progress.isFinished:
+                self._progress.finish()
+                if self._logFile:
+                    with open(self._logFile, 'a') as file:
+                        file.write(self._progress.report() + '\n')
             # reset exit code to None
             self._solverProcess.terminate()
-            # run solver if requested
+            # run solver if requested (unless its results are cached)
             if self._runSolverNext:
                 self._timeBox.setText('0 s')
-                self.startSolver()
-
-        # update log
-        if self._logFile and os.path.isfile(self._logFile):
-            with open(self._logFile, 'r') as log:
-                logText: str = log.read()
-                if logText != self._logBox.toPlainText():
-                    self._logBox.setPlainText(logText)
-                    self._logBox.verticalScrollBar().setValue(self._logBox.verticalScrollBar().maximum())
-        else:
-            self._logBox.setPlainText('...')
+                if not self.fetchCachedResults(): self.startSolver()
+            # store the results of a finished solver run
+            elif self._cacheKey and self._outputDatabaseFile:
+                try: ResultCache.store(self._cacheKey, self._outputDatabaseFile)
+                except OSError: pass
+                self._cacheKey = None
+
+        # show progress (and cost prediction)
+        self.updateProgress()
+        self.updatePrediction()
+
+        # poll fast while a process is alive, idle otherwise
+        interval: int = 250 if self._solverProcess.isAlive() or self._runSolverNext else 1000
+        if self._timer.interval() != interval: self._timer.setInterval(interval)
+
+    def updateLog(self) -> None:
+        '''
+        Appends the bytes written to the log file since the last update to the log box.
+        The log box is reset when the log file is truncated (a new job has started) or removed.
+        '''
+        # get log file size
+        try:
+            size: int = os.path.getsize(self._logFile) if self._logFile else -1
+        except OSError:
+            size = -1
+        if size < 0:
+            if self._logOffset != -1:
+                self._logOffset = -1
+                self._logBox.setPlainText('...')
+            return
+        # log file is shown for the first time or was truncated
+        if self._logOffset < 0 or size < self._logOffset:
+            self._logOffset = 0
+            self._logBox.clear()
+        if size == self._logOffset: return
+        # read appended bytes only (up to the last complete line)
+        with open(cast(str, self._logFile), 'rb') as log:
+            log.seek(self._logOffset)
+            data: bytes = log.read(size - self._logOffset)
+        end: int = data.rfind(b'\n') + 1
+        if end == 0: return
+        self._logOffset += end
+        # parse progress markers (not shown)
+        text: str = self._progress.feed(data[:end].decode(errors='replace').replace('\r\n', '\n'))
+        if not text: return
+        # append to log box (keeping the view at the bottom if it was there)
+        scrollBar: QScrollBar = self._logBox.verticalScrollBar()
+        atBottom: bool = scrollBar.value() == scrollBar.maximum()
+        self._logBox.moveCursor(QTextCursor.MoveOperation.End)
+        self._logBox.insertPlainText(text)
+        if atBottom: scrollBar.setValue(scrollBar.maximum())
+
+    def updateProgress(self) -> None:
+        '''Shows the solver progress (current phase, completed fraction and estimated time remaining).'''
+        value: int = round(1000*self._progress.fraction())
+        if self._progressBar.value() != value: self._progressBar.setValue(value)
+        phase: str = (
+            f'{self._progress.phaseName} ({self._progress.phaseIndex}/{self._progress.phaseCount}): '
+            if self._progress.phaseName and not self._progress.isFinished else ''
+        )
+        if self._progressBar.format() != phase + '%p%': self._progressBar.setFormat(phase + '%p%')
+        eta: float | None = self._progress.eta() if self._solverProcess.isAlive() else None
+        self._etaBox.setText(
+            '-' if eta is None else f'{int(eta)//3600}:{int(eta)%3600//60:02d}:{int(eta)%60:02d}'
+        )
+
+    def updatePrediction(self) -> None:
+        '''Shows the predicted solve time and memory of the current model database (for the selected analysis).'''
+        if not self._cost:
+            self._predictedTimeBox.setText('-')
+            self._predictedMemoryBox.setText('-')
+            return
+        self._cost.analysisType = self.analysisType()
+        self._cost.eigenvalues = self._eigenvaluesBox.value()
+        uncalibrated: str = '' if self._cost.isCalibrated() else ' (uncalibrated)'
+        self._predictedTimeBox.setText(CostPredictor.formatTime(self._cost.time()) + uncalibrated)
+        self._predictedMemoryBox.setText(f'{self._cost.memory():.0f} MB{uncalibrated}')
 
     def onStartSolver(self) -> None:
         '''On start solver button clicked.'''
@@ -99,6 +196,10 @@ class SolverDialog(SolverDialogShell):
         self._writeSolverJobInputButton.setEnabled(False)
         self.startPreprocessor(preprocessorOnly=True)
 
+    def onRenumberNodesToggled(self) -> None:
+        '''On renumber nodes box toggled (the renumbering changes the predicted cost).'''
+        if self._cost: self.analyzeCost()
+
     def onTerminateSolver(self) -> None:
         '''On terminate solver button clicked.'''
         if not self._solverProcess.isAlive():
@@ -107,6 +208,7 @@ class SolverDialog(SolverDialogShell):
         self._terminateSolverButton.setEnabled(False)
         # terminate process
         self._solverProcess.terminate()
+        self.stopTelemetry()
 
     def onOpenOutputDatabase(self) -> None:
         '''On open output database button clicked.'''
@@ -130,32 +232,102 @@ print("Output database opened: '{self._outputDatabaseFile}'")
             self._solverJobInputFile = os.path.splitext(filePath)[0] + '.fs_job'
             self._outputDatabaseFile = os.path.splitext(filePath)[0] + '.fs_odb'
             self._logFile            = os.path.splitext(filePath)[0] + '.fs_log'
+            self._logOffset          = -1
+            self._logBox.setPlainText('...')
+            self._progress           = SolverProgress()
+            self.analyzeCost()
+
+    def analyzeCost(self) -> None:
+        '''Analyzes the problem size of the model database, as renumbered by the preprocessor (cost prediction).'''
+        self._cost = None
+        if not self._modelDatabaseFile: return
+        try:
+            self._cost = CostPredictor(
+                FSReader.readModelDatabase(self._modelDatabaseFile),
+                self.analysisType(),
+                self._eigenvaluesBox.value(),
+                self.renumbering()
+            )
+        except Exception as error:
+            print(f'Unable to predict the solve cost: {error}')
 
     def startPreprocessor(self, preprocessorOnly: bool = False) -> None:
         '''Starts the preprocessor process.'''
         # check for file paths
-        if not self._modelDatabaseFile or not self._solverJobInputFile or not self._logFile:
+        if (
+            not self._modelDatabaseFile or not self._solverJobInputFile or not self._outputDatabaseFile or
+            not self._logFile
+        ):
             raise RuntimeError('a model database must first be specified')
         # check for a running process
         if self._solverProcess.isAlive():
             raise RuntimeError('a solver process has already been created')
-        # start process
-        self._runSolverNext = not preprocessorOnly
+        # stream the solver job input through a named pipe if it does not have to be kept
+        streamSolverJobInput: bool = (
+            not preprocessorOnly and not self._keepSolverJobInputBox.isChecked() and hasattr(os, 'mkfifo')
+        )
+        pipelineArgs: tuple[str, ...] = (
+            'pipe',
+            Executables.solver(),
+            self._outputDatabaseFile,
+            str(self._eigenvaluesBox.value())
+        ) if streamSolverJobInput else ()
+        # start process (in pipeline mode the preprocessor starts the solver)
+        self._runSolverNext = not preprocessorOnly and not streamSolverJobInput
+        self._cacheKey = None
+        self._timer.setInterval(250)
+        # the preprocessor truncates the log file
+        self._logOffset = -1
+        self._progress = SolverProgress(self.analysisType() if streamSolverJobInput else '')
         self._solverProcess.start(
-            exe='./fs_preprocessor.exe',
+            exe=Executables.preprocessor(),
             args=(
-                f'"{self._modelDatabaseFile}"',
-                f'"{self._solverJobInputFile}"',
-                f'"{self._logFile}"',
-                (
-                    'static'    if self._staticButton.isChecked()    else
-                    'frequency' if self._frequencyButton.isChecked() else
-                    'buckle'    if self._buckleButton.isChecked()    else
-                    'undefined'
-                ),
-                str(sys.tracebacklimit)
-            )
+                self._modelDatabaseFile,
+                self._solverJobInputFile,
+                self._logFile,
+                self.analysisType(),
+                str(sys.tracebacklimit),
+                *pipelineArgs
+            ),
+            env={'FS_RENUMBER': self.renumbering()}
         )
+        self.startTelemetry('preprocessor' if not streamSolverJobInput else 'preprocessor and solver', append=False)
+
+    def renumbering(self) -> str:
+        '''Returns the selected node renumbering method of the preprocessor.'''
+        return 'rcm' if self._renumberNodesBox.isChecked() else 'none'
+
+    def analysisType(self) -> str:
+        '''Returns the selected analysis type.'''
+        return (
+            'static'    if self._staticButton.isChecked()    else
+            'frequency' if self._frequencyButton.isChecked() else
+            'buckle'    if self._buckleButton.isChecked()    else
+            'undefined'
+        )
+
+    def fetchCachedResults(self) -> bool:
+        '''
+        Computes the result cache key of the current solver job input and, unless a re-solve is forced,
+        copies the cached output database of an identical job. Returns True if the solver run can be skipped.
+        '''
+        self._cacheKey = None
+        if not self._solverJobInputFile or not self._outputDatabaseFile or not ResultCache.isEnabled(): return False
+        try:
+            self._cacheKey = ResultCache.key(
+                self._solverJobInputFile, self.analysisType(), self._eigenvaluesBox.value(), Executables.solver()
+            )
+        except OSError:
+            return False
+        if self._forceSolveBox.isChecked() or not ResultCache.fetch(self._cacheKey, self._outputDatabaseFile):
+            return False
+        self._runSolverNext = False
+        self._progress.finish(success=False)
+        if self._logFile:
+            with open(self._logFile, 'a') as file:
+                file.write(f'Solver skipped: results taken from the result cache (key: {self._cacheKey})\n\n')
+        self._cacheKey = None
+        return True
 
     def startSolver(self) -> None:
         '''Starts the solver process.'''
@@ -167,20 +339,45 @@ print("Output database opened: '{self._outputDatabaseFile}'")
             raise RuntimeError('a solver process has already been created')
         # start process
         self._runSolverNext = False
+        self._progress = SolverProgress(self.analysisType())
         with open(self._logFile, 'a') as log:
+            if self._cost: log.write(self._cost.report() + '\n')
+            log.flush()
+            self._solverStartTime = time.perf_counter()
             self._solverProcess.start(
-                exe='./fs_solver.exe',
+                exe=Executables.solver(),
                 args=(
-                    f'"{self._solverJobInputFile}"',
-                    f'"{self._outputDatabaseFile}"',
-                    (
-                        'static'    if self._staticButton.isChecked()    else
-                        'frequency' if self._frequencyButton.isChecked() else
-                        'buckle'    if self._buckleButton.isChecked()    else
-                        'undefined'
-                    ),
+                    self._solverJobInputFile,
+                    self._outputDatabaseFile,
+                    self.analysisType(),
                     str(self._eigenvaluesBox.value())
                 ),
                 stdout=log,
                 stderr=log
             )
+        self.startTelemetry('solver', append=True)
+
+    def startTelemetry(self, label: str, append: bool) -> None:
+        '''Starts sampling the resource usage of the current process tree (written next to the log file).'''
+        pid: int | None = self._solverProcess.pid()
+        if pid is None or not self._logFile: return
+        if self._telemetrySampler: self._telemetrySampler.stop()
+        self._telemetrySampler = TelemetrySampler(
+            pid, os.path.splitext(self._logFile)[0] + '.fs_tel', label=label, append=append
+        )
+        self._telemetrySampler.start()
+
+    def stopTelemetry(self) -> None:
+        '''Stops sampling and appends the telemetry report (peak and mean values) to the log file.'''
+        if not self._telemetrySampler: return
+        self._telemetrySampler.stop(self._solverProcess.usage())
+        # calibrate the cost prediction with a completed solver run
+        if self._cost and self._solverStartTime is not None and self._solverProcess.exitCode() == 0:
+            self._cost.record(
+                time.perf_counter() - self._solverStartTime, self._telemetrySampler.summary()['peakMemory']
+            )
+        self._solverStartTime = None
+        if self._logFile:
+            with open(self._logFile, 'a') as file:
+                file.write(self._telemetrySampler.report() + '\n')
+        self._telemetrySampler = None
@@ -1,7 +1,7 @@
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QWidget, QDialog, QGridLayout, QHBoxLayout, QVBoxLayout, QGroupBox, QLabel, QLineEdit, QRadioButton, QFrame,
-    QSizePolicy, QPushButton, QPlainTextEdit, QSpinBox
+    QSizePolicy, QPushButton, QPlainTextEdit, QSpinBox, QCheckBox, QProgressBar
 )
 
 class SolverDialogShell(QDialog):
@@ -13,13 +13,15 @@ class SolverDialogShell(QDialog):
 #   __slots__ = (
 #       '_layout', '_currentJobGroupBox', '_currentJobGroupBoxLayout', '_modelDatabaseLabel', '_modelDatabaseBox',
 #       '_openModelDatabaseButton', '_solverJobInputLabel', '_solverJobInputBox', '_outputDatabaseLabel',
-#       '_outputDatabaseBox', '_logFileLabel', '_logFileBox', '_analysisTypeGroupBox', '_analysisTypeGroupBoxLayout',
-#       '_staticButton', '_frequencyButton', '_buckleButton', '_eigenvaluesGroupBox', '_eigenvaluesGroupBoxLayout',
-#       '_eigenvaluesLabel', '_eigenvaluesBox', '_space', '_processGroupBox', '_processGroupBoxLayout', '_statusLabel',
-#       '_statusBox', '_cpuLabel', '_cpuBox', '_timeLabel', '_timeBox', '_memoryLabel', '_memoryBox',
-#       '_actionsGroupBox', '_actionsGroupBoxLayout', '_startSolverButton', '_terminateSolverButton',
-#       '_writeSolverJobInputButton', '_openOutputDatabaseButton', '_logFrame', '_logFrameLayout', '_logLabel',
-#       '_logBox'
+#       '_outputDatabaseBox', '_logFileLabel', '_logFileBox', '_keepSolverJobInputBox', '_analysisTypeGroupBox',
+#       '_analysisTypeGroupBoxLayout', '_staticButton', '_frequencyButton', '_buckleButton', '_eigenvaluesGroupBox',
+#       '_eigenvaluesGroupBoxLayout', '_eigenvaluesLabel', '_eigenvaluesBox', '_space', '_processGroupBox',
+#       '_processGroupBoxLayout', '_statusLabel', '_statusBox', '_cpuLabel', '_cpuBox', '_timeLabel', '_timeBox',
+#       '_memoryLabel', '_memoryBox', '_actionsGroupBox', '_actionsGroupBoxLayout', '_startSolverButton',
+#       '_terminateSolverButton', '_writeSolverJobInputButton', '_openOutputDatabaseButton', '_logFrame',
+#       '_logFrameLayout', '_logLabel', '_logBox', '_forceSolveBox', '_progressLabel', '_progressBar', '_etaLabel',
+#       '_etaBox', '_predictedTimeLabel', '_predictedTimeBox', '_predictedMemoryLabel', '_predictedMemoryBox',
+#       '_renumberNodesBox'
 #   )
 
     def __init__(self, parent: QWidget | None = None) -> None:
@@ -92,6 +94,33 @@ class SolverDialogShell(QDialog):
         self._logFileBox.setText('...')
         self._currentJobGroupBoxLayout.addWidget(self._logFileBox, 3, 1)
 
+        # keep solver job input box
+        self._keepSolverJobInputBox: QCheckBox = QCheckBox(self._currentJobGroupBox)
+        self._keepSolverJobInputBox.setText('Keep Solver Job Input File')
+        self._keepSolverJobInputBox.setToolTip(
+            'When unchecked, the solver job input is streamed to the solver through a named pipe'
+        )
+        self._keepSolverJobInputBox.setChecked(True)
+        self._currentJobGroupBoxLayout.addWidget(self._keepSolverJobInputBox, 4, 1)
+
+        # force solve box
+        self._forceSolveBox: QCheckBox = QCheckBox(self._currentJobGroupBox)
+        self._forceSolveBox.setText('Force Re-Solve')
+        self._forceSolveBox.setToolTip(
+            'When unchecked, the results of an identical solver job are taken from the result cache (if available)'
+        )
+        self._forceSolveBox.setChecked(False)
+        self._currentJobGroupBoxLayout.addWidget(self._forceSolveBox, 5, 1)
+
+        # renumber nodes box
+        self._renumberNodesBox: QCheckBox = QCheckBox(self._currentJobGroupBox)
+        self._renumberNodesBox.setText('Renumber Nodes')
+        self._renumberNodesBox.setToolTip(
+            'When checked, the preprocessor renumbers the nodes (reverse Cuthill-McKee) to reduce the matrix bandwidth'
+        )
+        self._renumberNodesBox.setChecked(False)
+        self._currentJobGroupBoxLayout.addWidget(self._renumberNodesBox, 6, 1)
+
         # analysis type group box
         self._analysisTypeGroupBox: QGroupBox = QGroupBox(self)
         self._analysisTypeGroupBox.setTitle('Analysis Type')
@@ -213,6 +242,51 @@ class SolverDialogShell(QDialog):
         self._memoryBox.setText('0 MB')
         self._processGroupBoxLayout.addWidget(self._memoryBox, 3, 1)
 
+        # progress label
+        self._progressLabel: QLabel = QLabel(self._processGroupBox)
+        self._progressLabel.setText('Progress:')
+        self._processGroupBoxLayout.addWidget(self._progressLabel, 4, 0)
+
+        # progress bar
+        self._progressBar: QProgressBar = QProgressBar(self._processGroupBox)
+        self._progressBar.setRange(0, 1000)
+        self._progressBar.setValue(0)
+        self._progressBar.setFormat('%p%')
+        self._processGroupBoxLayout.addWidget(self._progressBar, 4, 1)
+
+        # eta label
+        self._etaLabel: QLabel = QLabel(self._processGroupBox)
+        self._etaLabel.setText('Time Remaining:')
+        self._processGroupBoxLayout.addWidget(self._etaLabel, 5, 0)
+
+        # eta box
+        self._etaBox: QLineEdit = QLineEdit(self._processGroupBox)
+        self._etaBox.setReadOnly(True)
+        self._etaBox.setText('-')
+        self._processGroupBoxLayout.addWidget(self._etaBox, 5, 1)
+
+        # predicted time label
+        self._predictedTimeLabel: QLabel = QLabel(self._processGroupBox)
+        self._predictedTimeLabel.setText('Predicted Time:')
+        self._processGroupBoxLayout.addWidget(self._predictedTimeLabel, 6, 0)
+
+        # predicted time box
+        self._predictedTimeBox: QLineEdit = QLineEdit(self._processGroupBox)
+        self._predictedTimeBox.setReadOnly(True)
+        self._predictedTimeBox.setText('-')
+        self._processGroupBoxLayout.addWidget(self._predictedTimeBox, 6, 1)
+
+        # predicted memory label
+        self._predictedMemoryLabel: QLabel = QLabel(self._processGroupBox)
+        self._predictedMemoryLabel.setText('Predicted Memory:')
+        self._processGroupBoxLayout.addWidget(self._predictedMemoryLabel, 7, 0)
+
+        # predicted memory box
+        self._predictedMemoryBox: QLineEdit = QLineEdit(self._processGroupBox)
+        self._predictedMemoryBox.setReadOnly(True)
+        self._predictedMemoryBox.setText('-')
+        self._processGroupBoxLayout.addWidget(self._predictedMemoryBox, 7, 1)
+
         # actions group box
         self._actionsGroupBox: QGroupBox = QGroupBox(self)
         self._actionsGroupBox.setTitle('Actions')
@@ -264,5 +338,6 @@ class SolverDialogShell(QDialog):
         # log box
         self._logBox: QPlainTextEdit = QPlainTextEdit(self._logFrame)
         self._logBox.setReadOnly(True)
+        self._logBox.setMaximumBlockCount(10000)
         self._logBox.setPlainText('...')
         self._logFrameLayout.addWidget(self._logBox)
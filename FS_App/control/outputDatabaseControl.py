@@ -44,24 +44,35 @@ class OutputDatabaseControl(QTreeWidget):
         self.setCurrentItem(self._rootItem)
         self._outputDatabase = outputDatabase
         if self._outputDatabase:
-            # field output
-            fieldItem: QTreeWidgetItem = QTreeWidgetItem(self._rootItem, ('Field Output',))
-            for frame in range(self._outputDatabase.frameCount):
-                frameItem: QTreeWidgetItem = QTreeWidgetItem(fieldItem, (f'Frame {frame + 1}',)) # 1-based indexing
-                for groupName in self._outputDatabase.nodalScalarFieldGroupNames(frame):
-                    groupItem: QTreeWidgetItem = QTreeWidgetItem(frameItem, (groupName,))
-                    for fieldName in self._outputDatabase.nodalScalarFieldNames(frame, groupName):
-                        QTreeWidgetItem(groupItem, (fieldName,))
-            # history output
-            historyItem: QTreeWidgetItem = QTreeWidgetItem(self._rootItem, ('History Output',))
-            for frame in range(self._outputDatabase.frameCount):
-                frameItem: QTreeWidgetItem = QTreeWidgetItem(historyItem, (f'Frame {frame + 1}',)) # 1-based indexing
-                for historyName in self._outputDatabase.historyNames(frame):
-                    QTreeWidgetItem(frameItem, (historyName,))
+            # field output and history output
+            QTreeWidgetItem(self._rootItem, ('Field Output',))
+            QTreeWidgetItem(self._rootItem, ('History Output',))
+            self.appendFrames()
             # done
             self._rootItem.setText(0, 'Output Database')
             self._rootItem.setExpanded(True)
 
+    def appendFrames(self) -> None:
+        '''
+        Adds the tree widget items of the frames not yet in the tree
+        (the frames of an output database that is still being written are added as they are read).
+        '''
+        if not self._outputDatabase: return
+        # field output
+        fieldItem: QTreeWidgetItem = self._rootItem.child(0)
+        for frame in range(fieldItem.childCount(), self._outputDatabase.frameCount):
+            frameItem: QTreeWidgetItem = QTreeWidgetItem(fieldItem, (f'Frame {frame + 1}',)) # 1-based indexing
+            for groupName in self._outputDatabase.nodalScalarFieldGroupNames(frame):
+                groupItem: QTreeWidgetItem = QTreeWidgetItem(frameItem, (groupName,))
+                for fieldName in self._outputDatabase.nodalScalarFieldNames(frame, groupName):
+                    QTreeWidgetItem(groupItem, (fieldName,))
+        # history output
+        historyItem: QTreeWidgetItem = self._rootItem.child(1)
+        for frame in range(historyItem.childCount(), self._outputDatabase.frameCount):
+            frameItem: QTreeWidgetItem = QTreeWidgetItem(historyItem, (f'Frame {frame + 1}',)) # 1-based indexing
+            for historyName in self._outputDatabase.historyNames(frame):
+                QTreeWidgetItem(frameItem, (historyName,))
+
     def currentSelection(self) -> tuple[Literal['Field', 'History'], tuple[int, str, str] | tuple[int, str]] | None:
         '''Gets the currently selected nodal scalar field.'''
         if not self._outputDatabase: return None
@@ -47,6 +47,16 @@ class DataObject(ABC):
         self._isAssignedGetter: Callable[[DataObject], bool] = isAssignedGetter
         self._callbacks: dict[int, Callable[[str], None]] = {}
 
+    def copyAttributes(self, dataObject: 'DataObject') -> None:
+        '''Copies the attributes (but not the name) of the specified data object, which must be of the same type.'''
+        if type(dataObject) is not type(self):
+            raise ValueError('data object types do not match')
+        for dataObjectType in type(self).__mro__:
+            if dataObjectType is DataObject: break
+            for slot in dataObjectType.__dict__.get('__slots__', ()):
+                value: object = getattr(dataObject, slot)
+                setattr(self, slot, value.copy() if isinstance(value, set) else value)
+
     def notifyPropertyChanged(self, propertyName: str) -> None:
         '''This method is called when a property has changed its value.'''
         for callback in self._callbacks.values(): callback(propertyName)
@@ -1,4 +1,3 @@
-from vtkmodules.vtkCommonDataModel import VTK_TRIANGLE, VTK_QUAD, VTK_TETRA, VTK_PYRAMID, VTK_WEDGE, VTK_HEXAHEDRON
 from dataModel.modelingSpaces import ModelingSpaces
 from dataModel.elementTypes import ElementTypes
 
@@ -15,6 +14,10 @@ class Element:
     @property
     def cellType(self) -> int:
         '''Corresponding VTK cell type.'''
+        # imported here so that the data model can be used without VTK (e.g. headless batch runs)
+        from vtkmodules.vtkCommonDataModel import (
+            VTK_TRIANGLE, VTK_QUAD, VTK_TETRA, VTK_PYRAMID, VTK_WEDGE, VTK_HEXAHEDRON
+        )
         match self._elementType:
             case ElementTypes.E2D3: return VTK_TRIANGLE
             case ElementTypes.E2D4: return VTK_QUAD
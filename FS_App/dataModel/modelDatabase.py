@@ -141,6 +141,28 @@ class ModelDatabase:
             BoundaryCondition, 'Boundary Conditions', 'Boundary-Condition-', self.isAssigned
         )
 
+    def containers(self) -> tuple[DataObjectContainer, ...]:
+        '''Returns all data object containers.'''
+        return (
+            self._nodeSets, self._elementSets, self._surfaceSets, self._materials, self._sections,
+            self._concentratedLoads, self._pressures, self._surfaceTractions, self._bodyLoads, self._boundaryConditions
+        )
+
+    def copy(self, mesh: Mesh | None = None) -> 'ModelDatabase':
+        '''
+        Returns a copy of the model database. The finite element mesh is shared (it is never modified),
+        while the data objects are copied, so that the copy can be modified independently (e.g. in parameter sweeps).
+        If a mesh is given, the copy uses it instead (e.g. a renumbered mesh; the indices of the sets are kept).
+        '''
+        modelDatabase: ModelDatabase = ModelDatabase(mesh if mesh else self._mesh)
+        modelDatabase.filePath = self._filePath
+        for source, target in zip(self.containers(), modelDatabase.containers()):
+            for dataObject in source.dataObjects():
+                newDataObject: DataObject = target.new()
+                newDataObject.name = dataObject.name
+                newDataObject.copyAttributes(dataObject)
+        return modelDatabase
+
     def isAssigned(self, dataObject: DataObject) -> bool:
         '''Determines if the specified data object is currently assigned.'''
         match dataObject:
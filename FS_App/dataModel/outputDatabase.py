@@ -1,3 +1,4 @@
+import numpy as np
 from collections.abc import Sequence
 from dataModel.mesh import Mesh
 
@@ -42,32 +43,87 @@ class OutputDatabase:
         '''Output database constructor.'''
         self._filePath: str = ''
         self._mesh: Mesh = mesh
-        self._frameCount: int = frameCount
-        self._frameDescriptions: tuple[str, ...] = tuple(frameDescriptions[0:frameCount])
-        self._historyData: tuple[dict[str, float], ...] = tuple({} for _ in range(frameCount))
-        self._fieldData: tuple[dict[str, dict[str, tuple[float, ...]]], ...] = tuple({} for _ in range(frameCount))
+        self._frameCount: int = 0
+        self._frameDescriptions: tuple[str, ...] = ()
+        self._historyData: tuple[dict[str, float], ...] = ()
+        self._fieldData: tuple[dict[str, dict[str, np.ndarray]], ...] = ()
         # convert input data
+        self.appendFrames(
+            frameDescriptions[0:frameCount], historyOutputDescriptions, fieldOutputDescriptions,
+            historyOutput[0:frameCount], fieldOutput[0:frameCount]
+        )
+
+    def appendFrames(
+        self,
+        frameDescriptions: Sequence[str],
+        historyOutputDescriptions: Sequence[str],
+        fieldOutputDescriptions: Sequence[str],
+        historyOutput: Sequence[Sequence[float]],
+        fieldOutput: Sequence[Sequence[Sequence[float]]]
+    ) -> None:
+        '''
+        Appends output frames (e.g. the frames of an output database file that is still being written).
+        The field output values are given per node of the output database mesh
+        (they are stored as a contiguous NumPy array per nodal scalar field).
+        '''
+        frameCount: int = len(frameDescriptions)
+        historyData: tuple[dict[str, float], ...] = tuple({} for _ in range(frameCount))
+        fieldData: tuple[dict[str, dict[str, np.ndarray]], ...] = tuple({} for _ in range(frameCount))
         for frame in range(frameCount):
             # convert history output data
             for i, description in enumerate(historyOutputDescriptions):
-                self._historyData[frame][description] = historyOutput[frame][i]
-            # convert field output data
+                historyData[frame][description] = historyOutput[frame][i]
+            # convert field output data (values per node and field)
+            values: np.ndarray = np.array(fieldOutput[frame], dtype=np.float64).reshape(
+                len(fieldOutput[frame]), len(fieldOutputDescriptions)
+            )
             for i, description in enumerate(fieldOutputDescriptions):
                 groupName, fieldName = description.split(':')
-                if groupName not in self._fieldData[frame]: self._fieldData[frame][groupName] = {}
-                self._fieldData[frame][groupName][fieldName] = tuple(x[i] for x in fieldOutput[frame])
+                if groupName not in fieldData[frame]: fieldData[frame][groupName] = {}
+                fieldData[frame][groupName][fieldName] = np.ascontiguousarray(values[:, i])
+        self._frameCount += frameCount
+        self._frameDescriptions += tuple(frameDescriptions)
+        self._historyData += historyData
+        self._fieldData += fieldData
+
+    def restoreOrder(self, nodeOrder: Sequence[int], elementOrder: Sequence[int] | None = None) -> None:
+        '''
+        Restores the original node (and element) order of an output database solved with a renumbered mesh.
+        The orders give the original index of every node (element) of the renumbered mesh.
+        '''
+        nodeCount: int = len(self._mesh.nodes)
+        elementCount: int = len(self._mesh.elements)
+        if len(nodeOrder) != nodeCount or (elementOrder is not None and len(elementOrder) != elementCount):
+            raise ValueError('the renumbering does not match the output database mesh')
+        # mesh
+        nodeData: list[tuple[float, float, float]] = [(0.0, 0.0, 0.0)]*nodeCount
+        for node, originalIndex in zip(self._mesh.nodes, nodeOrder): nodeData[originalIndex] = node.coordinates
+        elementData: list[tuple[str, tuple[int, ...]]] = [('', ())]*elementCount
+        for i, element in enumerate(self._mesh.elements):
+            elementData[elementOrder[i] if elementOrder is not None else i] = (
+                element.elementType.name, tuple(nodeOrder[x] for x in element.nodeIndices)
+            )
+        self._mesh = Mesh(self._mesh.modelingSpace, nodeData, elementData)
+        # nodal fields
+        order: np.ndarray = np.asarray(nodeOrder, dtype=np.int64)
+        for fieldData in self._fieldData:
+            for group in fieldData.values():
+                for fieldName, values in group.items():
+                    originalValues: np.ndarray = np.empty_like(values)
+                    originalValues[order] = values
+                    group[fieldName] = originalValues
 
-    def nodalDisplacements(self, frame: int) -> tuple[tuple[float, float, float], ...]:
-        '''Returns the nodal displacements for the specified frame.'''
+    def nodalDisplacements(self, frame: int) -> np.ndarray:
+        '''Returns the nodal displacements for the specified frame (array of shape: number of nodes, 3).'''
         if 'Displacement' in self._fieldData[frame]:
             if all(x in self._fieldData[frame]['Displacement'] for x in (
                 'Displacement in X', 'Displacement in Y', 'Displacement in Z'
             )):
-                return tuple((
-                    self._fieldData[frame]['Displacement']['Displacement in X'][i],
-                    self._fieldData[frame]['Displacement']['Displacement in Y'][i],
-                    self._fieldData[frame]['Displacement']['Displacement in Z'][i],
-                ) for i in range(len(self._mesh.nodes)))
+                return np.column_stack((
+                    self._fieldData[frame]['Displacement']['Displacement in X'],
+                    self._fieldData[frame]['Displacement']['Displacement in Y'],
+                    self._fieldData[frame]['Displacement']['Displacement in Z']
+                ))
         raise RuntimeError('output database does not contain nodal displacements')
 
     def frameDescription(self, frame: int) -> str:
@@ -82,8 +138,8 @@ class OutputDatabase:
         '''Returns the nodal scalar field names in the specified group.'''
         return tuple(self._fieldData[frame][groupName].keys())
 
-    def nodalScalarField(self, frame: int, groupName: str, fieldName: str) -> tuple[float, ...]:
-        '''Returns the nodal scalar field values.'''
+    def nodalScalarField(self, frame: int, groupName: str, fieldName: str) -> np.ndarray:
+        '''Returns the nodal scalar field values (array of one value per node).'''
         return self._fieldData[frame][groupName][fieldName]
 
     def historyNames(self, frame: int) -> tuple[str, ...]:
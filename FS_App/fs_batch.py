@@ -0,0 +1,276 @@
+# build command
+# pyinstaller fs_batch.py --clean --noconfirm --console
+
+# Headless batch runs: model files (*.inp or *.fs_mdb) -> preprocessor -> solver -> results summary (JSON/CSV).
+# Neither PySide6 nor VTK are imported, so this can be used on compute nodes and CI machines without a display.
+
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import numpy as np
+from typing import Any, Literal, cast
+from collections.abc import Sequence
+from process import Job, JobQueue, JobStates, Executables, ResultCache, CostPredictor
+from inputOutput import AbaqusReader, FSReader, FSWriter
+from dataModel import ModelDatabase, OutputDatabase
+
+def log(text: str = '') -> None:
+    '''Logs the specified text (to the standard error stream, so that standard output can carry results).'''
+    print(text, file=sys.stderr, flush=True)
+
+def prepareModelDatabase(modelFile: str, outputDirectory: str | None = None, overwrite: bool = False) -> ModelDatabase:
+    '''
+    Converts an Abaqus input file to a model database file (if needed). Returns the model database.
+    The model database file is written to the output directory (if specified; otherwise next to the input file):
+    an existing file is only overwritten if requested.
+    '''
+    if os.path.splitext(modelFile)[1].lower() == '.inp':
+        modelDatabaseFile: str = os.path.splitext(modelFile)[0] + '.fs_mdb'
+        if outputDirectory: modelDatabaseFile = os.path.join(outputDirectory, os.path.basename(modelDatabaseFile))
+        if os.path.exists(modelDatabaseFile) and not overwrite:
+            raise RuntimeError(
+                f"model database file already exists: '{modelDatabaseFile}' (see --overwrite, --output-dir)"
+            )
+        modelDatabase: ModelDatabase = AbaqusReader.readModelDatabase(modelFile)
+        modelDatabase.filePath = modelDatabaseFile
+        if outputDirectory: os.makedirs(outputDirectory, exist_ok=True)
+        FSWriter.writeModelDatabase(modelDatabase)
+        return modelDatabase
+    return FSReader.readModelDatabase(modelFile)
+
+def readJobList(filePath: str) -> list[tuple[str, str, int]]:
+    '''
+    Reads a job list (CSV file with the columns: model, analysis type, number of eigenvalues).
+    Missing models, invalid analysis types and numbers of eigenvalues are reported with their line number.
+    '''
+    jobs: list[tuple[str, str, int]] = []
+    with open(filePath, 'r', newline='') as file:
+        reader = csv.reader(file)
+        for row in reader:
+            if not row or row[0].strip().startswith('#'): continue
+            model: str = row[0].strip()
+            if not model: raise ValueError(f'missing model in job list line {reader.line_num}')
+            analysisType: str = row[1].strip().lower() if len(row) > 1 and row[1].strip() else 'static'
+            if analysisType not in ('static', 'frequency', 'buckle'):
+                raise ValueError(f"invalid analysis type in job list line {reader.line_num}: '{row[1].strip()}'")
+            try:
+                eigenvalues: int = int(row[2]) if len(row) > 2 and row[2].strip() else 10
+            except ValueError:
+                eigenvalues = 0
+            if eigenvalues < 1:
+                raise ValueError(
+                    f"the number of eigenvalues must be positive in job list line {reader.line_num}: '{row[2].strip()}'"
+                )
+            if not os.path.isabs(model): model = os.path.join(os.path.dirname(filePath), model)
+            jobs.append((model, analysisType, eigenvalues))
+    return jobs
+
+def summarizeJob(job: Job, fieldNames: Sequence[str], prediction: tuple[float, float] | None = None) -> dict[str, Any]:
+    '''
+    Summarizes the results of a job: history output per frame and the max/min values (and nodes) of the
+    specified nodal scalar fields ('Group:Field'; all fields if none are specified).
+    The prediction (solve time in seconds and memory in MB, as made before the run) is included if given.
+    '''
+    summary: dict[str, Any] = {
+        'model': job.modelDatabaseFile,
+        'analysisType': job.analysisType,
+        'eigenvalues': job.eigenvalues if job.analysisType != 'static' else None,
+        'state': job.state.name,
+        'exitCode': job.exitCode,
+        'attempts': job.attempts,
+        'cached': job.isCached,
+        'peakMemory': round(job.peakMemory, 1),
+        'cpuTime': round(job.cpuTime, 3),
+        'solveTime': round(job.solveTime, 3),
+        'predictedTime': round(prediction[0], 3) if prediction else None,
+        'predictedMemory': round(prediction[1], 1) if prediction else None,
+        'outputDatabase': job.outputDatabaseFile if job.state == JobStates.Done else None,
+        'error': None,
+        'frames': []
+    }
+    if job.state != JobStates.Done: return summary
+    try:
+        outputDatabase: OutputDatabase = FSReader.readOutputDatabase(job.outputDatabaseFile)
+    except Exception as error:
+        summary['error'] = f'unable to read the output database: {error}'
+        return summary
+    for frame in range(outputDatabase.frameCount):
+        history: dict[str, float] = {
+            name: outputDatabase.history(frame, name) for name in outputDatabase.historyNames(frame)
+        }
+        fields: dict[str, dict[str, float | int]] = {}
+        for groupName in outputDatabase.nodalScalarFieldGroupNames(frame):
+            for fieldName in outputDatabase.nodalScalarFieldNames(frame, groupName):
+                name: str = groupName + ':' + fieldName
+                if fieldNames and name not in fieldNames: continue
+                values: np.ndarray = outputDatabase.nodalScalarField(frame, groupName, fieldName)
+                if values.size == 0 or np.isnan(values).all(): continue
+                maxNode: int = int(np.nanargmax(values))
+                minNode: int = int(np.nanargmin(values))
+                fields[name] = {
+                    'max': float(values[maxNode]), 'maxNode': maxNode, 'min': float(values[minNode]), 'minNode': minNode
+                }
+        summary['frames'].append({
+            'frame': frame,
+            'description': outputDatabase.frameDescription(frame),
+            'history': history,
+            'fields': fields
+        })
+    return summary
+
+def writeJson(summaries: Sequence[dict[str, Any]], filePath: str) -> None:
+    '''Writes the summaries to a JSON file ('-' for the standard output stream).'''
+    if filePath == '-':
+        json.dump(list(summaries), sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        with open(filePath, 'w') as file:
+            json.dump(list(summaries), file, indent=2)
+
+def writeCsv(summaries: Sequence[dict[str, Any]], filePath: str) -> None:
+    '''Writes the summaries to a CSV file (one row per model and frame; '-' for the standard output stream).'''
+    # collect columns (in order of appearance)
+    historyColumns: dict[str, None] = {}
+    fieldColumns: dict[str, None] = {}
+    for summary in summaries:
+        for frame in summary['frames']:
+            historyColumns.update(dict.fromkeys(frame['history']))
+            fieldColumns.update(dict.fromkeys(frame['fields']))
+    header: list[str] = [
+        'model', 'analysisType', 'state', 'error', 'peakMemory', 'cpuTime', 'solveTime', 'predictedTime',
+        'predictedMemory', 'frame', 'description'
+    ]
+    header += list(historyColumns)
+    header += [f'{name} ({x})' for name in fieldColumns for x in ('max', 'maxNode', 'min', 'minNode')]
+    # write rows
+    file = sys.stdout if filePath == '-' else open(filePath, 'w', newline='')
+    try:
+        writer = csv.writer(file)
+        writer.writerow(header)
+        for summary in summaries:
+            common: list[Any] = [
+                summary['model'], summary['analysisType'], summary['state'], summary['error'] or '',
+                summary['peakMemory'], summary['cpuTime'], summary['solveTime'], summary['predictedTime'],
+                summary['predictedMemory']
+            ]
+            if not summary['frames']: writer.writerow(common + [''] * (len(header) - len(common)))
+            for frame in summary['frames']:
+                row: list[Any] = common + [frame['frame'], frame['description']]
+                row += [frame['history'].get(name, '') for name in historyColumns]
+                for name in fieldColumns:
+                    values: dict[str, float | int] = frame['fields'].get(name, {})
+                    row += [values.get(x, '') for x in ('max', 'maxNode', 'min', 'minNode')]
+                writer.writerow(row)
+    finally:
+        if file is not sys.stdout: file.close()
+
+def parseArguments(argv: Sequence[str]) -> argparse.Namespace:
+    '''Parses the command line arguments.'''
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='fs_batch',
+        description='Runs FeaSoft jobs headless (preprocessor and solver) and summarizes their results.'
+    )
+    parser.add_argument('models', nargs='*', help='model files (*.inp or *.fs_mdb)')
+    parser.add_argument('--jobs', help='job list: CSV file with the columns model, analysis type, eigenvalues')
+    parser.add_argument('--output-dir', dest='outputDirectory',
+                        help='directory of the model databases converted from Abaqus input files, and of their job '
+                             'files (default: next to the input files)')
+    parser.add_argument('--overwrite', action='store_true',
+                        help='overwrite existing model database files when converting Abaqus input files')
+    parser.add_argument('--analysis', choices=('static', 'frequency', 'buckle'), default='static',
+                        help='analysis type of the models given on the command line (default: static)')
+    parser.add_argument('--eigenvalues', type=int, default=10,
+                        help='number of eigenvalues of the models given on the command line (default: 10)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='maximum number of concurrent jobs (default: number of physical cores)')
+    parser.add_argument('--memory-reserve', type=float, default=512.0, dest='memoryReserve',
+                        help='memory in MB kept free when starting jobs (default: 512)')
+    parser.add_argument('--threads', type=int, default=None,
+                        help='math library threads per job (default: one per core of the job share)')
+    parser.add_argument('--no-partition', action='store_true', dest='noPartition',
+                        help='do not partition the cores between concurrent jobs (no CPU affinity)')
+    parser.add_argument('--renumber', choices=('none', 'rcm', 'morton'), default='none',
+                        help='renumber nodes and elements to reduce the matrix bandwidth (default: none)')
+    parser.add_argument('--retries', type=int, default=0, help='number of retries of failed jobs (default: 0)')
+    parser.add_argument('--force-solve', action='store_true', dest='forceSolve',
+                        help='solve even if the results of identical jobs are in the result cache')
+    parser.add_argument('--no-cache', action='store_true', dest='noCache', help='do not use the result cache')
+    parser.add_argument('--field', action='append', default=[], dest='fields',
+                        help="nodal scalar field to summarize, as 'Group:Field' (repeatable; default: all fields)")
+    parser.add_argument('--json', help="JSON summary file ('-' for standard output)")
+    parser.add_argument('--csv', help="CSV summary file ('-' for standard output)")
+    parser.add_argument('--preprocessor', help='preprocessor executable (default: FS_PREPROCESSOR, ./fs_preprocessor)')
+    parser.add_argument('--solver', help='solver executable (default: FS_SOLVER, ./fs_solver)')
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    # parse arguments
+    arguments: argparse.Namespace = parseArguments(sys.argv[1:])
+    if arguments.preprocessor: Executables.setPreprocessor(arguments.preprocessor)
+    if arguments.solver: Executables.setSolver(arguments.solver)
+    if arguments.noCache: ResultCache.setEnabled(False)
+    jobList: list[tuple[str, str, int]] = [(x, arguments.analysis, arguments.eigenvalues) for x in arguments.models]
+    if arguments.jobs:
+        try:
+            jobList += readJobList(arguments.jobs)
+        except ValueError as error:
+            log(f'Error: {error}')
+            sys.exit(2)
+    if not jobList:
+        log('Error: no models specified')
+        sys.exit(2)
+
+    # prepare model databases and submit jobs
+    jobQueue: JobQueue = JobQueue(arguments.workers, arguments.memoryReserve, not arguments.noPartition)
+    predictions: dict[Job, tuple[float, float]] = {}
+    modelDatabases: dict[str, ModelDatabase] = {} # per model file (converted once if listed more than once)
+    for modelFile, analysisType, eigenvalues in jobList:
+        log(f"Preparing model: '{modelFile}'")
+        if os.path.abspath(modelFile) not in modelDatabases:
+            try:
+                modelDatabases[os.path.abspath(modelFile)] = prepareModelDatabase(
+                    modelFile, arguments.outputDirectory, arguments.overwrite
+                )
+            except RuntimeError as error:
+                log(f'Error: {error}')
+                sys.exit(2)
+        modelDatabase: ModelDatabase = modelDatabases[os.path.abspath(modelFile)]
+        job: Job = Job(
+            modelDatabase.filePath,
+            cast(Literal['static', 'frequency', 'buckle'], analysisType),
+            eigenvalues,
+            maxRetries=arguments.retries
+        )
+        job.forceSolve = arguments.forceSolve
+        job.threads = arguments.threads
+        job.renumbering = arguments.renumber
+        # predict the solve cost (also used for memory admission)
+        job.cost = CostPredictor(modelDatabase, analysisType, eigenvalues, arguments.renumber)
+        predictions[job] = (job.cost.time(), job.cost.memory())
+        log(job.cost.report().rstrip('\n'))
+        jobQueue.submit(job)
+
+    # run jobs
+    log(f'Running {len(jobList)} job(s) with up to {jobQueue.maxWorkers} worker(s)')
+    startTime: float = time.perf_counter()
+    jobQueue.run()
+    log(f'Jobs finished in {time.perf_counter() - startTime:.2f} s')
+    for job in jobQueue.jobs():
+        log(
+            f"Job '{job.name}': {job.state.name}{' (cached)' if job.isCached else ''} "
+            f"(exit code: {job.exitCode}, log: '{job.logFile}')"
+        )
+
+    # summarize results
+    summaries: list[dict[str, Any]] = [
+        summarizeJob(job, arguments.fields, predictions.get(job)) for job in jobQueue.jobs()
+    ]
+    if arguments.json: writeJson(summaries, arguments.json)
+    if arguments.csv: writeCsv(summaries, arguments.csv)
+    if not arguments.json and not arguments.csv: writeJson(summaries, '-')
+
+    # exit with the number of failed jobs
+    sys.exit(sum(1 for job in jobQueue.jobs() if job.state != JobStates.Done))
@@ -0,0 +1,97 @@
+# build command
+# pyinstaller fs_export.py --clean --noconfirm --console --hidden-import vtkmodules.all
+
+# Headless image export: output database (*.fs_odb) -> PNG images (one per frame and view, e.g. an image sequence).
+# Rendering is off-screen (no window is shown) and runs in parallel worker processes.
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+from collections.abc import Sequence
+from inputOutput import FSReader
+from dataModel import OutputDatabase, ModelingSpaces
+from visualization import Views, OffscreenRenderer
+from visualization.offscreenRenderer import Specification
+
+def log(text: str = '') -> None:
+    '''Logs the specified text (to the standard error stream, so that standard output can carry results).'''
+    print(text, file=sys.stderr, flush=True)
+
+def parseFrames(text: str, frameCount: int) -> list[int]:
+    '''Parses a frame selection: comma separated frame numbers and ranges, 1-based (e.g. '1-10,12'; 'all').'''
+    if text.strip().lower() == 'all': return list(range(frameCount))
+    frames: list[int] = []
+    for part in text.split(','):
+        first, separator, last = part.strip().partition('-')
+        if separator and (not last or int(last) < int(first)):
+            raise ValueError(f"invalid frame range: '{part.strip()}'")
+        frames += range(int(first) - 1, int(last or first))
+    if any(not 0 <= frame < frameCount for frame in frames): raise ValueError(f"frame out of range: '{text}'")
+    return frames
+
+def parseSize(text: str) -> tuple[int, int]:
+    '''Parses an image size (e.g. '1920x1080').'''
+    width, _, height = text.lower().partition('x')
+    return int(width), int(height)
+
+def parseArguments(argv: Sequence[str]) -> argparse.Namespace:
+    '''Parses the command line arguments.'''
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='fs_export',
+        description='Renders FeaSoft output database results off-screen to PNG images.'
+    )
+    parser.add_argument('outputDatabase', help='output database file (*.fs_odb)')
+    parser.add_argument('--field', help="nodal scalar field, as 'Group:Field' (default: deformed grid only)")
+    parser.add_argument('--frames', default='all',
+                        help="frames, 1-based numbers and ranges (e.g. '1-10,12'; default: all frames with the field)")
+    parser.add_argument('--view', action='append', default=[], dest='views', choices=[x.name for x in Views],
+                        help='camera view (repeatable; default: Isometric in 3D, Front in 2D)')
+    parser.add_argument('--size', type=parseSize, default=(1920, 1080), help='image size (default: 1920x1080)')
+    parser.add_argument('--scale-factor', type=float, default=1.0, dest='scaleFactor',
+                        help='deformation scale factor (default: 1.0)')
+    parser.add_argument('--output',
+                        help="file pattern, with {index}, {frame} (1-based), {view} (default: <odb>_{index:04d}.png)")
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes (default: CPU count)')
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    # parse arguments
+    arguments: argparse.Namespace = parseArguments(sys.argv[1:])
+    log(f"Reading output database: '{arguments.outputDatabase}'")
+    outputDatabase: OutputDatabase = FSReader.readOutputDatabase(arguments.outputDatabase)
+
+    # specifications (frames with the field, in every view)
+    frames: list[int] = parseFrames(arguments.frames, outputDatabase.frameCount)
+    if arguments.field:
+        groupName, _, fieldName = arguments.field.partition(':')
+        frames = [
+            frame for frame in frames
+            if groupName in outputDatabase.nodalScalarFieldGroupNames(frame)
+            and fieldName in outputDatabase.nodalScalarFieldNames(frame, groupName)
+        ]
+    if not frames:
+        log('Error: no frames to export')
+        sys.exit(2)
+    views: list[Views] = [Views[x] for x in arguments.views] or [
+        Views.Isometric if outputDatabase.mesh.modelingSpace == ModelingSpaces.ThreeDimensional else Views.Front
+    ]
+    specifications: list[Specification] = [(frame, arguments.field, view) for frame in frames for view in views]
+    del outputDatabase
+
+    # render
+    filePattern: str = arguments.output or os.path.splitext(arguments.outputDatabase)[0] + '_{index:04d}.png'
+    log(f'Rendering {len(specifications)} images ({arguments.size[0]}x{arguments.size[1]})')
+    startTime: float = time.perf_counter()
+    filePaths: list[str] = OffscreenRenderer.export(
+        arguments.outputDatabase,
+        specifications,
+        filePattern,
+        *arguments.size,
+        workers=arguments.workers,
+        options={'deformationScaleFactor': arguments.scaleFactor}
+    )
+    log(f'Rendered {len(filePaths)} images in {time.perf_counter() - startTime:.1f} s')
+    for filePath in filePaths: print(filePath)
@@ -1,23 +1,106 @@
 # build command
-# pyinstaller fs_preprocessor.py --clean --noconfirm --noconsole --hidden-import vtkmodules.all
+# pyinstaller fs_preprocessor.py --clean --noconfirm --noconsole --hidden-import vtkmodules.all --hidden-import scipy
 
+import os
 import sys
-from typing import cast
+import time
+import json
+import errno
+import shutil
+import tempfile
+from io import FileIO, BufferedWriter, StringIO, TextIOWrapper
+from array import array
+from hashlib import blake2b
+from functools import partial
+from contextlib import contextmanager
+from collections.abc import Callable, Iterator, Sequence
+from typing import cast, Any, TextIO
 from datetime import datetime
+from subprocess import Popen
+import numpy as np
+from psutil import Process as ProcessInfo
 from inputOutput import FSReader
+from process import CostPredictor, Renumbering
 from dataModel import (
     StressStates, NodeSet, ElementSet, Material, Section, ConcentratedLoad, BoundaryCondition, ModelDatabase, BodyLoad,
-    Pressure, SurfaceTraction, SurfaceSet
+    Pressure, SurfaceTraction, SurfaceSet, Mesh
 )
 
 # warning and error counters
 warnings: int = 0
 errors: int = 0
 
+# stage measurements (name, wall time, CPU time, peak RSS, bytes written)
+stages: list[tuple[str, float, float, float, int]] = []
+
 def log(text: str = '') -> None:
     '''Logs the specified text without buffering.'''
     print(text, flush=True)
 
+def peakMemory() -> float:
+    '''
+    Returns the peak physical memory usage of the preprocessor in MB (since the last reset, see resetPeakMemory).
+    On Linux the high-water mark of the process is read (VmHWM): unlike the maximum RSS of the rusage, it does not
+    include the memory of the parent process before exec (e.g. the application).
+    '''
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/self/status') as file:
+                for line in file:
+                    if line.startswith('VmHWM:'): return int(line.split()[1]) * 1024e-6 # kibibytes
+        except (OSError, ValueError, IndexError):
+            pass
+    memoryInfo: Any = ProcessInfo().memory_info()
+    if hasattr(memoryInfo, 'peak_wset'): return memoryInfo.peak_wset * 1e-6 # Windows
+    if sys.platform == 'darwin':
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1e-6 # bytes
+    return memoryInfo.rss * 1e-6
+
+def resetPeakMemory() -> None:
+    '''Resets the peak physical memory usage to the current usage (Linux only), so that stages report their own peak.'''
+    if not sys.platform.startswith('linux'): return
+    try:
+        with open('/proc/self/clear_refs', 'w') as file: file.write('5')
+    except OSError:
+        pass
+
+@contextmanager
+def stage(name: str) -> Iterator[dict[str, int]]:
+    '''
+    Measures and logs the wall time, CPU time and peak RSS of a preprocessor stage.
+    The yielded dictionary may be given the number of bytes written by the stage.
+    '''
+    counters: dict[str, int] = {'bytes': 0}
+    resetPeakMemory()
+    wallTime: float = time.perf_counter()
+    cpuTime: float = time.process_time()
+    try:
+        yield counters
+    finally:
+        wallTime = time.perf_counter() - wallTime
+        cpuTime = time.process_time() - cpuTime
+        peak: float = peakMemory()
+        stages.append((name, wallTime, cpuTime, peak, counters['bytes']))
+        text: str = f'[{name}] wall time: {wallTime:.3f} s, CPU time: {cpuTime:.3f} s, peak RSS: {peak:.1f} MB'
+        if counters['bytes'] > 0:
+            text += f", written: {counters['bytes'] * 1e-6:.3f} MB"
+            text += f", rate: {counters['bytes'] * 1e-6 / max(wallTime, 1e-9):.1f} MB/s"
+        log(text)
+
+def logStageSummary() -> None:
+    '''Logs the summary table of all measured stages.'''
+    width: int = max(len('Stage'), *(len(name) for name, *_ in stages))
+    log('Stage summary')
+    log(f"{'Stage':<{width}}  {'Wall [s]':>10}  {'CPU [s]':>10}  {'Peak RSS [MB]':>13}  {'Written [MB]':>12}")
+    for name, wallTime, cpuTime, peak, bytesWritten in stages:
+        written: str = f'{bytesWritten * 1e-6:.3f}' if bytesWritten > 0 else '-'
+        log(f'{name:<{width}}  {wallTime:>10.3f}  {cpuTime:>10.3f}  {peak:>13.1f}  {written:>12}')
+    log(
+        f"{'Total':<{width}}  {sum(x[1] for x in stages):>10.3f}  {sum(x[2] for x in stages):>10.3f}  "
+        f"{max(x[3] for x in stages):>13.1f}  {sum(x[4] for x in stages) * 1e-6:>12.3f}"
+    )
+
 def countElementsPerNode(modelDatabase: ModelDatabase) -> tuple[int, ...]:
     '''Counts the number of elements associated to each node.'''
     counts: list[int] = [0]*len(modelDatabase.mesh.nodes)
@@ -229,121 +312,401 @@ def checkFrequencyAnalysis(modelDatabase: ModelDatabase, analysisType: str) -> N
             log(f'Warning: in a frequency analysis any prescribed displacement is assumed to be 0')
             break
 
-def writeSolverJobInputFile(modelDatabase: ModelDatabase, solverJobInputFile: str) -> None:
-    '''Writes the solver job input file.'''
-    with open(solverJobInputFile, 'w') as file:
-        # get element section indices
-        elementSectionIndices: list[int] = [0]*len(modelDatabase.mesh.elements)
-        for sectionIndex, section in enumerate(modelDatabase.sections.dataObjects()):
-            section = cast(Section, section)
-            elementSet = cast(ElementSet, modelDatabase.elementSets[section.elementSetName])
-            for elementIndex in elementSet.indices():
-                elementSectionIndices[elementIndex] = sectionIndex + 1 # 1-based indexing
-        # mesh
-        file.write('mesh' + '\n')
-        file.write(str(len(modelDatabase.mesh.nodes)) + ',')
-        file.write(str(len(modelDatabase.mesh.elements)) + ',')
-        file.write(str(modelDatabase.mesh.modelingSpace.value) + '\n')
-        # nodes
-        file.write('nodes' + '\n')
-        for node in modelDatabase.mesh.nodes:
-            file.write(f'{node.x},{node.y},{node.z}' + '\n')
-        # elements
-        file.write('elements' + '\n')
-        for element, elementSectionIndex in zip(modelDatabase.mesh.elements, elementSectionIndices):
-            file.write(f"{element.elementType.value},{elementSectionIndex},")
-            file.write(','.join(str(x + 1) for x in element.nodeIndices) + '\n') # 1-based indexing
-        # model database
-        file.write('database' + '\n')
-        file.write(str(len(modelDatabase.nodeSets)) + ',')
-        file.write(str(len(modelDatabase.elementSets)) + ',')
-        file.write(str(len(modelDatabase.surfaceSets)) + ',')
-        file.write(str(len(modelDatabase.materials)) + ',')
-        file.write(str(len(modelDatabase.sections)) + ',')
-        file.write(str(len(modelDatabase.concentratedLoads)) + ',')
-        file.write(str(len(modelDatabase.pressures) + len(modelDatabase.surfaceTractions)) + ',')
-        file.write(str(len(modelDatabase.bodyLoads)) + ',')
-        file.write(str(len(modelDatabase.boundaryConditions)) + '\n')
-        # node sets
-        for nodeSet in modelDatabase.nodeSets.dataObjects():
-            nodeSet = cast(NodeSet, nodeSet)
-            file.write('node-set' + '\n')
-            file.write(str(nodeSet.count) + '\n')
-            for index in nodeSet.indices():
-                file.write(str(index + 1) + '\n') # 1-based indexing
-        # element sets
-        for elementSet in modelDatabase.elementSets.dataObjects():
+def renumberModelDatabase(
+    modelDatabase: ModelDatabase,
+    nodeOrder: Sequence[int],
+    renumberElements: bool
+) -> tuple[ModelDatabase, list[int] | None]:
+    '''
+    Returns a copy of the model database with its nodes in the specified order (original index per new index) and,
+    if requested, its elements sorted by their lowest new node index; and the element order (None if unchanged).
+    The node, element and surface sets are renumbered accordingly.
+    '''
+    nodes, elements = modelDatabase.mesh.nodes, modelDatabase.mesh.elements
+    nodeRank: list[int] = [0]*len(nodes)
+    for newIndex, originalIndex in enumerate(nodeOrder): nodeRank[originalIndex] = newIndex
+    elementOrder: list[int] | None = sorted(
+        range(len(elements)), key=lambda i: min(nodeRank[x] for x in elements[i].nodeIndices)
+    ) if renumberElements else None
+    mesh: Mesh = Mesh(
+        modelDatabase.mesh.modelingSpace,
+        [nodes[i].coordinates for i in nodeOrder],
+        [
+            (elements[i].elementType.name, tuple(nodeRank[x] for x in elements[i].nodeIndices))
+            for i in (elementOrder if elementOrder is not None else range(len(elements)))
+        ]
+    )
+    renumbered: ModelDatabase = modelDatabase.copy(mesh)
+    for nodeSet in renumbered.nodeSets.dataObjects():
+        nodeSet = cast(NodeSet, nodeSet)
+        indices: tuple[int, ...] = nodeSet.indices()
+        nodeSet.remove(indices)
+        nodeSet.add([nodeRank[i] for i in indices])
+    if elementOrder is not None:
+        elementRank: list[int] = [0]*len(elements)
+        for newIndex, originalIndex in enumerate(elementOrder): elementRank[originalIndex] = newIndex
+        for elementSet in renumbered.elementSets.dataObjects():
             elementSet = cast(ElementSet, elementSet)
-            file.write('element-set' + '\n')
-            file.write(str(elementSet.count) + '\n')
-            for index in elementSet.indices():
-                file.write(str(index + 1) + '\n') # 1-based indexing
-        # surface sets
-        for surfaceSet in modelDatabase.surfaceSets.dataObjects():
+            indices = elementSet.indices()
+            elementSet.remove(indices)
+            elementSet.add([elementRank[i] for i in indices])
+        for surfaceSet in renumbered.surfaceSets.dataObjects():
             surfaceSet = cast(SurfaceSet, surfaceSet)
-            file.write('surface-set' + '\n')
-            file.write(str(surfaceSet.count) + '\n')
-            for surface in surfaceSet.surfaces():
-                elementIndex, connectivity = surface
-                file.write(str(elementIndex + 1) + ',') # 1-based indexing
-                file.write(str(len(connectivity)))
-                for index in connectivity: file.write(',' + str(index + 1)) # 1-based indexing
-                file.write('\n')
-        # materials
-        for material in modelDatabase.materials.dataObjects():
-            material = cast(Material, material)
-            file.write('material' + '\n')
-            file.write(f'{material.young},{material.poisson},{material.density}' + '\n')
-        # sections
-        for section in modelDatabase.sections.dataObjects():
-            section = cast(Section, section)
-            elementSet = cast(ElementSet, modelDatabase.elementSets[section.elementSetName])
-            material = cast(Material, modelDatabase.materials[section.materialName])
-            file.write('section' + '\n')
-            file.write(str(StressStates.fromName(section.stressState).value) + ',')
-            file.write(str(elementSet.index + 1) + ',')
-            file.write(str(material.index + 1) + ',')
-            file.write(str(section.planeThickness) + '\n')
-        # concentrated loads
-        for concentratedLoad in modelDatabase.concentratedLoads.dataObjects():
-            concentratedLoad = cast(ConcentratedLoad, concentratedLoad)
-            nodeSet = cast(NodeSet, modelDatabase.nodeSets[concentratedLoad.nodeSetName])
-            file.write('concentrated-load' + '\n')
-            file.write(f'{nodeSet.index + 1},{concentratedLoad.x},{concentratedLoad.y},{concentratedLoad.z}' + '\n')
-        # surface loads
-        for pressure in modelDatabase.pressures.dataObjects():
-            pressure = cast(Pressure, pressure)
-            surfaceSet = cast(SurfaceSet, modelDatabase.surfaceSets[pressure.surfaceSetName])
-            file.write('surface-load' + '\n')
-            file.write(f'{surfaceSet.index + 1},P,{pressure.magnitude},0.0,0.0' + '\n')
-        for surfaceTraction in modelDatabase.surfaceTractions.dataObjects():
-            surfaceTraction = cast(SurfaceTraction, surfaceTraction)
-            surfaceSet = cast(SurfaceSet, modelDatabase.surfaceSets[surfaceTraction.surfaceSetName])
-            file.write('surface-load' + '\n')
-            file.write(f'{surfaceSet.index + 1},T,{surfaceTraction.x},{surfaceTraction.y},{surfaceTraction.z}' + '\n')
-        # body loads
-        for bodyLoad in modelDatabase.bodyLoads.dataObjects():
-            bodyLoad = cast(BodyLoad, bodyLoad)
-            elementSet = cast(ElementSet, modelDatabase.elementSets[bodyLoad.elementSetName])
-            bodyLoadType: str = 'A' if bodyLoad.type == 'Acceleration' else 'F'
-            file.write('body-load' + '\n')
-            file.write(f'{elementSet.index + 1},{bodyLoadType},{bodyLoad.x},{bodyLoad.y},{bodyLoad.z}' + '\n')
-        # boundary conditions
-        for boundaryCondition in modelDatabase.boundaryConditions.dataObjects():
-            boundaryCondition = cast(BoundaryCondition, boundaryCondition)
-            nodeSet = cast(NodeSet, modelDatabase.nodeSets[boundaryCondition.nodeSetName])
-            file.write('boundary-condition' + '\n')
-            file.write(f'{nodeSet.index + 1},{boundaryCondition.x},{boundaryCondition.y},{boundaryCondition.z}' + ',')
-            file.write(('T' if boundaryCondition.isActiveInX else 'F') + ',')
-            file.write(('T' if boundaryCondition.isActiveInY else 'F') + ',')
-            file.write(('T' if boundaryCondition.isActiveInZ else 'F') + '\n')
+            surfaces: tuple[tuple[int, tuple[int, ...]], ...] = surfaceSet.surfaces()
+            surfaceSet.remove(surfaces)
+            surfaceSet.add((elementRank[elementIndex], connectivity) for elementIndex, connectivity in surfaces)
+    return renumbered, elementOrder
+
+def renumber(modelDatabase: ModelDatabase, method: str, renumberElements: bool, renumberingFile: str) -> ModelDatabase:
+    '''
+    Renumbers the nodes (and elements) to reduce the bandwidth and profile of the solver matrices, with the
+    reverse Cuthill-McKee ('rcm') or the Morton space-filling curve ('morton') ordering.
+    The orders are written to the renumbering file, which maps the results back to the original numbering.
+    The original numbering is kept if the renumbering does not reduce the profile.
+    '''
+    global warnings
+    if os.path.isfile(renumberingFile): os.remove(renumberingFile)
+    try:
+        nodeOrder: list[int] = Renumbering.nodeOrder(modelDatabase, method)
+    except ImportError:
+        warnings += 1
+        log('Warning: SciPy is not available, nodes are not renumbered')
+        return modelDatabase
+    renumbered, elementOrder = renumberModelDatabase(modelDatabase, nodeOrder, renumberElements)
+    before: CostPredictor = CostPredictor(modelDatabase)
+    after: CostPredictor = CostPredictor(renumbered)
+    log(f'Matrix bandwidth before renumbering: {before.bandwidth}, profile: {before.profile}')
+    log(f'Matrix bandwidth after renumbering ({method}): {after.bandwidth}, profile: {after.profile}')
+    if after.profile >= before.profile:
+        log('Renumbering does not reduce the profile, the original numbering is kept')
+        return modelDatabase
+    with open(renumberingFile, 'w') as file:
+        json.dump({'method': method, 'nodes': nodeOrder, 'elements': elementOrder}, file)
+    return renumbered
+
+def writeMeshHeader(modelDatabase: ModelDatabase, file: TextIO) -> None:
+    '''Writes the mesh header segment.'''
+    file.write('mesh' + '\n')
+    file.write(str(len(modelDatabase.mesh.nodes)) + ',')
+    file.write(str(len(modelDatabase.mesh.elements)) + ',')
+    file.write(str(modelDatabase.mesh.modelingSpace.value) + '\n')
+
+def writeNodes(modelDatabase: ModelDatabase, file: TextIO) -> None:
+    '''Writes the nodes segment.'''
+    file.write('nodes' + '\n')
+    for node in modelDatabase.mesh.nodes:
+        file.write(f'{node.x},{node.y},{node.z}' + '\n')
+
+def writeElements(modelDatabase: ModelDatabase, elementSectionIndices: Sequence[int], file: TextIO) -> None:
+    '''Writes the elements segment.'''
+    file.write('elements' + '\n')
+    for element, elementSectionIndex in zip(modelDatabase.mesh.elements, elementSectionIndices):
+        file.write(f"{element.elementType.value},{elementSectionIndex},")
+        file.write(','.join(str(x + 1) for x in element.nodeIndices) + '\n') # 1-based indexing
+
+def writeDatabaseHeader(modelDatabase: ModelDatabase, file: TextIO) -> None:
+    '''Writes the model database header segment.'''
+    file.write('database' + '\n')
+    file.write(str(len(modelDatabase.nodeSets)) + ',')
+    file.write(str(len(modelDatabase.elementSets)) + ',')
+    file.write(str(len(modelDatabase.surfaceSets)) + ',')
+    file.write(str(len(modelDatabase.materials)) + ',')
+    file.write(str(len(modelDatabase.sections)) + ',')
+    file.write(str(len(modelDatabase.concentratedLoads)) + ',')
+    file.write(str(len(modelDatabase.pressures) + len(modelDatabase.surfaceTractions)) + ',')
+    file.write(str(len(modelDatabase.bodyLoads)) + ',')
+    file.write(str(len(modelDatabase.boundaryConditions)) + '\n')
+
+def writeIndexSet(keyword: str, indexSet: NodeSet | ElementSet, file: TextIO) -> None:
+    '''Writes a node set or element set segment.'''
+    file.write(keyword + '\n')
+    file.write(str(indexSet.count) + '\n')
+    for index in indexSet.indices():
+        file.write(str(index + 1) + '\n') # 1-based indexing
+
+def writeSurfaceSet(surfaceSet: SurfaceSet, file: TextIO) -> None:
+    '''Writes a surface set segment.'''
+    file.write('surface-set' + '\n')
+    file.write(str(surfaceSet.count) + '\n')
+    for surface in surfaceSet.surfaces():
+        elementIndex, connectivity = surface
+        file.write(str(elementIndex + 1) + ',') # 1-based indexing
+        file.write(str(len(connectivity)))
+        for index in connectivity: file.write(',' + str(index + 1)) # 1-based indexing
+        file.write('\n')
+
+def writeMaterials(modelDatabase: ModelDatabase, file: TextIO) -> None:
+    '''Writes the materials segment.'''
+    for material in modelDatabase.materials.dataObjects():
+        material = cast(Material, material)
+        file.write('material' + '\n')
+        file.write(f'{material.young},{material.poisson},{material.density}' + '\n')
+
+def writeSections(modelDatabase: ModelDatabase, file: TextIO) -> None:
+    '''Writes the sections segment.'''
+    for section in modelDatabase.sections.dataObjects():
+        section = cast(Section, section)
+        elementSet = cast(ElementSet, modelDatabase.elementSets[section.elementSetName])
+        material = cast(Material, modelDatabase.materials[section.materialName])
+        file.write('section' + '\n')
+        file.write(str(StressStates.fromName(section.stressState).value) + ',')
+        file.write(str(elementSet.index + 1) + ',')
+        file.write(str(material.index + 1) + ',')
+        file.write(str(section.planeThickness) + '\n')
+
+def writeLoadsAndBoundaryConditions(modelDatabase: ModelDatabase, file: TextIO) -> None:
+    '''Writes the loads and boundary conditions segment.'''
+    # concentrated loads
+    for concentratedLoad in modelDatabase.concentratedLoads.dataObjects():
+        concentratedLoad = cast(ConcentratedLoad, concentratedLoad)
+        nodeSet = cast(NodeSet, modelDatabase.nodeSets[concentratedLoad.nodeSetName])
+        file.write('concentrated-load' + '\n')
+        file.write(f'{nodeSet.index + 1},{concentratedLoad.x},{concentratedLoad.y},{concentratedLoad.z}' + '\n')
+    # surface loads
+    for pressure in modelDatabase.pressures.dataObjects():
+        pressure = cast(Pressure, pressure)
+        surfaceSet = cast(SurfaceSet, modelDatabase.surfaceSets[pressure.surfaceSetName])
+        file.write('surface-load' + '\n')
+        file.write(f'{surfaceSet.index + 1},P,{pressure.magnitude},0.0,0.0' + '\n')
+    for surfaceTraction in modelDatabase.surfaceTractions.dataObjects():
+        surfaceTraction = cast(SurfaceTraction, surfaceTraction)
+        surfaceSet = cast(SurfaceSet, modelDatabase.surfaceSets[surfaceTraction.surfaceSetName])
+        file.write('surface-load' + '\n')
+        file.write(f'{surfaceSet.index + 1},T,{surfaceTraction.x},{surfaceTraction.y},{surfaceTraction.z}' + '\n')
+    # body loads
+    for bodyLoad in modelDatabase.bodyLoads.dataObjects():
+        bodyLoad = cast(BodyLoad, bodyLoad)
+        elementSet = cast(ElementSet, modelDatabase.elementSets[bodyLoad.elementSetName])
+        bodyLoadType: str = 'A' if bodyLoad.type == 'Acceleration' else 'F'
+        file.write('body-load' + '\n')
+        file.write(f'{elementSet.index + 1},{bodyLoadType},{bodyLoad.x},{bodyLoad.y},{bodyLoad.z}' + '\n')
+    # boundary conditions
+    for boundaryCondition in modelDatabase.boundaryConditions.dataObjects():
+        boundaryCondition = cast(BoundaryCondition, boundaryCondition)
+        nodeSet = cast(NodeSet, modelDatabase.nodeSets[boundaryCondition.nodeSetName])
+        file.write('boundary-condition' + '\n')
+        file.write(f'{nodeSet.index + 1},{boundaryCondition.x},{boundaryCondition.y},{boundaryCondition.z}' + ',')
+        file.write(('T' if boundaryCondition.isActiveInX else 'F') + ',')
+        file.write(('T' if boundaryCondition.isActiveInY else 'F') + ',')
+        file.write(('T' if boundaryCondition.isActiveInZ else 'F') + '\n')
+
+def writeText(text: str, file: TextIO) -> None:
+    '''Writes a pre-rendered segment.'''
+    file.write(text)
+
+def fingerprint(data: bytes) -> str:
+    '''Returns the fingerprint of the specified data.'''
+    return blake2b(data, digest_size=16).hexdigest()
+
+def solverJobInputSegments(modelDatabase: ModelDatabase) -> list[tuple[str, str, Callable[[TextIO], None]]]:
+    '''
+    Splits the solver job input into segments, in file order.
+    Each segment is given by its name, its fingerprint and its writer.
+    Small segments are rendered to text up front and fingerprinted as such.
+    Large segments are fingerprinted from compact binary copies of the model data and only formatted when written.
+    '''
+    segments: list[tuple[str, str, Callable[[TextIO], None]]] = []
+
+    def addTextSegment(name: str, writer: Callable[[TextIO], None]) -> None:
+        buffer: StringIO = StringIO()
+        writer(buffer)
+        text: str = buffer.getvalue()
+        segments.append((name, fingerprint(text.encode()), partial(writeText, text)))
+
+    # get element section indices
+    elementSectionIndices: list[int] = [0]*len(modelDatabase.mesh.elements)
+    for sectionIndex, section in enumerate(modelDatabase.sections.dataObjects()):
+        section = cast(Section, section)
+        elementSet = cast(ElementSet, modelDatabase.elementSets[section.elementSetName])
+        for elementIndex in elementSet.indices():
+            elementSectionIndices[elementIndex] = sectionIndex + 1 # 1-based indexing
+    # mesh
+    addTextSegment('mesh', partial(writeMeshHeader, modelDatabase))
+    # nodes
+    nodeData: array[float] = array('d')
+    for node in modelDatabase.mesh.nodes: nodeData.extend(node.coordinates)
+    segments.append(('nodes', fingerprint(nodeData.tobytes()), partial(writeNodes, modelDatabase)))
+    # elements
+    elementData: array[int] = array('q')
+    for element, elementSectionIndex in zip(modelDatabase.mesh.elements, elementSectionIndices):
+        elementData.extend((element.elementType.value, elementSectionIndex, len(element.nodeIndices)))
+        elementData.extend(element.nodeIndices)
+    segments.append((
+        'elements', fingerprint(elementData.tobytes()), partial(writeElements, modelDatabase, elementSectionIndices)
+    ))
+    # model database
+    addTextSegment('database', partial(writeDatabaseHeader, modelDatabase))
+    # node sets
+    for nodeSet in modelDatabase.nodeSets.dataObjects():
+        nodeSet = cast(NodeSet, nodeSet)
+        segments.append((
+            'node-set',
+            fingerprint(array('q', nodeSet.indices()).tobytes()),
+            partial(writeIndexSet, 'node-set', nodeSet)
+        ))
+    # element sets
+    for elementSet in modelDatabase.elementSets.dataObjects():
+        elementSet = cast(ElementSet, elementSet)
+        segments.append((
+            'element-set',
+            fingerprint(array('q', elementSet.indices()).tobytes()),
+            partial(writeIndexSet, 'element-set', elementSet)
+        ))
+    # surface sets
+    for surfaceSet in modelDatabase.surfaceSets.dataObjects():
+        surfaceSet = cast(SurfaceSet, surfaceSet)
+        surfaceData: array[int] = array('q')
+        for elementIndex, connectivity in surfaceSet.surfaces():
+            surfaceData.extend((elementIndex, len(connectivity)))
+            surfaceData.extend(connectivity)
+        segments.append(('surface-set', fingerprint(surfaceData.tobytes()), partial(writeSurfaceSet, surfaceSet)))
+    # materials, sections, loads and boundary conditions
+    addTextSegment('materials', partial(writeMaterials, modelDatabase))
+    addTextSegment('sections', partial(writeSections, modelDatabase))
+    addTextSegment('loads', partial(writeLoadsAndBoundaryConditions, modelDatabase))
+    return segments
+
+def writeSolverJobInput(modelDatabase: ModelDatabase, file: TextIO) -> None:
+    '''Writes the solver job input to the specified text stream.'''
+    for _, _, writer in solverJobInputSegments(modelDatabase):
+        writer(file)
+
+def writeSolverJobInputFile(modelDatabase: ModelDatabase, solverJobInputFile: str) -> int:
+    '''
+    Writes the solver job input file and returns the number of bytes written.
+    The segment fingerprints of the previous run are kept in an index file next to the job file.
+    Leading segments that did not change are reused as they are on disk, so that only the tail of the file is rewritten.
+    '''
+    indexFile: str = os.path.splitext(solverJobInputFile)[0] + '.fs_sig'
+    segments: list[tuple[str, str, Callable[[TextIO], None]]] = solverJobInputSegments(modelDatabase)
+
+    # load previous segment index (only valid if the job file was not touched since)
+    previousSegments: list[tuple[str, str]] = []
+    endOffsets: list[int] = []
+    try:
+        with open(indexFile, 'r') as file:
+            index: dict[str, Any] = json.load(file)
+        status: os.stat_result = os.stat(solverJobInputFile)
+        if index['size'] == status.st_size and index['mtime'] == status.st_mtime_ns:
+            previousSegments = [(name, digest) for name, digest, _ in index['segments']]
+            endOffsets = [endOffset for _, _, endOffset in index['segments']]
+    except (OSError, ValueError, KeyError, TypeError):
+        previousSegments, endOffsets = [], []
+
+    # count unchanged leading segments
+    reused: int = 0
+    for (name, digest, _), previousSegment in zip(segments, previousSegments):
+        if (name, digest) != previousSegment: break
+        reused += 1
+    if reused == len(segments) == len(previousSegments):
+        log(f'Solver job input file is up to date ({reused} segments reused)')
+        return 0
+    endOffsets = endOffsets[:reused]
+
+    # rewrite the tail of the file, starting at the first changed segment
+    startOffset: int = endOffsets[-1] if reused > 0 else 0
+    with TextIOWrapper(open(solverJobInputFile, 'r+b' if reused > 0 else 'wb')) as file:
+        file.buffer.seek(startOffset)
+        file.buffer.truncate()
+        for _, _, writer in segments[reused:]:
+            writer(file)
+            file.flush()
+            endOffsets.append(file.buffer.tell())
+    log(f'Solver job input segments reused: {reused} of {len(segments)}')
+
+    # save segment index
+    status = os.stat(solverJobInputFile)
+    with open(indexFile, 'w') as file:
+        json.dump({
+            'size': status.st_size,
+            'mtime': status.st_mtime_ns,
+            'segments': [(name, digest, endOffset) for (name, digest, _), endOffset in zip(segments, endOffsets)]
+        }, file)
+    return endOffsets[-1] - startOffset
+
+class CountingFileIO(FileIO):
+    '''
+    Raw file stream that counts the bytes written through it.
+    '''
+
+    # attribute slots
+    __slots__ = ('bytesWritten',)
+
+    def __init__(self, file: int | str, mode: str = 'w') -> None:
+        '''Counting file stream constructor.'''
+        super().__init__(file, mode)
+        self.bytesWritten: int = 0
+
+    def write(self, data: Any) -> int:
+        '''Writes the specified bytes and counts them.'''
+        count: int | None = super().write(data)
+        self.bytesWritten += count or 0
+        return count or 0
+
+def streamSolverJobInput(modelDatabase: ModelDatabase, solverExecutable: str, solverArguments: tuple[str, ...]) -> int:
+    '''
+    Streams the solver job input to the solver through a named pipe.
+    The solver is started by the preprocessor and reads the job input while it is being written.
+    No solver job input file is left on disk. Returns the solver exit code.
+    '''
+    if not hasattr(os, 'mkfifo'):
+        raise RuntimeError('named pipes are not supported on this platform')
+    # create named pipe in a private temporary directory
+    pipeDirectory: str = tempfile.mkdtemp(prefix='fs_job_')
+    pipeFile: str = os.path.join(pipeDirectory, 'pipe.fs_job')
+    try:
+        os.mkfifo(pipeFile, 0o600)
+        # start solver (shares the log stream)
+        sys.stdout.flush()
+        solver: Popen[bytes] = Popen(
+            args=(solverExecutable, pipeFile, *solverArguments),
+            stdout=sys.stdout,
+            stderr=sys.stdout
+        )
+        try:
+            # open the writing end as soon as the solver opens the reading end
+            descriptor: int | None = None
+            while descriptor is None and solver.poll() is None:
+                try:
+                    descriptor = os.open(pipeFile, os.O_WRONLY | os.O_NONBLOCK)
+                except OSError as error:
+                    if error.errno != errno.ENXIO: raise
+                    time.sleep(0.01)
+            # write solver job input
+            if descriptor is not None:
+                os.set_blocking(descriptor, True)
+                with stage('Stream solver job input') as counters:
+                    pipe: CountingFileIO = CountingFileIO(descriptor, 'w')
+                    try:
+                        with TextIOWrapper(BufferedWriter(pipe)) as file:
+                            writeSolverJobInput(modelDatabase, file)
+                    except BrokenPipeError:
+                        log('Error: the solver closed the solver job input pipe')
+                    counters['bytes'] = pipe.bytesWritten
+        except BaseException:
+            # do not leave an orphaned solver waiting on a truncated job input
+            solver.kill()
+            raise
+        # wait for the solver
+        with stage('Wait for solver'):
+            return solver.wait()
+    finally:
+        shutil.rmtree(pipeDirectory, ignore_errors=True)
 
 if __name__ == '__main__':
     # unpack arguments
-    modelDatabaseFile, solverJobInputFile, logFile, analysisType = sys.argv[:4]
+    modelDatabaseFile, solverJobInputFile, logFile, analysisType = sys.argv[1:5]
+    # optional pipeline arguments: job input mode ('file' or 'pipe'), solver executable, output database file,
+    # and number of eigenvalues
+    solverJobInputMode: str = sys.argv[6] if len(sys.argv) > 6 else 'file'
+    solverExitCode: int = 0
+    # optional renumbering (environment): method ('none', 'rcm' or 'morton') and element renumbering ('1' or '0')
+    renumberingMethod: str = os.environ.get('FS_RENUMBER', 'none').strip().lower() or 'none'
+    renumberElements: bool = os.environ.get('FS_RENUMBER_ELEMENTS', '1').strip() != '0'
+    renumberingFile: str = os.path.splitext(solverJobInputFile)[0] + '.fs_prm'
 
     # redirect standard output and error streams
-    sys.tracebacklimit = int(sys.argv[4])
+    sys.tracebacklimit = int(sys.argv[5])
     sys.stdout = open(logFile, 'w')
     sys.stderr = sys.stdout
 
@@ -354,39 +717,62 @@ if __name__ == '__main__':
 
     # load model database from file
     log(f"Loading model database from file: '{modelDatabaseFile}'")
-    modelDatabase: ModelDatabase = FSReader.readModelDatabase(modelDatabaseFile)
+    with stage('Load model database'):
+        modelDatabase: ModelDatabase = FSReader.readModelDatabase(modelDatabaseFile)
     log('Model database loaded')
     log()
 
     # perform basic checks
     log('Checking the model definition')
-    checkMesh(modelDatabase)
-    checkNodeSets(modelDatabase)
-    checkElementSets(modelDatabase)
-    checkSurfaceSets(modelDatabase)
-    checkMaterials(modelDatabase)
-    checkSections(modelDatabase)
-    checkConcentratedLoads(modelDatabase)
-    checkPressures(modelDatabase)
-    checkSurfaceTractions(modelDatabase)
-    checkBodyLoads(modelDatabase)
-    checkBoundaryConditions(modelDatabase)
-    checkFrequencyAnalysis(modelDatabase, analysisType)
+    for check in (
+        checkMesh, checkNodeSets, checkElementSets, checkSurfaceSets, checkMaterials, checkSections,
+        checkConcentratedLoads, checkPressures, checkSurfaceTractions, checkBodyLoads, checkBoundaryConditions
+    ):
+        with stage(check.__name__):
+            check(modelDatabase)
+    with stage(checkFrequencyAnalysis.__name__):
+        checkFrequencyAnalysis(modelDatabase, analysisType)
+    if renumberingMethod not in ('none', 'rcm', 'morton'):
+        warnings += 1
+        log(f"Warning: unknown renumbering method, nodes are not renumbered: '{renumberingMethod}'")
     if warnings > 0: log(f'Model definition contains {warnings} warning(s)')
     if errors > 0: log(f'Model definition contains {errors} error(s)')
     if warnings == 0 and errors == 0: log('Basic checks found no warnings nor errors')
     log()
 
+    # renumber nodes and elements (the renumbering file of a previous run no longer applies otherwise)
+    if errors == 0 and renumberingMethod in ('rcm', 'morton'):
+        log(f'Renumbering nodes{" and elements" if renumberElements else ""} ({renumberingMethod})')
+        with stage('Renumber nodes'):
+            modelDatabase = renumber(modelDatabase, renumberingMethod, renumberElements, renumberingFile)
+        log()
+    elif os.path.isfile(renumberingFile):
+        os.remove(renumberingFile)
+
     # write solver job input file
     if errors > 0:
         log('Solver job input file not written due to errors in the model definition')
+        log()
+    elif solverJobInputMode == 'pipe':
+        log('Streaming solver job input through a named pipe')
+        log()
+        solverExecutable, outputDatabaseFile, eigenvalues = sys.argv[7:10]
+        solverExitCode = streamSolverJobInput(
+            modelDatabase, solverExecutable, (outputDatabaseFile, analysisType, eigenvalues)
+        )
+        log()
     else:
         log('Writing solver job input file')
-        writeSolverJobInputFile(modelDatabase, solverJobInputFile)
+        with stage('Write solver job input') as counters:
+            counters['bytes'] = writeSolverJobInputFile(modelDatabase, solverJobInputFile)
         log('Solver job input file written')
+        log()
+
+    # stage summary
+    logStageSummary()
     log()
 
     # done
     log('Preprocessor is done')
     sys.stdout.close()
-    sys.exit(errors)
+    sys.exit(errors if errors > 0 else solverExitCode)
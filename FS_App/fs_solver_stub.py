@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+# Stand-in for the solver (fs_solver), for running and testing the application without the Fortran build.
+# It reads the mesh from the solver job input, emits the solver progress markers (with the phases of the real solver)
+# and writes an output database with synthetic results (displacement field only).
+# Usage: FS_SOLVER=./fs_solver_stub.py (executable script); FS_SOLVER_STUB_DURATION sets the run time in seconds.
+# FS_SOLVER_STUB_WORK makes the solution phase CPU-bound instead: the given number of dense matrix products
+# (size 1000, multi-threaded by the math library as set by OMP_NUM_THREADS/OPENBLAS_NUM_THREADS).
+# FS_SOLVER_STUB_FRAME_DELAY sets the time in seconds spent writing each frame of the output database.
+
+import os
+import sys
+import time
+import math
+from datetime import datetime
+from dataModel import ElementTypes
+
+# phases per analysis type (must match the Fortran source)
+phases: dict[str, tuple[str, ...]] = {
+    'static': (
+        'Assembling stiffness matrix', 'Assembling load vector', 'Solving linear system',
+        'Recovering strains and stresses', 'Building output database'
+    ),
+    'frequency': (
+        'Assembling stiffness matrix', 'Assembling mass matrix', 'Solving eigenproblem', 'Normalizing eigenvectors',
+        'Building output database'
+    ),
+    'buckle': (
+        'Assembling stiffness matrix', 'Assembling load vector', 'Solving linear system',
+        'Assembling stress-stiffness matrix', 'Solving eigenproblem', 'Normalizing eigenvectors',
+        'Building output database'
+    )
+}
+
+def log(text: str = '') -> None:
+    '''Logs the specified text without buffering.'''
+    print(text, flush=True)
+
+def readMesh(solverJobInputFile: str) -> tuple[int, list[tuple[float, float, float]], list[tuple[str, list[int]]]]:
+    '''Reads the modeling space, nodes and elements (type name, 0-based node indices) from the solver job input.'''
+    with open(solverJobInputFile, 'r') as file:
+        if file.readline().strip() != 'mesh':
+            raise RuntimeError(f"could not interpret solver job input from file: '{solverJobInputFile}'")
+        nodeCount, elementCount, modelingSpace = (int(x) for x in file.readline().split(','))
+        file.readline() # nodes
+        nodes: list[tuple[float, float, float]] = []
+        for _ in range(nodeCount):
+            x, y, z = (float(value) for value in file.readline().split(','))
+            nodes.append((x, y, z))
+        file.readline() # elements
+        elements: list[tuple[str, list[int]]] = []
+        for _ in range(elementCount):
+            values: list[int] = [int(value) for value in file.readline().split(',')]
+            elements.append((ElementTypes(values[0]).name, [index - 1 for index in values[2:]]))
+    return modelingSpace, nodes, elements
+
+def runPhase(index: int, name: str, steps: int, duration: float, work: int = 0) -> None:
+    '''Emits the markers of a phase that takes the specified time (or performs the specified CPU-bound work).'''
+    log(f'@phase {index} {name}')
+    if work > 0:
+        import numpy
+        a: numpy.ndarray = numpy.random.default_rng(index).random((1000, 1000))
+        for _ in range(work): a = numpy.tanh(a @ a)
+        return
+    if steps == 0: time.sleep(duration)
+    for step in range(1, steps + 1):
+        time.sleep(duration/steps)
+        log(f'@step {step} {steps}')
+
+def writeOutputDatabase(
+    outputDatabaseFile: str,
+    modelingSpace: int,
+    nodes: list[tuple[float, float, float]],
+    elements: list[tuple[str, list[int]]],
+    frameDescriptions: list[str],
+    historyOutputDescriptions: list[str],
+    historyOutput: list[list[float]],
+    fieldOutput: list[list[tuple[float, float, float, float]]],
+    frameDelay: float = 0.0
+) -> None:
+    '''Writes an output database file (in the format of the solver), waiting the specified time after every frame.'''
+    comment: str = '# '
+    separator: str = comment + '='*(80 - len(comment))
+    indentation: str = ' '*4
+    with open(outputDatabaseFile, 'w') as file:
+        file.write(f'{separator}\n{comment}OUTPUT DATABASE GENERATED BY FEASOFT\n')
+        file.write(f"{comment}{datetime.now().isoformat(sep=' ', timespec='seconds')}\n{separator}\n")
+        file.write('from dataModel import *\n\n')
+        file.write(f'{separator}\n{comment}NODAL COORDINATES\n{separator}\nnodeData = (\n')
+        for x, y, z in nodes: file.write(f'{indentation}({x:+.8E}, {y:+.8E}, {z:+.8E}),\n')
+        file.write(')\n\n')
+        file.write(f'{separator}\n{comment}ELEMENT CONNECTIVITY\n{separator}\nelementData = (\n')
+        for name, nodeIndices in elements:
+            file.write(f"{indentation}('{name}', ({', '.join(str(index) for index in nodeIndices)})),\n")
+        file.write(')\n\n')
+        file.write(f'{separator}\n{comment}FINITE ELEMENT MESH\n{separator}\n')
+        file.write(f'mesh = Mesh({modelingSpace}, nodeData, elementData)\n\n')
+        file.write(f'{separator}\n{comment}FRAME DESCRIPTIONS\n{separator}\n')
+        file.write(f'numberOfFrames = {len(frameDescriptions)}\n\nframeDescriptions = (\n')
+        for description in frameDescriptions: file.write(f"{indentation}'{description}',\n")
+        file.write(')\n\n')
+        file.write(f'{separator}\n{comment}HISTORY OUTPUT\n{separator}\nhistoryOutputDescriptions = (\n')
+        for description in historyOutputDescriptions: file.write(f"{indentation}'{description}',\n")
+        file.write(')\n\nhistoryOutput = (\n')
+        for values in historyOutput: file.write(f"{indentation}({', '.join(f'{x:+.8E}' for x in values)},),\n")
+        file.write(')\n\n')
+        file.write(f'{separator}\n{comment}FIELD OUTPUT\n{separator}\nfieldOutputDescriptions = (\n')
+        for component in ('Displacement in X', 'Displacement in Y', 'Displacement in Z', 'Magnitude of Displacement'):
+            file.write(f"{indentation}'Displacement:{component}',\n")
+        file.write(')\n\nfieldOutput = (\n')
+        for values in fieldOutput:
+            file.write(f'{indentation}(\n')
+            for nodeValues in values:
+                file.write(f"{indentation*2}({', '.join(f'{x:+.8E}' for x in nodeValues)}),\n")
+            file.write(f'{indentation}),\n')
+            # completed frame (the output database can be read while it is written)
+            file.flush()
+            if frameDelay > 0.0: time.sleep(frameDelay)
+        file.write(')\n\n')
+        file.write(f'{separator}\n{comment}OUTPUT DATABASE\n{separator}\noutputDatabase = OutputDatabase(\n')
+        for name in (
+            'mesh', 'numberOfFrames', 'frameDescriptions', 'historyOutputDescriptions', 'fieldOutputDescriptions',
+            'historyOutput', 'fieldOutput'
+        ):
+            file.write(f'{indentation}{name},\n')
+        file.write(')\n\n')
+
+if __name__ == '__main__':
+    # arguments: solver job input file, output database file, analysis type, number of eigenvalues
+    solverJobInputFile, outputDatabaseFile, analysisType = sys.argv[1:4]
+    eigenvalues: int = int(sys.argv[4]) if len(sys.argv) > 4 else 10
+    if analysisType not in phases:
+        log('Error: undefined analysis type')
+        sys.exit(1)
+    duration: float = float(os.environ.get('FS_SOLVER_STUB_DURATION', '2.0'))
+    work: int = int(os.environ.get('FS_SOLVER_STUB_WORK', '0'))
+    analysisPhases: tuple[str, ...] = phases[analysisType]
+    log(f'@phases {len(analysisPhases) + 3}')
+    log('Solver has started (stand-in)')
+    log()
+
+    # read solver job input
+    runPhase(1, 'Loading solver job input', 0, 0.0)
+    modelingSpace, nodes, elements = readMesh(solverJobInputFile)
+    log(f"Solver job input loaded: '{solverJobInputFile}'")
+    runPhase(2, 'Building algebraic connectivity', 0, 0.0)
+    log(f'@dofs {modelingSpace*len(nodes)}')
+    log(f'Active degrees of freedom: {modelingSpace*len(nodes)}')
+    log()
+
+    # analysis phases (element loops and mode loops report steps)
+    log(f'Performing {analysisType} analysis')
+    modes: int = 1 if analysisType == 'static' else eigenvalues
+    for index, name in enumerate(analysisPhases):
+        steps: int = (
+            min(len(elements), 100) if name.startswith(('Assembling', 'Recovering')) else
+            modes if name.startswith(('Normalizing', 'Building')) and analysisType != 'static' else 0
+        )
+        runPhase(index + 3, name, steps, duration/len(analysisPhases), work if name.startswith('Solving') else 0)
+    log(f'{analysisType.capitalize()} analysis successfully performed')
+    log()
+
+    # synthetic results
+    span: float = max((max(node[i] for node in nodes) - min(node[i] for node in nodes) for i in range(3)), default=1.0)
+    fieldOutput: list[list[tuple[float, float, float, float]]] = []
+    for mode in range(1, modes + 1):
+        values: list[tuple[float, float, float, float]] = []
+        for x, y, z in nodes:
+            u: tuple[float, float, float] = (0.0, 1e-3*math.sin(mode*math.pi*x/max(span, 1e-12)), 0.0)
+            values.append((*u, math.sqrt(sum(c*c for c in u))))
+        fieldOutput.append(values)
+    match analysisType:
+        case 'static':
+            frameDescriptions: list[str] = ['Increment: 1, Time: 1.0']
+            historyOutputDescriptions: list[str] = ['Time', 'Residual', 'Strain Energy']
+            historyOutput: list[list[float]] = [[1.0, 0.0, 1.0]]
+        case 'frequency':
+            frameDescriptions = [
+                f'Mode: {i}, Value: {float(i*i):+.5E}, Frequency: {i/(2*math.pi):+.5E}' for i in range(1, modes + 1)
+            ]
+            historyOutputDescriptions = ['Eigenvalue', 'Frequency']
+            historyOutput = [[float(i*i), i/(2*math.pi)] for i in range(1, modes + 1)]
+        case _:
+            frameDescriptions = [
+                f'Mode: {i}, Value: {float(i):+.5E}, Magnitude: {-float(i):+.5E}' for i in range(1, modes + 1)
+            ]
+            historyOutputDescriptions = ['Eigenvalue', 'Critical Load Magnitude']
+            historyOutput = [[float(i), -float(i)] for i in range(1, modes + 1)]
+
+    # write output database
+    runPhase(len(analysisPhases) + 3, 'Saving output database', 0, 0.0)
+    log(f"Saving output database to file: '{outputDatabaseFile}'")
+    writeOutputDatabase(
+        outputDatabaseFile, modelingSpace, nodes, elements, frameDescriptions, historyOutputDescriptions,
+        historyOutput, fieldOutput, float(os.environ.get('FS_SOLVER_STUB_FRAME_DELAY', '0.0'))
+    )
+    log('Output database saved')
+    log()
+    log('Solver is done')
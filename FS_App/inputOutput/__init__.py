@@ -1,4 +1,5 @@
 '''Public exports.'''
-from inputOutput.abaqusReader import AbaqusReader as AbaqusReader
-from inputOutput.fsWriter     import FSWriter     as FSWriter
-from inputOutput.fsReader     import FSReader     as FSReader
+from inputOutput.abaqusReader        import AbaqusReader        as AbaqusReader
+from inputOutput.fsWriter            import FSWriter            as FSWriter
+from inputOutput.fsReader            import FSReader            as FSReader
+from inputOutput.fsProgressiveReader import FSProgressiveReader as FSProgressiveReader
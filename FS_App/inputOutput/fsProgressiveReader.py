@@ -0,0 +1,172 @@
+import os
+from dataModel import OutputDatabase, Mesh
+from inputOutput.fsReader import FSReader
+
+class FSProgressiveReader:
+    '''
+    Progressive reader of FeaSoft output database files, for files that are still being written by the solver.
+    Every poll parses the complete lines written since the previous poll (the file size is polled), so that the
+    output database exposes the completed frames while the solver keeps appending new ones.
+    A frame is complete once its description, history output and field output have been read.
+    '''
+
+    @property
+    def filePath(self) -> str:
+        '''Output database file path.'''
+        return self._filePath
+
+    @property
+    def outputDatabase(self) -> OutputDatabase | None:
+        '''Output database with the completed frames (None until the mesh has been read).'''
+        return self._outputDatabase
+
+    @property
+    def frameCount(self) -> int:
+        '''Number of frames being written (0 until known).'''
+        return self._frameCount
+
+    @property
+    def isComplete(self) -> bool:
+        '''Determines if the whole output database file has been read.'''
+        return self._isComplete
+
+    # attribute slots
+    __slots__ = (
+        '_filePath', '_fileId', '_offset', '_buffer', '_section', '_isComplete', '_outputDatabase', '_renumbering',
+        '_nodeData', '_elementData', '_frameCount', '_frameDescriptions', '_historyOutputDescriptions',
+        '_historyOutput', '_fieldOutputDescriptions', '_fieldOutput', '_frame'
+    )
+
+    def __init__(self, filePath: str) -> None:
+        '''Progressive reader constructor (nothing is read until polled).'''
+        self._filePath: str = filePath
+        self.reset()
+
+    def reset(self) -> None:
+        '''Discards everything read so far (the file is read again from the start).'''
+        self._fileId: tuple[int, int] | None = None
+        self._offset: int = 0
+        self._buffer: bytes = b''
+        self._section: str | None = None
+        self._isComplete: bool = False
+        self._outputDatabase: OutputDatabase | None = None
+        self._renumbering: tuple[list[int], list[int] | None] | None = None
+        self._nodeData: list[tuple[float, float, float]] = []
+        self._elementData: list[tuple[str, tuple[int, ...]]] = []
+        self._frameCount: int = 0
+        self._frameDescriptions: list[str] = []
+        self._historyOutputDescriptions: list[str] = []
+        self._historyOutput: list[tuple[float, ...]] = []
+        self._fieldOutputDescriptions: list[str] = []
+        self._fieldOutput: list[list[tuple[float, ...]]] = []
+        self._frame: list[tuple[float, ...]] = []
+
+    def poll(self) -> int:
+        '''
+        Reads the lines written since the last poll. Returns the number of new completed frames.
+        If the file has been replaced (e.g. by a new solver run), it is read again from the start:
+        the output database is then a new object.
+        '''
+        try:
+            status: os.stat_result = os.stat(self._filePath)
+        except OSError:
+            return 0
+        fileId: tuple[int, int] = (status.st_dev, status.st_ino)
+        if (self._fileId is not None and fileId != self._fileId) or status.st_size < self._offset: self.reset()
+        self._fileId = fileId
+        if status.st_size == self._offset or self._isComplete: return 0
+        # complete lines only (the last line may still be written)
+        with open(self._filePath, 'rb') as file:
+            file.seek(self._offset)
+            data: bytes = self._buffer + file.read(status.st_size - self._offset)
+        self._offset = status.st_size
+        end: int = data.rfind(b'\n') + 1
+        self._buffer = data[end:]
+        frameCount: int = self._outputDatabase.frameCount if self._outputDatabase else 0
+        try:
+            for line in data[:end].decode().splitlines(): self.parseLine(line)
+        except (ValueError, IndexError, KeyError):
+            raise RuntimeError(f"could not interpret output database from file: '{self._filePath}'")
+        self.appendFrames()
+        if self._isComplete and not self._outputDatabase:
+            raise RuntimeError(f"could not interpret output database from file: '{self._filePath}'")
+        return (self._outputDatabase.frameCount if self._outputDatabase else 0) - frameCount
+
+    def parseLine(self, line: str) -> None:
+        '''Parses a complete line of the output database file.'''
+        text: str = line.strip()
+        # assignments (outside of the data sections)
+        if self._section is None:
+            if not text or text.startswith(('#', 'from ')): return
+            name, _, value = text.partition(' = ')
+            match name:
+                case 'mesh':
+                    self.createOutputDatabase(int(value.partition('(')[2].split(',')[0]))
+                case 'numberOfFrames':
+                    self._frameCount = int(value)
+                case _:
+                    if value.endswith('('): self._section = name
+            return
+        # end of a data section
+        if text == ')':
+            if self._section == 'outputDatabase': self._isComplete = True
+            self._section = None
+            return
+        # data section entries
+        match self._section:
+            case 'nodeData':
+                x, y, z = (float(value) for value in text.strip('(),').split(','))
+                self._nodeData.append((x, y, z))
+            case 'elementData':
+                elementType, _, nodeIndices = text[2:].partition("'")
+                self._elementData.append(
+                    (elementType, tuple(int(index) for index in nodeIndices.strip(' ,()').split(',') if index))
+                )
+            case 'frameDescriptions':
+                self._frameDescriptions.append(text[1:-2])
+            case 'historyOutputDescriptions':
+                self._historyOutputDescriptions.append(text[1:-2])
+            case 'fieldOutputDescriptions':
+                self._fieldOutputDescriptions.append(text[1:-2])
+            case 'historyOutput':
+                self._historyOutput.append(tuple(float(value) for value in text.strip('(),').split(',') if value))
+            case 'fieldOutput':
+                if text == '(':
+                    self._frame = []
+                elif text == '),':
+                    self._fieldOutput.append(self._frame)
+                    self._frame = []
+                else:
+                    self._frame.append(tuple(float(value) for value in text.strip('(),').split(',')))
+            case _:
+                pass
+
+    def createOutputDatabase(self, modelingSpace: int) -> None:
+        '''Creates the (empty) output database from the mesh read so far.'''
+        mesh: Mesh = Mesh(modelingSpace, self._nodeData, self._elementData)
+        self._outputDatabase = OutputDatabase(mesh, 0, (), (), (), (), ())
+        self._outputDatabase.filePath = self._filePath
+        self._nodeData, self._elementData = [], []
+        # map the results of a renumbered solver job back to the original node and element order
+        self._renumbering = FSReader.readRenumbering(self._filePath)
+        if self._renumbering: self._outputDatabase.restoreOrder(*self._renumbering)
+
+    def appendFrames(self) -> None:
+        '''Appends the completed frames read so far to the output database.'''
+        if not self._outputDatabase: return
+        first: int = self._outputDatabase.frameCount
+        last: int = min(len(self._frameDescriptions), len(self._historyOutput), first + len(self._fieldOutput))
+        if last <= first: return
+        fieldOutput: list[list[tuple[float, ...]]] = self._fieldOutput[:last - first]
+        del self._fieldOutput[:last - first]
+        # nodal values in the original node order
+        if self._renumbering:
+            nodeOrder: list[int] = self._renumbering[0]
+            for values in fieldOutput:
+                originalValues: list[tuple[float, ...]] = list(values)
+                for value, originalIndex in zip(values, nodeOrder): originalValues[originalIndex] = value
+                values[:] = originalValues
+        self._outputDatabase.appendFrames(
+            self._frameDescriptions[first:last], self._historyOutputDescriptions, self._fieldOutputDescriptions,
+            self._historyOutput[first:last], fieldOutput
+        )
@@ -1,3 +1,5 @@
+import os
+import json
 from typing import Any
 from dataModel import ModelDatabase, OutputDatabase
 
@@ -8,8 +10,8 @@ class FSReader:
 
     @staticmethod
     def readModelDatabase(filePath: str) -> ModelDatabase:
-        '''Reads the model database from the specified file.'''
-        variables: dict[str, Any] = {}
+        '''Reads the model database from the specified file (variants refer to their base file relative to __file__).'''
+        variables: dict[str, Any] = {'__file__': filePath}
         with open(filePath, 'r') as file:
             exec(file.read(), variables)
         if 'modelDatabase' in variables and isinstance(variables['modelDatabase'], ModelDatabase):
@@ -25,5 +27,20 @@ class FSReader:
             exec(file.read(), variables)
         if 'outputDatabase' in variables and isinstance(variables['outputDatabase'], OutputDatabase):
             variables['outputDatabase'].filePath = filePath
+            # map the results of a renumbered solver job back to the original node and element order
+            renumbering: tuple[list[int], list[int] | None] | None = FSReader.readRenumbering(filePath)
+            if renumbering: variables['outputDatabase'].restoreOrder(*renumbering)
             return variables['outputDatabase']
         raise RuntimeError(f"could not interpret output database from file: '{filePath}'")
+
+    @staticmethod
+    def readRenumbering(filePath: str) -> tuple[list[int], list[int] | None] | None:
+        '''
+        Reads the node and element orders (original index per renumbered index) written by the preprocessor next to
+        the specified job or output database file. Returns None if the solver job was not renumbered.
+        '''
+        renumberingFile: str = os.path.splitext(filePath)[0] + '.fs_prm'
+        if not os.path.isfile(renumberingFile): return None
+        with open(renumberingFile, 'r') as file:
+            data: dict[str, Any] = json.load(file)
+        return list(data['nodes']), list(data['elements']) if data.get('elements') is not None else None
@@ -1,5 +1,7 @@
+import os
 from typing import cast
 from datetime import datetime
+from collections.abc import Sequence
 from dataModel import (
     NodeSet, ElementSet, Material, Section, ConcentratedLoad, BoundaryCondition, ModelDatabase, BodyLoad, SurfaceSet,
     SurfaceTraction, Pressure
@@ -225,5 +227,51 @@ class FSWriter:
                         file.write(f'boundaryCondition{i + 1}.isActiveInZ = {boundaryCondition.isActiveInZ}' + '\n')
                     file.write('\n')
 
+    @staticmethod
+    def writeModelDatabaseVariant(
+        modelDatabase: ModelDatabase,
+        baseFilePath: str,
+        parameters: Sequence[tuple[str, str, str]]
+    ) -> None:
+        '''
+        Writes the specified model database to file as a variant of a base model database file: only the values of
+        the specified parameters (container name, data object name, attribute name) are written, the rest of the
+        model (in particular the mesh) is read from the base file (referenced relative to the variant file).
+        '''
+        comment: str = '# '
+        separator: str = comment + '='*(80 - len(comment))
+        try:
+            basePath: str = os.path.relpath(baseFilePath, os.path.dirname(os.path.abspath(modelDatabase.filePath)))
+        except ValueError:
+            basePath = os.path.abspath(baseFilePath) # on another drive
+        with open(modelDatabase.filePath, 'w') as file:
+            # header and imports
+            file.write(separator + '\n')
+            file.write(comment + 'MODEL DATABASE VARIANT GENERATED BY FEASOFT' + '\n')
+            file.write(comment + datetime.now().isoformat(sep=' ', timespec='seconds') + '\n')
+            file.write(separator + '\n')
+            file.write('import os' + '\n')
+            file.write('from inputOutput import FSReader' + '\n')
+            file.write('\n')
+            # base model database
+            file.write(separator + '\n')
+            file.write(comment + 'BASE MODEL DATABASE' + '\n')
+            file.write(separator + '\n')
+            file.write(
+                f'modelDatabase = FSReader.readModelDatabase(os.path.join(os.path.dirname(__file__), {basePath!r}))' +
+                '\n'
+            )
+            file.write('\n')
+            # parameters
+            file.write(separator + '\n')
+            file.write(comment + 'PARAMETERS' + '\n')
+            file.write(separator + '\n')
+            for containerName, dataObjectName, attributeName in parameters:
+                value: object = getattr(getattr(modelDatabase, containerName)[dataObjectName], attributeName)
+                file.write(
+                    f"modelDatabase.{containerName}['{dataObjectName}'].{attributeName} = " +
+                    (f"'{value}'" if isinstance(value, str) else f'{value}') + '\n'
+                )
+
     # attribute slots
     __slots__ = ()
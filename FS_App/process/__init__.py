@@ -1,2 +1,12 @@
 '''Public exports.'''
-from process.subprocess import Subprocess as Subprocess
+from process.subprocess    import Subprocess       as Subprocess
+from process.executables   import Executables      as Executables
+from process.telemetry     import TelemetrySampler as TelemetrySampler
+from process.resultCache   import ResultCache      as ResultCache
+from process.progress      import SolverProgress   as SolverProgress
+from process.renumbering   import Renumbering      as Renumbering
+from process.costPredictor import CostPredictor    as CostPredictor
+from process.jobStates     import JobStates        as JobStates
+from process.job           import Job              as Job
+from process.jobQueue      import JobQueue         as JobQueue
+from process.sweep         import Sweep            as Sweep
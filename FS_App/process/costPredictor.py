@@ -0,0 +1,247 @@
+import os
+import json
+import numpy as np
+from typing import Any, cast
+from collections.abc import Sequence
+from dataModel import ModelDatabase, Mesh, NodeSet, BoundaryCondition
+from process.renumbering import Renumbering
+
+class CostPredictor:
+    '''
+    Prediction of the solve time and peak memory of a solver job, before it is run.
+    The algebraic size of the problem is computed from the model database as numbered by the solver, i.e. after the
+    renumbering of the preprocessor (which keeps the original numbering unless the renumbering reduces the profile):
+    the number of active degrees of freedom, the nonzeros of the (upper triangle of the) stiffness matrix from the
+    node-element adjacency, and the profile (envelope) and bandwidth of the matrix from the connectivity.
+    These give an estimate of the solution effort (operations) and storage (matrix values), which a calibration
+    table maps to seconds and MB: a linear fit per analysis type over the recorded runs of completed jobs.
+    Uncalibrated analysis types use conservative defaults. The calibration file is versioned: runs recorded with an
+    older version of the measurements are discarded.
+    '''
+
+    # class variables
+    _calibrationFile: str = os.path.join(os.path.expanduser('~'), '.feasoft', 'cost.json')
+    _calibration: dict[str, list[dict[str, float]]] | None = None
+    _maxRecords: int = 50
+    # version 2: peak memory of the solver process only (version 1 included the memory of the parent process)
+    _calibrationVersion: int = 2
+    # defaults: seconds per operation, MB per stored value (factor and work arrays), and offsets
+    _defaultTime: tuple[float, float] = (0.5, 1.0/2e9)
+    _defaultMemory: tuple[float, float] = (50.0, 3*8e-6)
+
+    @property
+    def analysisType(self) -> str:
+        '''Analysis type (calibration key).'''
+        return self._analysisType
+
+    @analysisType.setter
+    def analysisType(self, value: str) -> None:
+        self._analysisType = value
+
+    @property
+    def eigenvalues(self) -> int:
+        '''Requested number of eigenvalues (frequency and buckle analyses).'''
+        return self._eigenvalues
+
+    @eigenvalues.setter
+    def eigenvalues(self, value: int) -> None:
+        if value < 1: raise ValueError('the number of eigenvalues must be positive')
+        self._eigenvalues = value
+
+    @property
+    def renumbering(self) -> str:
+        '''Node renumbering method of the preprocessor the problem size is computed for.'''
+        return self._renumbering
+
+    @property
+    def dofs(self) -> int:
+        '''Number of active degrees of freedom.'''
+        return self._dofs
+
+    @property
+    def nonzeros(self) -> int:
+        '''Number of nonzeros of the upper triangle of the stiffness matrix.'''
+        return self._nonzeros
+
+    @property
+    def profile(self) -> int:
+        '''Profile of the stiffness matrix (number of values in its lower envelope, diagonal included).'''
+        return self._profile
+
+    @property
+    def bandwidth(self) -> int:
+        '''Half-bandwidth of the stiffness matrix.'''
+        return self._bandwidth
+
+    @property
+    def effort(self) -> float:
+        '''Estimated number of operations (factorization of the envelope plus the solves).'''
+        solves: int = 1 if self._analysisType == 'static' else 2*self._eigenvalues
+        return self._factorization + 2.0*self.storage*solves
+
+    @property
+    def storage(self) -> float:
+        '''Estimated number of stored values (matrix and factor).'''
+        return float(self._nonzeros + self._profile)
+
+    # attribute slots
+    __slots__ = (
+        '_analysisType', '_eigenvalues', '_renumbering', '_dofs', '_nonzeros', '_profile', '_bandwidth',
+        '_factorization'
+    )
+
+    def __init__(
+        self,
+        modelDatabase: ModelDatabase,
+        analysisType: str = 'static',
+        eigenvalues: int = 10,
+        renumbering: str = 'none'
+    ) -> None:
+        '''Cost predictor constructor (analyzes the model database, as renumbered by the preprocessor).'''
+        self._analysisType: str = analysisType
+        self._renumbering: str = renumbering
+        self._eigenvalues: int = 1
+        self.eigenvalues = eigenvalues
+        self._dofs: int = 0
+        self._nonzeros: int = 0
+        self._profile: int = 0
+        self._bandwidth: int = 0
+        self._factorization: float = 0.0
+        self.analyze(modelDatabase)
+        # the preprocessor keeps the original numbering if the renumbering does not reduce the profile
+        if renumbering != 'none':
+            try:
+                nodeOrder: list[int] = Renumbering.nodeOrder(modelDatabase, renumbering)
+            except ImportError:
+                return
+            profile: int = self._profile
+            self.analyze(modelDatabase, nodeOrder)
+            if self._profile >= profile: self.analyze(modelDatabase)
+
+    def analyze(self, modelDatabase: ModelDatabase, nodeOrder: Sequence[int] | None = None) -> None:
+        '''Computes the algebraic size of the model database (with its nodes in the order, if specified).'''
+        mesh: Mesh = modelDatabase.mesh
+        nodeCount: int = len(mesh.nodes)
+        dimensions: int = mesh.modelingSpace.value
+        # active degrees of freedom per node (constrained components are eliminated by the solver)
+        active: np.ndarray = np.ones((nodeCount, dimensions), dtype=bool)
+        for boundaryCondition in cast(tuple[BoundaryCondition, ...], modelDatabase.boundaryConditions.dataObjects()):
+            if boundaryCondition.nodeSetName not in modelDatabase.nodeSets.names(): continue
+            indices: list[int] = list(cast(NodeSet, modelDatabase.nodeSets[boundaryCondition.nodeSetName]).indices())
+            flags: tuple[bool, ...] = (
+                boundaryCondition.isActiveInX, boundaryCondition.isActiveInY, boundaryCondition.isActiveInZ
+            )
+            for j in range(dimensions):
+                if flags[j] and indices: active[indices, j] = False
+        counts: np.ndarray = active.sum(axis=1).astype(np.int64)
+        # unique node pairs (i < j) of the node-element adjacency
+        low, high = Renumbering.nodePairs(modelDatabase)
+        keep: np.ndarray = low != high
+        low, high = low[keep], high[keep]
+        # renumbered nodes (new index per original index)
+        if nodeOrder is not None:
+            order: np.ndarray = np.asarray(nodeOrder, dtype=np.int64)
+            rank: np.ndarray = np.empty(nodeCount, dtype=np.int64)
+            rank[order] = np.arange(nodeCount, dtype=np.int64)
+            counts = counts[order]
+            low, high = np.minimum(rank[low], rank[high]), np.maximum(rank[low], rank[high])
+        # nonzeros: diagonal node blocks (upper triangles) plus off-diagonal node blocks
+        self._dofs = int(counts.sum())
+        self._nonzeros = int((counts*(counts + 1)//2).sum() + (counts[low]*counts[high]).sum())
+        # envelope: first column per row (degrees of freedom are numbered node by node; fully constrained neighbors
+        # have no columns)
+        offsets: np.ndarray = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        firstNode: np.ndarray = np.arange(nodeCount, dtype=np.int64)
+        coupled: np.ndarray = (counts[low] > 0) & (counts[high] > 0)
+        np.minimum.at(firstNode, high[coupled], low[coupled])
+        base: np.ndarray = (offsets - offsets[firstNode]).astype(np.float64)
+        widths: np.ndarray = counts*base + counts*(counts + 1)//2
+        self._profile = int(widths.sum())
+        hasDofs: np.ndarray = counts > 0
+        self._bandwidth = int((base + counts - 1)[hasDofs].max()) if hasDofs.any() else 0
+        # envelope factorization: sum of the squared row widths
+        meanWidths: np.ndarray = base + (counts + 1)/2
+        self._factorization = float((counts*meanWidths**2).sum())
+
+    def time(self) -> float:
+        '''Returns the predicted solve time in seconds.'''
+        intercept, slope = self.fit('time', 'effort', CostPredictor._defaultTime)
+        return intercept + slope*self.effort
+
+    def memory(self) -> float:
+        '''Returns the predicted peak memory usage in MB.'''
+        intercept, slope = self.fit('memory', 'storage', CostPredictor._defaultMemory)
+        return intercept + slope*self.storage
+
+    def fit(self, target: str, feature: str, default: tuple[float, float]) -> tuple[float, float]:
+        '''
+        Fits the target (time or memory) of the recorded runs of this analysis type linearly to the feature
+        (effort or storage). Returns the intercept and slope (the defaults if there are no records).
+        '''
+        records: list[dict[str, float]] = self.calibration().get(self._analysisType, [])
+        x: np.ndarray = np.array([record[feature] for record in records], dtype=np.float64)
+        y: np.ndarray = np.array([record[target] for record in records], dtype=np.float64)
+        if x.size == 0 or x.max() <= 0.0: return default
+        # a single run (or runs of the same size) only scales the default
+        if x.size < 2 or np.ptp(x) <= 1e-3*x.max():
+            scale: float = float(y.mean())/(default[0] + default[1]*float(x.mean()))
+            return (default[0]*scale, default[1]*scale)
+        slope, intercept = (float(value) for value in np.polyfit(x, y, 1))
+        if slope <= 0.0: return (0.0, float((y/np.maximum(x, 1.0)).mean()))
+        return (max(0.0, intercept), slope)
+
+    def record(self, seconds: float, memory: float) -> None:
+        '''Records the measured solve time (seconds) and peak memory (MB) of a completed run (and saves them).'''
+        if seconds <= 0.0 or self._dofs <= 0: return
+        calibration: dict[str, list[dict[str, float]]] = self.calibration()
+        records: list[dict[str, float]] = calibration.setdefault(self._analysisType, [])
+        records.append({
+            'dofs': self._dofs, 'effort': self.effort, 'storage': self.storage, 'time': seconds, 'memory': memory
+        })
+        del records[:-CostPredictor._maxRecords]
+        try:
+            os.makedirs(os.path.dirname(CostPredictor._calibrationFile), exist_ok=True)
+            with open(CostPredictor._calibrationFile, 'w') as file:
+                json.dump({'version': CostPredictor._calibrationVersion, 'analyses': calibration}, file, indent=2)
+        except OSError:
+            pass
+
+    def report(self) -> str:
+        '''Returns a short (log) report of the problem size and the predictions.'''
+        return (
+            f'Problem size: {self._dofs} active degrees of freedom, {self._nonzeros} nonzeros, '
+            f'profile {self._profile}, bandwidth {self._bandwidth}\n'
+            f'Predicted solve time: {CostPredictor.formatTime(self.time())}, '
+            f"predicted memory: {self.memory():.0f} MB{'' if self.isCalibrated() else ' (uncalibrated)'}\n"
+        )
+
+    def isCalibrated(self) -> bool:
+        '''Determines if there are recorded runs of this analysis type.'''
+        return bool(self.calibration().get(self._analysisType))
+
+    @staticmethod
+    def formatTime(seconds: float) -> str:
+        '''Formats a duration in seconds (h:mm:ss).'''
+        return f'{int(seconds)//3600}:{int(seconds)%3600//60:02d}:{int(seconds)%60:02d}'
+
+    @classmethod
+    def calibration(cls) -> dict[str, list[dict[str, float]]]:
+        '''Returns the calibration table (recorded runs per analysis type).'''
+        if cls._calibration is None:
+            try:
+                with open(cls._calibrationFile, 'r') as file:
+                    data: dict[str, Any] = json.load(file)
+                analyses: dict[str, Any] = data['analyses'] if data.get('version') == cls._calibrationVersion else {}
+                cls._calibration = {
+                    analysisType: [{key: float(value) for key, value in record.items()} for record in records]
+                    for analysisType, records in analyses.items()
+                }
+            except (OSError, ValueError, TypeError, AttributeError, KeyError):
+                cls._calibration = {}
+        return cls._calibration
+
+    @classmethod
+    def setCalibrationFile(cls, value: str) -> None:
+        '''Sets the calibration file path (the calibration is reloaded).'''
+        cls._calibrationFile = value
+        cls._calibration = None
@@ -0,0 +1,36 @@
+import os
+import sys
+
+class Executables:
+    '''
+    Paths of the external executables (preprocessor and solver).
+    Defaults can be overridden with the FS_PREPROCESSOR and FS_SOLVER environment variables.
+    '''
+
+    # class variables
+    _suffix: str = '.exe' if sys.platform == 'win32' else ''
+    _preprocessor: str = os.environ.get('FS_PREPROCESSOR', './fs_preprocessor' + _suffix)
+    _solver: str = os.environ.get('FS_SOLVER', './fs_solver' + _suffix)
+
+    @classmethod
+    def preprocessor(cls) -> str:
+        '''Gets the preprocessor executable path.'''
+        return cls._preprocessor
+
+    @classmethod
+    def setPreprocessor(cls, value: str) -> None:
+        '''Sets the preprocessor executable path.'''
+        cls._preprocessor = value
+
+    @classmethod
+    def solver(cls) -> str:
+        '''Gets the solver executable path.'''
+        return cls._solver
+
+    @classmethod
+    def setSolver(cls, value: str) -> None:
+        '''Sets the solver executable path.'''
+        cls._solver = value
+
+    # attribute slots
+    __slots__ = ()
@@ -0,0 +1,376 @@
+import sys
+import time
+import os.path
+from typing import Literal, Sequence
+from process.subprocess import Subprocess
+from process.executables import Executables
+from process.jobStates import JobStates
+from process.telemetry import TelemetrySampler
+from process.resultCache import ResultCache
+from process.costPredictor import CostPredictor
+
+class Job:
+    '''
+    Definition of a solver job: the preprocessor and solver runs of a model database.
+    The job is driven by its poll method, which also records the peak memory and CPU time of its processes.
+    The processes can be limited to a number of math library threads (OMP, MKL and OpenBLAS environment variables)
+    and restricted to a set of logical CPUs. Unless set explicitly, both follow the cores assigned on start.
+    The preprocessor can renumber the nodes and elements to reduce the bandwidth of the solver matrices.
+    '''
+
+    # class variables
+    _threadVariables: tuple[str, ...] = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS')
+
+    @property
+    def name(self) -> str:
+        '''Job name (model database file name without extension).'''
+        return os.path.splitext(os.path.basename(self._modelDatabaseFile))[0]
+
+    @property
+    def modelDatabaseFile(self) -> str:
+        '''Model database file path.'''
+        return self._modelDatabaseFile
+
+    @property
+    def solverJobInputFile(self) -> str:
+        '''Solver job input file path.'''
+        return os.path.splitext(self._modelDatabaseFile)[0] + '.fs_job'
+
+    @property
+    def outputDatabaseFile(self) -> str:
+        '''Output database file path.'''
+        return os.path.splitext(self._modelDatabaseFile)[0] + '.fs_odb'
+
+    @property
+    def logFile(self) -> str:
+        '''Log file path.'''
+        return os.path.splitext(self._modelDatabaseFile)[0] + '.fs_log'
+
+    @property
+    def analysisType(self) -> Literal['static', 'frequency', 'buckle']:
+        '''Analysis type.'''
+        return self._analysisType
+
+    @property
+    def eigenvalues(self) -> int:
+        '''Requested number of eigenvalues (frequency and buckle analyses).'''
+        return self._eigenvalues
+
+    @property
+    def priority(self) -> int:
+        '''Job priority (higher values are started first).'''
+        return self._priority
+
+    @property
+    def maxRetries(self) -> int:
+        '''Maximum number of retries after a failed attempt.'''
+        return self._maxRetries
+
+    @property
+    def telemetryFile(self) -> str:
+        '''Telemetry (time-series) file path.'''
+        return os.path.splitext(self._modelDatabaseFile)[0] + '.fs_tel'
+
+    @property
+    def telemetryInterval(self) -> float:
+        '''Telemetry sampling interval in seconds.'''
+        return self._telemetryInterval
+
+    @telemetryInterval.setter
+    def telemetryInterval(self, value: float) -> None:
+        if value <= 0.0: raise ValueError('the sampling interval must be positive')
+        self._telemetryInterval = value
+
+    @property
+    def memoryEstimate(self) -> float:
+        '''Estimated peak memory usage in MB (used for admission by the job queue; predicted if not set).'''
+        if self._memoryEstimate <= 0.0 and self._cost: return self._cost.memory()
+        return self._memoryEstimate
+
+    @memoryEstimate.setter
+    def memoryEstimate(self, value: float) -> None:
+        self._memoryEstimate = value
+
+    @property
+    def cost(self) -> CostPredictor | None:
+        '''Cost prediction of the job (completed solver runs are recorded to calibrate it).'''
+        return self._cost
+
+    @cost.setter
+    def cost(self, value: CostPredictor | None) -> None:
+        self._cost = value
+
+    @property
+    def solveTime(self) -> float:
+        '''Wall time in seconds of the solver stage of the last attempt.'''
+        return self._solveTime
+
+    @property
+    def solveMemory(self) -> float:
+        '''Peak physical memory usage in MB of the solver stage of the last attempt.'''
+        return self._solveMemory
+
+    @property
+    def forceSolve(self) -> bool:
+        '''Solve even if the results of an identical job are available in the result cache.'''
+        return self._forceSolve
+
+    @forceSolve.setter
+    def forceSolve(self, value: bool) -> None:
+        self._forceSolve = value
+
+    @property
+    def isCached(self) -> bool:
+        '''Determines if the results of the last attempt were taken from the result cache.'''
+        return self._isCached
+
+    @property
+    def threads(self) -> int | None:
+        '''Number of math library threads (None: one per assigned core, or the library default).'''
+        return self._threads
+
+    @threads.setter
+    def threads(self, value: int | None) -> None:
+        if value is not None and value < 1: raise ValueError('the number of threads must be positive')
+        self._threads = value
+
+    @property
+    def affinity(self) -> tuple[int, ...] | None:
+        '''Logical CPUs the processes are restricted to (None: the assigned cores, or no restriction).'''
+        return self._affinity
+
+    @affinity.setter
+    def affinity(self, value: Sequence[int] | None) -> None:
+        if value is not None and not value: raise ValueError('the CPU affinity must not be empty')
+        self._affinity = tuple(value) if value is not None else None
+
+    @property
+    def renumbering(self) -> Literal['none', 'rcm', 'morton']:
+        '''Node renumbering method of the preprocessor (reverse Cuthill-McKee or Morton curve ordering).'''
+        return self._renumbering
+
+    @renumbering.setter
+    def renumbering(self, value: Literal['none', 'rcm', 'morton']) -> None:
+        if value not in ('none', 'rcm', 'morton'): raise ValueError('invalid renumbering method')
+        self._renumbering = value
+
+    @property
+    def cores(self) -> tuple[int, ...]:
+        '''Logical CPUs used by the current attempt (empty if not restricted).'''
+        return self._affinity if self._affinity is not None else self._cores
+
+    @property
+    def state(self) -> JobStates:
+        '''Current job state.'''
+        return self._state
+
+    @property
+    def stage(self) -> Literal['preprocessor', 'solver'] | None:
+        '''Current job stage (while running).'''
+        return self._stage
+
+    @property
+    def attempts(self) -> int:
+        '''Number of started attempts.'''
+        return self._attempts
+
+    @property
+    def exitCode(self) -> int | None:
+        '''Exit code of the last finished process.'''
+        return self._exitCode
+
+    @property
+    def peakMemory(self) -> float:
+        '''Peak physical memory usage in MB (over all stages of the last attempt).'''
+        return self._peakMemory
+
+    @property
+    def memory(self) -> float:
+        '''Current physical memory usage in MB (process tree).'''
+        return self._sampler.memory if self._sampler and self._state == JobStates.Running else 0.0
+
+    @property
+    def cpuTime(self) -> float:
+        '''CPU time in seconds (over all stages of the last attempt).'''
+        return self._cpuTime + (self._sampler.cpuTime if self._sampler else 0.0)
+
+    # attribute slots
+    __slots__ = (
+        '_modelDatabaseFile', '_analysisType', '_eigenvalues', '_priority', '_maxRetries', '_memoryEstimate', '_state',
+        '_stage', '_attempts', '_exitCode', '_peakMemory', '_cpuTime', '_process', '_sampler', '_telemetryInterval',
+        '_forceSolve', '_cacheKey', '_isCached', '_threads', '_affinity', '_cores', '_cost', '_solveTime',
+        '_solverStartTime', '_renumbering', '_solveMemory'
+    )
+
+    def __init__(
+        self,
+        modelDatabaseFile: str,
+        analysisType: Literal['static', 'frequency', 'buckle'] = 'static',
+        eigenvalues: int = 10,
+        priority: int = 0,
+        maxRetries: int = 0,
+        memoryEstimate: float = 0.0
+    ) -> None:
+        '''Job constructor.'''
+        if analysisType not in ('static', 'frequency', 'buckle'):
+            raise ValueError('invalid analysis type')
+        if eigenvalues < 1:
+            raise ValueError('the number of eigenvalues must be positive')
+        if maxRetries < 0:
+            raise ValueError('the number of retries must not be negative')
+        self._modelDatabaseFile: str = modelDatabaseFile
+        self._analysisType: Literal['static', 'frequency', 'buckle'] = analysisType
+        self._eigenvalues: int = eigenvalues
+        self._priority: int = priority
+        self._maxRetries: int = maxRetries
+        self._memoryEstimate: float = memoryEstimate
+        self._state: JobStates = JobStates.Queued
+        self._stage: Literal['preprocessor', 'solver'] | None = None
+        self._attempts: int = 0
+        self._exitCode: int | None = None
+        self._peakMemory: float = 0.0
+        self._cpuTime: float = 0.0
+        self._process: Subprocess = Subprocess()
+        self._sampler: TelemetrySampler | None = None
+        self._telemetryInterval: float = 0.5
+        self._forceSolve: bool = False
+        self._cacheKey: str | None = None
+        self._isCached: bool = False
+        self._threads: int | None = None
+        self._affinity: tuple[int, ...] | None = None
+        self._cores: tuple[int, ...] = ()
+        self._cost: CostPredictor | None = None
+        self._solveTime: float = 0.0
+        self._solverStartTime: float = 0.0
+        self._renumbering: Literal['none', 'rcm', 'morton'] = 'none'
+        self._solveMemory: float = 0.0
+
+    def environment(self) -> dict[str, str]:
+        '''Returns the environment variables of the job processes (thread counts and renumbering method).'''
+        threads: int | None = self._threads if self._threads is not None else (len(self.cores) or None)
+        environment: dict[str, str] = {name: str(threads) for name in Job._threadVariables} if threads else {}
+        environment['FS_RENUMBER'] = self._renumbering
+        return environment
+
+    def start(self, cores: Sequence[int] = ()) -> None:
+        '''Starts a new attempt of the job (preprocessor stage) on the specified cores (if any, see cores).'''
+        if self._state == JobStates.Running:
+            raise RuntimeError('the job is already running')
+        self._state = JobStates.Running
+        self._stage = 'preprocessor'
+        self._attempts += 1
+        self._exitCode = None
+        self._peakMemory = 0.0
+        self._cpuTime = 0.0
+        self._cacheKey = None
+        self._isCached = False
+        self._cores = tuple(cores)
+        self._solveTime = 0.0
+        self._solveMemory = 0.0
+        self._process.start(
+            exe=Executables.preprocessor(),
+            args=(
+                self._modelDatabaseFile,
+                self.solverJobInputFile,
+                self.logFile,
+                self._analysisType,
+                str(getattr(sys, 'tracebacklimit', 1000))
+            ),
+            env=self.environment(),
+            affinity=self.cores
+        )
+        self.startSampler()
+
+    def poll(self) -> JobStates:
+        '''Samples the running process, advances the job to its next stage when needed, and returns the job state.'''
+        if self._state != JobStates.Running: return self._state
+        if self._process.isAlive(): return self._state
+        # process has exited
+        self._exitCode = self._process.exitCode()
+        self._process.terminate()
+        self.stopSampler(self._process.usage())
+        if self._exitCode != 0:
+            self._state = JobStates.Failed
+            self._stage = None
+        elif self._stage == 'preprocessor':
+            # reuse the results of an identical job if available
+            try:
+                self._cacheKey = ResultCache.key(
+                    self.solverJobInputFile, self._analysisType, self._eigenvalues, Executables.solver()
+                ) if ResultCache.isEnabled() else None
+            except OSError:
+                self._cacheKey = None
+            if self._cacheKey and not self._forceSolve and ResultCache.fetch(self._cacheKey, self.outputDatabaseFile):
+                with open(self.logFile, 'a') as log:
+                    log.write(f'Solver skipped: results taken from the result cache (key: {self._cacheKey})\n\n')
+                self._isCached = True
+                self._state = JobStates.Done
+                self._stage = None
+                return self._state
+            self._stage = 'solver'
+            with open(self.logFile, 'a') as log:
+                if self._cost: log.write(self._cost.report() + '\n')
+                log.flush()
+                self._solverStartTime = time.perf_counter()
+                self._process.start(
+                    exe=Executables.solver(),
+                    args=(self.solverJobInputFile, self.outputDatabaseFile, self._analysisType, str(self._eigenvalues)),
+                    stdout=log,
+                    stderr=log,
+                    env=self.environment(),
+                    affinity=self.cores
+                )
+            self.startSampler()
+        else:
+            self._solveTime = time.perf_counter() - self._solverStartTime
+            # calibrate with the solver stage only (and the problem size as numbered by the preprocessor)
+            if self._cost and self._cost.renumbering == self._renumbering:
+                self._cost.record(self._solveTime, self._solveMemory)
+            if self._cacheKey:
+                try: ResultCache.store(self._cacheKey, self.outputDatabaseFile)
+                except OSError: pass
+            self._state = JobStates.Done
+            self._stage = None
+        return self._state
+
+    def cancel(self) -> None:
+        '''Cancels the job (terminates its running process, if any).'''
+        if self._state in (JobStates.Done, JobStates.Failed, JobStates.Cancelled): return
+        self._process.terminate()
+        self.stopSampler()
+        self._state = JobStates.Cancelled
+        self._stage = None
+
+    def requeue(self) -> None:
+        '''Puts a failed job back in the queued state.'''
+        if self._state != JobStates.Failed:
+            raise RuntimeError('only failed jobs can be requeued')
+        self._state = JobStates.Queued
+
+    def startSampler(self) -> None:
+        '''Starts sampling the resource usage of the current stage process tree.'''
+        pid: int | None = self._process.pid()
+        if pid is None: return
+        self._sampler = TelemetrySampler(
+            pid,
+            self.telemetryFile,
+            self._telemetryInterval,
+            label=str(self._stage),
+            append=self._stage != 'preprocessor'
+        )
+        self._sampler.start()
+
+    def stopSampler(self, usage: tuple[float, float] | None = None) -> None:
+        '''
+        Stops sampling, records the peak memory and CPU time, and appends the telemetry report to the log.
+        The resource usage of the exited process (see Subprocess.usage) completes the sampled values.
+        '''
+        if not self._sampler: return
+        self._sampler.stop(usage)
+        peakMemory: float = self._sampler.summary()['peakMemory']
+        if self._stage == 'solver': self._solveMemory = peakMemory
+        self._peakMemory = max(self._peakMemory, peakMemory)
+        self._cpuTime += self._sampler.cpuTime
+        with open(self.logFile, 'a') as log:
+            log.write(self._sampler.report() + '\n')
+        self._sampler = None
@@ -0,0 +1,162 @@
+import time
+import heapq
+import asyncio
+from psutil import Process as ProcessInfo, cpu_count, virtual_memory
+from process.job import Job
+from process.jobStates import JobStates
+
+class JobQueue:
+    '''
+    Queue of solver jobs run concurrently by a bounded pool of workers.
+    Queued jobs are started by priority (then by submission order) while a worker is free and
+    the free memory reported by psutil can accommodate the job memory estimate (plus a reserve).
+    The queue is driven by its poll method: either from a GUI timer or from the (blocking) run method.
+    If core partitioning is enabled, the available logical CPUs are split evenly between the workers:
+    each started job is restricted to its free share of cores and its math libraries use one thread per core,
+    so that concurrent jobs do not oversubscribe the machine. A job waits in the queue while no share of cores is
+    free (e.g. more workers than logical CPUs), unless it has its own CPU affinity.
+    '''
+
+    @property
+    def maxWorkers(self) -> int:
+        '''Maximum number of concurrently running jobs.'''
+        return self._maxWorkers
+
+    @maxWorkers.setter
+    def maxWorkers(self, value: int) -> None:
+        if value < 1: raise ValueError('the number of workers must be positive')
+        self._maxWorkers = value
+
+    @property
+    def memoryReserve(self) -> float:
+        '''Free memory (in MB) that must remain available after starting a job.'''
+        return self._memoryReserve
+
+    @memoryReserve.setter
+    def memoryReserve(self, value: float) -> None:
+        if value < 0.0: raise ValueError('the memory reserve must not be negative')
+        self._memoryReserve = value
+
+    @property
+    def partitionCores(self) -> bool:
+        '''Determines if the available cores are partitioned between concurrent jobs.'''
+        return self._partitionCores
+
+    @partitionCores.setter
+    def partitionCores(self, value: bool) -> None:
+        self._partitionCores = value
+
+    # attribute slots
+    __slots__ = ('_maxWorkers', '_memoryReserve', '_jobs', '_queue', '_counter', '_partitionCores')
+
+    def __init__(
+        self,
+        maxWorkers: int | None = None,
+        memoryReserve: float = 512.0,
+        partitionCores: bool = True
+    ) -> None:
+        '''Job queue constructor. By default, one worker is used per physical core.'''
+        self._maxWorkers: int = 1
+        self._memoryReserve: float = 0.0
+        self.maxWorkers = maxWorkers if maxWorkers else (cpu_count(logical=False) or cpu_count() or 1)
+        self.memoryReserve = memoryReserve
+        self._jobs: list[Job] = []
+        self._queue: list[tuple[int, int, Job]] = []
+        self._counter: int = 0
+        self._partitionCores: bool = partitionCores
+
+    def jobs(self) -> tuple[Job, ...]:
+        '''Returns all submitted jobs (in submission order).'''
+        return tuple(self._jobs)
+
+    def runningJobs(self) -> tuple[Job, ...]:
+        '''Returns the currently running jobs.'''
+        return tuple(job for job in self._jobs if job.state == JobStates.Running)
+
+    def isIdle(self) -> bool:
+        '''Determines if there are no queued nor running jobs.'''
+        return all(job.state not in (JobStates.Queued, JobStates.Running) for job in self._jobs)
+
+    def submit(self, job: Job) -> Job:
+        '''Adds the specified job to the queue.'''
+        if job in self._jobs:
+            raise RuntimeError('the job has already been submitted')
+        if job.state != JobStates.Queued:
+            raise RuntimeError('only queued jobs can be submitted')
+        self._jobs.append(job)
+        self._push(job)
+        return job
+
+    def cancel(self, job: Job) -> None:
+        '''Cancels the specified job (queued jobs are dropped lazily from the queue).'''
+        job.cancel()
+
+    def cancelAll(self) -> None:
+        '''Cancels all queued and running jobs.'''
+        for job in self._jobs: job.cancel()
+
+    def clearFinished(self) -> None:
+        '''Removes done, failed and cancelled jobs from the list of jobs.'''
+        self._jobs = [job for job in self._jobs if job.state in (JobStates.Queued, JobStates.Running)]
+
+    def poll(self) -> None:
+        '''Advances the running jobs, retries failed jobs, and starts queued jobs while resources are available.'''
+        # advance running jobs
+        for job in self.runningJobs():
+            if job.poll() == JobStates.Failed and job.attempts <= job.maxRetries:
+                job.requeue()
+                self._push(job)
+        # start queued jobs
+        running: tuple[Job, ...] = self.runningJobs()
+        workers: int = len(running)
+        # memory still to be claimed by the running jobs (estimate minus current usage)
+        pendingMemory: float = sum(max(0.0, job.memoryEstimate - job.memory) for job in running)
+        while self._queue and workers < self._maxWorkers:
+            job: Job = self._queue[0][2]
+            if job.state != JobStates.Queued:
+                heapq.heappop(self._queue) # cancelled while queued
+                continue
+            freeMemory: float = virtual_memory().available * 1e-6 - pendingMemory - self._memoryReserve
+            if workers > 0 and job.memoryEstimate > freeMemory: break
+            # wait for a free share of cores (jobs with their own CPU affinity do not take a share)
+            cores: tuple[int, ...] = self.freeCores() if self._partitionCores and job.affinity is None else ()
+            if self._partitionCores and job.affinity is None and not cores: break
+            heapq.heappop(self._queue)
+            job.start(cores)
+            workers += 1
+            pendingMemory += job.memoryEstimate
+
+    def run(self, pollInterval: float = 0.25) -> None:
+        '''Runs the queue until all jobs are finished (blocking, for headless use).'''
+        while not self.isIdle():
+            self.poll()
+            time.sleep(pollInterval)
+
+    async def runAsync(self, pollInterval: float = 0.25) -> None:
+        '''Runs the queue until all jobs are finished (for use within an asyncio event loop).'''
+        while not self.isIdle():
+            self.poll()
+            await asyncio.sleep(pollInterval)
+
+    def freeCores(self) -> tuple[int, ...]:
+        '''
+        Returns the share of cores for the next job: free logical CPUs, available CPUs divided by the workers
+        (at least one). Empty if all available CPUs are used by the running jobs.
+        '''
+        cpus: list[int] = JobQueue.availableCores()
+        share: int = max(1, len(cpus)//self._maxWorkers)
+        busy: set[int] = {core for job in self.runningJobs() for core in job.cores}
+        return tuple([core for core in cpus if core not in busy][:share])
+
+    @staticmethod
+    def availableCores() -> list[int]:
+        '''Returns the logical CPUs available to this process.'''
+        try:
+            return list(ProcessInfo().cpu_affinity())
+        except (AttributeError, OSError):
+            return list(range(cpu_count() or 1))
+
+    def _push(self, job: Job) -> None:
+        '''Pushes the specified job onto the priority queue.'''
+        self._counter += 1
+        heapq.heappush(self._queue, (-job.priority, self._counter, job))
@@ -0,0 +1,12 @@
+from enum import Enum, unique
+
+@unique
+class JobStates(Enum):
+    '''
+    Possible states of a solver job.
+    '''
+    Queued    = 0
+    Running   = 1
+    Done      = 2
+    Failed    = 3
+    Cancelled = 4
@@ -0,0 +1,229 @@
+import os
+import json
+import time
+
+class SolverProgress:
+    '''
+    Progress model of a solver run, fed with the solver output.
+    The solver writes structured markers on their own lines:
+        @phases <number of phases>
+        @dofs <number of active degrees of freedom>
+        @phase <phase index> <phase name>
+        @step <step> <number of steps>
+    The time spent per phase is recorded. Once a run has finished, the phase times (per active degree of freedom)
+    calibrate the duration estimates of later runs of the same analysis type, which weigh the phases in the overall
+    progress and give the estimated time remaining. Uncalibrated runs weigh all phases equally.
+    '''
+
+    # class variables
+    _calibrationFile: str = os.path.join(os.path.expanduser('~'), '.feasoft', 'progress.json')
+    _calibration: dict[str, list[tuple[str, float]]] | None = None
+
+    @property
+    def analysisType(self) -> str:
+        '''Analysis type (calibration key).'''
+        return self._analysisType
+
+    @property
+    def dofs(self) -> int:
+        '''Number of active degrees of freedom (0 until reported).'''
+        return self._dofs
+
+    @property
+    def phaseCount(self) -> int:
+        '''Number of phases (0 until reported).'''
+        return self._phaseCount
+
+    @property
+    def phaseIndex(self) -> int:
+        '''Index of the current phase (1-based, 0 before the first phase).'''
+        return self._phaseIndex
+
+    @property
+    def phaseName(self) -> str:
+        '''Name of the current phase.'''
+        return self._phaseTimes[-1][0] if self._phaseTimes else ''
+
+    @property
+    def step(self) -> int:
+        '''Current step within the current phase.'''
+        return self._step
+
+    @property
+    def stepCount(self) -> int:
+        '''Number of steps of the current phase (0 if not reported).'''
+        return self._stepCount
+
+    @property
+    def phaseTimes(self) -> tuple[tuple[str, float], ...]:
+        '''Phase names and wall times in seconds (the current phase up to now).'''
+        if not self._phaseTimes: return ()
+        return tuple(self._phaseTimes[:-1]) + ((self._phaseTimes[-1][0], self.phaseElapsed()),)
+
+    @property
+    def isFinished(self) -> bool:
+        '''Determines if the run has been finished.'''
+        return self._finishTime is not None
+
+    # attribute slots
+    __slots__ = (
+        '_analysisType', '_dofs', '_phaseCount', '_phaseIndex', '_step', '_stepCount', '_phaseTimes', '_startTime',
+        '_phaseStartTime', '_finishTime'
+    )
+
+    def __init__(self, analysisType: str = '') -> None:
+        '''Solver progress constructor.'''
+        self._analysisType: str = analysisType
+        self._dofs: int = 0
+        self._phaseCount: int = 0
+        self._phaseIndex: int = 0
+        self._step: int = 0
+        self._stepCount: int = 0
+        self._phaseTimes: list[tuple[str, float]] = []
+        self._startTime: float | None = None
+        self._phaseStartTime: float = 0.0
+        self._finishTime: float | None = None
+
+    def feed(self, text: str) -> str:
+        '''Parses the progress markers of the specified (complete) lines of output and returns the other lines.'''
+        lines: list[str] = text.splitlines(keepends=True)
+        return ''.join(line for line in lines if not self.parseLine(line))
+
+    def parseLine(self, line: str) -> bool:
+        '''Parses a line of output. Returns True if it is a progress marker.'''
+        if not line.startswith('@'): return False
+        keyword, _, arguments = line.strip().partition(' ')
+        try:
+            match keyword:
+                case '@phases':
+                    self._phaseCount = int(arguments)
+                    self._startTime = self._startTime if self._startTime is not None else time.perf_counter()
+                case '@dofs':
+                    self._dofs = int(arguments)
+                case '@phase':
+                    index, _, name = arguments.partition(' ')
+                    self.startPhase(int(index), name)
+                case '@step':
+                    step, stepCount = arguments.split()
+                    self._step, self._stepCount = int(step), int(stepCount)
+                case _:
+                    return False
+        except ValueError:
+            return False
+        return True
+
+    def startPhase(self, index: int, name: str) -> None:
+        '''Starts the specified phase (ending the current one).'''
+        now: float = time.perf_counter()
+        if self._startTime is None: self._startTime = now
+        if self._phaseTimes: self._phaseTimes[-1] = (self._phaseTimes[-1][0], now - self._phaseStartTime)
+        self._phaseTimes.append((name, 0.0))
+        self._phaseIndex = index
+        self._phaseStartTime = now
+        self._step, self._stepCount = 0, 0
+        self._phaseCount = max(self._phaseCount, index)
+
+    def finish(self, success: bool = True) -> None:
+        '''Finishes the run (ending the current phase). Successful runs calibrate the duration estimates.'''
+        if self._finishTime is not None: return
+        self._finishTime = time.perf_counter()
+        if self._phaseTimes: self._phaseTimes[-1] = (self._phaseTimes[-1][0], self._finishTime - self._phaseStartTime)
+        if success and self._dofs > 0 and self._analysisType and len(self._phaseTimes) == self._phaseCount:
+            self.calibrate()
+
+    def elapsed(self) -> float:
+        '''Returns the wall time in seconds since the first marker.'''
+        if self._startTime is None: return 0.0
+        return (self._finishTime if self._finishTime is not None else time.perf_counter()) - self._startTime
+
+    def phaseElapsed(self) -> float:
+        '''Returns the wall time in seconds spent in the current phase.'''
+        if not self._phaseTimes: return 0.0
+        if self._finishTime is not None: return self._phaseTimes[-1][1]
+        return time.perf_counter() - self._phaseStartTime
+
+    def stepFraction(self) -> float:
+        '''Returns the completed fraction of the current phase (0 if no steps were reported).'''
+        return min(1.0, self._step/self._stepCount) if self._stepCount > 0 else 0.0
+
+    def estimates(self) -> list[float] | None:
+        '''Returns the calibrated durations in seconds of all phases (None if not calibrated for this run).'''
+        rates: list[tuple[str, float]] | None = self.calibration().get(self._analysisType)
+        if not rates or self._dofs <= 0 or len(rates) != self._phaseCount: return None
+        return [rate*self._dofs for _, rate in rates]
+
+    def fraction(self) -> float:
+        '''Returns the completed fraction of the run (weighted by the calibrated phase durations, if available).'''
+        if self._finishTime is not None: return 1.0
+        if self._phaseCount <= 0 or self._phaseIndex <= 0: return 0.0
+        estimates: list[float] | None = self.estimates()
+        if estimates and sum(estimates) > 0.0:
+            done: float = sum(estimates[:self._phaseIndex - 1])
+            current: float = estimates[self._phaseIndex - 1]
+            # without step reports, assume the phase proceeds as calibrated
+            current *= self.stepFraction() if self._stepCount > 0 else min(1.0, self.phaseElapsed()/max(current, 1e-9))
+            return min(1.0, (done + current)/sum(estimates))
+        return min(1.0, (self._phaseIndex - 1 + self.stepFraction())/self._phaseCount)
+
+    def eta(self) -> float | None:
+        '''Returns the estimated time remaining in seconds (None if it cannot be estimated yet).'''
+        if self._finishTime is not None: return 0.0
+        if self._phaseIndex <= 0: return None
+        estimates: list[float] | None = self.estimates()
+        phaseElapsed: float = self.phaseElapsed()
+        stepFraction: float = self.stepFraction()
+        if estimates:
+            # current phase: extrapolated from its steps, otherwise from its calibrated duration
+            current: float = (
+                phaseElapsed*(1.0 - stepFraction)/stepFraction if stepFraction > 0.0 else
+                max(0.0, estimates[self._phaseIndex - 1] - phaseElapsed)
+            )
+            return current + sum(estimates[self._phaseIndex:])
+        fraction: float = self.fraction()
+        if fraction <= 0.0: return None
+        return self.elapsed()*(1.0 - fraction)/fraction
+
+    def report(self) -> str:
+        '''Returns a short (log) report of the time spent per phase.'''
+        lines: list[str] = [f'Solver phases ({self._dofs} active degrees of freedom):']
+        for name, seconds in self.phaseTimes:
+            lines.append(f'{name:<36} {seconds:>10.3f} s')
+        lines.append(f"{'Total':<36} {self.elapsed():>10.3f} s")
+        return '\n'.join(lines) + '\n'
+
+    def calibrate(self) -> None:
+        '''Updates the calibration of this analysis type with the phase times of this run (and saves it).'''
+        calibration: dict[str, list[tuple[str, float]]] = self.calibration()
+        rates: list[tuple[str, float]] = [(name, seconds/self._dofs) for name, seconds in self._phaseTimes]
+        previous: list[tuple[str, float]] | None = calibration.get(self._analysisType)
+        # smooth over runs (if the phases match)
+        if previous and [name for name, _ in previous] == [name for name, _ in rates]:
+            rates = [(name, 0.5*(rate + previousRate)) for (name, rate), (_, previousRate) in zip(rates, previous)]
+        calibration[self._analysisType] = rates
+        try:
+            os.makedirs(os.path.dirname(SolverProgress._calibrationFile), exist_ok=True)
+            with open(SolverProgress._calibrationFile, 'w') as file:
+                json.dump(calibration, file, indent=2)
+        except OSError:
+            pass
+
+    @classmethod
+    def calibration(cls) -> dict[str, list[tuple[str, float]]]:
+        '''Returns the phase duration calibration (seconds per active degree of freedom, per analysis type).'''
+        if cls._calibration is None:
+            try:
+                with open(cls._calibrationFile, 'r') as file:
+                    data: dict[str, list[list[str | float]]] = json.load(file)
+                cls._calibration = {
+                    analysisType: [(str(name), float(rate)) for name, rate in rates]
+                    for analysisType, rates in data.items()
+                }
+            except (OSError, ValueError, TypeError):
+                cls._calibration = {}
+        return cls._calibration
+
+    @classmethod
+    def setCalibrationFile(cls, value: str) -> None:
+        '''Sets the calibration file path (the calibration is reloaded).'''
+        cls._calibrationFile = value
+        cls._calibration = None
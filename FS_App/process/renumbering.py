@@ -0,0 +1,76 @@
+import numpy as np
+from dataModel import ModelDatabase
+
+class Renumbering:
+    '''
+    Node orderings that reduce the bandwidth and profile of the solver matrices: reverse Cuthill-McKee ('rcm',
+    requires SciPy) and the Morton space-filling curve ('morton'). The preprocessor renumbers the model with them,
+    and the cost prediction analyzes the problem as the preprocessor numbers it.
+    Orders give the original node index per new node index.
+    '''
+
+    @classmethod
+    def nodeOrder(cls, modelDatabase: ModelDatabase, method: str) -> list[int]:
+        '''Returns the node order of a renumbering method (ImportError if it requires SciPy and it is missing).'''
+        match method:
+            case 'rcm':    return cls.reverseCuthillMcKeeOrder(modelDatabase)
+            case 'morton': return cls.mortonOrder(modelDatabase)
+            case 'none':   return list(range(len(modelDatabase.mesh.nodes)))
+            case _:        raise ValueError(f"unknown renumbering method: '{method}'")
+
+    @staticmethod
+    def nodePairs(modelDatabase: ModelDatabase) -> tuple[np.ndarray, np.ndarray]:
+        '''Returns the unique pairs of adjacent nodes (lower and higher node indices) of the node-element adjacency.'''
+        nodeCount: int = len(modelDatabase.mesh.nodes)
+        connectivity: dict[int, list[tuple[int, ...]]] = {}
+        for element in modelDatabase.mesh.elements:
+            connectivity.setdefault(element.nodeCount, []).append(element.nodeIndices)
+        keys: list[np.ndarray] = []
+        for nodeIndices in connectivity.values():
+            table: np.ndarray = np.asarray(nodeIndices, dtype=np.int64)
+            first, second = np.triu_indices(table.shape[1], k=1)
+            a: np.ndarray = table[:, first].ravel()
+            b: np.ndarray = table[:, second].ravel()
+            keys.append(np.minimum(a, b)*nodeCount + np.maximum(a, b))
+        pairs: np.ndarray = np.unique(np.concatenate(keys)) if keys else np.zeros(0, dtype=np.int64)
+        return pairs//nodeCount, pairs%nodeCount
+
+    @staticmethod
+    def reverseCuthillMcKeeOrder(modelDatabase: ModelDatabase) -> list[int]:
+        '''Returns the reverse Cuthill-McKee node order.'''
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import reverse_cuthill_mckee
+        nodeCount: int = len(modelDatabase.mesh.nodes)
+        low, high = Renumbering.nodePairs(modelDatabase)
+        graph = coo_matrix(
+            (np.ones(2*len(low)), (np.concatenate((low, high)), np.concatenate((high, low)))),
+            shape=(nodeCount, nodeCount)
+        ).tocsr()
+        return [int(x) for x in reverse_cuthill_mckee(graph, symmetric_mode=True)]
+
+    @staticmethod
+    def mortonOrder(modelDatabase: ModelDatabase) -> list[int]:
+        '''Returns the node order along a Morton (Z-order) space-filling curve.'''
+        coordinates: np.ndarray = np.array([node.coordinates for node in modelDatabase.mesh.nodes], dtype=np.float64)
+        if len(coordinates) == 0: return []
+        # quantize coordinates to 21 bits per axis (of the largest extent)
+        lower: np.ndarray = coordinates.min(axis=0)
+        extent: float = max(float((coordinates.max(axis=0) - lower).max()), 1e-30)
+        quantized: np.ndarray = ((coordinates - lower)/extent*(2**21 - 1)).astype(np.uint64)
+        # interleave the bits of the three axes
+        def spread(x: np.ndarray) -> np.ndarray:
+            x = x & np.uint64(0x1fffff)
+            for shift, mask in (
+                (32, 0x1f00000000ffff), (16, 0x1f0000ff0000ff), (8, 0x100f00f00f00f00f), (4, 0x10c30c30c30c30c3),
+                (2, 0x1249249249249249)
+            ):
+                x = (x | (x << np.uint64(shift))) & np.uint64(mask)
+            return x
+        codes: np.ndarray = (
+            spread(quantized[:, 0]) | (spread(quantized[:, 1]) << np.uint64(1)) |
+            (spread(quantized[:, 2]) << np.uint64(2))
+        )
+        return [int(x) for x in np.argsort(codes, kind='stable')]
+
+    # attribute slots
+    __slots__ = ()
@@ -0,0 +1,127 @@
+import os
+import shutil
+import tempfile
+from hashlib import blake2b
+
+class ResultCache:
+    '''
+    Local content-addressed cache of output databases.
+    Output databases are stored under a key computed from the solver job input file, the analysis type,
+    the number of eigenvalues and the solver executable, so that unchanged jobs need not be solved again.
+    The cache is bounded in size: least recently used entries are evicted first.
+    The cache directory can be overridden with the FS_CACHE environment variable.
+    '''
+
+    # class variables
+    _directory: str = os.environ.get('FS_CACHE', os.path.join(os.path.expanduser('~'), '.feasoft', 'cache'))
+    _maxSize: float = 2048.0
+    _isEnabled: bool = True
+
+    @classmethod
+    def directory(cls) -> str:
+        '''Gets the cache directory.'''
+        return cls._directory
+
+    @classmethod
+    def setDirectory(cls, value: str) -> None:
+        '''Sets the cache directory.'''
+        cls._directory = value
+
+    @classmethod
+    def maxSize(cls) -> float:
+        '''Gets the maximum cache size in MB.'''
+        return cls._maxSize
+
+    @classmethod
+    def setMaxSize(cls, value: float) -> None:
+        '''Sets the maximum cache size in MB.'''
+        if value < 0.0: raise ValueError('the maximum cache size must not be negative')
+        cls._maxSize = value
+
+    @classmethod
+    def isEnabled(cls) -> bool:
+        '''Gets the cache enabled status.'''
+        return cls._isEnabled
+
+    @classmethod
+    def setEnabled(cls, value: bool) -> None:
+        '''Sets the cache enabled status.'''
+        cls._isEnabled = value
+
+    @staticmethod
+    def key(solverJobInputFile: str, analysisType: str, eigenvalues: int, solverExecutable: str = '') -> str:
+        '''Computes the cache key of a solver job.'''
+        digest = blake2b(digest_size=20)
+        # the number of eigenvalues is irrelevant for static analyses
+        digest.update(f'{analysisType}\n{eigenvalues if analysisType != "static" else 0}\n'.encode())
+        # a rebuilt solver invalidates the cached results
+        if os.path.isfile(solverExecutable):
+            status: os.stat_result = os.stat(solverExecutable)
+            digest.update(f'{status.st_size}\n{status.st_mtime_ns}\n'.encode())
+        with open(solverJobInputFile, 'rb') as file:
+            while chunk := file.read(1 << 20): digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def entryFile(cls, key: str) -> str:
+        '''Returns the cached output database file path of the specified key.'''
+        return os.path.join(cls._directory, key[:2], key + '.fs_odb')
+
+    @classmethod
+    def fetch(cls, key: str, outputDatabaseFile: str) -> bool:
+        '''Copies the cached output database to the specified file (if cached). Returns True on a cache hit.'''
+        if not cls._isEnabled: return False
+        entryFile: str = cls.entryFile(key)
+        try:
+            cls._copy(entryFile, outputDatabaseFile)
+            os.utime(entryFile) # mark as recently used
+        except OSError:
+            return False
+        return True
+
+    @classmethod
+    def store(cls, key: str, outputDatabaseFile: str) -> None:
+        '''Stores a copy of the specified output database in the cache and evicts the least recently used entries.'''
+        if not cls._isEnabled: return
+        entryFile: str = cls.entryFile(key)
+        os.makedirs(os.path.dirname(entryFile), exist_ok=True)
+        cls._copy(outputDatabaseFile, entryFile)
+        cls.evict()
+
+    @classmethod
+    def evict(cls) -> None:
+        '''Removes the least recently used entries until the cache size does not exceed its maximum.'''
+        entries: list[tuple[int, int, str]] = []
+        for root, _, files in os.walk(cls._directory):
+            for name in files:
+                if not name.endswith('.fs_odb'): continue
+                try:
+                    status: os.stat_result = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                entries.append((status.st_mtime_ns, status.st_size, os.path.join(root, name)))
+        size: int = sum(entry[1] for entry in entries)
+        for _, entrySize, filePath in sorted(entries):
+            if size <= cls._maxSize * 1e6: break
+            try:
+                os.remove(filePath)
+            except OSError:
+                continue
+            size -= entrySize
+
+    @classmethod
+    def clear(cls) -> None:
+        '''Removes all cached output databases.'''
+        shutil.rmtree(cls._directory, ignore_errors=True)
+
+    @staticmethod
+    def _copy(source: str, target: str) -> None:
+        '''Copies a file atomically (through a temporary file in the target directory).'''
+        descriptor, temporaryFile = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(target)), suffix='.tmp')
+        os.close(descriptor)
+        try:
+            shutil.copyfile(source, temporaryFile)
+            os.replace(temporaryFile, target)
+        except BaseException:
+            os.remove(temporaryFile)
+            raise
@@ -1,73 +1,194 @@
-from typing import Sequence
-from subprocess import Popen as Process, CREATE_NO_WINDOW
-from psutil import Process as ProcessInfo, cpu_count
-from io import TextIOWrapper
+import os
+import sys
+import signal
+import asyncio
+from typing import IO, Mapping, Sequence
+from subprocess import Popen as Process, PIPE
+from psutil import Process as ProcessInfo, NoSuchProcess, AccessDenied, cpu_count
+if sys.platform == 'win32': from subprocess import CREATE_NO_WINDOW
 
 class Subprocess:
     '''
     Utility class for creating and managing subprocesses.
+    On POSIX systems the process is started in its own process group (session),
+    so that terminating it also terminates any process it has started (e.g. the solver started by the preprocessor).
+    The argument vector of the process starts with the executable path (argv[0]), followed by the arguments
+    (argv[1], ...), so that executables and executable scripts (e.g. stand-ins of the solver) see the same arguments.
+    The process can be started with additional environment variables and restricted to a set of logical CPUs.
+    The resource usage of the exited process (CPU time, including the processes it has waited for, and peak RSS on
+    Windows) is taken when it is reaped (see usage).
     '''
 
     # attribute slots
-    __slots__ = ('_process', '_info')
+    __slots__ = ('_process', '_info', '_usage')
 
     def __init__(self) -> None:
         '''Subprocess constructor.'''
         self._process: Process[bytes] | None = None
         self._info: ProcessInfo | None = None
+        self._usage: tuple[float, float] | None = None
+
+    def pid(self) -> int | None:
+        '''Returns the process identifier (while the process is managed).'''
+        return self._process.pid if self._process else None
 
     def isAlive(self) -> bool:
         '''Determines if the process is currently alive.'''
-        if self._process and self._info and self._info.is_running():
+        if self._process and self._info and self._poll() is None:
             return True
         return False
 
+    def usage(self) -> tuple[float, float] | None:
+        '''
+        Returns the resource usage of the last process once it has exited: CPU time (user + system) in seconds and
+        peak RSS in MB (None if not available, e.g. the process was terminated). The peak RSS is only known on Windows
+        (0.0 elsewhere): the maximum RSS of the POSIX rusage survives exec, so it includes the memory of the parent
+        process that has forked the process (e.g. the application).
+        '''
+        return self._usage
+
     def cpuPercentage(self) -> int:
         '''Returns the current CPU usage in percentage.'''
-        if self._process and self._info and self._info.is_running():
-            return round(self._info.cpu_percent()/cpu_count())
+        if self._info and self.isAlive():
+            try: return round(self._info.cpu_percent()/cpu_count())
+            except NoSuchProcess: pass
         return 0
 
     def memory(self) -> int:
         '''Returns the current physical memory usage in MB.'''
-        if self._process and self._info and self._info.is_running():
-            return round(self._info.memory_info().rss * 1e-6)
+        if self._info and self.isAlive():
+            try: return round(self._info.memory_info().rss * 1e-6)
+            except NoSuchProcess: pass
         return 0
 
     def cpuTime(self) -> float:
         '''Returns the current CPU time in seconds.'''
-        if self._process and self._info and self._info.is_running():
-            userTime: float = self._info.cpu_times().user
-            systemTime: float = self._info.cpu_times().system
-            return round(userTime + systemTime, 3)
+        if self._info and self.isAlive():
+            try:
+                userTime: float = self._info.cpu_times().user
+                systemTime: float = self._info.cpu_times().system
+                return round(userTime + systemTime, 3)
+            except NoSuchProcess: pass
         return 0
 
     def start(
         self, exe: str,
         args: Sequence[str],
-        stdout: TextIOWrapper | None = None,
-        stderr: TextIOWrapper | None = None
+        stdout: IO[str] | None = None,
+        stderr: IO[str] | None = None,
+        capture: bool = False,
+        env: Mapping[str, str] | None = None,
+        affinity: Sequence[int] | None = None
     ) -> None:
-        '''Starts the specified process.'''
+        '''
+        Starts the specified process.
+        If capture is set, the standard output and error streams are redirected to non-blocking pipes
+        (see readOutput and readErrors); otherwise they are redirected to the given streams.
+        The environment variables in env are added to the environment of this process.
+        If affinity is given, the process is restricted to these logical CPUs (where supported by the platform).
+        '''
         if self._process and self._info: self.terminate()
+        self._usage = None
         self._process = Process(
-            executable=exe,
-            args=' '.join(args),
-            stdout=stdout,
-            stderr=stderr,
-            creationflags=CREATE_NO_WINDOW
+            args=[exe, *args],
+            stdout=PIPE if capture else stdout,
+            stderr=PIPE if capture else stderr,
+            env={**os.environ, **env} if env else None,
+            **(
+                {'creationflags': CREATE_NO_WINDOW} if sys.platform == 'win32' else
+                {'start_new_session': True}
+            )
         )
+        for pipe in (self._process.stdout, self._process.stderr):
+            if pipe: os.set_blocking(pipe.fileno(), False)
         self._info = ProcessInfo(self._process.pid)
+        if affinity: self.setAffinity(affinity)
+
+    def setAffinity(self, cpus: Sequence[int]) -> bool:
+        '''
+        Restricts the process to the specified logical CPUs (threads started afterwards inherit the restriction).
+        Returns False if the platform does not support it (e.g. macOS) or the process is gone.
+        '''
+        if not self._info: return False
+        try:
+            self._info.cpu_affinity(list(cpus))
+            return True
+        except (AttributeError, NoSuchProcess, ValueError, OSError):
+            return False
+
+    def readOutput(self) -> str:
+        '''Returns the text currently available on the captured standard output stream (never blocks).'''
+        return self._read(self._process.stdout if self._process else None)
+
+    def readErrors(self) -> str:
+        '''Returns the text currently available on the captured standard error stream (never blocks).'''
+        return self._read(self._process.stderr if self._process else None)
 
     def terminate(self) -> None:
-        '''Terminates the process if it is running.'''
+        '''Terminates the process (and the processes it has started) if it is running.'''
         if self._process and self._info:
-            self._process.terminate()
+            if self._poll() is None:
+                if sys.platform == 'win32':
+                    try:
+                        for child in self._info.children(recursive=True): child.terminate()
+                    except NoSuchProcess: pass
+                    self._process.terminate()
+                else:
+                    try: os.killpg(self._process.pid, signal.SIGTERM)
+                    except ProcessLookupError: pass
+            for pipe in (self._process.stdout, self._process.stderr):
+                if pipe: pipe.close()
             self._process = None
             self._info = None
 
     def exitCode(self) -> int | None:
-        '''Returns the exit code if the process has exited successfully.'''
-        if self._process and self._info and not self._info.is_running():
-            return self._process.poll()
+        '''Returns the exit code if the process has exited.'''
+        if self._process and self._info:
+            return self._poll()
         return None
+
+    async def wait(self, pollInterval: float = 0.1) -> int | None:
+        '''Waits (asynchronously) for the process to exit and returns its exit code.'''
+        while self.isAlive():
+            await asyncio.sleep(pollInterval)
+        return self.exitCode()
+
+    def _poll(self) -> int | None:
+        '''
+        Polls the process and returns its exit code if it has exited. The exited process is reaped here
+        (wait4 on POSIX systems) to record its resource usage; on Windows it is queried before the handle is released.
+        '''
+        if not self._process: return None
+        if self._process.returncode is not None: return self._process.returncode
+        if sys.platform == 'win32':
+            exitCode: int | None = self._process.poll()
+            if exitCode is not None and self._info:
+                try:
+                    with self._info.oneshot():
+                        cpuTimes = self._info.cpu_times()
+                        self._usage = (cpuTimes.user + cpuTimes.system, self._info.memory_info().peak_wset * 1e-6)
+                except (NoSuchProcess, AccessDenied, AttributeError): pass
+            return exitCode
+        try:
+            pid, status, usage = os.wait4(self._process.pid, os.WNOHANG)
+        except ChildProcessError:
+            return self._process.poll()
+        if pid == 0: return None
+        self._process.returncode = os.waitstatus_to_exitcode(status)
+        # no peak memory: the maximum resident set size includes the memory of this process (inherited by the fork)
+        self._usage = (usage.ru_utime + usage.ru_stime, 0.0)
+        return self._process.returncode
+
+    @staticmethod
+    def _read(pipe: IO[bytes] | None) -> str:
+        '''Reads all bytes currently available on a non-blocking pipe.'''
+        if not pipe or pipe.closed: return ''
+        chunks: list[bytes] = []
+        while True:
+            try:
+                chunk: bytes | None = os.read(pipe.fileno(), 65536)
+            except BlockingIOError:
+                break
+            if not chunk: break
+            chunks.append(chunk)
+        return b''.join(chunks).decode(errors='replace')
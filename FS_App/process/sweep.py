@@ -0,0 +1,182 @@
+import os
+import csv
+import shutil
+import itertools
+from typing import Any, Literal
+from collections.abc import Mapping, Sequence
+from dataModel import ModelDatabase, DataObjectContainer, OutputDatabase
+from inputOutput import FSReader, FSWriter
+from process.job import Job
+from process.jobQueue import JobQueue
+from process.jobStates import JobStates
+from process.costPredictor import CostPredictor
+
+class Sweep:
+    '''
+    Parametric sweep over the attributes of the data objects of a base model database.
+    Each parameter is given by its (container name, data object name, attribute name), e.g.
+    ('materials', 'Steel', 'young'), and by its values; a variant is run for every combination of values.
+    Variants are copies of the base model database that share its mesh. A snapshot of the base model database is
+    written once to the sweep directory: the model database file of each variant only holds its parameter values.
+    The job files of the variants are seeded from the job file of the base model database (if any), so that the
+    preprocessor only rewrites the changed segments (materials, sections and loads come last in the job file).
+    '''
+
+    @property
+    def modelDatabase(self) -> ModelDatabase:
+        '''Base model database.'''
+        return self._modelDatabase
+
+    @property
+    def parameters(self) -> tuple[tuple[str, str, str], ...]:
+        '''Swept parameters (container name, data object name, attribute name).'''
+        return tuple(self._parameters)
+
+    @property
+    def directory(self) -> str:
+        '''Directory of the variant model database (and job) files.'''
+        return self._directory
+
+    @property
+    def jobs(self) -> tuple[Job, ...]:
+        '''Jobs of the variants (once submitted).'''
+        return tuple(self._jobs)
+
+    # attribute slots
+    __slots__ = ('_modelDatabase', '_parameters', '_values', '_directory', '_analysisType', '_eigenvalues', '_jobs')
+
+    def __init__(
+        self,
+        modelDatabase: ModelDatabase,
+        parameters: Mapping[tuple[str, str, str], Sequence[Any]],
+        directory: str | None = None,
+        analysisType: Literal['static', 'frequency', 'buckle'] = 'static',
+        eigenvalues: int = 10
+    ) -> None:
+        '''Sweep constructor. By default, the variants are written next to the base model database file.'''
+        for (containerName, dataObjectName, attributeName), values in parameters.items():
+            container: object = getattr(modelDatabase, containerName, None)
+            if not isinstance(container, DataObjectContainer):
+                raise ValueError(f"invalid data object container: '{containerName}'")
+            if dataObjectName not in container.names():
+                raise ValueError(f"data object not found in {container.name.lower()}: '{dataObjectName}'")
+            if not isinstance(getattr(type(container[dataObjectName]), attributeName, None), property):
+                raise ValueError(f"invalid attribute of '{dataObjectName}': '{attributeName}'")
+            if len(values) == 0:
+                raise ValueError(f"no values given for: '{dataObjectName}.{attributeName}'")
+        baseName: str = os.path.splitext(os.path.basename(modelDatabase.filePath))[0] or 'Model'
+        self._modelDatabase: ModelDatabase = modelDatabase
+        self._parameters: list[tuple[str, str, str]] = list(parameters.keys())
+        self._values: list[tuple[Any, ...]] = [tuple(values) for values in parameters.values()]
+        self._directory: str = directory or os.path.join(os.path.dirname(modelDatabase.filePath), baseName + '-Sweep')
+        self._analysisType: Literal['static', 'frequency', 'buckle'] = analysisType
+        self._eigenvalues: int = eigenvalues
+        self._jobs: list[Job] = []
+
+    def combinations(self) -> tuple[tuple[Any, ...], ...]:
+        '''Returns the parameter values of every variant (full grid, last parameter varying fastest).'''
+        return tuple(itertools.product(*self._values))
+
+    def variant(self, values: Sequence[Any]) -> ModelDatabase:
+        '''Returns a variant of the base model database with the specified parameter values.'''
+        modelDatabase: ModelDatabase = self._modelDatabase.copy()
+        for (containerName, dataObjectName, attributeName), value in zip(self._parameters, values):
+            container: DataObjectContainer = getattr(modelDatabase, containerName)
+            setattr(container[dataObjectName], attributeName, value)
+        return modelDatabase
+
+    def variantFile(self, index: int) -> str:
+        '''Returns the model database file path of the specified variant.'''
+        baseName: str = os.path.splitext(os.path.basename(self._modelDatabase.filePath))[0] or 'Model'
+        return os.path.join(self._directory, f'{baseName}-{index + 1:04d}.fs_mdb')
+
+    def baseFile(self) -> str:
+        '''Returns the file path of the base model database snapshot (read by the variants).'''
+        baseName: str = os.path.splitext(os.path.basename(self._modelDatabase.filePath))[0] or 'Model'
+        return os.path.join(self._directory, f'{baseName}-Base.fs_mdb')
+
+    def write(self) -> tuple[str, ...]:
+        '''
+        Writes the base model database snapshot and the model database files of all variants (and seeds their
+        job files). Returns the file paths of the variants.
+        '''
+        os.makedirs(self._directory, exist_ok=True)
+        baseModelDatabase: ModelDatabase = self._modelDatabase.copy()
+        baseModelDatabase.filePath = self.baseFile()
+        FSWriter.writeModelDatabase(baseModelDatabase)
+        seedFile: str = os.path.splitext(self._modelDatabase.filePath)[0]
+        filePaths: list[str] = []
+        for index, values in enumerate(self.combinations()):
+            modelDatabase: ModelDatabase = self.variant(values)
+            modelDatabase.filePath = self.variantFile(index)
+            FSWriter.writeModelDatabaseVariant(modelDatabase, baseModelDatabase.filePath, self._parameters)
+            filePaths.append(modelDatabase.filePath)
+            # seed the job file and its segment index (copied with their time stamps, which validate the index)
+            variantFile: str = os.path.splitext(modelDatabase.filePath)[0]
+            if not os.path.isfile(variantFile + '.fs_job') and os.path.isfile(seedFile + '.fs_sig'):
+                shutil.copy2(seedFile + '.fs_job', variantFile + '.fs_job')
+                shutil.copy2(seedFile + '.fs_sig', variantFile + '.fs_sig')
+        return tuple(filePaths)
+
+    def submit(self, jobQueue: JobQueue, priority: int = 0, maxRetries: int = 0) -> tuple[Job, ...]:
+        '''Writes the variants and submits their jobs to the specified job queue (with their cost predictions).'''
+        # the problem size only depends on the swept parameters through the boundary conditions (and node sets)
+        sizeVaries: bool = any(parameter[0] in ('boundaryConditions', 'nodeSets') for parameter in self._parameters)
+        cost: CostPredictor | None = None
+        self._jobs = []
+        for values, filePath in zip(self.combinations(), self.write()):
+            job: Job = Job(filePath, self._analysisType, self._eigenvalues, priority, maxRetries)
+            if sizeVaries or cost is None:
+                cost = CostPredictor(self.variant(values), self._analysisType, self._eigenvalues, job.renumbering)
+            job.cost = cost
+            self._jobs.append(jobQueue.submit(job))
+        return tuple(self._jobs)
+
+    def run(self, jobQueue: JobQueue | None = None) -> tuple[list[str], list[list[Any]]]:
+        '''Runs all variants (blocking, for headless use) and returns the results table (see table).'''
+        jobQueue = jobQueue or JobQueue()
+        self.submit(jobQueue)
+        jobQueue.run()
+        return self.table()
+
+    def table(self) -> tuple[list[str], list[list[Any]]]:
+        '''
+        Collects the history output of all variants into a single table (header and rows).
+        There is one row per variant and frame (a single row without results for variants that did not finish).
+        '''
+        parameterNames: list[str] = ['.'.join(parameter) for parameter in self._parameters]
+        historyNames: dict[str, None] = {}
+        results: list[tuple[int, tuple[Any, ...], Job, OutputDatabase | None]] = []
+        for index, (values, job) in enumerate(zip(self.combinations(), self._jobs)):
+            outputDatabase: OutputDatabase | None = None
+            if job.state == JobStates.Done:
+                try:
+                    outputDatabase = FSReader.readOutputDatabase(job.outputDatabaseFile)
+                except Exception:
+                    outputDatabase = None
+            if outputDatabase:
+                for frame in range(outputDatabase.frameCount):
+                    historyNames.update(dict.fromkeys(outputDatabase.historyNames(frame)))
+            results.append((index + 1, values, job, outputDatabase))
+        header: list[str] = ['variant'] + parameterNames + ['state', 'frame', 'description'] + list(historyNames)
+        rows: list[list[Any]] = []
+        for index, values, job, outputDatabase in results:
+            state: str = job.state.name if outputDatabase or job.state != JobStates.Done else 'Unreadable'
+            if not outputDatabase or outputDatabase.frameCount == 0:
+                rows.append([index, *values, state] + [None]*(2 + len(historyNames)))
+                continue
+            for frame in range(outputDatabase.frameCount):
+                available: tuple[str, ...] = outputDatabase.historyNames(frame)
+                rows.append(
+                    [index, *values, state, frame, outputDatabase.frameDescription(frame)] +
+                    [outputDatabase.history(frame, name) if name in available else None for name in historyNames]
+                )
+        return header, rows
+
+    def writeTable(self, filePath: str) -> None:
+        '''Writes the results table to a CSV file.'''
+        header, rows = self.table()
+        with open(filePath, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            writer.writerows(['' if value is None else value for value in row] for row in rows)
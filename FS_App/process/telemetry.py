@@ -0,0 +1,182 @@
+import sys
+import time
+from threading import Thread, Event
+from typing import TextIO
+from psutil import Process as ProcessInfo, NoSuchProcess, AccessDenied
+
+class TelemetrySampler:
+    '''
+    Background sampler of the resource usage of a process tree (a process and all its descendants).
+    Every sample records the elapsed time, CPU usage (percentage of one core), RSS, cumulative I/O bytes and
+    number of threads, summed over the tree. Samples are optionally appended to a compact time-series file
+    (comma separated values, one sample per line). A last sample is taken when sampling is stopped, and the resource
+    usage of the exited root process (e.g. from its rusage) completes the CPU time of the samples. On Linux the peak
+    RSS of every process (VmHWM, reset by exec) is read with each sample, so that the peak memory also covers the
+    peaks between samples.
+    '''
+
+    @property
+    def interval(self) -> float:
+        '''Sampling interval in seconds.'''
+        return self._interval
+
+    @property
+    def samples(self) -> tuple[tuple[float, float, float, float, float, int], ...]:
+        '''Recorded samples (time [s], CPU [%], RSS [MB], read [MB], written [MB], threads).'''
+        return tuple(self._samples)
+
+    @property
+    def cpuTime(self) -> float:
+        '''CPU time (user + system) in seconds of the process tree, as of the last sample (or of the exit).'''
+        return max(sum(self._cpuTimes.values()), self._usage[0] if self._usage else 0.0)
+
+    @property
+    def memory(self) -> float:
+        '''RSS in MB of the process tree, as of the last sample.'''
+        return self._samples[-1][2] if self._samples else 0.0
+
+    # attribute slots
+    __slots__ = (
+        '_root', '_interval', '_filePath', '_label', '_append', '_processes', '_cpuTimes', '_samples', '_thread',
+        '_stopEvent', '_startTime', '_usage', '_peakMemories'
+    )
+
+    def __init__(
+        self,
+        pid: int,
+        filePath: str | None = None,
+        interval: float = 0.5,
+        label: str = '',
+        append: bool = False
+    ) -> None:
+        '''Telemetry sampler constructor.'''
+        if interval <= 0.0:
+            raise ValueError('the sampling interval must be positive')
+        self._root: ProcessInfo = ProcessInfo(pid)
+        self._interval: float = interval
+        self._filePath: str | None = filePath
+        self._label: str = label
+        self._append: bool = append
+        self._processes: dict[int, ProcessInfo] = {}
+        self._cpuTimes: dict[int, float] = {}
+        self._samples: list[tuple[float, float, float, float, float, int]] = []
+        self._thread: Thread | None = None
+        self._stopEvent: Event = Event()
+        self._startTime: float = 0.0
+        self._usage: tuple[float, float] | None = None
+        self._peakMemories: dict[int, float] = {}
+
+    def start(self) -> None:
+        '''Starts sampling in a background thread.'''
+        if self._thread:
+            raise RuntimeError('the sampler has already been started')
+        self._startTime = time.perf_counter()
+        self._thread = Thread(target=self._run, name='TelemetrySampler', daemon=True)
+        self._thread.start()
+
+    def stop(self, usage: tuple[float, float] | None = None) -> None:
+        '''
+        Stops sampling (waits for the background thread to finish, after a last sample).
+        The resource usage of the exited root process (CPU time in seconds and peak RSS in MB, see Subprocess.usage)
+        completes the sampled values, which miss the usage after the last sample.
+        '''
+        if self._thread:
+            self._stopEvent.set()
+            self._thread.join()
+        if usage: self._usage = usage
+
+    def summary(self) -> dict[str, float]:
+        '''Returns the peak and mean values of the recorded samples.'''
+        count: int = len(self._samples)
+        def column(i: int) -> list[float]: return [sample[i] for sample in self._samples] or [0.0]
+        return {
+            'duration':    self._samples[-1][0] if count > 0 else 0.0,
+            'samples':     count,
+            'cpuTime':     self.cpuTime,
+            'peakCpu':     max(column(1)),
+            'meanCpu':     sum(column(1))/max(count, 1),
+            'peakMemory':  max(
+                max(column(2)), max(self._peakMemories.values(), default=0.0), self._usage[1] if self._usage else 0.0
+            ),
+            'meanMemory':  sum(column(2))/max(count, 1),
+            'readBytes':   max(column(3)),
+            'writeBytes':  max(column(4)),
+            'peakThreads': max(column(5))
+        }
+
+    def report(self) -> str:
+        '''Returns a short (log) report of the recorded samples.'''
+        summary: dict[str, float] = self.summary()
+        return (
+            f"Telemetry{' (' + self._label + ')' if self._label else ''}: "
+            f"{summary['samples']:.0f} samples over {summary['duration']:.1f} s\n"
+            f"CPU usage: peak {summary['peakCpu']:.0f}%, mean {summary['meanCpu']:.0f}%, "
+            f"CPU time {summary['cpuTime']:.3f} s\n"
+            f"Memory (RSS): peak {summary['peakMemory']:.1f} MB, mean {summary['meanMemory']:.1f} MB\n"
+            f"I/O: read {summary['readBytes']:.1f} MB, written {summary['writeBytes']:.1f} MB\n"
+            f"Threads: peak {summary['peakThreads']:.0f}\n"
+        )
+
+    def _run(self) -> None:
+        '''Sampling loop (background thread).'''
+        file: TextIO | None = open(self._filePath, 'a' if self._append else 'w') if self._filePath else None
+        try:
+            if file:
+                if self._label: file.write(f'# {self._label}\n')
+                file.write('# time [s], cpu [%], rss [MB], read [MB], written [MB], threads\n')
+            isStopped: bool = False
+            while True:
+                sample: tuple[float, float, float, float, float, int] | None = self._sample()
+                if sample is None: break
+                self._samples.append(sample)
+                if file: file.write('{:.3f},{:.1f},{:.1f},{:.3f},{:.3f},{}\n'.format(*sample))
+                if isStopped: break
+                # once stopped, a last sample records the usage since the previous one
+                isStopped = self._stopEvent.wait(self._interval)
+        finally:
+            if file: file.close()
+
+    def _sample(self) -> tuple[float, float, float, float, float, int] | None:
+        '''Samples the process tree. Returns None once the root process has exited.'''
+        try:
+            if not self._root.is_running(): return None
+            tree: list[ProcessInfo] = [self._root] + self._root.children(recursive=True)
+        except NoSuchProcess:
+            return None
+        cpu: float = 0.0
+        rss: float = 0.0
+        read: float = 0.0
+        written: float = 0.0
+        threads: int = 0
+        for process in tree:
+            # reuse process objects (CPU percentages are measured between consecutive calls)
+            process = self._processes.setdefault(process.pid, process)
+            try:
+                with process.oneshot():
+                    cpu += process.cpu_percent()
+                    rss += process.memory_info().rss * 1e-6
+                    self._peakMemories[process.pid] = max(
+                        self._peakMemories.get(process.pid, 0.0), self._peakMemory(process.pid)
+                    )
+                    threads += process.num_threads()
+                    cpuTimes = process.cpu_times()
+                    self._cpuTimes[process.pid] = cpuTimes.user + cpuTimes.system
+                    if hasattr(process, 'io_counters'):
+                        ioCounters = process.io_counters()
+                        read += ioCounters.read_bytes * 1e-6
+                        written += ioCounters.write_bytes * 1e-6
+            except (NoSuchProcess, AccessDenied):
+                continue
+        return (time.perf_counter() - self._startTime, cpu, rss, read, written, threads)
+
+    @staticmethod
+    def _peakMemory(pid: int) -> float:
+        '''Returns the peak RSS in MB of the process (VmHWM, Linux only; 0.0 if not available).'''
+        if not sys.platform.startswith('linux'): return 0.0
+        try:
+            with open(f'/proc/{pid}/status') as file:
+                for line in file:
+                    if line.startswith('VmHWM:'): return int(line.split()[1]) * 1024e-6
+        except (OSError, ValueError, IndexError):
+            pass
+        return 0.0
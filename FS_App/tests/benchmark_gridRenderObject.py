@@ -0,0 +1,33 @@
+# Benchmark of the grid data set build: shared NumPy buffers (GridRenderObject.buildDataSet) versus the reference
+# build point by point and cell by cell (InsertNextCell).
+# usage: python tests/benchmark_gridRenderObject.py [cells per axis (20)] [repeats (5)]
+
+import os
+import sys
+import time
+from collections.abc import Callable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dataModel import Mesh
+from visualization.rendering import GridRenderObject
+from models import gridMesh
+from test_gridRenderObject import referenceDataSet
+
+def measure(build: Callable[[Mesh], object], mesh: Mesh, repeats: int) -> float:
+    '''Returns the best wall time in seconds of the build over the repeats.'''
+    best: float = float('inf')
+    for _ in range(repeats):
+        startTime: float = time.perf_counter()
+        build(mesh)
+        best = min(best, time.perf_counter() - startTime)
+    return best
+
+if __name__ == '__main__':
+    cells: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    repeats: int = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    mesh: Mesh = gridMesh(cells, cells, cells)
+    print(f'Grid of {len(mesh.elements)} hexahedra and {len(mesh.nodes)} nodes (best of {repeats})')
+    reference: float = measure(referenceDataSet, mesh, repeats)
+    shared: float = measure(GridRenderObject.buildDataSet, mesh, repeats)
+    print(f'Reference (per point and cell):  {reference*1e3:10.1f} ms')
+    print(f'Shared buffers (NumPy arrays):   {shared*1e3:10.1f} ms')
+    print(f'Speedup: {reference/shared:.1f}x')
@@ -0,0 +1,59 @@
+# Benchmark of the core partitioning of the job queue: concurrent CPU-bound solver jobs (the solver stand-in with
+# multi-threaded dense matrix products, FS_SOLVER_STUB_WORK) partitioned between the workers versus oversubscribed
+# (every job uses the math library default of one thread per core, on all cores).
+# usage: python tests/benchmark_jobQueue.py [jobs (4)] [workers (jobs)] [work (10)]
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from inputOutput import FSWriter
+from dataModel import ModelDatabase
+from process import Job, JobQueue, JobStates, Executables, ResultCache
+from models import gridModel
+
+def wrapper(directory: str, script: str) -> str:
+    '''Writes an executable wrapper that runs the script of the application with this interpreter.'''
+    application: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    filePath: str = os.path.join(directory, os.path.splitext(script)[0])
+    with open(filePath, 'w') as file:
+        file.write(f'#!/bin/sh\nPYTHONPATH="{application}" exec "{sys.executable}" "{application}/{script}" "$@"\n')
+    os.chmod(filePath, 0o755)
+    return filePath
+
+def runJobs(directory: str, jobCount: int, workers: int, partitionCores: bool) -> float:
+    '''Runs the jobs through the job queue and returns the wall time in seconds.'''
+    queue: JobQueue = JobQueue(maxWorkers=workers, memoryReserve=0.0, partitionCores=partitionCores)
+    for i in range(jobCount):
+        modelDatabase: ModelDatabase = gridModel(10, 10)
+        name: str = f"job{i}_{'partitioned' if partitionCores else 'shared'}"
+        modelDatabase.filePath = os.path.join(directory, name + '.fs_mdb')
+        FSWriter.writeModelDatabase(modelDatabase)
+        queue.submit(Job(modelDatabase.filePath, memoryEstimate=1.0))
+    startTime: float = time.perf_counter()
+    queue.run(0.05)
+    wallTime: float = time.perf_counter() - startTime
+    if any(job.state != JobStates.Done for job in queue.jobs()): raise RuntimeError('a job has failed')
+    return wallTime
+
+if __name__ == '__main__':
+    jobCount: int = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    workers: int = int(sys.argv[2]) if len(sys.argv) > 2 else jobCount
+    os.environ['FS_SOLVER_STUB_WORK'] = sys.argv[3] if len(sys.argv) > 3 else '10'
+    os.environ['FS_SOLVER_STUB_DURATION'] = '0'
+    directory: str = tempfile.mkdtemp(prefix='fs_benchmark_')
+    try:
+        Executables.setPreprocessor(wrapper(directory, 'fs_preprocessor.py'))
+        Executables.setSolver(wrapper(directory, 'fs_solver_stub.py'))
+        ResultCache.setEnabled(False)
+        print(f'{jobCount} jobs, {workers} workers, {len(JobQueue.availableCores())} logical CPUs')
+        partitioned: float = runJobs(directory, jobCount, workers, True)
+        shared: float = runJobs(directory, jobCount, workers, False)
+        print(f'Partitioned cores:   {partitioned:8.2f} s')
+        print(f'Oversubscribed:      {shared:8.2f} s')
+        print(f'Speedup: {shared/partitioned:.2f}x')
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
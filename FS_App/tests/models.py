@@ -0,0 +1,62 @@
+import random
+from typing import cast
+from dataModel import (
+    Mesh, ModelDatabase, NodeSet, ElementSet, Material, Section, ConcentratedLoad, BoundaryCondition, StressStates
+)
+
+def gridMesh(nx: int, ny: int, nz: int = 0, shuffle: bool = False) -> Mesh:
+    '''
+    Returns a structured mesh of unit quadrilaterals (nz = 0) or hexahedra, with the nodes numbered row by row
+    (or in a random order, if shuffle is set; the seed is fixed).
+    '''
+    layers: int = max(nz, 0) + 1
+    coordinates: list[tuple[float, float, float]] = [
+        (float(i), float(j), float(k)) for k in range(layers) for j in range(ny + 1) for i in range(nx + 1)
+    ]
+    order: list[int] = list(range(len(coordinates)))
+    if shuffle: random.Random(0).shuffle(order)
+    index: list[int] = [0]*len(order)
+    for new, original in enumerate(order): index[original] = new
+    def node(i: int, j: int, k: int = 0) -> int: return index[(k*(ny + 1) + j)*(nx + 1) + i]
+    elements: list[tuple[str, tuple[int, ...]]] = []
+    for k in range(max(nz, 1)):
+        for j in range(ny):
+            for i in range(nx):
+                quad: tuple[int, ...] = (node(i, j, k), node(i + 1, j, k), node(i + 1, j + 1, k), node(i, j + 1, k))
+                if nz <= 0:
+                    elements.append(('E2D4', quad))
+                else:
+                    top: tuple[int, ...] = (
+                        node(i, j, k + 1), node(i + 1, j, k + 1), node(i + 1, j + 1, k + 1), node(i, j + 1, k + 1)
+                    )
+                    elements.append(('E3D8', quad + top))
+    return Mesh(3 if nz > 0 else 2, [coordinates[original] for original in order], elements)
+
+def gridModel(nx: int, ny: int, nz: int = 0, shuffle: bool = False) -> ModelDatabase:
+    '''
+    Returns a complete model database on a structured mesh (see gridMesh): one material and section, the nodes at
+    x = 0 fixed, and a concentrated load on the nodes at x = nx.
+    '''
+    modelDatabase: ModelDatabase = ModelDatabase(gridMesh(nx, ny, nz, shuffle))
+    fixed: NodeSet = cast(NodeSet, modelDatabase.nodeSets.new())
+    loaded: NodeSet = cast(NodeSet, modelDatabase.nodeSets.new())
+    for index, node in enumerate(modelDatabase.mesh.nodes):
+        if node.coordinates[0] == 0.0: fixed.add((index,))
+        if node.coordinates[0] == float(nx): loaded.add((index,))
+    elementSet: ElementSet = cast(ElementSet, modelDatabase.elementSets.new())
+    elementSet.add(range(len(modelDatabase.mesh.elements)))
+    material: Material = cast(Material, modelDatabase.materials.new())
+    material.young = 210000.0
+    material.poisson = 0.3
+    section: Section = cast(Section, modelDatabase.sections.new())
+    section.elementSetName = elementSet.name
+    section.materialName = material.name
+    section.stressState = (StressStates.C3D if nz > 0 else StressStates.CPS).name
+    section.planeThickness = 1.0
+    boundaryCondition: BoundaryCondition = cast(BoundaryCondition, modelDatabase.boundaryConditions.new())
+    boundaryCondition.nodeSetName = fixed.name
+    boundaryCondition.isActiveInX = boundaryCondition.isActiveInY = boundaryCondition.isActiveInZ = True
+    concentratedLoad: ConcentratedLoad = cast(ConcentratedLoad, modelDatabase.concentratedLoads.new())
+    concentratedLoad.nodeSetName = loaded.name
+    concentratedLoad.y = -1.0
+    return modelDatabase
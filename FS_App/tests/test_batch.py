@@ -0,0 +1,90 @@
+import os
+import shutil
+import tempfile
+import unittest
+from dataModel import ModelDatabase
+from fs_batch import prepareModelDatabase, readJobList
+
+# Abaqus input of a single quadrilateral
+abaqusInput: str = (
+    '*Node\n1, 0., 0.\n2, 1., 0.\n3, 1., 1.\n4, 0., 1.\n*Element, type=CPS4\n1, 1, 2, 3, 4\n*Nset, nset=fixed\n1, 4\n'
+)
+
+class BatchTest(unittest.TestCase):
+    '''Tests of the batch run preparation (model conversion and job lists).'''
+
+    def setUp(self) -> None:
+        '''Writes an Abaqus input file to a temporary directory.'''
+        self.directory: str = tempfile.mkdtemp(prefix='fs_test_')
+        self.modelFile: str = self.path('beam.inp')
+        with open(self.modelFile, 'w') as file: file.write(abaqusInput)
+
+    def tearDown(self) -> None:
+        '''Removes the temporary directory.'''
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def path(self, fileName: str) -> str:
+        '''Returns the path of a file in the temporary directory.'''
+        return os.path.join(self.directory, fileName)
+
+    def testConvert(self) -> None:
+        '''An Abaqus input file is converted next to the input file; a model database file is read.'''
+        modelDatabase: ModelDatabase = prepareModelDatabase(self.modelFile)
+        self.assertEqual(modelDatabase.filePath, self.path('beam.fs_mdb'))
+        self.assertTrue(os.path.isfile(modelDatabase.filePath))
+        self.assertEqual(len(prepareModelDatabase(modelDatabase.filePath).mesh.elements), 1)
+
+    def testOverwrite(self) -> None:
+        '''An existing model database file is not overwritten unless requested.'''
+        with open(self.path('beam.fs_mdb'), 'w') as file: file.write('# edited model\n')
+        with self.assertRaises(RuntimeError):
+            prepareModelDatabase(self.modelFile)
+        with open(self.path('beam.fs_mdb'), 'r') as file: self.assertEqual(file.read(), '# edited model\n')
+        prepareModelDatabase(self.modelFile, overwrite=True)
+        with open(self.path('beam.fs_mdb'), 'r') as file: self.assertNotEqual(file.read(), '# edited model\n')
+
+    def testOutputDirectory(self) -> None:
+        '''With an output directory, the model database file is written there (the input directory is unchanged).'''
+        with open(self.path('beam.fs_mdb'), 'w') as file: file.write('# edited model\n')
+        modelDatabase: ModelDatabase = prepareModelDatabase(self.modelFile, self.path('output'))
+        self.assertEqual(modelDatabase.filePath, os.path.join(self.path('output'), 'beam.fs_mdb'))
+        self.assertTrue(os.path.isfile(modelDatabase.filePath))
+        with open(self.path('beam.fs_mdb'), 'r') as file: self.assertEqual(file.read(), '# edited model\n')
+        with self.assertRaises(RuntimeError):
+            prepareModelDatabase(self.modelFile, self.path('output'))
+    def writeJobList(self, text: str) -> str:
+        '''Writes a job list to the temporary directory and returns its file path.'''
+        filePath: str = self.path('jobs.csv')
+        with open(filePath, 'w') as file: file.write(text)
+        return filePath
+
+    def testJobList(self) -> None:
+        '''Job lists have defaults for the analysis type and eigenvalues; relative paths are relative to the list.'''
+        jobs: list[tuple[str, str, int]] = readJobList(self.writeJobList(
+            '# model, analysis type, eigenvalues\n'
+            'beam.inp\n'
+            '\n'
+            'beam.inp, Frequency, 4\n'
+            f'{self.path("plate.fs_mdb")}, buckle,\n'
+        ))
+        self.assertEqual(jobs, [
+            (self.path('beam.inp'), 'static', 10),
+            (self.path('beam.inp'), 'frequency', 4),
+            (self.path('plate.fs_mdb'), 'buckle', 10)
+        ])
+
+    def testInvalidJobList(self) -> None:
+        '''Invalid entries are reported with their line number.'''
+        for text, message in (
+            ('beam.inp\nbeam.inp, modal, 4\n', "line 2: 'modal'"),
+            ('# comment\n\nbeam.inp, frequency, 0\n', "line 3: '0'"),
+            ('beam.inp, buckle, -2\n', "line 1: '-2'"),
+            ('beam.inp, frequency, four\n', "line 1: 'four'"),
+            ('beam.inp, frequency, 2.5\n', "line 1: '2.5'"),
+            ('beam.inp\n, static\n', 'line 2')
+        ):
+            with self.subTest(text=text), self.assertRaisesRegex(ValueError, message):
+                readJobList(self.writeJobList(text))
+
+if __name__ == '__main__':
+    unittest.main()
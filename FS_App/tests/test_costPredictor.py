@@ -0,0 +1,114 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from typing import cast
+from collections.abc import Sequence
+from dataModel import ModelDatabase, NodeSet, BoundaryCondition
+from process import CostPredictor, Renumbering
+from models import gridModel
+
+def referenceSize(modelDatabase: ModelDatabase, nodeOrder: Sequence[int] | None = None) -> tuple[int, int, int, int]:
+    '''
+    Returns the active degrees of freedom, nonzeros (upper triangle), profile and half-bandwidth of the stiffness
+    matrix, from its sparsity pattern built entry by entry (reference for the vectorized analysis).
+    '''
+    nodeCount: int = len(modelDatabase.mesh.nodes)
+    dimensions: int = modelDatabase.mesh.modelingSpace.value
+    order: list[int] = list(nodeOrder) if nodeOrder is not None else list(range(nodeCount))
+    fixed: set[tuple[int, int]] = set()
+    for boundaryCondition in cast(tuple[BoundaryCondition, ...], modelDatabase.boundaryConditions.dataObjects()):
+        flags: tuple[bool, ...] = (
+            boundaryCondition.isActiveInX, boundaryCondition.isActiveInY, boundaryCondition.isActiveInZ
+        )
+        for index in cast(NodeSet, modelDatabase.nodeSets[boundaryCondition.nodeSetName]).indices():
+            fixed.update((index, j) for j in range(dimensions) if flags[j])
+    # degrees of freedom numbered node by node (in the node order)
+    dofs: dict[int, list[int]] = {}
+    count: int = 0
+    for original in order:
+        dofs[original] = []
+        for j in range(dimensions):
+            if (original, j) in fixed: continue
+            dofs[original].append(count)
+            count += 1
+    entries: set[tuple[int, int]] = set()
+    for element in modelDatabase.mesh.elements:
+        elementDofs: list[int] = [dof for node in element.nodeIndices for dof in dofs[node]]
+        entries.update((max(a, b), min(a, b)) for a in elementDofs for b in elementDofs)
+    firstColumn: list[int] = list(range(count))
+    for row, column in entries: firstColumn[row] = min(firstColumn[row], column)
+    profile: int = sum(row - firstColumn[row] + 1 for row in range(count))
+    bandwidth: int = max((row - firstColumn[row] for row in range(count)), default=0)
+    return count, len(entries), profile, bandwidth
+
+class CostPredictorTest(unittest.TestCase):
+    '''Tests of the cost predictor (problem size, renumbering and calibration).'''
+
+    def setUp(self) -> None:
+        '''Uses a calibration file in a temporary directory.'''
+        self.directory: str = tempfile.mkdtemp(prefix='fs_test_')
+        CostPredictor.setCalibrationFile(os.path.join(self.directory, 'cost.json'))
+
+    def tearDown(self) -> None:
+        '''Removes the temporary directory.'''
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def assertSize(self, cost: CostPredictor, size: tuple[int, int, int, int]) -> None:
+        '''Asserts the problem size of the cost predictor.'''
+        self.assertEqual((cost.dofs, cost.nonzeros, cost.profile, cost.bandwidth), size)
+
+    def testProblemSize(self) -> None:
+        '''The problem size matches the sparsity pattern of the stiffness matrix (2D and 3D, any node order).'''
+        for modelDatabase in (gridModel(5, 3), gridModel(3, 2, 2), gridModel(4, 3, 2, shuffle=True)):
+            cost: CostPredictor = CostPredictor(modelDatabase)
+            self.assertSize(cost, referenceSize(modelDatabase))
+            order: list[int] = Renumbering.mortonOrder(modelDatabase)
+            cost.analyze(modelDatabase, order)
+            self.assertSize(cost, referenceSize(modelDatabase, order))
+
+    def testRenumbering(self) -> None:
+        '''The problem size is computed as renumbered by the preprocessor (only if the profile is reduced).'''
+        modelDatabase: ModelDatabase = gridModel(6, 4, 2, shuffle=True)
+        original: tuple[int, int, int, int] = referenceSize(modelDatabase)
+        for method in ('rcm', 'morton'):
+            try:
+                order: list[int] = Renumbering.nodeOrder(modelDatabase, method)
+            except ImportError:
+                continue
+            renumbered: tuple[int, int, int, int] = referenceSize(modelDatabase, order)
+            cost: CostPredictor = CostPredictor(modelDatabase, renumbering=method)
+            self.assertEqual(cost.renumbering, method)
+            self.assertSize(cost, renumbered if renumbered[2] < original[2] else original)
+            self.assertLess(cost.profile, original[2])
+
+    def testCalibration(self) -> None:
+        '''Recorded runs calibrate the predictions (linear fit), and they are saved and reloaded.'''
+        small: CostPredictor = CostPredictor(gridModel(4, 4))
+        large: CostPredictor = CostPredictor(gridModel(16, 16))
+        self.assertFalse(small.isCalibrated())
+        small.record(1.0, 100.0)
+        large.record(3.0, 300.0)
+        self.assertTrue(large.isCalibrated())
+        self.assertAlmostEqual(small.time(), 1.0)
+        self.assertAlmostEqual(large.memory(), 300.0)
+        CostPredictor.setCalibrationFile(os.path.join(self.directory, 'cost.json'))
+        self.assertEqual(len(CostPredictor.calibration()['static']), 2)
+        self.assertFalse(CostPredictor(gridModel(4, 4), 'frequency').isCalibrated())
+
+    def testOutdatedCalibration(self) -> None:
+        '''Calibration files of an older version (peak memory including the parent process) are discarded.'''
+        calibrationFile: str = os.path.join(self.directory, 'old.json')
+        record: dict[str, float] = {'dofs': 10, 'effort': 100.0, 'storage': 100.0, 'time': 1.0, 'memory': 270.0}
+        with open(calibrationFile, 'w') as file: json.dump({'static': [record]}, file)
+        CostPredictor.setCalibrationFile(calibrationFile)
+        cost: CostPredictor = CostPredictor(gridModel(4, 4))
+        self.assertFalse(cost.isCalibrated())
+        cost.record(1.0, 10.0)
+        with open(calibrationFile, 'r') as file: data: dict = json.load(file)
+        self.assertEqual(data['version'], 2)
+        self.assertEqual([x['memory'] for x in data['analyses']['static']], [10.0])
+
+if __name__ == '__main__':
+    unittest.main()
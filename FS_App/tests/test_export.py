@@ -0,0 +1,30 @@
+import unittest
+from fs_export import parseFrames, parseSize
+
+class ExportArgumentsTest(unittest.TestCase):
+    '''Tests of the command line argument parsing of the image export.'''
+
+    def testFrames(self) -> None:
+        '''Frame selections are 1-based numbers and ranges, converted to 0-based frame indices.'''
+        self.assertEqual(parseFrames('all', 3), [0, 1, 2])
+        self.assertEqual(parseFrames(' ALL ', 2), [0, 1])
+        self.assertEqual(parseFrames('all', 0), [])
+        self.assertEqual(parseFrames('1', 5), [0])
+        self.assertEqual(parseFrames('2-4', 5), [1, 2, 3])
+        self.assertEqual(parseFrames('1-2, 5, 3-3', 5), [0, 1, 4, 2])
+        self.assertEqual(parseFrames('5,1', 5), [4, 0])
+
+    def testInvalidFrames(self) -> None:
+        '''Frames out of range, reversed ranges and malformed selections are rejected.'''
+        for text in ('0', '6', '4-6', '0-2', '3-1', '1,5-4', '', 'a', '1-', '1,,2', '-1'):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parseFrames(text, 5)
+
+    def testSize(self) -> None:
+        '''Image sizes are given as width x height.'''
+        self.assertEqual(parseSize('1920x1080'), (1920, 1080))
+        self.assertEqual(parseSize('640X480'), (640, 480))
+        with self.assertRaises(ValueError): parseSize('640')
+
+if __name__ == '__main__':
+    unittest.main()
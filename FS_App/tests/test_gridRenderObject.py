@@ -0,0 +1,85 @@
+import gc
+import unittest
+import numpy as np
+from dataModel import Mesh
+from visualization.rendering import GridRenderObject
+from vtkmodules.util import numpy_support
+from vtkmodules.vtkCommonCore import vtkPoints, vtkDoubleArray, vtkDataArray
+from vtkmodules.vtkCommonDataModel import vtkUnstructuredGrid
+from models import gridMesh
+
+def referenceDataSet(mesh: Mesh) -> vtkUnstructuredGrid:
+    '''Builds the data set point by point and cell by cell (reference for the shared buffer build).'''
+    dataSet: vtkUnstructuredGrid = vtkUnstructuredGrid()
+    points: vtkPoints = vtkPoints()
+    points.SetNumberOfPoints(len(mesh.nodes))
+    for i, node in enumerate(mesh.nodes):
+        points.SetPoint(i, node.coordinates)
+    dataSet.SetPoints(points) # type: ignore
+    dataSet.AllocateEstimate(len(mesh.elements), 8)
+    for element in mesh.elements:
+        dataSet.InsertNextCell(element.cellType, element.nodeCount, element.nodeIndices) # type: ignore
+    pointData: vtkDoubleArray = vtkDoubleArray()
+    pointData.SetNumberOfValues(len(mesh.nodes))
+    for i in range(len(mesh.nodes)):
+        pointData.SetValue(i, float('nan'))
+    dataSet.GetPointData().SetScalars(pointData) # type: ignore
+    dataSet.Squeeze()
+    return dataSet
+
+def mixedMesh() -> Mesh:
+    '''Returns a 3D mesh with all 3D element types (a hexahedral grid and tetrahedra, pyramids and wedges on it).'''
+    grid: Mesh = gridMesh(3, 2, 2)
+    elements: list[tuple[str, tuple[int, ...]]] = [
+        (element.elementType.name, element.nodeIndices) for element in grid.elements
+    ]
+    elements += [('E3D4', (0, 1, 4, 12)), ('E3D5', (1, 2, 6, 5, 13)), ('E3D6', (4, 5, 8, 16, 17, 20))]*3
+    return Mesh(3, [node.coordinates for node in grid.nodes], elements)
+
+class GridRenderObjectTest(unittest.TestCase):
+    '''Tests of the grid data set build (shared NumPy buffers) against the reference build.'''
+
+    def assertDataSet(self, mesh: Mesh) -> None:
+        '''Asserts that the data set of the mesh equals the reference data set.'''
+        dataSet: vtkUnstructuredGrid = GridRenderObject.buildDataSet(mesh)
+        reference: vtkUnstructuredGrid = referenceDataSet(mesh)
+        # the shared buffers are owned by the data set
+        gc.collect()
+        def array(x: vtkDataArray) -> np.ndarray: return numpy_support.vtk_to_numpy(x)
+        self.assertEqual(dataSet.GetNumberOfPoints(), reference.GetNumberOfPoints())
+        self.assertEqual(dataSet.GetNumberOfCells(), reference.GetNumberOfCells())
+        np.testing.assert_array_equal(array(dataSet.GetPoints().GetData()), array(reference.GetPoints().GetData()))
+        self.assertEqual(
+            [dataSet.GetCellType(i) for i in range(len(mesh.elements))],
+            [reference.GetCellType(i) for i in range(len(mesh.elements))]
+        )
+        cells, referenceCells = dataSet.GetCells(), reference.GetCells()
+        np.testing.assert_array_equal(array(cells.GetOffsetsArray()), array(referenceCells.GetOffsetsArray()))
+        np.testing.assert_array_equal(
+            array(cells.GetConnectivityArray()), array(referenceCells.GetConnectivityArray())
+        )
+        self.assertTrue(np.isnan(array(dataSet.GetPointData().GetScalars())).all())
+        pointIds: np.ndarray = array(dataSet.GetPointData().GetArray('vtkOriginalPointIds'))
+        cellIds: np.ndarray = array(dataSet.GetCellData().GetArray('vtkOriginalCellIds'))
+        np.testing.assert_array_equal(pointIds, np.arange(len(mesh.nodes)))
+        np.testing.assert_array_equal(cellIds, np.arange(len(mesh.elements)))
+
+    def testQuadrilaterals(self) -> None:
+        '''2D grid of quadrilaterals (shuffled nodes).'''
+        self.assertDataSet(gridMesh(8, 5, shuffle=True))
+
+    def testMixedElements(self) -> None:
+        '''3D mesh of all 3D element types.'''
+        self.assertDataSet(mixedMesh())
+
+    def testTriangles(self) -> None:
+        '''2D mesh of triangles and quadrilaterals.'''
+        grid: Mesh = gridMesh(4, 4)
+        elements: list[tuple[str, tuple[int, ...]]] = [
+            ('E2D3', element.nodeIndices[:3]) if i % 2 else (element.elementType.name, element.nodeIndices)
+            for i, element in enumerate(grid.elements)
+        ]
+        self.assertDataSet(Mesh(2, [node.coordinates for node in grid.nodes], elements))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+import unittest
+from collections.abc import Sequence
+from unittest.mock import patch
+from process import Job, JobQueue, JobStates
+
+class StandInJob(Job):
+    '''Job that runs no processes: it is running once started, until it is finished by the test.'''
+
+    @property
+    def memory(self) -> float:
+        '''Current memory usage in MB (set by the test).'''
+        return self.usedMemory if self._state == JobStates.Running else 0.0
+
+    # attribute slots
+    __slots__ = ('result', 'usedMemory')
+
+    def __init__(self, name: str, priority: int = 0, memoryEstimate: float = 0.0, maxRetries: int = 0) -> None:
+        '''Stand-in job constructor.'''
+        super().__init__(f'{name}.fs_mdb', priority=priority, maxRetries=maxRetries, memoryEstimate=memoryEstimate)
+        self.result: JobStates | None = None
+        self.usedMemory: float = 0.0
+
+    def start(self, cores: Sequence[int] = ()) -> None:
+        '''Starts the job on the specified cores (no processes).'''
+        self._state = JobStates.Running
+        self._attempts += 1
+        self._cores = tuple(cores)
+
+    def poll(self) -> JobStates:
+        '''Finishes the job with its result (if set by the test).'''
+        if self._state == JobStates.Running and self.result:
+            self._state, self.result = self.result, None
+        return self._state
+
+class JobQueueTest(unittest.TestCase):
+    '''Tests of the job queue (admission, retries and core partitioning) with stand-in jobs and eight logical CPUs.'''
+
+    def setUp(self) -> None:
+        '''Patches the available CPUs and memory.'''
+        self.availableMemory: float = 16e9
+        patches = (
+            patch.object(JobQueue, 'availableCores', staticmethod(lambda: list(range(8)))),
+            patch('process.jobQueue.virtual_memory', lambda: type('Memory', (), {'available': self.availableMemory}))
+        )
+        for x in patches:
+            x.start()
+            self.addCleanup(x.stop)
+
+    def testMemoryAdmission(self) -> None:
+        '''Jobs start while the free memory (minus the memory still to be claimed and the reserve) fits the estimate.'''
+        queue: JobQueue = JobQueue(maxWorkers=4, memoryReserve=512.0, partitionCores=False)
+        jobs: list[StandInJob] = [queue.submit(StandInJob(f'job{i}', memoryEstimate=6000.0)) for i in range(3)]
+        queue.poll()
+        self.assertEqual([job.state for job in jobs], [JobStates.Running]*2 + [JobStates.Queued])
+        # the memory used by the first job is no longer available, the second job may still claim its estimate
+        self.availableMemory = 10e9
+        jobs[0].usedMemory = 6000.0
+        queue.poll()
+        self.assertEqual(jobs[2].state, JobStates.Queued)
+        jobs[1].result = JobStates.Done
+        queue.poll()
+        self.assertEqual(jobs[2].state, JobStates.Running)
+
+    def testOversizedJob(self) -> None:
+        '''A job whose estimate exceeds the free memory still starts if no other job is running.'''
+        queue: JobQueue = JobQueue(maxWorkers=2, memoryReserve=512.0, partitionCores=False)
+        jobs: list[StandInJob] = [queue.submit(StandInJob(f'job{i}', memoryEstimate=1e5)) for i in range(2)]
+        queue.poll()
+        self.assertEqual([job.state for job in jobs], [JobStates.Running, JobStates.Queued])
+        jobs[0].result = JobStates.Done
+        queue.poll()
+        self.assertEqual(jobs[1].state, JobStates.Running)
+
+    def testPriority(self) -> None:
+        '''Jobs start by priority, then in submission order; at most maxWorkers jobs run.'''
+        queue: JobQueue = JobQueue(maxWorkers=1, memoryReserve=0.0, partitionCores=False)
+        jobs: list[StandInJob] = [
+            queue.submit(StandInJob(name, priority)) for name, priority in (('a', 0), ('b', 2), ('c', 1), ('d', 1))
+        ]
+        order: list[str] = []
+        while not queue.isIdle():
+            queue.poll()
+            self.assertLessEqual(len(queue.runningJobs()), 1)
+            for job in queue.runningJobs():
+                if job.name not in order: order.append(job.name)
+                job.result = JobStates.Done
+        self.assertEqual(order, ['b', 'c', 'd', 'a'])
+        self.assertEqual([job.attempts for job in jobs], [1]*4)
+
+    def testRetry(self) -> None:
+        '''Failed jobs are requeued (behind the queued jobs of equal priority) until their retries are used up.'''
+        queue: JobQueue = JobQueue(maxWorkers=1, memoryReserve=0.0, partitionCores=False)
+        failing: StandInJob = queue.submit(StandInJob('failing', maxRetries=1))
+        other: StandInJob = queue.submit(StandInJob('other'))
+        queue.poll()
+        failing.result = JobStates.Failed
+        queue.poll()
+        self.assertEqual((failing.state, other.state), (JobStates.Queued, JobStates.Running))
+        other.result = JobStates.Done
+        queue.poll()
+        self.assertEqual((failing.state, failing.attempts), (JobStates.Running, 2))
+        failing.result = JobStates.Failed
+        queue.poll()
+        self.assertEqual((failing.state, failing.attempts), (JobStates.Failed, 2))
+        self.assertTrue(queue.isIdle())
+
+    def testCancelQueued(self) -> None:
+        '''Jobs cancelled while queued are skipped.'''
+        queue: JobQueue = JobQueue(maxWorkers=1, memoryReserve=0.0, partitionCores=False)
+        jobs: list[StandInJob] = [queue.submit(StandInJob(f'job{i}')) for i in range(3)]
+        queue.poll()
+        queue.cancel(jobs[1])
+        jobs[0].result = JobStates.Done
+        queue.poll()
+        self.assertEqual([job.state for job in jobs], [JobStates.Done, JobStates.Cancelled, JobStates.Running])
+        self.assertEqual(jobs[1].attempts, 0)
+        queue.clearFinished()
+        self.assertEqual(queue.jobs(), (jobs[2],))
+
+    def testPartitionCores(self) -> None:
+        '''Concurrent jobs get disjoint shares of the cores; finished jobs release their share.'''
+        queue: JobQueue = JobQueue(maxWorkers=3, memoryReserve=0.0)
+        jobs: list[StandInJob] = [queue.submit(StandInJob(f'job{i}')) for i in range(4)]
+        queue.poll()
+        self.assertEqual([job.cores for job in jobs], [(0, 1), (2, 3), (4, 5), ()])
+        jobs[1].result = JobStates.Done
+        queue.poll()
+        self.assertEqual(jobs[3].cores, (2, 3))
+        self.assertEqual(jobs[3].state, JobStates.Running)
+
+    def testWaitForFreeCores(self) -> None:
+        '''Without a free share of cores (more workers than CPUs), jobs wait instead of starting unrestricted.'''
+        queue: JobQueue = JobQueue(maxWorkers=10, memoryReserve=0.0)
+        jobs: list[StandInJob] = [queue.submit(StandInJob(f'job{i}')) for i in range(10)]
+        queue.poll()
+        self.assertEqual(len(queue.runningJobs()), 8)
+        self.assertEqual(sorted(core for job in queue.runningJobs() for core in job.cores), list(range(8)))
+        self.assertEqual([job.state for job in jobs[8:]], [JobStates.Queued]*2)
+        # a job with its own CPU affinity does not wait for a share (queued ahead of the waiting jobs)
+        pinned: StandInJob = StandInJob('pinned', priority=1)
+        pinned.affinity = (0,)
+        queue.maxWorkers = 11
+        queue.submit(pinned)
+        queue.poll()
+        self.assertEqual((pinned.state, pinned.cores), (JobStates.Running, (0,)))
+        # the share of a finished job is taken by the next job (core 0 is still used by the pinned job)
+        jobs[0].result = JobStates.Done
+        queue.poll()
+        self.assertEqual(jobs[8].state, JobStates.Queued)
+        jobs[1].result = JobStates.Done
+        queue.poll()
+        self.assertEqual((jobs[8].state, jobs[8].cores), (JobStates.Running, (1,)))
+
+    def testNoPartition(self) -> None:
+        '''Without core partitioning, jobs are not restricted.'''
+        queue: JobQueue = JobQueue(maxWorkers=10, memoryReserve=0.0, partitionCores=False)
+        jobs: list[StandInJob] = [queue.submit(StandInJob(f'job{i}')) for i in range(10)]
+        queue.poll()
+        self.assertEqual([job.cores for job in jobs], [()]*10)
+
+if __name__ == '__main__':
+    unittest.main()
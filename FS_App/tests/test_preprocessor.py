@@ -0,0 +1,118 @@
+import os
+import re
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+from typing import cast
+from contextlib import redirect_stdout
+from dataModel import ModelDatabase, ConcentratedLoad, Material
+from inputOutput import FSWriter
+from process import Subprocess
+from models import gridModel
+import fs_preprocessor
+
+class PreprocessorTest(unittest.TestCase):
+    '''Tests of the preprocessor (run as a process on model databases written to a temporary directory).'''
+
+    def setUp(self) -> None:
+        '''Creates the temporary directory.'''
+        self.directory: str = tempfile.mkdtemp(prefix='fs_test_')
+        self.preprocessor: str = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fs_preprocessor.py'
+        )
+
+    def tearDown(self) -> None:
+        '''Removes the temporary directory.'''
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def path(self, fileName: str) -> str:
+        '''Returns the path of a file in the temporary directory.'''
+        return os.path.join(self.directory, fileName)
+
+    def writeModelDatabase(self, modelDatabase: ModelDatabase, fileName: str = 'model.fs_mdb') -> str:
+        '''Writes the model database to the temporary directory and returns its file path.'''
+        modelDatabase.filePath = self.path(fileName)
+        FSWriter.writeModelDatabase(modelDatabase)
+        return modelDatabase.filePath
+
+    def preprocess(self, modelDatabaseFile: str, solverJobInputFile: str, env: dict[str, str] | None = None) -> str:
+        '''Runs the preprocessor (static analysis) and returns its log.'''
+        logFile: str = os.path.splitext(solverJobInputFile)[0] + '.fs_log'
+        process: Subprocess = Subprocess()
+        process.start(
+            sys.executable,
+            (self.preprocessor, modelDatabaseFile, solverJobInputFile, logFile, 'static', '0'),
+            env={'PYTHONPATH': os.pathsep.join(sys.path), **(env or {})}
+        )
+        while process.isAlive(): time.sleep(0.01)
+        self.assertEqual(process.exitCode(), 0)
+        with open(logFile, 'r') as file: return file.read()
+
+    def testStagePeakMemory(self) -> None:
+        '''The stage peak memory does not include the memory of the (large) parent process that has started it.'''
+        parentMemory: bytearray = bytearray(300_000_000)
+        parentMemory[::4096] = b'x'*len(parentMemory[::4096])
+        log: str = self.preprocess(self.writeModelDatabase(gridModel(4, 4)), self.path('model.fs_job'))
+        peaks: list[float] = [float(x) for x in re.findall(r'peak RSS: ([0-9.]+) MB', log)]
+        self.assertTrue(peaks)
+        self.assertLess(max(peaks), 250.0)
+
+    def testRenumberingMethod(self) -> None:
+        '''Renumbering writes the renumbering file; an unknown method is a warning and removes a stale file.'''
+        modelDatabaseFile: str = self.writeModelDatabase(gridModel(8, 6, shuffle=True))
+        solverJobInputFile: str = self.path('model.fs_job')
+        renumberingFile: str = self.path('model.fs_prm')
+        log: str = self.preprocess(modelDatabaseFile, solverJobInputFile, {'FS_RENUMBER': 'rcm'})
+        self.assertIn('Matrix bandwidth after renumbering (rcm)', log)
+        self.assertTrue(os.path.isfile(renumberingFile))
+        log = self.preprocess(modelDatabaseFile, solverJobInputFile, {'FS_RENUMBER': 'amd'})
+        self.assertIn("Warning: unknown renumbering method, nodes are not renumbered: 'amd'", log)
+        self.assertIn('Model definition contains 1 warning(s)', log)
+        self.assertFalse(os.path.isfile(renumberingFile))
+
+    def writeSolverJobInputFile(self, modelDatabase: ModelDatabase, solverJobInputFile: str) -> tuple[int, int]:
+        '''
+        Writes the solver job input file (incrementally), checks that it is identical to a full write,
+        and returns the number of bytes and segments written.
+        '''
+        log: StringIO = StringIO()
+        with redirect_stdout(log):
+            bytesWritten: int = fs_preprocessor.writeSolverJobInputFile(modelDatabase, solverJobInputFile)
+        reference: StringIO = StringIO()
+        fs_preprocessor.writeSolverJobInput(modelDatabase, reference)
+        with open(solverJobInputFile, 'rb') as file: self.assertEqual(file.read(), reference.getvalue().encode())
+        segmentCount: int = len(fs_preprocessor.solverJobInputSegments(modelDatabase))
+        match: re.Match[str] | None = re.search(r'reused: (\d+) of (\d+)', log.getvalue())
+        if match is None:
+            self.assertIn('up to date', log.getvalue())
+            return bytesWritten, 0
+        self.assertEqual(int(match.group(2)), segmentCount)
+        return bytesWritten, segmentCount - int(match.group(1))
+
+    def testIncrementalSolverJobInputFile(self) -> None:
+        '''Only the segments from the first changed one on are rewritten, and the file equals a full write.'''
+        modelDatabase: ModelDatabase = gridModel(20, 10, 2)
+        solverJobInputFile: str = self.path('model.fs_job')
+        segmentCount: int = len(fs_preprocessor.solverJobInputSegments(modelDatabase))
+        fullBytes, segments = self.writeSolverJobInputFile(modelDatabase, solverJobInputFile)
+        self.assertEqual(segments, segmentCount)
+        self.assertEqual(fullBytes, os.path.getsize(solverJobInputFile))
+        # unchanged model: nothing is written
+        self.assertEqual(self.writeSolverJobInputFile(modelDatabase, solverJobInputFile), (0, 0))
+        # edited load (last segment)
+        cast(ConcentratedLoad, modelDatabase.concentratedLoads.dataObjects()[0]).y = -2.0
+        bytesWritten, segments = self.writeSolverJobInputFile(modelDatabase, solverJobInputFile)
+        self.assertEqual(segments, 1)
+        self.assertLess(bytesWritten, fullBytes/100)
+        # edited material (materials, sections and loads)
+        cast(Material, modelDatabase.materials.dataObjects()[0]).young = 70000.0
+        self.assertEqual(self.writeSolverJobInputFile(modelDatabase, solverJobInputFile)[1], 3)
+        # job file changed since the last run: the index is not trusted
+        with open(solverJobInputFile, 'a') as file: file.write('\n')
+        self.assertEqual(self.writeSolverJobInputFile(modelDatabase, solverJobInputFile)[1], segmentCount)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from collections.abc import Callable
+from inputOutput import FSWriter
+from dataModel import ModelDatabase
+from process import Subprocess, SolverProgress
+from models import gridModel
+
+class SolverProgressTest(unittest.TestCase):
+    '''Tests of the solver progress model, fed with the output of the solver stand-in (fs_solver_stub.py).'''
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        '''Writes the solver job input of a small model to a temporary directory (with the preprocessor).'''
+        cls.directory: str = tempfile.mkdtemp(prefix='fs_test_')
+        cls.application: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modelDatabase: ModelDatabase = gridModel(10, 5)
+        modelDatabase.filePath = os.path.join(cls.directory, 'model.fs_mdb')
+        FSWriter.writeModelDatabase(modelDatabase)
+        cls.solverJobInputFile: str = os.path.join(cls.directory, 'model.fs_job')
+        exitCode: int | None = cls.runScript(
+            os.path.join(cls.application, 'fs_preprocessor.py'),
+            (modelDatabase.filePath, cls.solverJobInputFile, os.path.join(cls.directory, 'model.fs_log'), 'static', '0')
+        )
+        if exitCode != 0: raise RuntimeError('the preprocessor has failed')
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        '''Removes the temporary directory.'''
+        shutil.rmtree(cls.directory, ignore_errors=True)
+
+    @classmethod
+    def runScript(
+        cls,
+        script: str,
+        args: tuple[str, ...],
+        onOutput: Callable[[str], None] | None = None
+    ) -> int | None:
+        '''Runs a script of the application (output captured and passed on in complete lines), returns its exit code.'''
+        process: Subprocess = Subprocess()
+        process.start(
+            sys.executable,
+            (script, *args),
+            capture=True,
+            env={'PYTHONPATH': os.pathsep.join(sys.path), 'FS_SOLVER_STUB_DURATION': '0.4'}
+        )
+        pending: str = ''
+        endTime: float = time.perf_counter() + 60.0
+        while time.perf_counter() < endTime:
+            isAlive: bool = process.isAlive()
+            pending += process.readOutput()
+            lines, separator, pending = pending.rpartition('\n')
+            if separator and onOutput: onOutput(lines + separator)
+            if not isAlive: break
+            time.sleep(0.01)
+        exitCode: int | None = process.exitCode()
+        process.terminate()
+        return exitCode
+
+    def setUp(self) -> None:
+        '''Uses a calibration file in the temporary directory (uncalibrated at first).'''
+        SolverProgress.setCalibrationFile(os.path.join(self.directory, f'{self.id()}.json'))
+
+    def solve(self, progress: SolverProgress) -> list[tuple[float, float | None]]:
+        '''Runs the solver stand-in (static analysis) and returns the fraction and ETA after every output.'''
+        values: list[tuple[float, float | None]] = []
+        def onOutput(text: str) -> None:
+            output: str = progress.feed(text)
+            self.assertNotIn('@', output)
+            values.append((progress.fraction(), progress.eta()))
+        exitCode: int | None = self.runScript(
+            os.path.join(self.application, 'fs_solver_stub.py'),
+            (self.solverJobInputFile, os.path.join(self.directory, 'model.fs_odb'), 'static', '1'),
+            onOutput
+        )
+        self.assertEqual(exitCode, 0)
+        progress.finish(exitCode == 0)
+        return values
+
+    def assertProgress(self, progress: SolverProgress, values: list[tuple[float, float | None]]) -> None:
+        '''Asserts the phases of a static run, and a monotone fraction that completes at 1.0.'''
+        self.assertEqual(progress.phaseCount, 8)
+        self.assertEqual(progress.phaseIndex, 8)
+        self.assertEqual(len(progress.phaseTimes), 8)
+        self.assertEqual(progress.dofs, 2*11*6)
+        fractions: list[float] = [fraction for fraction, _ in values]
+        self.assertTrue(values)
+        self.assertTrue(all(0.0 <= x <= 1.0 for x in fractions))
+        self.assertEqual(fractions, sorted(fractions))
+        self.assertEqual(progress.fraction(), 1.0)
+        self.assertEqual(progress.eta(), 0.0)
+        self.assertTrue(all(eta is None or eta >= 0.0 for _, eta in values))
+
+    def testUncalibrated(self) -> None:
+        '''Uncalibrated runs weigh the phases equally.'''
+        progress: SolverProgress = SolverProgress('static')
+        self.assertIsNone(progress.estimates())
+        self.assertProgress(progress, self.solve(progress))
+
+    def testCalibrated(self) -> None:
+        '''A finished run calibrates the phase durations of the next run of the same analysis type.'''
+        self.solve(SolverProgress('static'))
+        progress: SolverProgress = SolverProgress('static')
+        values: list[tuple[float, float | None]] = self.solve(progress)
+        self.assertIsNotNone(progress.estimates())
+        self.assertProgress(progress, values)
+        self.assertIsNone(SolverProgress('frequency').estimates())
+
+    def testMalformedMarkers(self) -> None:
+        '''Malformed markers (missing or non-numeric arguments, unknown keywords) are passed on as output.'''
+        progress: SolverProgress = SolverProgress('static')
+        output: str = progress.feed('@phases 4\n@dofs 100\n@phase 1 Loading\n@step 5 10\n')
+        self.assertEqual(output, '')
+        malformed: str = '@phases four\n@dofs\n@phase one Loading\n@step 6\n@step six 10\n@steps 1 2\n@\n'
+        self.assertEqual(progress.feed(malformed + 'Solver output\n'), malformed + 'Solver output\n')
+        self.assertEqual((progress.phaseCount, progress.dofs, progress.phaseIndex), (4, 100, 1))
+        self.assertEqual((progress.step, progress.stepCount), (5, 10))
+        self.assertAlmostEqual(progress.fraction(), 0.125)
+        # a step beyond the step count does not exceed the phase
+        progress.feed('@step 20 10\n')
+        self.assertAlmostEqual(progress.fraction(), 0.25)
+        # a phase beyond the phase count extends the phase count
+        progress.feed('@phase 5 Extra\n')
+        self.assertEqual(progress.phaseCount, 5)
+        self.assertAlmostEqual(progress.fraction(), 0.8)
+
+if __name__ == '__main__':
+    unittest.main()
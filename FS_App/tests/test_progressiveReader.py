@@ -0,0 +1,140 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from typing import cast
+from inputOutput import FSWriter, FSReader, FSProgressiveReader
+from dataModel import ModelDatabase, OutputDatabase, Material
+from process import Subprocess
+from models import gridModel
+
+class ProgressiveReaderTest(unittest.TestCase):
+    '''
+    Tests of the progressive output database reader on truncated copies of an output database (frequency analysis
+    of a renumbered model, written by the solver stand-in).
+    '''
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        '''Writes the output database of a small model to a temporary directory (preprocessor and solver stand-in).'''
+        cls.directory: str = tempfile.mkdtemp(prefix='fs_test_')
+        application: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        cls.modelDatabase: ModelDatabase = gridModel(6, 3, shuffle=True)
+        cast(Material, cls.modelDatabase.materials.dataObjects()[0]).density = 7.85e-9
+        cls.modelDatabase.filePath = os.path.join(cls.directory, 'model.fs_mdb')
+        FSWriter.writeModelDatabase(cls.modelDatabase)
+        solverJobInputFile: str = os.path.join(cls.directory, 'model.fs_job')
+        logFile: str = os.path.join(cls.directory, 'model.fs_log')
+        cls.outputDatabaseFile: str = os.path.join(cls.directory, 'model.fs_odb')
+        for script, args in (
+            ('fs_preprocessor.py', (cls.modelDatabase.filePath, solverJobInputFile, logFile, 'frequency', '0')),
+            ('fs_solver_stub.py', (solverJobInputFile, cls.outputDatabaseFile, 'frequency', '4'))
+        ):
+            process: Subprocess = Subprocess()
+            process.start(
+                sys.executable,
+                (os.path.join(application, script), *args),
+                env={'PYTHONPATH': os.pathsep.join(sys.path), 'FS_RENUMBER': 'rcm', 'FS_SOLVER_STUB_DURATION': '0'},
+                capture=True
+            )
+            while process.isAlive(): time.sleep(0.01)
+            if process.exitCode() != 0: raise RuntimeError(f'{script} has failed')
+        cls.reference: OutputDatabase = FSReader.readOutputDatabase(cls.outputDatabaseFile)
+        with open(cls.outputDatabaseFile, 'rb') as file: cls.data: bytes = file.read()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        '''Removes the temporary directory.'''
+        shutil.rmtree(cls.directory, ignore_errors=True)
+
+    def setUp(self) -> None:
+        '''Uses a partial copy of the output database (with the renumbering file of the solver job).'''
+        self.filePath: str = os.path.join(self.directory, f'{self.id().rpartition(".")[2]}.fs_odb')
+        shutil.copyfile(os.path.join(self.directory, 'model.fs_prm'), os.path.splitext(self.filePath)[0] + '.fs_prm')
+
+    def write(self, data: bytes, mode: str = 'wb') -> None:
+        '''Writes (or appends) data to the partial copy.'''
+        with open(self.filePath, mode) as file: file.write(data)
+
+    def assertFrames(self, outputDatabase: OutputDatabase) -> None:
+        '''Asserts that the mesh and the frames read so far match the reference (in the original node order).'''
+        nodes: np.ndarray = np.array([node.coordinates for node in self.modelDatabase.mesh.nodes])
+        self.assertTrue(np.allclose(np.array([node.coordinates for node in outputDatabase.mesh.nodes]), nodes))
+        self.assertLessEqual(outputDatabase.frameCount, self.reference.frameCount)
+        for frame in range(outputDatabase.frameCount):
+            self.assertEqual(outputDatabase.frameDescription(frame), self.reference.frameDescription(frame))
+            self.assertEqual(outputDatabase.historyNames(frame), self.reference.historyNames(frame))
+            for name in self.reference.historyNames(frame):
+                self.assertEqual(outputDatabase.history(frame, name), self.reference.history(frame, name))
+            self.assertTrue(np.array_equal(
+                outputDatabase.nodalDisplacements(frame), self.reference.nodalDisplacements(frame)
+            ))
+
+    def testTruncated(self) -> None:
+        '''A truncated file yields the completed frames only, at any offset (including within a line).'''
+        self.assertEqual(self.reference.frameCount, 4)
+        frameCounts: list[int] = []
+        for offset in range(0, len(self.data), max(1, len(self.data)//97)):
+            self.write(self.data[:offset])
+            reader: FSProgressiveReader = FSProgressiveReader(self.filePath)
+            reader.poll()
+            self.assertFalse(reader.isComplete)
+            if reader.outputDatabase: self.assertFrames(reader.outputDatabase)
+            frameCounts.append(reader.outputDatabase.frameCount if reader.outputDatabase else -1)
+        self.assertEqual(frameCounts, sorted(frameCounts))
+        self.assertEqual(frameCounts[0], -1)
+        self.assertEqual(set(range(4)) - set(frameCounts), set())
+
+    def testGrowing(self) -> None:
+        '''A growing file is read incrementally: the new frames returned by every poll add up to all frames.'''
+        self.write(b'')
+        reader: FSProgressiveReader = FSProgressiveReader(self.filePath)
+        newFrames: int = 0
+        for offset in range(0, len(self.data), 1000):
+            self.write(self.data[offset:offset + 1000], 'ab')
+            newFrames += reader.poll()
+            self.assertEqual(reader.outputDatabase.frameCount if reader.outputDatabase else 0, newFrames)
+        self.assertTrue(reader.isComplete)
+        self.assertEqual(reader.frameCount, 4)
+        self.assertIsNotNone(reader.outputDatabase)
+        if reader.outputDatabase:
+            self.assertEqual(reader.outputDatabase.frameCount, 4)
+            self.assertFrames(reader.outputDatabase)
+        self.assertEqual(reader.poll(), 0)
+
+    def testReplaced(self) -> None:
+        '''A replaced (or shortened) file is read again from the start, into a new output database.'''
+        self.write(self.data)
+        reader: FSProgressiveReader = FSProgressiveReader(self.filePath)
+        reader.poll()
+        first: OutputDatabase | None = reader.outputDatabase
+        self.write(self.data[:len(self.data)//2])
+        reader.poll()
+        self.assertFalse(reader.isComplete)
+        self.assertIsNot(reader.outputDatabase, first)
+        self.write(self.data[len(self.data)//2:], 'ab')
+        reader.poll()
+        self.assertTrue(reader.isComplete)
+        self.assertIsNotNone(reader.outputDatabase)
+        if reader.outputDatabase:
+            self.assertEqual(reader.outputDatabase.frameCount, 4)
+            self.assertFrames(reader.outputDatabase)
+
+    def testMissing(self) -> None:
+        '''A file that does not exist yet is not an error.'''
+        reader: FSProgressiveReader = FSProgressiveReader(self.filePath)
+        self.assertEqual(reader.poll(), 0)
+        self.assertIsNone(reader.outputDatabase)
+
+    def testCorrupted(self) -> None:
+        '''A file that cannot be interpreted raises a runtime error.'''
+        start: int = self.data.index(b'nodeData = (\n') + len(b'nodeData = (\n')
+        self.write(self.data[:start] + b'    (x, y, z),\n')
+        with self.assertRaises(RuntimeError):
+            FSProgressiveReader(self.filePath).poll()
+
+if __name__ == '__main__':
+    unittest.main()
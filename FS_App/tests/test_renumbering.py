@@ -0,0 +1,104 @@
+import random
+import unittest
+from typing import cast
+from collections.abc import Sequence
+from dataModel import ModelDatabase, Mesh, NodeSet, ElementSet
+from process import Renumbering
+from models import gridModel
+import fs_preprocessor
+
+def nodeBandwidth(mesh: Mesh, nodeOrder: Sequence[int]) -> int:
+    '''Returns the largest difference of the new node indices of an element.'''
+    rank: list[int] = [0]*len(nodeOrder)
+    for newIndex, originalIndex in enumerate(nodeOrder): rank[originalIndex] = newIndex
+    return max(
+        max(rank[x] for x in element.nodeIndices) - min(rank[x] for x in element.nodeIndices)
+        for element in mesh.elements
+    )
+
+def mortonCode(x: int, y: int, z: int) -> int:
+    '''Returns the Morton code of the quantized coordinates (bit by bit).'''
+    code: int = 0
+    for bit in range(21):
+        for axis, value in enumerate((x, y, z)):
+            code |= ((value >> bit) & 1) << (3*bit + axis)
+    return code
+
+class RenumberingTest(unittest.TestCase):
+    '''Tests of the node renumbering orders and of the renumbered model database of the preprocessor.'''
+
+    def assertPermutation(self, order: Sequence[int], count: int) -> None:
+        '''Asserts that the order is a permutation of the node indices.'''
+        self.assertEqual(sorted(order), list(range(count)))
+
+    def testReverseCuthillMcKee(self) -> None:
+        '''The reverse Cuthill-McKee order is a permutation that reduces the bandwidth of a shuffled grid.'''
+        try:
+            import scipy
+        except ImportError:
+            self.skipTest('SciPy is not available')
+        for modelDatabase in (gridModel(12, 8, shuffle=True), gridModel(6, 5, 4, shuffle=True)):
+            mesh: Mesh = modelDatabase.mesh
+            order: list[int] = Renumbering.nodeOrder(modelDatabase, 'rcm')
+            self.assertPermutation(order, len(mesh.nodes))
+            shuffled: int = nodeBandwidth(mesh, range(len(mesh.nodes)))
+            self.assertLess(nodeBandwidth(mesh, order), shuffled/2)
+
+    def testMorton(self) -> None:
+        '''The Morton order sorts the nodes by the interleaved bits of their quantized coordinates.'''
+        modelDatabase: ModelDatabase = gridModel(7, 5, 3, shuffle=True)
+        generator: random.Random = random.Random(1)
+        modelDatabase = ModelDatabase(Mesh(
+            3,
+            [tuple(x + generator.uniform(-0.3, 0.3) for x in node.coordinates) for node in modelDatabase.mesh.nodes],
+            [(element.elementType.name, element.nodeIndices) for element in modelDatabase.mesh.elements]
+        ))
+        coordinates: list[tuple[float, float, float]] = [node.coordinates for node in modelDatabase.mesh.nodes]
+        lower: list[float] = [min(x[axis] for x in coordinates) for axis in range(3)]
+        extent: float = max(max(x[axis] for x in coordinates) - lower[axis] for axis in range(3))
+        codes: list[int] = [
+            mortonCode(*(int((x[axis] - lower[axis])/extent*(2**21 - 1)) for axis in range(3))) for x in coordinates
+        ]
+        order: list[int] = Renumbering.nodeOrder(modelDatabase, 'morton')
+        self.assertPermutation(order, len(coordinates))
+        self.assertEqual([codes[i] for i in order], sorted(codes))
+        self.assertEqual(Renumbering.mortonOrder(ModelDatabase(Mesh(2, [], []))), [])
+
+    def testMethods(self) -> None:
+        '''The identity order ('none') and unknown methods.'''
+        modelDatabase: ModelDatabase = gridModel(3, 2)
+        self.assertEqual(Renumbering.nodeOrder(modelDatabase, 'none'), list(range(12)))
+        with self.assertRaises(ValueError): Renumbering.nodeOrder(modelDatabase, 'amd')
+
+    def testRenumberedModelDatabase(self) -> None:
+        '''The renumbered model database has the same nodes, elements and sets (in the new numbering).'''
+        modelDatabase: ModelDatabase = gridModel(5, 4, 2, shuffle=True)
+        order: list[int] = Renumbering.mortonOrder(modelDatabase)
+        renumbered, elementOrder = fs_preprocessor.renumberModelDatabase(modelDatabase, order, True)
+        assert elementOrder is not None
+        self.assertEqual(sorted(elementOrder), list(range(len(modelDatabase.mesh.elements))))
+        nodes, elements = modelDatabase.mesh.nodes, modelDatabase.mesh.elements
+        for newIndex, originalIndex in enumerate(order):
+            self.assertEqual(renumbered.mesh.nodes[newIndex].coordinates, nodes[originalIndex].coordinates)
+        for newIndex, originalIndex in enumerate(elementOrder):
+            self.assertEqual(
+                [renumbered.mesh.nodes[x].coordinates for x in renumbered.mesh.elements[newIndex].nodeIndices],
+                [nodes[x].coordinates for x in elements[originalIndex].nodeIndices]
+            )
+        # elements are sorted by their lowest new node index
+        lowest: list[int] = [min(element.nodeIndices) for element in renumbered.mesh.elements]
+        self.assertEqual(lowest, sorted(lowest))
+        for name in modelDatabase.nodeSets.names():
+            renumberedSet: NodeSet = cast(NodeSet, renumbered.nodeSets[name])
+            self.assertEqual(
+                sorted(renumbered.mesh.nodes[i].coordinates for i in renumberedSet.indices()),
+                sorted(nodes[i].coordinates for i in cast(NodeSet, modelDatabase.nodeSets[name]).indices())
+            )
+        for name in modelDatabase.elementSets.names():
+            self.assertEqual(
+                sorted(cast(ElementSet, renumbered.elementSets[name]).indices()),
+                sorted(cast(ElementSet, modelDatabase.elementSets[name]).indices())
+            )
+
+if __name__ == '__main__':
+    unittest.main()
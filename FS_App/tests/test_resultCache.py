@@ -0,0 +1,96 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from process import ResultCache
+
+class ResultCacheTest(unittest.TestCase):
+    '''Tests of the result cache (key, fetch/store and least recently used eviction).'''
+
+    def setUp(self) -> None:
+        '''Uses a cache directory in a temporary directory.'''
+        self.directory: str = tempfile.mkdtemp(prefix='fs_test_')
+        self.settings: tuple[str, float, bool] = (
+            ResultCache.directory(), ResultCache.maxSize(), ResultCache.isEnabled()
+        )
+        ResultCache.setDirectory(os.path.join(self.directory, 'cache'))
+        ResultCache.setMaxSize(2048.0)
+        ResultCache.setEnabled(True)
+
+    def tearDown(self) -> None:
+        '''Restores the cache settings and removes the temporary directory.'''
+        ResultCache.setDirectory(self.settings[0])
+        ResultCache.setMaxSize(self.settings[1])
+        ResultCache.setEnabled(self.settings[2])
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def file(self, name: str, content: bytes) -> str:
+        '''Writes a file in the temporary directory and returns its path.'''
+        filePath: str = os.path.join(self.directory, name)
+        with open(filePath, 'wb') as file: file.write(content)
+        return filePath
+
+    def testKey(self) -> None:
+        '''The key depends on the job input, the analysis type and (not for static analyses) the eigenvalues.'''
+        jobFile: str = self.file('a.fs_sji', b'job input\n')
+        key: str = ResultCache.key(jobFile, 'static', 0)
+        self.assertEqual(len(key), 40)
+        self.assertEqual(ResultCache.key(self.file('b.fs_sji', b'job input\n'), 'static', 0), key)
+        self.assertEqual(ResultCache.key(jobFile, 'static', 5), key)
+        self.assertNotEqual(ResultCache.key(self.file('c.fs_sji', b'job input \n'), 'static', 0), key)
+        self.assertNotEqual(ResultCache.key(jobFile, 'frequency', 5), key)
+        self.assertNotEqual(ResultCache.key(jobFile, 'frequency', 5), ResultCache.key(jobFile, 'frequency', 6))
+        self.assertNotEqual(ResultCache.key(jobFile, 'frequency', 5), ResultCache.key(jobFile, 'buckle', 5))
+
+    def testSolverExecutableKey(self) -> None:
+        '''A rebuilt solver executable changes the key; a missing executable is ignored.'''
+        jobFile: str = self.file('a.fs_sji', b'job input\n')
+        solverFile: str = self.file('solver', b'solver')
+        key: str = ResultCache.key(jobFile, 'static', 0, solverFile)
+        self.assertEqual(ResultCache.key(jobFile, 'static', 0, solverFile), key)
+        self.assertNotEqual(ResultCache.key(jobFile, 'static', 0), key)
+        os.utime(solverFile, ns=(0, os.stat(solverFile).st_mtime_ns + 1_000_000_000))
+        self.assertNotEqual(ResultCache.key(jobFile, 'static', 0, solverFile), key)
+        self.assertEqual(
+            ResultCache.key(jobFile, 'static', 0, os.path.join(self.directory, 'missing')),
+            ResultCache.key(jobFile, 'static', 0)
+        )
+
+    def testFetchStore(self) -> None:
+        '''A stored output database is fetched unchanged; a missing entry or a disabled cache is a miss.'''
+        outputFile: str = self.file('a.fs_odb', b'output database')
+        targetFile: str = os.path.join(self.directory, 'b.fs_odb')
+        key: str = ResultCache.key(self.file('a.fs_sji', b'job input\n'), 'static', 0)
+        self.assertFalse(ResultCache.fetch(key, targetFile))
+        ResultCache.store(key, outputFile)
+        self.assertTrue(ResultCache.fetch(key, targetFile))
+        with open(targetFile, 'rb') as file: self.assertEqual(file.read(), b'output database')
+        self.assertFalse(any(name.endswith('.tmp') for _, _, files in os.walk(self.directory) for name in files))
+        ResultCache.setEnabled(False)
+        self.assertFalse(ResultCache.fetch(key, targetFile))
+        ResultCache.store('0' * 40, outputFile)
+        self.assertFalse(os.path.exists(ResultCache.entryFile('0' * 40)))
+
+    def testEviction(self) -> None:
+        '''The least recently used entries are evicted first; a fetch marks an entry as recently used.'''
+        ResultCache.setMaxSize(1.0)
+        outputFile: str = self.file('a.fs_odb', bytes(400_000))
+        keys: list[str] = ['a' * 40, 'b' * 40, 'c' * 40]
+        now: float = time.time()
+        for index, key in enumerate(keys[:2]):
+            ResultCache.store(key, outputFile)
+            os.utime(ResultCache.entryFile(key), (now - 100.0 + index, now - 100.0 + index))
+        # the first entry becomes the most recently used
+        self.assertTrue(ResultCache.fetch(keys[0], os.path.join(self.directory, 'b.fs_odb')))
+        ResultCache.store(keys[2], outputFile)
+        self.assertEqual([os.path.exists(ResultCache.entryFile(key)) for key in keys], [True, False, True])
+        ResultCache.setMaxSize(0.0)
+        ResultCache.evict()
+        self.assertFalse(any(os.path.exists(ResultCache.entryFile(key)) for key in keys))
+
+    def testClear(self) -> None:
+        '''Clearing removes all entries.'''
+        ResultCache.store('a' * 40, self.file('a.fs_odb', b'output database'))
+        ResultCache.clear()
+        self.assertFalse(os.path.exists(ResultCache.directory()))
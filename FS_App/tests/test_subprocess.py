@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from process import Subprocess
+
+# stand-in script: prints its arguments (one per line), then sleeps (if the first argument is 'sleep')
+standIn: str = '''
+import sys
+import time
+for argument in sys.argv[1:]: print(argument, flush=True)
+if len(sys.argv) > 2 and sys.argv[1] == 'sleep': time.sleep(float(sys.argv[2]))
+'''
+
+class SubprocessTest(unittest.TestCase):
+    '''Tests of the subprocess utility with stand-in scripts (instead of the preprocessor and solver executables).'''
+
+    def setUp(self) -> None:
+        '''Writes the stand-in script to a temporary directory.'''
+        self.directory: str = tempfile.mkdtemp(prefix='fs_test_')
+        self.script: str = os.path.join(self.directory, 'stand_in.py')
+        with open(self.script, 'w') as file: file.write(standIn)
+        self.process: Subprocess = Subprocess()
+
+    def tearDown(self) -> None:
+        '''Terminates the process and removes the temporary directory.'''
+        self.process.terminate()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def waitForExit(self, timeout: float = 10.0) -> None:
+        '''Waits for the process to exit.'''
+        endTime: float = time.perf_counter() + timeout
+        while self.process.isAlive() and time.perf_counter() < endTime: time.sleep(0.01)
+
+    def testArguments(self) -> None:
+        '''The process sees the arguments from argv[1] on, in order (the executable path is argv[0]).'''
+        self.process.start(sys.executable, (self.script, 'job.fs_job', 'job.fs_odb', 'static', '10'), capture=True)
+        self.waitForExit()
+        self.assertEqual(self.process.exitCode(), 0)
+        self.assertEqual(self.process.readOutput().split(), ['job.fs_job', 'job.fs_odb', 'static', '10'])
+
+    def testStreamOutput(self) -> None:
+        '''The captured output is streamed while the process runs (reads never block).'''
+        self.process.start(sys.executable, ('-u', self.script, 'sleep', '5'), capture=True)
+        output: str = ''
+        endTime: float = time.perf_counter() + 10.0
+        while 'sleep\n5\n' not in output.replace('\r', '') and time.perf_counter() < endTime:
+            output += self.process.readOutput()
+            time.sleep(0.01)
+        self.assertIn('sleep\n5\n', output.replace('\r', ''))
+        self.assertTrue(self.process.isAlive())
+
+    def testTerminate(self) -> None:
+        '''Terminating the process ends it (and its resource usage is then not available).'''
+        self.process.start(sys.executable, (self.script, 'sleep', '30'))
+        pid: int | None = self.process.pid()
+        self.assertTrue(self.process.isAlive())
+        self.process.terminate()
+        self.assertFalse(self.process.isAlive())
+        self.assertIsNone(self.process.pid())
+        self.assertIsNotNone(pid)
+        self.assertIsNone(self.process.usage())
+
+    def testUsage(self) -> None:
+        '''The resource usage (CPU time, and peak memory on Windows) of an exited process is recorded.'''
+        self.process.start(sys.executable, (self.script,))
+        self.waitForExit()
+        usage: tuple[float, float] | None = self.process.usage()
+        self.assertIsNotNone(usage)
+        if usage:
+            self.assertGreater(usage[0], 0.0)
+            if sys.platform != 'win32': self.assertEqual(usage[1], 0.0)
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), 'named pipes are not supported on this platform')
+    def testStreamSolverJobInput(self) -> None:
+        '''The preprocessor streams the solver job input through a named pipe to the solver stand-in.'''
+        import fs_preprocessor
+        from dataModel import Mesh, ModelDatabase
+        modelDatabase: ModelDatabase = ModelDatabase(
+            Mesh(2, ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)), (('E2D4', (0, 1, 2, 3)),))
+        )
+        solver: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fs_solver_stub.py')
+        outputDatabaseFile: str = os.path.join(self.directory, 'job.fs_odb')
+        environment: dict[str, str] = dict(os.environ)
+        os.environ['FS_SOLVER_STUB_DURATION'] = '0'
+        standardOutput = sys.stdout
+        try:
+            with open(os.path.join(self.directory, 'job.fs_log'), 'w') as log:
+                sys.stdout = log
+                exitCode: int = fs_preprocessor.streamSolverJobInput(
+                    modelDatabase, solver, (outputDatabaseFile, 'static', '1')
+                )
+        finally:
+            sys.stdout = standardOutput
+            os.environ.clear()
+            os.environ.update(environment)
+        self.assertEqual(exitCode, 0)
+        self.assertTrue(os.path.isfile(outputDatabaseFile))
+
+if __name__ == '__main__':
+    unittest.main()
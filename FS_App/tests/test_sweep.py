@@ -0,0 +1,116 @@
+import os
+import re
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from io import StringIO
+from typing import cast
+from dataModel import ModelDatabase, Material, ConcentratedLoad
+from inputOutput import FSWriter, FSReader
+from process import Sweep, Subprocess
+from models import gridModel
+import fs_preprocessor
+
+class SweepTest(unittest.TestCase):
+    '''Tests of the parametric sweep (variant files and seeded job files) on a model in a temporary directory.'''
+
+    def setUp(self) -> None:
+        '''Writes the base model database to the temporary directory and defines a sweep over two parameters.'''
+        self.directory: str = tempfile.mkdtemp(prefix='fs_test_')
+        self.modelDatabase: ModelDatabase = gridModel(12, 8)
+        self.modelDatabase.filePath = os.path.join(self.directory, 'model.fs_mdb')
+        FSWriter.writeModelDatabase(self.modelDatabase)
+        material: Material = cast(Material, self.modelDatabase.materials.dataObjects()[0])
+        concentratedLoad: ConcentratedLoad = cast(
+            ConcentratedLoad, self.modelDatabase.concentratedLoads.dataObjects()[0]
+        )
+        self.sweep: Sweep = Sweep(self.modelDatabase, {
+            ('materials', material.name, 'young'): (70000.0, 210000.0),
+            ('concentratedLoads', concentratedLoad.name, 'y'): (-1.0, -2.5)
+        })
+
+    def tearDown(self) -> None:
+        '''Removes the temporary directory.'''
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def preprocess(self, modelDatabaseFile: str) -> str:
+        '''Runs the preprocessor (static analysis) on the model database file and returns its log.'''
+        logFile: str = os.path.splitext(modelDatabaseFile)[0] + '.fs_log'
+        process: Subprocess = Subprocess()
+        process.start(
+            sys.executable,
+            (
+                os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fs_preprocessor.py'),
+                modelDatabaseFile, os.path.splitext(modelDatabaseFile)[0] + '.fs_job', logFile, 'static', '0'
+            ),
+            env={'PYTHONPATH': os.pathsep.join(sys.path)}
+        )
+        while process.isAlive(): time.sleep(0.01)
+        self.assertEqual(process.exitCode(), 0)
+        with open(logFile, 'r') as file: return file.read()
+
+    def assertVariant(self, modelDatabase: ModelDatabase, values: tuple[float, ...]) -> None:
+        '''Asserts that a model database read from a variant file equals the variant with the specified values.'''
+        reference: ModelDatabase = self.sweep.variant(values)
+        self.assertEqual(
+            [node.coordinates for node in modelDatabase.mesh.nodes], [node.coordinates for node in reference.mesh.nodes]
+        )
+        self.assertEqual(
+            [element.nodeIndices for element in modelDatabase.mesh.elements],
+            [element.nodeIndices for element in reference.mesh.elements]
+        )
+        for variant, original in zip(modelDatabase.containers(), reference.containers()):
+            self.assertEqual(variant.names(), original.names())
+        for containerName, dataObjectName, attributeName in self.sweep.parameters:
+            self.assertEqual(
+                getattr(getattr(modelDatabase, containerName)[dataObjectName], attributeName),
+                getattr(getattr(reference, containerName)[dataObjectName], attributeName)
+            )
+
+    def testVariantFiles(self) -> None:
+        '''The mesh is written once; the variant files only hold their parameter values and read the base file.'''
+        filePaths: tuple[str, ...] = self.sweep.write()
+        self.assertEqual(len(filePaths), 4)
+        self.assertEqual(
+            sorted(os.listdir(self.sweep.directory)),
+            sorted([os.path.basename(self.sweep.baseFile())] + [os.path.basename(x) for x in filePaths])
+        )
+        for filePath, values in zip(filePaths, self.sweep.combinations()):
+            self.assertLess(os.path.getsize(filePath), os.path.getsize(self.sweep.baseFile())/10)
+            modelDatabase: ModelDatabase = FSReader.readModelDatabase(filePath)
+            self.assertEqual(modelDatabase.filePath, filePath)
+            self.assertVariant(modelDatabase, values)
+        # the base file is referenced relative to the variant files (the sweep directory can be moved)
+        movedDirectory: str = os.path.join(self.directory, 'moved')
+        shutil.move(self.sweep.directory, movedDirectory)
+        self.assertVariant(
+            FSReader.readModelDatabase(os.path.join(movedDirectory, os.path.basename(filePaths[3]))),
+            self.sweep.combinations()[3]
+        )
+
+    def testSeededJobFiles(self) -> None:
+        '''
+        The preprocessor reads a variant file and only rewrites the changed segments of the seeded job file
+        (materials, sections and loads for another material; loads only for another load; none for the base values).
+        '''
+        self.preprocess(self.modelDatabase.filePath)
+        filePaths: tuple[str, ...] = self.sweep.write()
+        segmentCount: int = len(fs_preprocessor.solverJobInputSegments(self.modelDatabase))
+        for filePath, values in zip(filePaths, self.sweep.combinations()):
+            log: str = self.preprocess(filePath)
+            match: re.Match[str] | None = re.search(r'reused: (\d+) of (\d+)', log)
+            if values == (210000.0, -1.0):
+                self.assertIn(f'Solver job input file is up to date ({segmentCount} segments reused)', log)
+            elif values[0] == 210000.0:
+                self.assertEqual(match.groups() if match else None, (str(segmentCount - 1), str(segmentCount)))
+            else:
+                self.assertEqual(match.groups() if match else None, (str(segmentCount - 3), str(segmentCount)))
+            reference: StringIO = StringIO()
+            fs_preprocessor.writeSolverJobInput(self.sweep.variant(values), reference)
+            with open(os.path.splitext(filePath)[0] + '.fs_job', 'r') as file:
+                self.assertEqual(file.read(), reference.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import sys
+import time
+import unittest
+from process import Subprocess, TelemetrySampler
+
+class TelemetrySamplerTest(unittest.TestCase):
+    '''Tests of the telemetry sampler with stand-in processes.'''
+
+    def sample(self, args: tuple[str, ...], interval: float = 0.2) -> dict[str, float]:
+        '''Runs the Python interpreter with the arguments under the sampler and returns the summary.'''
+        process: Subprocess = Subprocess()
+        process.start(sys.executable, args)
+        pid: int | None = process.pid()
+        assert pid is not None
+        sampler: TelemetrySampler = TelemetrySampler(pid, interval=interval)
+        sampler.start()
+        endTime: float = time.perf_counter() + 30.0
+        while process.isAlive() and time.perf_counter() < endTime: time.sleep(0.01)
+        sampler.stop(process.usage())
+        process.terminate()
+        return sampler.summary()
+
+    def testPeakMemoryExcludesParent(self) -> None:
+        '''The peak memory of a process does not include the memory of the (large) parent process that started it.'''
+        parentMemory: bytearray = bytearray(300_000_000)
+        parentMemory[::4096] = b'x'*len(parentMemory[::4096])
+        summary: dict[str, float] = self.sample(('-c', 'import time; time.sleep(0.5)'))
+        self.assertLess(summary['peakMemory'], 100.0)
+        self.assertGreater(summary['samples'], 0)
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'the peak RSS between samples is only read on Linux')
+    def testPeakMemoryBetweenSamples(self) -> None:
+        '''The peak memory covers an allocation that is released between two samples.'''
+        summary: dict[str, float] = self.sample((
+            '-c',
+            'import time; time.sleep(0.3); b = bytearray(200_000_000); b[::4096] = b"x"*len(b[::4096]); del b; '
+            'time.sleep(0.5)'
+        ), interval=0.25)
+        self.assertGreater(summary['peakMemory'], 200.0)
+        self.assertLess(summary['meanMemory'], 200.0)
+
+    def testCpuTime(self) -> None:
+        '''The CPU time of a process includes its usage after the last sample (from the exit resource usage).'''
+        summary: dict[str, float] = self.sample(
+            ('-c', 'import time\nt = time.process_time()\nwhile time.process_time() - t < 0.3: pass'), 5.0
+        )
+        self.assertGreaterEqual(summary['cpuTime'], 0.25)
+
+if __name__ == '__main__':
+    unittest.main()
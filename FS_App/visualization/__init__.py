@@ -1,5 +1,20 @@
 '''Public exports.'''
-from visualization.interaction import Views             as Views
-from visualization.interaction import InteractionStyles as InteractionStyles
-from visualization.decoration  import Colormaps         as Colormaps
-from visualization.viewport    import Viewport          as Viewport
+from typing import Any, TYPE_CHECKING
+from visualization.interaction       import Views             as Views
+from visualization.interaction       import InteractionStyles as InteractionStyles
+from visualization.decoration        import Colormaps         as Colormaps
+from visualization.offscreenRenderer import OffscreenRenderer as OffscreenRenderer
+if TYPE_CHECKING:
+    from visualization.viewport      import Viewport          as Viewport
+    from visualization.animator      import Animator          as Animator
+
+def __getattr__(name: str) -> Any:
+    '''Imports the Qt based exports on first access (headless tools, e.g. fs_export, do not require Qt).'''
+    match name:
+        case 'Viewport':
+            from visualization.viewport import Viewport
+            return Viewport
+        case 'Animator':
+            from visualization.animator import Animator
+            return Animator
+        case _: raise AttributeError(f"module 'visualization' has no attribute '{name}'")
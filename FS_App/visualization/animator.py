@@ -0,0 +1,190 @@
+import math
+import time
+import numpy as np
+from typing import Literal
+from collections import OrderedDict
+from dataModel import OutputDatabase
+from visualization.viewport import Viewport
+from PySide6.QtCore import QTimer
+
+class Animator:
+    '''
+    Animation of output database results in a viewport. Either cycles through the frames (the selected nodal scalar
+    field of every frame that has it) or sweeps the deformation of a single frame (e.g. a mode shape) with a sinusoidal
+    scale factor. The animation is driven by a timer and is time based: when rendering exceeds the frame time budget,
+    frames are skipped rather than slowing the animation down.
+    The nodal scalar fields and displacements of the frames are kept in a small cache (least recently used out),
+    and the next frame is prefetched when the frame time budget allows it.
+    '''
+
+    # class variables
+    _frameRate: float = 5.0     # frames per second (frames animation)
+    _sweepPeriod: float = 2.0   # seconds per cycle (mode sweep)
+    _frameTimeBudget: int = 33  # milliseconds (timer interval)
+    _cacheSize: float = 256.0   # MB
+
+    @classmethod
+    def frameRate(cls) -> float:
+        '''Gets the frame rate of the frames animation (frames per second).'''
+        return cls._frameRate
+
+    @classmethod
+    def setFrameRate(cls, value: float) -> None:
+        '''Sets the frame rate of the frames animation (frames per second).'''
+        if value <= 0.0: raise ValueError('the frame rate must be positive')
+        cls._frameRate = value
+
+    @classmethod
+    def sweepPeriod(cls) -> float:
+        '''Gets the period of the mode sweep (seconds per cycle).'''
+        return cls._sweepPeriod
+
+    @classmethod
+    def setSweepPeriod(cls, value: float) -> None:
+        '''Sets the period of the mode sweep (seconds per cycle).'''
+        if value <= 0.0: raise ValueError('the sweep period must be positive')
+        cls._sweepPeriod = value
+
+    @classmethod
+    def cacheSize(cls) -> float:
+        '''Gets the size of the frame cache in MB.'''
+        return cls._cacheSize
+
+    @classmethod
+    def setCacheSize(cls, value: float) -> None:
+        '''Sets the size of the frame cache in MB (applies to the next animation).'''
+        if value < 0.0: raise ValueError('the cache size must not be negative')
+        cls._cacheSize = value
+
+    @property
+    def isRunning(self) -> bool:
+        '''Determines if an animation is running.'''
+        return self._timer.isActive()
+
+    @property
+    def mode(self) -> Literal['Frames', 'Mode'] | None:
+        '''The current animation mode (None if no animation is running).'''
+        return self._mode if self.isRunning else None
+
+    @property
+    def fps(self) -> float:
+        '''The measured number of rendered frames per second.'''
+        return self._fps
+
+    # attribute slots
+    __slots__ = (
+        '_viewport', '_timer', '_mode', '_outputDatabase', '_groupName', '_fieldName', '_frames', '_index', '_cache',
+        '_cacheBytes', '_startTime', '_fps', '_fpsTime', '_fpsCount'
+    )
+
+    def __init__(self, viewport: Viewport) -> None:
+        '''Animator constructor.'''
+        self._viewport: Viewport = viewport
+        self._timer: QTimer = QTimer()
+        self._timer.setInterval(Animator._frameTimeBudget)
+        self._timer.timeout.connect(self.onTimer) # type: ignore
+        self._mode: Literal['Frames', 'Mode'] = 'Frames'
+        self._outputDatabase: OutputDatabase | None = None
+        self._groupName: str = ''
+        self._fieldName: str = ''
+        self._frames: list[int] = []
+        self._index: int = -1
+        self._cache: OrderedDict[int, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        self._cacheBytes: int = 0
+        self._startTime: float = 0.0
+        self._fps: float = 0.0
+        self._fpsTime: float = 0.0
+        self._fpsCount: int = 0
+
+    def start(
+        self,
+        outputDatabase: OutputDatabase,
+        frame: int,
+        groupName: str,
+        fieldName: str,
+        mode: Literal['Frames', 'Mode']
+    ) -> None:
+        '''
+        Starts animating the nodal scalar field: through all frames that have it (starting at the specified frame),
+        or sweeping the deformation of the specified frame.
+        '''
+        self.stop()
+        self._cache.clear()
+        self._cacheBytes = 0
+        self._outputDatabase = outputDatabase
+        self._groupName, self._fieldName, self._mode = groupName, fieldName, mode
+        if mode == 'Frames':
+            self._frames = [
+                k for k in range(outputDatabase.frameCount)
+                if groupName in outputDatabase.nodalScalarFieldGroupNames(k)
+                and fieldName in outputDatabase.nodalScalarFieldNames(k, groupName)
+            ]
+            first: int = self._frames.index(frame) if frame in self._frames else 0
+            self._frames = self._frames[first:] + self._frames[:first]
+        else:
+            self._frames = [frame]
+        if not self._frames: raise ValueError(f"nodal scalar field not found in output database: '{fieldName}'")
+        # show the first frame (also checks that the frame data is available)
+        self._index = -1
+        self.showFrame(0)
+        self._viewport.info.setText(3, 'Animation')
+        self._viewport.render()
+        self._startTime = self._fpsTime = time.perf_counter()
+        self._fps, self._fpsCount = 0.0, 0
+        self._timer.start()
+
+    def stop(self) -> None:
+        '''Stops the animation (the frame cache is kept until the next start).'''
+        self._timer.stop()
+
+    def frameData(self, frame: int) -> tuple[np.ndarray, np.ndarray]:
+        '''Returns the nodal scalar field and the nodal displacements of the frame (cached).'''
+        if frame in self._cache:
+            self._cache.move_to_end(frame)
+            return self._cache[frame]
+        if not self._outputDatabase: raise RuntimeError('no output database is animated')
+        data: tuple[np.ndarray, np.ndarray] = (
+            np.ascontiguousarray(
+                self._outputDatabase.nodalScalarField(frame, self._groupName, self._fieldName), dtype=np.float64
+            ),
+            self._outputDatabase.nodalDisplacements(frame)
+        )
+        # keep the most recently used frames that fit in the cache (at least the current one)
+        self._cache[frame] = data
+        self._cacheBytes += data[0].nbytes + data[1].nbytes
+        while len(self._cache) > 1 and self._cacheBytes > Animator._cacheSize*1024*1024:
+            scalars, displacements = self._cache.popitem(last=False)[1]
+            self._cacheBytes -= scalars.nbytes + displacements.nbytes
+        return data
+
+    def showFrame(self, index: int) -> None:
+        '''Shows the frame at the specified index of the animated frames (not rendered).'''
+        if index == self._index: return
+        self._index = index
+        frame: int = self._frames[index]
+        scalars, displacements = self.frameData(frame)
+        self._viewport.info.setText(1, self._outputDatabase.frameDescription(frame) if self._outputDatabase else '')
+        self._viewport.plotNodalScalarField(scalars, render=False)
+        self._viewport.setGridDeformation(displacements, render=False)
+
+    def onTimer(self) -> None:
+        '''On timer timeout: shows the animation state at the current time.'''
+        tickTime: float = time.perf_counter()
+        elapsed: float = tickTime - self._startTime
+        if self._mode == 'Frames':
+            index: int = int(elapsed*Animator._frameRate)%len(self._frames)
+            if index == self._index: return
+            self.showFrame(index)
+        else:
+            self._viewport.scaleGridDeformation(math.sin(2.0*math.pi*elapsed/Animator._sweepPeriod), render=False)
+        self._viewport.render()
+        # frames per second readout (updated every second)
+        self._fpsCount += 1
+        now: float = time.perf_counter()
+        if now - self._fpsTime >= 1.0:
+            self._fps = self._fpsCount/(now - self._fpsTime)
+            self._fpsTime, self._fpsCount = now, 0
+            self._viewport.info.setText(3, f'Animation: {self._fps:.1f} fps')
+        # prefetch the next frame if the frame time budget allows it
+        if self._mode == 'Frames' and (now - tickTime)*1000.0 < 0.5*Animator._frameTimeBudget:
+            self.frameData(self._frames[(self._index + 1)%len(self._frames)])
@@ -1,19 +1,20 @@
 import math
-import visualization.utility as vu
+import time
 from abc import ABC, abstractmethod
 from typing import Literal, Any, cast
 from collections.abc import Sequence, Callable
-from visualization.rendering import PointsRenderObject, CellsRenderObject
+from visualization.rendering import PointsRenderObject, CellsRenderObject, GridRenderObject
+from vtkmodules.util import numpy_support
 from vtkmodules.vtkCommonExecutionModel import vtkAlgorithmOutput, vtkAlgorithm
-from vtkmodules.vtkCommonCore import vtkObject, vtkCommand, vtkPoints
-from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData, vtkUnstructuredGrid
+from vtkmodules.vtkCommonCore import vtkObject, vtkCommand, vtkPoints, vtkDataArray, vtkIdList, reference
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData, vtkUnstructuredGrid, vtkGenericCell, vtkBox
 from vtkmodules.vtkFiltersCore import vtkGlyph3D
 from vtkmodules.vtkFiltersSources import vtkLineSource
 from vtkmodules.vtkFiltersExtraction import vtkExtractGeometry
 from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
 from vtkmodules.vtkRenderingCore import (
     vtkRenderWindow, vtkRenderer, vtkRenderWindowInteractor, vtkActor2D, vtkActor, vtkPolyDataMapper2D, vtkCoordinate,
-    vtkMapper, vtkPointPicker, vtkCellPicker, vtkPicker, vtkAreaPicker, vtkPolyDataMapper
+    vtkMapper, vtkAreaPicker, vtkPolyDataMapper
 )
 
 class InteractionStyle(ABC):
@@ -25,6 +26,8 @@ class InteractionStyle(ABC):
     _pointGlyphScale: float = 0.004
     _arrowGlyphScale: float = 0.020
     _foreground: tuple[float, float, float] = (1.0, 1.0, 1.0)
+    _hoverInterval: float = 1.0/60.0 # seconds (hover picks are throttled to the display refresh rate)
+    _pointPickTolerance: float = 0.003 # fraction of the render window diagonal
 
     @classmethod
     def setGridLineWidth(cls, value: float) -> None:
@@ -210,6 +213,14 @@ class InteractionStyle(ABC):
         actor.GetProperty().SetColor(*cls._foreground)
         return actor
 
+    @staticmethod
+    def displayToWorld(point: tuple[float, float, float], renderer: vtkRenderer) -> tuple[float, float, float]:
+        '''Converts a display point (with depth) to world coordinates.'''
+        renderer.SetDisplayPoint(*point)
+        renderer.DisplayToWorld()
+        x, y, z, w = renderer.GetWorldPoint()
+        return x/w, y/w, z/w
+
     @classmethod
     def pickSingle(
         cls,
@@ -217,20 +228,82 @@ class InteractionStyle(ABC):
         target: Literal['Points', 'Cells'],
         renderer: vtkRenderer
     ) -> tuple[int, vtkUnstructuredGrid | None]:
-        '''Picks a single point or cell.'''
-        # perform pick operation
-        picker: vtkPicker = vtkPointPicker() if target == 'Points' else vtkCellPicker()
-        picker.SetTolerance(0.003 if target == 'Points' else 0.0)
-        picker.Pick(*point, 0.0, renderer)
-        # get picked data set (if any)
-        actor: vtkActor | None = picker.GetActor()
-        mapper: vtkMapper | None = actor.GetMapper() if actor else None
-        dataSet: Any | None = mapper.GetInput() if mapper else None # type: ignore
-        # return
-        if isinstance(dataSet, vtkUnstructuredGrid):
-            index: int = picker.GetPointId() if target == 'Points' else picker.GetCellId() # type: ignore
-            return index, dataSet # type: ignore
-        return -1, None
+        '''
+        Picks a single point or cell of the rendered grids, through the cached locators of the grid surfaces: the cell
+        hit first by the pick ray, or the point of the hit surface closest to the ray within the pick tolerance
+        (a fraction of the render window diagonal, measured per coordinate as the point picker).
+        '''
+        # pick tolerance (in display coordinates, and in world coordinates at the focal point)
+        renderer.SetWorldPoint(*renderer.GetActiveCamera().GetFocalPoint(), 1.0)
+        renderer.WorldToDisplay()
+        depth: float = renderer.GetDisplayPoint()[2]
+        width, height = renderer.GetSize()
+        tolerance: float = cls._pointPickTolerance*math.dist(
+            cls.displayToWorld((0.0, 0.0, depth), renderer), cls.displayToWorld((width, height, depth), renderer)
+        )
+        radius: float = cls._pointPickTolerance*math.hypot(width, height)
+        # visible grid surfaces
+        surfaces: list[tuple[GridRenderObject, vtkPolyData]] = []
+        for i in range(renderer.GetActors().GetNumberOfItems()):
+            actor: vtkActor = cast(vtkActor, renderer.GetActors().GetItemAsObject(i))
+            if not actor.GetVisibility() or not actor.GetPickable(): continue
+            surface: Any | None = actor.GetMapper().GetInput() # type: ignore
+            gridRenderObject: GridRenderObject | None = GridRenderObject.surfaceRenderObject(surface)
+            if gridRenderObject: surfaces.append((gridRenderObject, surface))
+        # closest intersection of the pick ray (from the near to the far clipping plane) with the grid surfaces
+        # (points: if the ray misses them, rays around the picked point within the pick tolerance, for the surfaces
+        # the ray passes close to; picks on outlines)
+        origin: tuple[float, float, float] = cls.displayToWorld((*point, 0.0), renderer)
+        end: tuple[float, float, float] = cls.displayToWorld((*point, 1.0), renderer)
+        offsets: list[tuple[float, float]] = [(0.0, 0.0)]
+        if target == 'Points':
+            offsets += [
+                (f*radius*math.cos((k + f)*math.pi/4.0), f*radius*math.sin((k + f)*math.pi/4.0))
+                for f in (0.5, 1.0) for k in range(8)
+            ]
+        picked: tuple[float, GridRenderObject, vtkPolyData, list[float], int] | None = None
+        for dx, dy in offsets:
+            ray: tuple[tuple[float, float, float], tuple[float, float, float]] = (origin, end)
+            if dx or dy:
+                ray = (
+                    cls.displayToWorld((point[0] + dx, point[1] + dy, 0.0), renderer),
+                    cls.displayToWorld((point[0] + dx, point[1] + dy, 1.0), renderer)
+                )
+            for gridRenderObject, surface in surfaces:
+                t: reference = reference(0.0)
+                position: list[float] = [0.0, 0.0, 0.0]
+                cellId: reference = reference(-1)
+                if gridRenderObject.cellLocator().IntersectWithLine(
+                    *ray, 0.0, t, position, [0.0, 0.0, 0.0], reference(0), cellId, vtkGenericCell()
+                ) and (not picked or float(t) < picked[0]):
+                    picked = (float(t), gridRenderObject, surface, position, int(cellId))
+            if picked: break
+            surfaces = [
+                (gridRenderObject, surface) for gridRenderObject, surface in surfaces
+                if vtkBox.IntersectWithLine(
+                    [x - tolerance if j%2 == 0 else x + tolerance for j, x in enumerate(surface.GetBounds())],
+                    origin, end, reference(0.0), reference(0.0), [0.0]*3, [0.0]*3, reference(0), reference(0)
+                )
+            ]
+            if not surfaces: break
+        if not picked: return -1, None
+        _, gridRenderObject, surface, position, index = picked
+        # snap to the surface point closest to the pick ray (within the pick tolerance)
+        if target == 'Points':
+            candidates: vtkIdList = vtkIdList()
+            gridRenderObject.pointLocator().FindPointsWithinRadius(3.0*tolerance, position, candidates)
+            direction: list[float] = [b - a for a, b in zip(origin, end)]
+            length: float = sum(x*x for x in direction)
+            index, minimumDistance = -1, tolerance
+            for i in range(candidates.GetNumberOfIds()):
+                candidate: tuple[float, float, float] = surface.GetPoint(candidates.GetId(i))
+                s: float = sum(d*(c - a) for d, c, a in zip(direction, candidate, origin))/length
+                distance: float = max(abs(c - a - s*d) for d, c, a in zip(direction, candidate, origin))
+                if distance <= minimumDistance: index, minimumDistance = candidates.GetId(i), distance
+            if index < 0: return -1, None
+        # return (the picked grid surface is mapped to its grid)
+        index = GridRenderObject.surfaceIndex(surface, target, index)
+        return (index, gridRenderObject.dataSet) if index > -1 else (-1, None)
 
     @classmethod
     def pickMultiple(
@@ -247,14 +320,17 @@ class InteractionStyle(ABC):
             actor: vtkActor = cast(vtkActor, picker.GetProp3Ds().GetItemAsObject(i))
             mapper: vtkMapper = actor.GetMapper()
             dataSet: Any | None = mapper.GetInput() # type: ignore
+            if isinstance(dataSet, vtkPolyData): dataSet = GridRenderObject.surfaceDataSet(dataSet)
             if isinstance(dataSet, vtkUnstructuredGrid):
                 filter: vtkExtractGeometry = vtkExtractGeometry()
                 filter.SetImplicitFunction(picker.GetFrustum())     # type: ignore
                 filter.SetInputData(dataSet)                        # type: ignore
                 filter.Update()                                     # type: ignore
                 selection: vtkUnstructuredGrid = filter.GetOutput() # type: ignore
-                if target == 'Points': return vu.findPointIndices(dataSet, selection)
-                else: return vu.findCellIndices(dataSet, selection)
+                # map back through the original indices carried by the extraction (see GridRenderObject.buildDataSet)
+                if target == 'Points': ids: vtkDataArray = selection.GetPointData().GetArray('vtkOriginalPointIds')
+                else: ids: vtkDataArray = selection.GetCellData().GetArray('vtkOriginalCellIds')
+                return numpy_support.vtk_to_numpy(ids).tolist() if ids else ()
         return ()
 
     @property
@@ -280,7 +356,8 @@ class InteractionStyle(ABC):
     # attribute slots
     __slots__ = (
         '_base', '_isLeftButtonDown', '_isMiddleButtonDown', '_isRightButtonDown', '_pointA', '_pointB', '_hint2D',
-        '_onPicked', '_pickTarget'
+        '_onPicked', '_pickTarget', '_onInteraction', '_hoverPosition', '_hoverTime', '_hoverTimerId', '_highlight',
+        '_pointsHighlight', '_cellsHighlight'
     )
 
     @abstractmethod
@@ -297,6 +374,8 @@ class InteractionStyle(ABC):
         self._base.AddObserver(vtkCommand.MouseWheelForwardEvent, self.onMouseWheelForward)
         self._base.AddObserver(vtkCommand.MouseWheelBackwardEvent, self.onMouseWheelBackward)
         self._base.AddObserver(vtkCommand.MouseMoveEvent, self.onMouseMove)
+        self._base.AddObserver(vtkCommand.TimerEvent, self.onTimer)
+        self._base.AddObserver(vtkCommand.LeaveEvent, self.onLeave)
         self._isLeftButtonDown: bool = False
         self._isMiddleButtonDown: bool = False
         self._isRightButtonDown: bool = False
@@ -305,6 +384,13 @@ class InteractionStyle(ABC):
         self._hint2D: vtkActor2D | None = None
         self._onPicked: Callable[[Sequence[int], bool], None] | None = None
         self._pickTarget: Literal['Points', 'Cells'] | None = None
+        self._onInteraction: Callable[[bool], None] | None = None
+        self._hoverPosition: tuple[int, int] = (0, 0)
+        self._hoverTime: float = 0.0
+        self._hoverTimerId: int = -1
+        self._highlight: tuple[Literal['Points', 'Cells'], int, vtkUnstructuredGrid] | None = None
+        self._pointsHighlight: PointsRenderObject | None = None
+        self._cellsHighlight: CellsRenderObject | None = None
 
     def setPickAction(
         self,
@@ -315,6 +401,102 @@ class InteractionStyle(ABC):
         self._onPicked = onPicked
         self._pickTarget = pickTarget
 
+    def setInteractionAction(self, onInteraction: Callable[[bool], None] | None) -> None:
+        '''Sets the callback function for when a camera interaction starts (True) or ends (False).'''
+        self._onInteraction = onInteraction
+
+    def notifyInteraction(self, isInteracting: bool) -> None:
+        '''Notifies the start or end of a camera interaction (before the interaction state changes).'''
+        if self._onInteraction: self._onInteraction(isInteracting)
+
+    def requestHover(self) -> None:
+        '''
+        Requests a hover pick at the current event position (see onHover). Hover picks are throttled to the display
+        refresh rate: a request that comes too early is deferred with a one-shot timer, and the latest position wins.
+        '''
+        self._hoverPosition = self._interactor.GetEventPosition()
+        if self._hoverTimerId > -1: return
+        delay: float = self._hoverTime + self._hoverInterval - time.perf_counter()
+        if delay > 0.0: self._hoverTimerId = self._interactor.CreateOneShotTimer(max(1, math.ceil(delay*1000.0)))
+        else: self.hover()
+
+    def flushHover(self) -> None:
+        '''Performs the deferred hover pick now (if any), e.g. before acting on the hovered point or cell.'''
+        if self._hoverTimerId < 0: return
+        self._interactor.DestroyTimer(self._hoverTimerId)
+        self._hoverTimerId = -1
+        self.hover()
+
+    def resetHover(self) -> None:
+        '''Cancels the deferred hover pick (if any) and removes the highlight (not rendered).'''
+        if self._hoverTimerId > -1:
+            self._interactor.DestroyTimer(self._hoverTimerId)
+            self._hoverTimerId = -1
+        self.setHighlight(None, render=False)
+
+    def hover(self) -> None:
+        '''Performs the hover pick at the last requested position.'''
+        self.onHover(self._hoverPosition)
+        self._hoverTime = time.perf_counter()
+
+    def onHover(self, position: tuple[int, int]) -> None:
+        '''On hover pick (throttled mouse move without pressed buttons). Nothing by default.'''
+        pass
+
+    def onTimer(self, sender: vtkObject, event: str) -> None:
+        '''On timer (deferred hover pick).'''
+        self.flushHover()
+
+    def onLeave(self, sender: vtkObject, event: str) -> None:
+        '''On leave (the mouse leaves the viewport): removes the hover highlight (rendered if there was one).'''
+        hasHighlight: bool = self._highlight is not None
+        self.resetHover()
+        if hasHighlight: self._renderWindow.Render()
+
+    def setHighlight(
+        self,
+        target: Literal['Points', 'Cells'] | None,
+        index: int = -1,
+        dataSet: vtkUnstructuredGrid | None = None,
+        render: bool = True
+    ) -> None:
+        '''
+        Highlights the point or cell of the data set (nothing if the target is None or the index is negative).
+        The highlight render objects are created once and updated in place; nothing is rendered if the highlighted
+        point or cell does not change.
+        '''
+        highlight: tuple[Literal['Points', 'Cells'], int, vtkUnstructuredGrid] | None = (
+            (target, index, dataSet) if target and dataSet and index > -1 else None
+        )
+        if highlight == self._highlight: return
+        self._highlight = highlight
+        if self._pointsHighlight: self._pointsHighlight.actors()[0].VisibilityOff()
+        if self._cellsHighlight: self._cellsHighlight.actors()[0].VisibilityOff()
+        if target == 'Points' and dataSet and index > -1:
+            if not self._pointsHighlight:
+                self._pointsHighlight = PointsRenderObject(dataSet, (index,))
+                self._pointsHighlight.actors()[0].PickableOff()
+                self._renderer.AddActor(self._pointsHighlight.actors()[0])
+            else:
+                self._pointsHighlight.setPoints(dataSet, (index,))
+            actor: vtkActor = self._pointsHighlight.actors()[0]
+            actor.GetProperty().SetColor(*self._foreground)
+            actor.VisibilityOn()
+            self.recomputeGlyphSize(self._renderer, render=False)
+        elif target == 'Cells' and dataSet and index > -1:
+            if not self._cellsHighlight:
+                self._cellsHighlight = CellsRenderObject(dataSet, (index,), True, self._gridLineWidth, (1.0, 1.0, 1.0))
+                self._cellsHighlight.actors()[0].GetProperty().SetRepresentationToWireframe()
+                self._cellsHighlight.actors()[0].PickableOff()
+                self._renderer.AddActor(self._cellsHighlight.actors()[0])
+            else:
+                self._cellsHighlight.setCells(dataSet, (index,))
+            actor: vtkActor = self._cellsHighlight.actors()[0]
+            actor.GetProperty().SetColor(*self._foreground)
+            self._cellsHighlight.setLineWidth(self._gridLineWidth)
+            actor.VisibilityOn()
+        if render: self._renderWindow.Render()
+
     @abstractmethod
     def onLeftButtonPress(self, sender: vtkObject, event: str) -> None:
         '''On left button press.'''
@@ -330,12 +512,14 @@ class InteractionStyle(ABC):
         if self._isLeftButtonDown or self._isRightButtonDown: return
         self._isMiddleButtonDown = True
         self._pointA = self._interactor.GetEventPosition()
+        self.notifyInteraction(True)
         self._base.StartPan()
 
     def onMiddleButtonRelease(self, sender: vtkObject, event: str) -> None:
         '''On middle button release.'''
         self._isMiddleButtonDown = False
         if self._hint2D: self._renderer.RemoveActor2D(self._hint2D)
+        self.notifyInteraction(False)
         self._base.EndPan()
 
     def onRightButtonPress(self, sender: vtkObject, event: str) -> None:
@@ -343,12 +527,14 @@ class InteractionStyle(ABC):
         if self._isLeftButtonDown or self._isMiddleButtonDown: return
         self._isRightButtonDown = True
         self._pointA = self._interactor.GetEventPosition()
+        self.notifyInteraction(True)
         self._base.StartDolly()
 
     def onRightButtonRelease(self, sender: vtkObject, event: str) -> None:
         '''On right button release.'''
         self._isRightButtonDown = False
         if self._hint2D: self._renderer.RemoveActor2D(self._hint2D)
+        self.notifyInteraction(False)
         self._base.EndDolly()
 
     def onMouseWheelForward(self, sender: vtkObject, event: str) -> None:
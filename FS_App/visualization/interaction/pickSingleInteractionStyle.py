@@ -1,6 +1,5 @@
 from visualization.interaction.interactionStyle import InteractionStyle
 from vtkmodules.vtkCommonCore import vtkObject
-from vtkmodules.vtkRenderingCore import vtkActor
 
 class PickSingleInteractionStyle(InteractionStyle):
     '''
@@ -21,6 +20,7 @@ class PickSingleInteractionStyle(InteractionStyle):
         if self._isMiddleButtonDown or self._isRightButtonDown: return
         self._isLeftButtonDown = True
         self._isShiftKeyDown = self._interactor.GetShiftKey() != 0
+        self.flushHover()
         if self._pickedIndex > -1 and self._onPicked:
             self._onPicked((self._pickedIndex,), self._isShiftKeyDown)
 
@@ -34,16 +34,12 @@ class PickSingleInteractionStyle(InteractionStyle):
             not self._isLeftButtonDown and not self._isMiddleButtonDown and not self._isRightButtonDown
             and self._onPicked and self._pickTarget
         ):
-            position: tuple[int, int] = self._interactor.GetEventPosition()
-            self._pickedIndex, selection = self.pickSingle(position, self._pickTarget, self._renderer)
-            if selection:
-                if self._pickTarget == 'Points': actor: vtkActor = self.newPointsHint(selection, (self._pickedIndex,))
-                else: actor: vtkActor = self.newCellsHint(selection, (self._pickedIndex,))
-                self._renderer.AddActor(actor)
-                self.recomputeGlyphSize(self._renderer)
-                self._renderWindow.Render()
-                self._renderer.RemoveActor(actor)
-            else:
-                self._renderWindow.Render()
+            self.requestHover()
             self._base.OnMouseMove()
         else: super().onMouseMove(sender, event)
+
+    def onHover(self, position: tuple[int, int]) -> None:
+        '''On hover pick: picks a point or cell (pick target) and highlights it.'''
+        if not self._pickTarget: return
+        self._pickedIndex, selection = self.pickSingle(position, self._pickTarget, self._renderer)
+        self.setHighlight(self._pickTarget, self._pickedIndex, selection)
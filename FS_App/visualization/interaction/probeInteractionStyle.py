@@ -4,7 +4,6 @@ from typing import Literal
 from visualization.interaction.interactionStyle import InteractionStyle
 from vtkmodules.vtkCommonCore import vtkObject, vtkIdList, vtkDataArray
 from vtkmodules.vtkCommonDataModel import vtkUnstructuredGrid
-from vtkmodules.vtkRenderingCore import vtkActor
 
 class ProbeInteractionStyle(InteractionStyle):
     '''
@@ -24,6 +23,7 @@ class ProbeInteractionStyle(InteractionStyle):
     def onLeftButtonPress(self, sender: vtkObject, event: str) -> None:
         '''On left button press.'''
         if self._isMiddleButtonDown or self._isRightButtonDown: return
+        self.flushHover()
         if self._pickedIndex > -1 and self._pickedDataSet and self._target:
             if self._target == 'Points':
                 print(f'Node {self._pickedIndex + 1} (1-based indexing):')
@@ -52,24 +52,17 @@ class ProbeInteractionStyle(InteractionStyle):
     def onMouseMove(self, sender: vtkObject, event: str) -> None:
         '''On mouse move.'''
         if not self._isLeftButtonDown and not self._isMiddleButtonDown and not self._isRightButtonDown:
-            position: tuple[int, int] = self._interactor.GetEventPosition()
-            self._pickedIndex, self._pickedDataSet = self.pickSingle(position, 'Points', self._renderer)
-            if self._pickedDataSet:
-                self._target = 'Points'
-            else:
-                self._pickedIndex, self._pickedDataSet = self.pickSingle(position, 'Cells', self._renderer)
-                if self._pickedDataSet: self._target = 'Cells'
-                else: self._target = None
-            if self._pickedDataSet and self._target:
-                if self._target == 'Points':
-                    actor: vtkActor = self.newPointsHint(self._pickedDataSet, (self._pickedIndex,))
-                else:
-                    actor: vtkActor = self.newCellsHint(self._pickedDataSet, (self._pickedIndex,))
-                self._renderer.AddActor(actor)
-                self.recomputeGlyphSize(self._renderer)
-                self._renderWindow.Render()
-                self._renderer.RemoveActor(actor)
-            else:
-                self._renderWindow.Render()
+            self.requestHover()
             self._base.OnMouseMove()
         else: super().onMouseMove(sender, event)
+
+    def onHover(self, position: tuple[int, int]) -> None:
+        '''On hover pick: picks a point (or else a cell) and highlights it.'''
+        self._pickedIndex, self._pickedDataSet = self.pickSingle(position, 'Points', self._renderer)
+        if self._pickedDataSet:
+            self._target = 'Points'
+        else:
+            self._pickedIndex, self._pickedDataSet = self.pickSingle(position, 'Cells', self._renderer)
+            if self._pickedDataSet: self._target = 'Cells'
+            else: self._target = None
+        self.setHighlight(self._target, self._pickedIndex, self._pickedDataSet)
@@ -20,6 +20,7 @@ class RotateInteractionStyle(InteractionStyle):
         self._isLeftButtonDown = True
         self._isShiftKeyDown = self._interactor.GetShiftKey() != 0
         self._pointA = self._interactor.GetEventPosition()
+        self.notifyInteraction(True)
         if self._isShiftKeyDown: self._base.StartSpin()
         else: self._base.StartRotate()
 
@@ -27,6 +28,7 @@ class RotateInteractionStyle(InteractionStyle):
         '''On left button release.'''
         self._isLeftButtonDown, self._isShiftKeyDown = False, False
         if self._hint2D: self._renderer.RemoveActor2D(self._hint2D)
+        self.notifyInteraction(False)
         self._base.EndRotate()
         self._base.EndSpin()
 
@@ -12,3 +12,15 @@ class Views(Enum):
     Left      = 4
     Right     = 5
     Isometric = 6
+
+    @property
+    def camera(self) -> tuple[tuple[float, float, float], tuple[float, float, float], tuple[float, float, float]]:
+        '''The camera focal point, position and view up vectors of the view (before fitting the scene).'''
+        match self:
+            case Views.Front:     return (+0.0, +0.0, +0.0), (+0.0, +0.0, +1.0), (+0.0, +1.0, +0.0)
+            case Views.Back:      return (+0.0, +0.0, +0.0), (+0.0, +0.0, -1.0), (+0.0, +1.0, +0.0)
+            case Views.Top:       return (+0.0, +0.0, +0.0), (+0.0, +1.0, +0.0), (+0.0, +0.0, -1.0)
+            case Views.Bottom:    return (+0.0, +0.0, +0.0), (+0.0, -1.0, +0.0), (+0.0, +0.0, +1.0)
+            case Views.Left:      return (+0.0, +0.0, +0.0), (-1.0, +0.0, +0.0), (+0.0, +1.0, +0.0)
+            case Views.Right:     return (+0.0, +0.0, +0.0), (+1.0, +0.0, +0.0), (+0.0, +1.0, +0.0)
+            case Views.Isometric: return (+0.0, +0.0, +0.0), (+1.0, +1.0, +1.0), (+0.0, +1.0, +0.0)
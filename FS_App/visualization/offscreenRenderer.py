@@ -0,0 +1,219 @@
+import vtkmodules.vtkRenderingContextOpenGL2 # type: ignore (initialize VTK)
+import os
+import multiprocessing
+import numpy as np
+from typing import Any
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, Future
+from dataModel import OutputDatabase
+from inputOutput import FSReader
+from visualization.decoration import Info, ScalarBar
+from visualization.rendering import GridRenderObject
+from visualization.decoration import Colormaps
+from visualization.interaction import Views
+from vtkmodules.vtkIOImage import vtkPNGWriter
+from vtkmodules.vtkRenderingCore import vtkRenderer, vtkRenderWindow, vtkWindowToImageFilter
+
+# image specification: frame, nodal scalar field ('Group:Field', or None for the deformed grid only), camera view
+Specification = tuple[int, str | None, Views]
+
+class OffscreenRenderer:
+    '''
+    Off-screen renderer of output database results: renders (frame, field, view) specifications to PNG files at any
+    resolution, without a visible window (and without the viewport colors of the screen: white background and black
+    foreground, as printed viewports). Batches are rendered in parallel worker processes, each of which reads the
+    output database once and renders its (contiguous) share of the specifications, e.g. an image sequence for reports.
+    The off-screen renderer does not depend on Qt (headless export).
+    '''
+
+    @staticmethod
+    def defaultOptions() -> dict[str, Any]:
+        '''Gets the default rendering options (the defaults of the viewport options).'''
+        return {
+            'gridLinesVisible': True,
+            'gridLineWidth': 1.5,
+            'gridLineColor': (0.0, 0.0, 0.0),
+            'gridCellRepresentation': 'Surface',
+            'gridCellColor': (0.0, 0.5, 1.0),
+            'projection': 'Perspective',
+            'lighting': 'On',
+            'fontSize': 20,
+            'deformationScaleFactor': 1.0,
+            'scalarBarNumberFormat': 'Scientific',
+            'scalarBarDecimalPlaces': 3,
+            'colormap': Colormaps.Jet,
+            'colormapIntervals': 12,
+            'reverseColormap': False
+        }
+
+    @staticmethod
+    def renderFiles(
+        outputDatabaseFile: str,
+        specifications: Sequence[Specification],
+        filePaths: Sequence[str],
+        width: int,
+        height: int,
+        options: dict[str, Any]
+    ) -> list[str]:
+        '''Reads the output database file and renders the specifications to the files (worker process entry point).'''
+        renderer: OffscreenRenderer = OffscreenRenderer(
+            FSReader.readOutputDatabase(outputDatabaseFile), width, height, options
+        )
+        try:
+            for (frame, field, view), filePath in zip(specifications, filePaths):
+                renderer.render(frame, field, view, filePath)
+        finally:
+            renderer.finalize()
+        return list(filePaths)
+
+    @classmethod
+    def export(
+        cls,
+        outputDatabaseFile: str,
+        specifications: Sequence[Specification],
+        filePattern: str,
+        width: int = 1920,
+        height: int = 1080,
+        workers: int | None = None,
+        options: dict[str, Any] | None = None
+    ) -> list[str]:
+        '''
+        Renders the specifications of the output database file to PNG files, in parallel worker processes
+        (default: one per CPU, at most one per specification). The file pattern is formatted with the index of the
+        specification, its frame number (1-based) and its view name (e.g. 'images/frame_{index:04d}.png' for an image
+        sequence). The options override the default options. Returns the written file paths, in order of the
+        specifications.
+        '''
+        if width <= 0 or height <= 0: raise ValueError('the image size must be positive')
+        options = cls.defaultOptions() | (options or {})
+        filePaths: list[str] = [
+            filePattern.format(index=index, frame=frame + 1, view=view.name)
+            for index, (frame, _, view) in enumerate(specifications)
+        ]
+        if len(set(filePaths)) != len(filePaths): raise ValueError(f"file pattern is not unique: '{filePattern}'")
+        for directory in {os.path.dirname(x) for x in filePaths if os.path.dirname(x)}:
+            os.makedirs(directory, exist_ok=True)
+        workers = max(1, min(workers or os.cpu_count() or 1, len(specifications)))
+        if workers == 1:
+            return cls.renderFiles(outputDatabaseFile, specifications, filePaths, width, height, options)
+        # contiguous chunks (consecutive frames of a worker share its caches); spawned workers (no inherited contexts)
+        chunks: list[tuple[int, int]] = [
+            (i*len(specifications)//workers, (i + 1)*len(specifications)//workers) for i in range(workers)
+        ]
+        with ProcessPoolExecutor(workers, multiprocessing.get_context('spawn')) as executor:
+            futures: list[Future[list[str]]] = [
+                executor.submit(
+                    cls.renderFiles,
+                    outputDatabaseFile,
+                    specifications[first:last],
+                    filePaths[first:last],
+                    width,
+                    height,
+                    options
+                )
+                for first, last in chunks
+            ]
+            return [filePath for future in futures for filePath in future.result()]
+
+    # attribute slots
+    __slots__ = (
+        '_outputDatabase', '_options', '_renderWindow', '_renderer', '_gridRenderObject', '_scalarBar', '_info',
+        '_view', '_filter', '_writer'
+    )
+
+    def __init__(
+        self,
+        outputDatabase: OutputDatabase,
+        width: int = 1920,
+        height: int = 1080,
+        options: dict[str, Any] | None = None
+    ) -> None:
+        '''Off-screen renderer constructor (the options override the default options).'''
+        self._outputDatabase: OutputDatabase = outputDatabase
+        self._options: dict[str, Any] = self.defaultOptions() | (options or {})
+        # renderer (white background)
+        self._renderer: vtkRenderer = vtkRenderer()
+        self._renderer.SetBackground(1.0, 1.0, 1.0)
+        self._renderer.GetActiveCamera().SetParallelProjection(self._options['projection'] == 'Parallel')
+        # render window (off-screen)
+        self._renderWindow: vtkRenderWindow = vtkRenderWindow()
+        self._renderWindow.SetOffScreenRendering(1)
+        self._renderWindow.SetSize(width, height)
+        self._renderWindow.AddRenderer(self._renderer)
+        # info & scalar bar (black foreground)
+        self._info: Info = Info((0.0, 0.0, 0.0), self._options['fontSize'])
+        self._info.initialize(self._renderer)
+        self._scalarBar: ScalarBar = ScalarBar(
+            self._options['scalarBarDecimalPlaces'],
+            self._options['scalarBarNumberFormat'],
+            (0.0, 0.0, 0.0),
+            self._options['fontSize']
+        )
+        self._scalarBar.setColormap(
+            self._options['colormap'], self._options['colormapIntervals'], self._options['reverseColormap']
+        )
+        self._scalarBar.initialize(self._renderer)
+        # grid
+        self._gridRenderObject: GridRenderObject = GridRenderObject(
+            outputDatabase.mesh,
+            True,
+            self._scalarBar.lookupTable,
+            self._options['gridLinesVisible'],
+            self._options['gridLineWidth'],
+            self._options['gridLineColor'],
+            self._options['gridCellRepresentation'],
+            self._options['gridCellColor'],
+            self._options['lighting']
+        )
+        for actor in self._gridRenderObject.actors(): self._renderer.AddActor(actor)
+        self._view: Views | None = None
+        # image filter & writer
+        self._filter: vtkWindowToImageFilter = vtkWindowToImageFilter()
+        self._filter.SetInput(self._renderWindow) # type: ignore
+        self._filter.SetInputBufferTypeToRGBA()
+        self._filter.ReadFrontBufferOff()
+        self._writer: vtkPNGWriter = vtkPNGWriter()
+        self._writer.SetInputConnection(self._filter.GetOutputPort())
+
+    def finalize(self) -> None:
+        '''Finalizes the off-screen renderer (releases the graphics resources).'''
+        self._renderWindow.Finalize()
+
+    def render(self, frame: int, field: str | None, view: Views, filePath: str) -> None:
+        '''
+        Renders the nodal scalar field ('Group:Field', or None for the deformed grid only) of the frame
+        in the camera view to a PNG file. The camera is fitted to the scene when the view changes.
+        '''
+        # nodal scalar field
+        self._info.clear()
+        if field is not None:
+            groupName, _, fieldName = field.partition(':')
+            values: np.ndarray = np.asarray(
+                self._outputDatabase.nodalScalarField(frame, groupName, fieldName), dtype=np.float64
+            )
+            self._gridRenderObject.setNodalScalarField(values)
+            if values.size > 0 and not np.isnan(values).all():
+                self._gridRenderObject.setNodalScalarFieldRange(float(np.nanmin(values)), float(np.nanmax(values)))
+            self._info.setText(2, fieldName)
+        else:
+            self._gridRenderObject.setNodalScalarField(None)
+        self._scalarBar.setVisible(field is not None)
+        # deformation
+        self._gridRenderObject.setPointDisplacements(
+            self._outputDatabase.nodalDisplacements(frame), self._options['deformationScaleFactor']
+        )
+        self._info.setText(1, self._outputDatabase.frameDescription(frame))
+        self._info.setText(0, f"Deformation Scale Factor: {self._options['deformationScaleFactor']}")
+        # camera
+        if view != self._view:
+            self._view = view
+            focalPoint, position, viewUp = view.camera
+            self._renderer.GetActiveCamera().SetFocalPoint(focalPoint)
+            self._renderer.GetActiveCamera().SetPosition(position)
+            self._renderer.GetActiveCamera().SetViewUp(viewUp)
+            self._renderer.ResetCamera()
+        # render & write
+        self._renderWindow.Render()
+        self._filter.Modified()
+        self._writer.SetFileName(filePath)
+        self._writer.Write()
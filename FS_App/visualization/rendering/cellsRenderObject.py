@@ -60,6 +60,19 @@ class CellsRenderObject(RenderObject):
         '''The renderable VTK actors.'''
         return (self._actor,)
 
+    def setCells(self, dataSet: vtkUnstructuredGrid, indices: Sequence[int]) -> None:
+        '''
+        Sets the cells (of the data set) in place, e.g. to move a reused hint (not rendered: the cells are extracted
+        when the actor is next rendered).
+        '''
+        self._indices.SetNumberOfValues(len(indices))
+        for i, index in enumerate(indices):
+            self._indices.SetValue(i, index)
+        self._indices.Modified()
+        self._selectionNode.Modified()
+        if self._extractionFilter.GetInputDataObject(0, 0) is not dataSet:
+            self._extractionFilter.SetInputData(0, dataSet) # type: ignore
+
     def setLinesVisible(self, value: bool) -> None:
         '''Sets the line visibility.'''
         self._actor.GetProperty().SetEdgeVisibility(value)
@@ -1,48 +1,127 @@
+import weakref
+import itertools
+import numpy as np
 from typing import cast, Literal
 from collections.abc import Sequence
-from dataModel import Mesh
+from dataModel import Mesh, ElementTypes
 from visualization.rendering.renderObject import RenderObject
-from vtkmodules.vtkCommonCore import vtkPoints, vtkDoubleArray, vtkLookupTable
-from vtkmodules.vtkCommonDataModel import vtkUnstructuredGrid
-from vtkmodules.vtkRenderingCore import vtkDataSetMapper, vtkActor
+from vtkmodules.util import numpy_support
+from vtkmodules.vtkCommonCore import (
+    vtkPoints, vtkDoubleArray, vtkIdTypeArray, vtkLookupTable, VTK_ID_TYPE, VTK_UNSIGNED_CHAR
+)
+from vtkmodules.vtkCommonDataModel import (
+    vtkDataObject, vtkUnstructuredGrid, vtkPolyData, vtkCellArray, vtkStaticPointLocator, vtkStaticCellLocator
+)
+from vtkmodules.vtkFiltersCore import vtkQuadricClustering
+from vtkmodules.vtkFiltersGeometry import vtkDataSetSurfaceFilter
+from vtkmodules.vtkRenderingCore import vtkPolyDataMapper, vtkActor
 
 class GridRenderObject(RenderObject):
     '''
     Renderable grid.
     '''
 
+    # class variables
+    _surfaces: weakref.WeakValueDictionary[str, 'GridRenderObject'] = weakref.WeakValueDictionary()
+
     @staticmethod
     def buildDataSet(mesh: Mesh) -> vtkUnstructuredGrid:
-        '''Builds the vtkUnstructuredGrid data set object.'''
+        '''
+        Builds the vtkUnstructuredGrid data set object.
+        The VTK arrays are built from NumPy arrays of the mesh and share their buffers (no copies, no per item calls).
+        The points and cells carry their own indices (vtkOriginalPointIds and vtkOriginalCellIds arrays), which are
+        passed through extraction filters, so that extracted points and cells map back to the data set directly.
+        '''
         # create the data set object
         dataSet: vtkUnstructuredGrid = vtkUnstructuredGrid()
         # set point coordinates
+        coordinates: np.ndarray = np.array([node.coordinates for node in mesh.nodes], dtype=np.float64).reshape(-1, 3)
         points: vtkPoints = vtkPoints()
-        points.SetNumberOfPoints(len(mesh.nodes))
-        for i, node in enumerate(mesh.nodes):
-            points.SetPoint(i, node.coordinates)
+        points.SetData(numpy_support.numpy_to_vtk(coordinates, deep=False)) # type: ignore
         dataSet.SetPoints(points) # type: ignore
-        # set cell connectivity
-        dataSet.AllocateEstimate(len(mesh.elements), 8)
+        # set cell connectivity (offsets and connectivity) and cell types
+        cellTypes: dict[ElementTypes, int] = {}
         for element in mesh.elements:
-            dataSet.InsertNextCell(element.cellType, element.nodeCount, element.nodeIndices) # type: ignore
+            if element.elementType not in cellTypes: cellTypes[element.elementType] = element.cellType
+        idType: type = numpy_support.get_numpy_array_type(VTK_ID_TYPE)
+        nodeIndices: list[tuple[int, ...]] = [element.nodeIndices for element in mesh.elements]
+        offsets: np.ndarray = np.zeros(len(nodeIndices) + 1, dtype=idType)
+        np.cumsum(np.fromiter(map(len, nodeIndices), dtype=idType, count=len(nodeIndices)), out=offsets[1:])
+        connectivity: np.ndarray = np.fromiter(
+            itertools.chain.from_iterable(nodeIndices), dtype=idType, count=int(offsets[-1])
+        )
+        types: np.ndarray = np.fromiter(
+            (cellTypes[element.elementType] for element in mesh.elements), dtype=np.uint8, count=len(nodeIndices)
+        )
+        cells: vtkCellArray = vtkCellArray()
+        cells.SetData( # type: ignore
+            numpy_support.numpy_to_vtkIdTypeArray(offsets, deep=False),
+            numpy_support.numpy_to_vtkIdTypeArray(connectivity, deep=False)
+        )
+        dataSet.SetCells(numpy_support.numpy_to_vtk(types, deep=False, array_type=VTK_UNSIGNED_CHAR), cells)
         # set point data
-        pointData: vtkDoubleArray = vtkDoubleArray()
-        pointData.SetNumberOfValues(len(mesh.nodes))
-        for i in range(len(mesh.nodes)):
-            pointData.SetValue(i, float('nan'))
+        pointData: vtkDoubleArray = cast(
+            vtkDoubleArray, numpy_support.numpy_to_vtk(np.full(len(mesh.nodes), np.nan), deep=False)
+        )
         dataSet.GetPointData().SetScalars(pointData) # type: ignore
+        # set original point and cell indices
+        pointIds: vtkIdTypeArray = numpy_support.numpy_to_vtkIdTypeArray(np.arange(len(mesh.nodes), dtype=idType))
+        pointIds.SetName('vtkOriginalPointIds')
+        dataSet.GetPointData().AddArray(pointIds) # type: ignore
+        cellIds: vtkIdTypeArray = numpy_support.numpy_to_vtkIdTypeArray(np.arange(len(nodeIndices), dtype=idType))
+        cellIds.SetName('vtkOriginalCellIds')
+        dataSet.GetCellData().AddArray(cellIds) # type: ignore
         # done
-        dataSet.Squeeze()
         return dataSet
 
+    @staticmethod
+    def buildSurface(dataSet: vtkUnstructuredGrid) -> vtkPolyData:
+        '''
+        Builds the exterior surface (vtkPolyData object) of the data set, which is rendered instead of the data set.
+        The surface carries the original point and cell indices (vtkOriginalPointIds and vtkOriginalCellIds arrays)
+        and keeps a reference to the data set in its information (see surfaceDataSet).
+        '''
+        filter: vtkDataSetSurfaceFilter = vtkDataSetSurfaceFilter()
+        filter.PassThroughPointIdsOn()
+        filter.PassThroughCellIdsOn()
+        filter.SetInputData(dataSet) # type: ignore
+        filter.Update()              # type: ignore
+        surface: vtkPolyData = vtkPolyData()
+        surface.ShallowCopy(filter.GetOutput()) # type: ignore
+        surface.GetInformation().Set(vtkDataObject.DATA_OBJECT(), dataSet) # type: ignore
+        return surface
+
+    @staticmethod
+    def surfaceDataSet(surface: vtkDataObject) -> vtkUnstructuredGrid | None:
+        '''Returns the data set of a grid surface (None if the data object is not a grid surface).'''
+        dataSet: vtkDataObject | None = surface.GetInformation().Get(vtkDataObject.DATA_OBJECT()) # type: ignore
+        return dataSet if isinstance(dataSet, vtkUnstructuredGrid) else None
+
+    @staticmethod
+    def surfaceRenderObject(surface: vtkDataObject | None) -> 'GridRenderObject | None':
+        '''Returns the grid render object of a grid surface (None if the data object is not a live grid surface).'''
+        if not isinstance(surface, vtkPolyData): return None
+        return GridRenderObject._surfaces.get(surface.GetAddressAsString('vtkPolyData'))
+
+    @staticmethod
+    def surfaceIndex(surface: vtkPolyData, target: Literal['Points', 'Cells'], index: int) -> int:
+        '''Maps a point or cell index of a grid surface to the point or cell index of its data set.'''
+        if index < 0: return -1
+        if target == 'Points': return int(surface.GetPointData().GetArray('vtkOriginalPointIds').GetValue(index))
+        else: return int(surface.GetCellData().GetArray('vtkOriginalCellIds').GetValue(index))
+
     @property
     def dataSet(self) -> vtkUnstructuredGrid:
         '''The underlying VTK data set.'''
         return self._dataSet
 
     # attribute slots
-    __slots__ = ('_dataSet', '_mapper', '_actor', '_isDeformable', '_pointCoordinates', '_pointDisplacements')
+    __slots__ = (
+        '_dataSet', '_surface', '_surfacePointIndices', '_surfacePoints', '_surfaceScalars', '_mapper', '_actor',
+        '_scalars', '_isDeformable', '_pointCoordinates', '_pointDisplacements', '_deformedCoordinates',
+        '_proxyMapper', '_linesVisible', '_pointLocator', '_cellLocator', '_isPointLocatorValid', '_isCellLocatorValid',
+        '__weakref__'
+    )
 
     def __init__(
         self,
@@ -60,39 +139,79 @@ class GridRenderObject(RenderObject):
         super().__init__()
         # data set
         self._dataSet: vtkUnstructuredGrid = self.buildDataSet(mesh)
+        # nodal scalars (the buffer of the VTK point data scalars, updated in place)
+        self._scalars: np.ndarray = numpy_support.vtk_to_numpy(self._dataSet.GetPointData().GetScalars()) # type: ignore
+        # exterior surface (extracted once): updates of the data set are scattered into its points and scalars
+        self._surface: vtkPolyData = self.buildSurface(self._dataSet)
+        self._surfacePointIndices: np.ndarray = numpy_support.vtk_to_numpy(
+            self._surface.GetPointData().GetArray('vtkOriginalPointIds') # type: ignore
+        )
+        self._surfacePoints: np.ndarray = numpy_support.vtk_to_numpy(self._surface.GetPoints().GetData()) # type: ignore
+        self._surfaceScalars: np.ndarray = numpy_support.vtk_to_numpy(
+            self._surface.GetPointData().GetScalars() # type: ignore
+        )
+        GridRenderObject._surfaces[self._surface.GetAddressAsString('vtkPolyData')] = self
+        # point and cell locators of the surface (built on first use, and again after the grid is deformed only:
+        # the existing search structures are kept when the scalars of the surface change)
+        self._pointLocator: vtkStaticPointLocator = vtkStaticPointLocator()
+        self._pointLocator.SetDataSet(self._surface)
+        self._pointLocator.UseExistingSearchStructureOn()
+        self._cellLocator: vtkStaticCellLocator = vtkStaticCellLocator()
+        self._cellLocator.SetDataSet(self._surface)
+        self._cellLocator.UseExistingSearchStructureOn()
+        self._isPointLocatorValid: bool = False
+        self._isCellLocatorValid: bool = False
         # mapper
-        self._mapper: vtkDataSetMapper = vtkDataSetMapper()
+        self._mapper: vtkPolyDataMapper = vtkPolyDataMapper()
         self._mapper.InterpolateScalarsBeforeMappingOn()
         self._mapper.ScalarVisibilityOff()
         self._mapper.SetLookupTable(lookupTable) # type: ignore
-        self._mapper.SetInputData(self._dataSet) # type: ignore
+        self._mapper.SetInputData(self._surface) # type: ignore
         self._mapper.Update()                    # type: ignore
+        # proxy mapper (built on first use, see setProxyVisible)
+        self._proxyMapper: vtkPolyDataMapper | None = None
         # actor
         self._actor: vtkActor = vtkActor()
         self._actor.SetMapper(self._mapper)
+        self._linesVisible: bool = linesVisible
         self.setLinesVisible(linesVisible)
         self.setLineWidth(lineWidth)
         self.setLineColor(lineColor)
         self.setCellRepresentation(cellRepresentation)
         self.setCellColor(cellColor)
         self.setLighting(lighting)
-        # deformable grid
+        # deformable grid: undeformed coordinates, displacements, and deformed coordinates
+        # (the latter is the buffer of the VTK points, updated in place)
         self._isDeformable: bool = isDeformable
         if self._isDeformable:
-            self._pointDisplacements: tuple[tuple[float, float, float], ...] = tuple(
-                (0.0, 0.0, 0.0) for _ in range(len(mesh.nodes))
-            )
-            self._pointCoordinates: tuple[tuple[float, float, float], ...] = tuple(
-                node.coordinates for node in mesh.nodes
+            self._deformedCoordinates: np.ndarray = numpy_support.vtk_to_numpy(
+                self._dataSet.GetPoints().GetData() # type: ignore
             )
+            self._pointCoordinates: np.ndarray = self._deformedCoordinates.copy()
+            self._pointDisplacements: np.ndarray = np.zeros_like(self._pointCoordinates)
 
     def actors(self) -> Sequence[vtkActor]:
         '''The renderable VTK actors.'''
         return (self._actor,)
 
+    def pointLocator(self) -> vtkStaticPointLocator:
+        '''The point locator of the surface (rebuilt when first needed after the grid has been deformed).'''
+        if not self._isPointLocatorValid:
+            self._pointLocator.ForceBuildLocator()
+            self._isPointLocatorValid = True
+        return self._pointLocator
+
+    def cellLocator(self) -> vtkStaticCellLocator:
+        '''The cell locator of the surface (rebuilt when first needed after the grid has been deformed).'''
+        if not self._isCellLocatorValid:
+            self._cellLocator.ForceBuildLocator()
+            self._isCellLocatorValid = True
+        return self._cellLocator
+
     def setLinesVisible(self, value: bool) -> None:
         '''Sets the line visibility.'''
-        self._actor.GetProperty().SetEdgeVisibility(value)
+        self._linesVisible = value
+        self._actor.GetProperty().SetEdgeVisibility(value and self._actor.GetMapper() is self._mapper)
 
     def setLineWidth(self, value: float) -> None:
         '''Sets the line width.'''
@@ -116,38 +235,69 @@ class GridRenderObject(RenderObject):
         '''Sets the lighting flag.'''
         self._actor.GetProperty().SetLighting(value == 'On')
 
+    def setProxyVisible(self, value: bool) -> None:
+        '''
+        Shows a decimated proxy of the surface (without lines and scalars) instead of the surface, or the surface back.
+        The proxy is built on first use by quadric clustering of the surface, and rebuilt when the surface changes.
+        '''
+        if value:
+            if not self._proxyMapper:
+                filter: vtkQuadricClustering = vtkQuadricClustering()
+                filter.SetInputData(self._surface) # type: ignore
+                self._proxyMapper = vtkPolyDataMapper()
+                self._proxyMapper.ScalarVisibilityOff()
+                self._proxyMapper.SetInputConnection(filter.GetOutputPort())
+            self._actor.SetMapper(self._proxyMapper)
+            self._actor.GetProperty().SetEdgeVisibility(False)
+        else:
+            self._actor.SetMapper(self._mapper)
+            self._actor.GetProperty().SetEdgeVisibility(self._linesVisible)
+
     def setPointDisplacements(
         self,
-        displacements: tuple[tuple[float, float, float], ...] | None,
+        displacements: np.ndarray | Sequence[tuple[float, float, float]] | None,
         deformationScaleFactor: float
     ) -> None:
-        '''Sets the grid deformation.'''
-        k = deformationScaleFactor
+        '''
+        Sets the grid deformation (the current displacements are kept if none are given).
+        The deformed coordinates are computed in place in the buffer shared with the VTK points,
+        and scattered into the points of the surface.
+        '''
         # check if the current grid is set up to be deformable
         if not self._isDeformable: return # raise ValueError('grid is not deformable')
         # update point displacements if required
-        if displacements: self._pointDisplacements = displacements
+        if displacements is not None:
+            self._pointDisplacements = np.asarray(displacements, dtype=np.float64).reshape(-1, 3)
         # update point coordinates
-        for i, ((x, y, z), (u, v, w)) in enumerate(zip(self._pointCoordinates, self._pointDisplacements)):
-            self._dataSet.GetPoints().SetPoint(i, x + k*u, y + k*v, z + k*w) # type: ignore
+        np.multiply(self._pointDisplacements, deformationScaleFactor, out=self._deformedCoordinates)
+        self._deformedCoordinates += self._pointCoordinates
+        self._dataSet.GetPoints().Modified() # type: ignore
         self._dataSet.Modified()
+        np.take(self._deformedCoordinates, self._surfacePointIndices, axis=0, out=self._surfacePoints)
+        self._surface.GetPoints().Modified() # type: ignore
+        self._surface.Modified()
+        self._isPointLocatorValid, self._isCellLocatorValid = False, False
 
-    def setNodalScalarField(self, nodalScalarField: tuple[float, ...] | None) -> None:
-        '''Sets the current nodal scalar field to be shown.'''
-        if nodalScalarField:
+    def setNodalScalarField(self, nodalScalarField: np.ndarray | Sequence[float] | None) -> None:
+        '''
+        Sets the current nodal scalar field to be shown
+        (copied into the buffer of the VTK scalars, and scattered into the scalars of the surface).
+        '''
+        if nodalScalarField is not None:
             # update scalars
-            scalars: vtkDoubleArray = cast(vtkDoubleArray, self._dataSet.GetPointData().GetScalars()) # type: ignore
-            for i, scalar in enumerate(nodalScalarField):
-                scalars.SetValue(i, scalar)
-            scalars.Modified()
+            self._scalars[:] = nodalScalarField
+            self._dataSet.GetPointData().GetScalars().Modified() # type: ignore
+            np.take(self._scalars, self._surfacePointIndices, out=self._surfaceScalars)
+            self._surface.GetPointData().GetScalars().Modified() # type: ignore
             # update mapper
             self._mapper.ScalarVisibilityOn()
             self._mapper.Modified()
         else:
             # update scalars
-            scalars: vtkDoubleArray = cast(vtkDoubleArray, self._dataSet.GetPointData().GetScalars()) # type: ignore
-            for i in range(scalars.GetNumberOfValues()):
-                scalars.SetValue(i, float('nan'))
+            self._scalars.fill(np.nan)
+            self._dataSet.GetPointData().GetScalars().Modified() # type: ignore
+            self._surfaceScalars.fill(np.nan)
+            self._surface.GetPointData().GetScalars().Modified() # type: ignore
             # update mapper
             self._mapper.ScalarVisibilityOff()
             self._mapper.Modified()
@@ -24,9 +24,7 @@ class PointsRenderObject(RenderObject):
         super().__init__()
         # center of spheres
         self._centers: vtkPoints = vtkPoints()
-        self._centers.SetNumberOfPoints(len(indices))
-        for i, index in enumerate(indices):
-            self._centers.SetPoint(i, dataSet.GetPoint(index))
+        self.setPoints(dataSet, indices)
         # sphere source
         self._source: vtkSphereSource = vtkSphereSource()
         self._source.SetPhiResolution(8)
@@ -54,3 +52,10 @@ class PointsRenderObject(RenderObject):
     def actors(self) -> Sequence[vtkActor]:
         '''The renderable VTK actors.'''
         return (self._actor,)
+
+    def setPoints(self, dataSet: vtkUnstructuredGrid, indices: Sequence[int]) -> None:
+        '''Sets the points (of the data set) in place, e.g. to move a reused hint (not rendered).'''
+        self._centers.SetNumberOfPoints(len(indices))
+        for i, index in enumerate(indices):
+            self._centers.SetPoint(i, dataSet.GetPoint(index))
+        self._centers.Modified()
@@ -1,4 +1,5 @@
 import vtkmodules.vtkRenderingContextOpenGL2 # type: ignore (initialize VTK)
+import numpy as np
 import visualization.utility as vu
 from typing import Literal, Any, cast
 from collections.abc import Callable, Sequence
@@ -18,8 +19,12 @@ from PySide6.QtWidgets import QWidget, QFrame, QVBoxLayout
 from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor # type: ignore
 from vtkmodules.vtkCommonCore import vtkObject
 from vtkmodules.vtkCommonDataModel import vtkCell
+from vtkmodules.vtkCommonExecutionModel import vtkAlgorithmOutput
+from vtkmodules.vtkFiltersCore import vtkGlyph3D
 from vtkmodules.vtkIOImage import vtkPNGWriter
-from vtkmodules.vtkRenderingCore import vtkRenderer, vtkRenderWindow, vtkRenderWindowInteractor, vtkWindowToImageFilter
+from vtkmodules.vtkRenderingCore import (
+    vtkRenderer, vtkRenderWindow, vtkRenderWindowInteractor, vtkWindowToImageFilter, vtkActor
+)
 
 class Viewport(QFrame):
     '''
@@ -56,6 +61,7 @@ class Viewport(QFrame):
     _colormap: Colormaps = Colormaps.Jet
     _colormapIntervals: int = 12
     _reverseColormap: bool = False
+    _levelOfDetailThreshold: int = 1000000
 
     @classmethod
     def registerCallback(cls, callback: Callable[[str, Any], None]) -> int:
@@ -83,6 +89,7 @@ class Viewport(QFrame):
         '''Sets the viewport interaction style for all viewports.'''
         cls._currentInteractionStyle = interactionStyle
         for viewport in cls._viewports:
+            viewport.resetHover()
             viewport._interactor.SetInteractorStyle(viewport._interactionStyles[cls._currentInteractionStyle].base)
             viewport._interactor.RemoveObservers('CharEvent')
         cls.notifyOptionChanged('InteractionStyle', cls._currentInteractionStyle)
@@ -265,11 +272,7 @@ class Viewport(QFrame):
         InteractionStyle.setForeground(value)
         cls._foreground = value
         for viewport in cls._viewports:
-            viewport._triad.setTextColor(cls._foreground)
-            viewport._info.setTextColor(cls._foreground)
-            viewport._scalarBar.setTextColor(cls._foreground)
-            viewport._maxPointLabel.setColor(cls._foreground)
-            viewport._minPointLabel.setColor(cls._foreground)
+            viewport.setDecorationColor(cls._foreground)
             viewport.render()
         cls.notifyOptionChanged('Foreground', cls._foreground)
 
@@ -301,13 +304,15 @@ class Viewport(QFrame):
         '''Sets the deformation scale factor.'''
         cls._deformationScaleFactor = value
         for viewport in cls._viewports:
+            viewport.resetHover()
             if viewport._gridRenderObject:
                 gridRenderObject: GridRenderObject = viewport._gridRenderObject
                 gridRenderObject.setPointDisplacements(None, cls._deformationScaleFactor)
                 viewport._maxPointLabel.setPosition(gridRenderObject.dataSet.GetPoint(viewport._maxPointIndex))
                 viewport._minPointLabel.setPosition(gridRenderObject.dataSet.GetPoint(viewport._minPointIndex))
-            viewport.render()
+        # notified before rendering (a single render per change, e.g. while dragging the scale factor slider)
         cls.notifyOptionChanged('DeformationScaleFactor', cls._deformationScaleFactor)
+        for viewport in cls._viewports: viewport.render()
 
     @classmethod
     def showMaxPointLabel(cls) -> bool:
@@ -462,6 +467,21 @@ class Viewport(QFrame):
             viewport.render()
         cls.notifyOptionChanged('ReverseColormap', cls._reverseColormap)
 
+    @classmethod
+    def levelOfDetailThreshold(cls) -> int:
+        '''Gets the level of detail threshold (number of cells).'''
+        return cls._levelOfDetailThreshold
+
+    @classmethod
+    def setLevelOfDetailThreshold(cls, value: int) -> None:
+        '''
+        Sets the level of detail threshold (number of cells): during camera interaction, grids with at least as many
+        cells are replaced by a decimated proxy and the glyphs are hidden (0 disables the level of detail).
+        '''
+        if value < 0: raise ValueError('the level of detail threshold must not be negative')
+        cls._levelOfDetailThreshold = value
+        cls.notifyOptionChanged('LevelOfDetailThreshold', cls._levelOfDetailThreshold)
+
     @classmethod
     def setPickAction(
         cls,
@@ -470,6 +490,7 @@ class Viewport(QFrame):
     ) -> None:
         '''Sets the pick action on the current interaction style.'''
         for viewport in cls._viewports:
+            viewport.resetHover()
             viewport._interactionStyles[cls._currentInteractionStyle].setPickAction(onPicked, pickTarget)
 
     @property
@@ -481,7 +502,7 @@ class Viewport(QFrame):
     __slots__ = (
         '_layout', '_vtkWidget', '_renderer', '_renderWindow', '_interactor', '_interactionStyles', '_triad', '_info',
         '_scalarBar', '_gridRenderObject', '_selectionRenderObject', '_maxPointIndex', '_minPointIndex',
-        '_maxPointLabel', '_minPointLabel'
+        '_maxPointLabel', '_minPointLabel', '_isLevelOfDetail', '_hiddenGlyphActors'
     )
 
     def __init__(self, parent: QWidget | None = None) -> None:
@@ -518,6 +539,10 @@ class Viewport(QFrame):
             InteractionStyles.Probe        : ProbeInteractionStyle(),
             InteractionStyles.Ruler        : RulerInteractionStyle()
         }
+        for interactionStyle in self._interactionStyles.values():
+            interactionStyle.setInteractionAction(self.setLevelOfDetail)
+        self._isLevelOfDetail: bool = False
+        self._hiddenGlyphActors: list[vtkActor] = []
         # triad & info % scalar bar & max/min point labels
         self._triad: Triad = Triad(self._foreground, self._fontSize)
         self._info: Info = Info(self._foreground, self._fontSize)
@@ -558,16 +583,18 @@ class Viewport(QFrame):
         self._vtkWidget.Finalize()
 
     def print(self, file: str) -> None:
-        '''Prints the viewport scene to a file.'''
-        # save current background and foreground colors
-        background1: tuple[float, float, float] = Viewport.background1()
-        background2: tuple[float, float, float] = Viewport.background2()
-        foreground: tuple[float, float, float] = Viewport.foreground()
+        '''
+        Prints the viewport scene to a file (PNG), with a white background and a black foreground.
+        Only the colors of this viewport are changed while capturing (a single render for the capture).
+        The hover highlight is removed first, so that it does not appear in the image.
+        '''
+        # remove hover highlight
+        self.resetHover()
         # set white background and black foreground
-        Viewport.setBackground1((1.0, 1.0, 1.0))
-        Viewport.setBackground2((1.0, 1.0, 1.0))
-        Viewport.setForeground((0.0, 0.0, 0.0))
-        # create filter
+        self._renderer.SetBackground2((1.0, 1.0, 1.0))
+        self._renderer.SetBackground((1.0, 1.0, 1.0))
+        self.setDecorationColor((0.0, 0.0, 0.0))
+        # create filter (renders the window)
         filter: vtkWindowToImageFilter = vtkWindowToImageFilter()
         filter.SetInput(self._renderWindow) # type: ignore
         filter.SetInputBufferTypeToRGBA()
@@ -580,9 +607,18 @@ class Viewport(QFrame):
         # write
         writer.Write()
         # reset background and foreground colors
-        Viewport.setBackground1(background1)
-        Viewport.setBackground2(background2)
-        Viewport.setForeground(foreground)
+        self._renderer.SetBackground2(self._background1)
+        self._renderer.SetBackground(self._background2)
+        self.setDecorationColor(self._foreground)
+        self.render()
+
+    def setDecorationColor(self, color: tuple[float, float, float]) -> None:
+        '''Sets the text color of the viewport decorations (not rendered).'''
+        self._triad.setTextColor(color)
+        self._info.setTextColor(color)
+        self._scalarBar.setTextColor(color)
+        self._maxPointLabel.setColor(color)
+        self._minPointLabel.setColor(color)
 
     def render(self) -> None:
         '''Renders the current scene.'''
@@ -602,38 +638,7 @@ class Viewport(QFrame):
 
     def setView(self, view: Views, render: bool = True) -> None:
         '''Sets the camera view.'''
-        focalPoint: tuple[float, float, float]
-        position:   tuple[float, float, float]
-        viewUp:     tuple[float, float, float]
-        match view:
-            case Views.Front:
-                focalPoint = (+0.0, +0.0, +0.0)
-                position   = (+0.0, +0.0, +1.0)
-                viewUp     = (+0.0, +1.0, +0.0)
-            case Views.Back:
-                focalPoint = (+0.0, +0.0, +0.0)
-                position   = (+0.0, +0.0, -1.0)
-                viewUp     = (+0.0, +1.0, +0.0)
-            case Views.Top:
-                focalPoint = (+0.0, +0.0, +0.0)
-                position   = (+0.0, +1.0, +0.0)
-                viewUp     = (+0.0, +0.0, -1.0)
-            case Views.Bottom:
-                focalPoint = (+0.0, +0.0, +0.0)
-                position   = (+0.0, -1.0, +0.0)
-                viewUp     = (+0.0, +0.0, +1.0)
-            case Views.Left:
-                focalPoint = (+0.0, +0.0, +0.0)
-                position   = (-1.0, +0.0, +0.0)
-                viewUp     = (+0.0, +1.0, +0.0)
-            case Views.Right:
-                focalPoint = (+0.0, +0.0, +0.0)
-                position   = (+1.0, +0.0, +0.0)
-                viewUp     = (+0.0, +1.0, +0.0)
-            case Views.Isometric:
-                focalPoint = (+0.0, +0.0, +0.0)
-                position   = (+1.0, +1.0, +1.0)
-                viewUp     = (+0.0, +1.0, +0.0)
+        focalPoint, position, viewUp = view.camera
         self._renderer.GetActiveCamera().SetFocalPoint(focalPoint)
         self._renderer.GetActiveCamera().SetPosition(position)
         self._renderer.GetActiveCamera().SetViewUp(viewUp)
@@ -641,6 +646,37 @@ class Viewport(QFrame):
         InteractionStyle.recomputeGlyphSize(self._renderer, render=False)
         if render: self.render()
 
+    def setLevelOfDetail(self, value: bool) -> None:
+        '''
+        Sets the level of detail mode (called when a camera interaction starts or ends): the grid is replaced by its
+        decimated proxy and the glyph actors are hidden, if the grid has at least as many cells as the threshold.
+        Nothing is rendered here (the interaction renders the scene).
+        '''
+        value = value and self._gridRenderObject is not None and (
+            0 < self._levelOfDetailThreshold <= self._gridRenderObject.dataSet.GetNumberOfCells()
+        )
+        if value == self._isLevelOfDetail: return
+        self._isLevelOfDetail = value
+        if self._gridRenderObject: self._gridRenderObject.setProxyVisible(value)
+        # hide the visible glyph actors (and show them back afterwards)
+        if value:
+            for i in range(self._renderer.GetActors().GetNumberOfItems()):
+                actor: vtkActor = cast(vtkActor, self._renderer.GetActors().GetItemAsObject(i))
+                output: vtkAlgorithmOutput | None = actor.GetMapper().GetInputConnection(0, 0)
+                if output and isinstance(output.GetProducer(), vtkGlyph3D) and actor.GetVisibility():
+                    actor.VisibilityOff()
+                    self._hiddenGlyphActors.append(actor)
+        else:
+            for actor in self._hiddenGlyphActors: actor.VisibilityOn()
+            self._hiddenGlyphActors.clear()
+
+    def resetHover(self) -> None:
+        '''
+        Cancels the deferred hover picks and removes the hover highlights of the interaction styles (not rendered),
+        e.g. when the highlighted grid changes.
+        '''
+        for interactionStyle in self._interactionStyles.values(): interactionStyle.resetHover()
+
     def setGridRenderObject(self, mesh: Mesh | None, isDeformable: bool, render: bool = True) -> None:
         '''Renders the specified grid.'''
         self._scalarBar.setVisible(False)
@@ -648,6 +684,8 @@ class Viewport(QFrame):
         self._minPointLabel.setVisible(False)
         if self._selectionRenderObject: self.remove(self._selectionRenderObject, render=False)
         if self._gridRenderObject: self.remove(self._gridRenderObject, render=False)
+        self.setLevelOfDetail(False)
+        self.resetHover()
         self._gridRenderObject = GridRenderObject(
             mesh,
             isDeformable,
@@ -664,21 +702,33 @@ class Viewport(QFrame):
 
     def setGridDeformation(
         self,
-        nodalDisplacements: tuple[tuple[float, float, float], ...] | None,
+        nodalDisplacements: np.ndarray | Sequence[tuple[float, float, float]] | None,
         render: bool = True
     ) -> None:
         '''Sets the deformation on the currently drawn grid.'''
         if not self._gridRenderObject: return
-        if not nodalDisplacements:
-            nodalDisplacements = tuple(
-                (0.0, 0.0, 0.0) for _ in range(self._gridRenderObject.dataSet.GetNumberOfPoints())
-            )
+        self.resetHover()
+        if nodalDisplacements is None:
+            nodalDisplacements = np.zeros((self._gridRenderObject.dataSet.GetNumberOfPoints(), 3))
         self._gridRenderObject.setPointDisplacements(nodalDisplacements, self._deformationScaleFactor)
         # update max/min labels position
         self._maxPointLabel.setPosition(self._gridRenderObject.dataSet.GetPoint(self._maxPointIndex))
         self._minPointLabel.setPosition(self._gridRenderObject.dataSet.GetPoint(self._minPointIndex))
         if render: self.render()
 
+    def scaleGridDeformation(self, factor: float, render: bool = True) -> None:
+        '''
+        Scales the current deformation of the drawn grid by the given factor (relative to the deformation scale factor,
+        which is not changed), e.g. to animate a mode shape.
+        '''
+        if not self._gridRenderObject: return
+        self.resetHover()
+        self._gridRenderObject.setPointDisplacements(None, self._deformationScaleFactor*factor)
+        # update max/min labels position
+        self._maxPointLabel.setPosition(self._gridRenderObject.dataSet.GetPoint(self._maxPointIndex))
+        self._minPointLabel.setPosition(self._gridRenderObject.dataSet.GetPoint(self._minPointIndex))
+        if render: self.render()
+
     def setSelectionRenderObject(
         self,
         dataObject: DataObject | None,
@@ -806,7 +856,7 @@ class Viewport(QFrame):
             InteractionStyle.recomputeGlyphSize(self._renderer, render=False)
         if render: self.render()
 
-    def plotNodalScalarField(self, nodalScalarField: tuple[float, ...] | None, render: bool = True) -> None:
+    def plotNodalScalarField(self, nodalScalarField: np.ndarray | Sequence[float] | None, render: bool = True) -> None:
         '''Plots the given nodal scalar field on the current mesh.'''
         if not self._gridRenderObject:
             self._scalarBar.setVisible(False)
@@ -817,15 +867,19 @@ class Viewport(QFrame):
             self._scalarBar.setVisible(nodalScalarField is not None)
             self._maxPointLabel.setVisible(nodalScalarField is not None and self._showMaxPointLabel)
             self._minPointLabel.setVisible(nodalScalarField is not None and self._showMinPointLabel)
-            # update max/min
-            if nodalScalarField:
-                Viewport._defaultMaxLimit = max(nodalScalarField)
-                Viewport._defaultMinLimit = min(nodalScalarField)
+            # update max/min (and their locations, ignoring undefined values)
+            if nodalScalarField is not None and len(nodalScalarField) > 0:
+                values: np.ndarray = np.asarray(nodalScalarField, dtype=np.float64)
+                try:
+                    self._maxPointIndex = int(np.nanargmax(values))
+                    self._minPointIndex = int(np.nanargmin(values))
+                except ValueError: # all values undefined
+                    self._maxPointIndex, self._minPointIndex = 0, 0
+                Viewport._defaultMaxLimit = float(values[self._maxPointIndex])
+                Viewport._defaultMinLimit = float(values[self._minPointIndex])
                 if not self._useCustomLimits:
                     self.setCustomMaxLimit(self._defaultMaxLimit)
                     self.setCustomMinLimit(self._defaultMinLimit)
-                self._maxPointIndex = nodalScalarField.index(self._defaultMaxLimit)
-                self._minPointIndex = nodalScalarField.index(self._defaultMinLimit)
                 self._maxPointLabel.setPosition(self._gridRenderObject.dataSet.GetPoint(self._maxPointIndex))
                 self._minPointLabel.setPosition(self._gridRenderObject.dataSet.GetPoint(self._minPointIndex))
             # plot contour
@@ -5,6 +5,7 @@ module m_gproc
     use data_model
     use m_shapef
     use m_eproc
+    use m_progress
     implicit none
     
     private
@@ -37,6 +38,7 @@ module m_gproc
             section  = sections(element%i_section)
             material = materials(section%i_material)
             Ks(i)    = e_get_K(element, section, material, mesh%nodes)
+            call progress_step(i, mesh%n_elements)
         end do
         
         ! build global matrix
@@ -71,6 +73,7 @@ module m_gproc
             section  = sections(element%i_section)
             material = materials(section%i_material)
             Ms(i)    = e_get_M(element, section, material, mesh%nodes)
+            call progress_step(i, mesh%n_elements)
         end do
         
         ! build global matrix
@@ -106,6 +109,7 @@ module m_gproc
             section  = sections(element%i_section)
             material = materials(section%i_material)
             Ss(i)    = e_get_S(element, section, material, mesh%nodes, Ua, Ub)
+            call progress_step(i, mesh%n_elements)
         end do
         
         ! build global matrix
@@ -143,6 +147,7 @@ module m_gproc
             section  = sections(element%i_section)
             material = materials(section%i_material)
             Fs(i)   = e_get_F(element, section, material, mesh%nodes, Ua, Ub, strain(i), stress(i))
+            call progress_step(i, mesh%n_elements)
         end do
         
         ! build global vector
@@ -5,6 +5,7 @@ module m_sproc
     use linear_algebra
     use data_model
     use m_gproc
+    use m_progress
     implicit none
     
     private
@@ -50,9 +51,11 @@ module m_sproc
         allocate(stress_extra_nodes(mdb%mesh%n_elements))
         
         ! compute global stiffness matrix
+        call progress_phase('Assembling stiffness matrix')
         call g_get_K(mdb%n_adofs, mdb%n_idofs, mdb%mesh, mdb%sections, mdb%materials, Kaa, Kab, Kba, Kbb)
         
         ! compute equivalent nodal loads vector
+        call progress_phase('Assembling load vector')
         Pa = new_vector(mdb%n_adofs)
         call g_add_Pc(mdb%mesh%m_space, mdb%n_cloads, mdb%mesh%nodes, mdb%cloads, mdb%nsets, Pa)                   ! add concentrated loads
         call g_add_Ps(mdb%n_adofs, mdb%n_sloads, mdb%mesh, mdb%sloads, mdb%ssets, mdb%sections, Pa)                ! add surface loads
@@ -63,9 +66,11 @@ module m_sproc
         Fe = subtract(Pa, multiply(Kab, Ub))
         
         ! compute unknown displacements
+        call progress_phase('Solving linear system')
         Ua = solve(Kaa, Fe)
         
         ! compute strain energy
+        call progress_phase('Recovering strains and stresses')
         strain_energy = dot(Ua, Fe)/2.0
         
         ! compute reaction forces
@@ -93,6 +98,7 @@ module m_sproc
         stress_extra_mesh = average(mdb%mesh, stress_extra_nodes, 13); if (allocated(stress_extra_nodes)) deallocate(stress_extra_nodes)
         
         ! convert global vectors to result matrices
+        call progress_phase('Building output database')
         displacement = convert_vector(mdb%mesh%m_space, mdb%mesh%n_nodes, mdb%mesh%nodes, Ua, Ub)
         reaction     = convert_vector(mdb%mesh%m_space, mdb%mesh%n_nodes, mdb%mesh%nodes, new_vector(mdb%n_adofs), R)
         nodal_load   = convert_vector(mdb%mesh%m_space, mdb%mesh%n_nodes, mdb%mesh%nodes, Pa, new_vector(mdb%n_idofs))
@@ -213,12 +219,15 @@ module m_sproc
         character(64)  :: frame_descr        ! frame description
         
         ! compute global stiffness matrix
+        call progress_phase('Assembling stiffness matrix')
         call g_get_K(mdb%n_adofs, mdb%n_idofs, mdb%mesh, mdb%sections, mdb%materials, Kaa, Kab, Kba, Kbb)
         
         ! compute global mass matrix
+        call progress_phase('Assembling mass matrix')
         call g_get_M(mdb%n_adofs, mdb%n_idofs, mdb%mesh, mdb%sections, mdb%materials, Maa, Mab, Mba, Mbb)
         
         ! solve generalized sparse eigenproblem
+        call progress_phase('Solving eigenproblem')
         call eigen('S', Kaa, Maa, k0, k, E, X)
         
         ! compute frequencies
@@ -226,14 +235,17 @@ module m_sproc
         f%at(:) = sqrt(E%at(:))/(2.0*PI)
         
         ! normalize eigenvectors
+        call progress_phase('Normalizing eigenvectors')
         do i = 1, k
             phi = new_vector(mdb%n_adofs)
             phi%at(:) = X%at(:, i)
             norm = sqrt(dot(phi, multiply(Maa, phi)))
             X%at(:, i) = phi%at(:)/norm
+            call progress_step(i, k)
         end do
         
         ! create output database
+        call progress_phase('Building output database')
         odb = new_odb(mdb%mesh%n_nodes, 2, 4)
         
         ! history output descriptions
@@ -264,6 +276,7 @@ module m_sproc
             call odb%set_nsfout(frame, 2, displacement%at(:, 2))
             call odb%set_nsfout(frame, 3, displacement%at(:, 3))
             call odb%set_nsfout(frame, 4, displacement%at(:, 4))
+            call progress_step(i, k)
         end do
         
         ! squeeze storage
@@ -299,9 +312,11 @@ module m_sproc
         ! ---------------------------------------
         
         ! compute global stiffness matrix
+        call progress_phase('Assembling stiffness matrix')
         call g_get_K(mdb%n_adofs, mdb%n_idofs, mdb%mesh, mdb%sections, mdb%materials, Kaa, Kab, Kba, Kbb)
         
         ! compute equivalent nodal loads vector
+        call progress_phase('Assembling load vector')
         Pa = new_vector(mdb%n_adofs)
         call g_add_Pc(mdb%mesh%m_space, mdb%n_cloads, mdb%mesh%nodes, mdb%cloads, mdb%nsets, Pa)                   ! add concentrated loads
         call g_add_Ps(mdb%n_adofs, mdb%n_sloads, mdb%mesh, mdb%sloads, mdb%ssets, mdb%sections, Pa)                ! add surface loads
@@ -312,6 +327,7 @@ module m_sproc
         Fe = subtract(Pa, multiply(Kab, Ub))
         
         ! compute unknown displacements
+        call progress_phase('Solving linear system')
         Ua = solve(Kaa, Fe)
         
         ! ---------------------------------------
@@ -319,12 +335,15 @@ module m_sproc
         ! ---------------------------------------
         
         ! compute global stress-stiffness matrix
+        call progress_phase('Assembling stress-stiffness matrix')
         call g_get_S(mdb%n_adofs, mdb%n_idofs, mdb%mesh, mdb%sections, mdb%materials, Ua, Ub, Saa, Sab, Sba, Sbb)
         
         ! solve generalized sparse eigenproblem
+        call progress_phase('Solving eigenproblem')
         call eigen('S', Saa, Kaa, k0, k, E, X)
         
         ! general post-processing
+        call progress_phase('Normalizing eigenvectors')
         do i = 1, k
             ! get eigenvalue
             E%at(i) = 1.0/E%at(i)
@@ -334,9 +353,11 @@ module m_sproc
             phi%at(:) = X%at(:, i)
             norm = maxabs(phi)
             X%at(:, i) = X%at(:, i)/norm
+            call progress_step(i, k)
         end do
         
         ! create output database
+        call progress_phase('Building output database')
         odb = new_odb(mdb%mesh%n_nodes, 2, 4)
         
         ! history output descriptions
@@ -367,6 +388,7 @@ module m_sproc
             call odb%set_nsfout(frame, 2, displacement%at(:, 2))
             call odb%set_nsfout(frame, 3, displacement%at(:, 3))
             call odb%set_nsfout(frame, 4, displacement%at(:, 4))
+            call progress_step(i, k)
         end do
         
         ! squeeze storage
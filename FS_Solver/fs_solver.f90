@@ -25,13 +25,25 @@ program fs_solver
     integer                     :: k0      ! requested number of eigenpairs
     integer                     :: i       ! loop counter
     
-    ! get command line arguments
-    argc = command_argument_count() + 1
+    ! get command line arguments (the program path is argument 0)
+    argc = command_argument_count()
     allocate(argv(argc))
     do i = 1, argc
-        call get_command_argument(i - 1, argv(i))
+        call get_command_argument(i, argv(i))
     end do
     
+    ! announce the number of phases (loading, connectivity, analysis phases, saving)
+    select case (trim(argv(3)))
+        case ('static')
+            call progress_init(8)
+        case ('frequency')
+            call progress_init(8)
+        case ('buckle')
+            call progress_init(10)
+        case default
+            call progress_init(3)
+    end select
+    
     ! print info
     call date_and_time(date, time)
     print '("Solver has started")'
@@ -39,14 +51,17 @@ program fs_solver
     print '("")'
     
     ! read solver job input
+    call progress_phase('Loading solver job input')
     print '("Loading solver job input from file: ''",A,"''")', trim(argv(1))
     mdb = read_input(trim(argv(1)))
     print '("Solver job input loaded")'
     print '("")'
     
     ! compute algebraic connectivity
+    call progress_phase('Building algebraic connectivity')
     print '("Building algebraic connectivity")'
     call mdb%build_dofs()
+    call progress_dofs(mdb%n_adofs)
     print '("Active degrees of freedom: ",I0)', mdb%n_adofs
     print '("Inactive degrees of freedom: ",I0)', mdb%n_idofs
     print '("")'
@@ -81,6 +96,7 @@ program fs_solver
     end select
     
     ! write output database
+    call progress_phase('Saving output database')
     print '("Saving output database to file: ''",A,"''")', trim(argv(2))
     call write_output(trim(argv(2)), mdb%mesh, odb)
     print '("Output database saved")'
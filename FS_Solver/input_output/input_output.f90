@@ -3,4 +3,5 @@
 module input_output
     use m_reader
     use m_writer
+    use m_progress
 end module
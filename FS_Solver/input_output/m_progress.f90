@@ -0,0 +1,65 @@
+! Description:
+! Structured progress markers (written to the standard output and parsed by the application).
+!   @phases <number of phases>
+!   @dofs <number of active degrees of freedom>
+!   @phase <phase index> <phase name>
+!   @step <step> <number of steps>
+module m_progress
+    use iso_fortran_env, only: output_unit
+    implicit none
+    
+    private
+    public progress_init, progress_dofs, progress_phase, progress_step
+    
+    integer :: i_phase      = 0  ! current phase index
+    integer :: last_percent = -1 ! last reported step percentage (current phase)
+    
+    contains
+    
+    ! Description:
+    ! Announces the number of phases.
+    subroutine progress_init(n_phases)
+        integer, intent(in) :: n_phases ! number of phases
+        
+        i_phase = 0
+        print '("@phases ",I0)', n_phases
+        flush(output_unit)
+    end subroutine
+    
+    ! Description:
+    ! Announces the number of active degrees of freedom (problem size).
+    subroutine progress_dofs(n_adofs)
+        integer, intent(in) :: n_adofs ! number of active degrees of freedom
+        
+        print '("@dofs ",I0)', n_adofs
+        flush(output_unit)
+    end subroutine
+    
+    ! Description:
+    ! Announces the start of the next phase.
+    subroutine progress_phase(name)
+        character(*), intent(in) :: name ! phase name
+        
+        i_phase = i_phase + 1
+        last_percent = -1
+        print '("@phase ",I0," ",A)', i_phase, name
+        flush(output_unit)
+    end subroutine
+    
+    ! Description:
+    ! Reports the progress within the current phase (at most once per percent).
+    subroutine progress_step(step, n_steps)
+        integer, intent(in) :: step    ! current step
+        integer, intent(in) :: n_steps ! number of steps
+        
+        ! additional variables
+        integer :: percent ! current step percentage
+        
+        percent = int(100.0*real(step)/real(max(n_steps, 1)))
+        if (percent == last_percent .and. step < n_steps) return
+        last_percent = percent
+        print '("@step ",I0," ",I0)', step, n_steps
+        flush(output_unit)
+    end subroutine
+
+end module
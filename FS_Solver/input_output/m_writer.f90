@@ -74,6 +74,20 @@ module m_writer
         write(unit=1, fmt='(A,I0,A)'), 'mesh = Mesh(', mesh%m_space, ', nodeData, elementData)'
         write(unit=1, fmt='(A)'), ''
         
+        ! frame descriptions (written before the results, so that every frame is complete once its field output is)
+        write(unit=1, fmt='(A)'), separator
+        write(unit=1, fmt='(A,A)'), comment, 'FRAME DESCRIPTIONS'
+        write(unit=1, fmt='(A)'), separator
+        write(unit=1, fmt='(A,I0)'), 'numberOfFrames = ', odb%n_frames
+        write(unit=1, fmt='(A)'), ''
+        write(unit=1, fmt='(A)'), 'frameDescriptions = ('
+        do i = 1, odb%n_frames
+            write(unit=1, fmt='(A,"''",A,"'',")'), indentation, trim(odb%d_frames(i))
+        end do
+        write(unit=1, fmt='(A)'), ')'
+        write(unit=1, fmt='(A)'), ''
+        flush(unit=1)
+        
         ! history output
         write(unit=1, fmt='(A)'), separator
         write(unit=1, fmt='(A,A)'), comment, 'HISTORY OUTPUT'
@@ -125,6 +139,7 @@ module m_writer
                 end do
             end do
             write(unit=1, fmt='(A,"),")'), indentation
+            flush(unit=1) ! completed frame (the output database can be read while it is written)
         end do
         write(unit=1, fmt='(A)'), ')'
         write(unit=1, fmt='(A)'), ''
@@ -133,14 +148,6 @@ module m_writer
         write(unit=1, fmt='(A)'), separator
         write(unit=1, fmt='(A,A)'), comment, 'OUTPUT DATABASE'
         write(unit=1, fmt='(A)'), separator
-        write(unit=1, fmt='(A,I0)'), 'numberOfFrames = ', odb%n_frames
-        write(unit=1, fmt='(A)'), ''
-        write(unit=1, fmt='(A)'), 'frameDescriptions = ('
-        do i = 1, odb%n_frames
-            write(unit=1, fmt='(A,"''",A,"'',")'), indentation, trim(odb%d_frames(i))
-        end do
-        write(unit=1, fmt='(A)'), ')'
-        write(unit=1, fmt='(A)'), ''
         write(unit=1, fmt='(A)'), 'outputDatabase = OutputDatabase('
         write(unit=1, fmt='(A,A,",")'), indentation, 'mesh'
         write(unit=1, fmt='(A,A,",")'), indentation, 'numberOfFrames'